@@ -0,0 +1,101 @@
+"""Latency benchmark for block_actions round-trips with process_before_response=False.
+
+    python benchmarks/ack_latency.py
+
+This script dispatches block_actions requests to an App whose listener calls ack() right away,
+and then reports the p50/p99 latency of `App#dispatch()`. The "polling" row emulates the former behavior,
+which checked the ack() completion every 10 milliseconds.
+"""
+
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import quote
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from slack_bolt import App, BoltRequest  # noqa: E402
+from slack_bolt.authorization import AuthorizeResult  # noqa: E402
+from slack_bolt.context.ack import Ack  # noqa: E402
+
+body = {
+    "type": "block_actions",
+    "team": {"id": "T111", "domain": "workspace-domain"},
+    "user": {"id": "W111", "team_id": "T111"},
+    "api_app_id": "A111",
+    "channel": {"id": "C111", "name": "general"},
+    "response_url": "https://hooks.slack.com/actions/T111/111/xxx",
+    "trigger_id": "111.222.xxx",
+    "actions": [
+        {
+            "type": "button",
+            "action_id": "button",
+            "block_id": "b",
+            "action_ts": "111.222",
+            "value": "v",
+        }
+    ],
+}
+raw_body = f"payload={quote(json.dumps(body))}"
+
+
+def polling_wait(self: Ack, timeout: Optional[float] = None) -> bool:
+    started = time.time()
+    while self.response is None and (timeout is None or time.time() - started <= timeout):
+        time.sleep(0.01)
+    return self.response is not None
+
+
+def build_app() -> App:
+    app = App(
+        signing_secret="secret",
+        request_verification_enabled=False,
+        authorize=lambda enterprise_id, team_id: AuthorizeResult(
+            enterprise_id=enterprise_id,
+            team_id=team_id,
+            bot_token="xoxb-dummy",
+            bot_user_id="U222",
+        ),
+    )
+
+    @app.action("button")
+    def handle(ack):
+        ack()
+
+    return app
+
+
+def run(app: App, count: int) -> List[float]:
+    millis = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = app.dispatch(BoltRequest(body=raw_body))
+        millis.append((time.perf_counter() - started) * 1000)
+        assert response.status == 200
+    return millis
+
+
+def percentile(values: List[float], p: int) -> float:
+    return statistics.quantiles(values, n=100)[p - 1]
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    app = build_app()
+    run(app, 20)  # warm up
+
+    results = {"event-driven": run(app, count)}
+    event_driven_wait = Ack.wait_until_acknowledged
+    Ack.wait_until_acknowledged = polling_wait  # type: ignore[method-assign]
+    try:
+        results["polling"] = run(app, count)
+    finally:
+        Ack.wait_until_acknowledged = event_driven_wait  # type: ignore[method-assign]
+
+    print(f"{'mode':>14} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    for mode, values in results.items():
+        print(f"{mode:>14} {percentile(values, 50):>9.2f} {percentile(values, 99):>9.2f}")
+    app.listener_runner.listener_executor.shutdown()  # type: ignore[attr-defined]
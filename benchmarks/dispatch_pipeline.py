@@ -0,0 +1,527 @@
+"""Throughput and latency benchmark for the request dispatch pipeline.
+
+    python benchmarks/dispatch_pipeline.py
+    python benchmarks/dispatch_pipeline.py --targets app,asgi --scenarios events,commands --count 2000
+    python benchmarks/dispatch_pipeline.py --json results.json
+
+This script replays signed requests through `App`, `AsyncApp`, the WSGI and ASGI adapters,
+and `SlackAppDevelopmentServer` over HTTP. All the apps talk to the mock Web API server used by the tests
+(tests/mock_web_api_server, listening on port 8888), and the "oauth" scenario authorizes requests from many
+workspaces with `SQLite3InstallationStore`. For each pair of a target and a scenario, it reports
+the throughput (req/s), the p50/p99 latency, and the peak memory allocated while handling a request.
+
+The --json option writes the results in a machine-readable format so that two runs can be compared.
+The listeners only acknowledge the requests, so that the numbers reflect the overhead of Bolt itself.
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import platform
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from http.client import HTTPConnection
+from pathlib import Path
+from queue import Queue
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from slack_sdk.oauth.installation_store import Installation  # noqa: E402
+from slack_sdk.oauth.installation_store.sqlite3 import SQLite3InstallationStore  # noqa: E402
+from slack_sdk.signature import SignatureVerifier  # noqa: E402
+from slack_sdk.web import WebClient  # noqa: E402
+from slack_sdk.web.async_client import AsyncWebClient  # noqa: E402
+
+from slack_bolt import App, BoltRequest  # noqa: E402
+from slack_bolt.adapter.asgi.async_handler import AsyncSlackRequestHandler  # noqa: E402
+from slack_bolt.adapter.wsgi import SlackRequestHandler  # noqa: E402
+from slack_bolt.app.app import SlackAppDevelopmentServer  # noqa: E402
+from slack_bolt.app.async_app import AsyncApp  # noqa: E402
+from slack_bolt.request.async_request import AsyncBoltRequest  # noqa: E402
+from slack_bolt.version import __version__  # noqa: E402
+from tests.mock_web_api_server import cleanup_mock_web_api_server  # noqa: E402
+from tests.mock_web_api_server.mock_handler import MockHandler  # noqa: E402
+from tests.mock_web_api_server.mock_server_thread import MockServerThread  # noqa: E402
+from tests.mock_web_api_server.received_requests import ReceivedRequests  # noqa: E402
+
+SIGNING_SECRET = "secret"
+VALID_TOKEN = "xoxb-valid"
+MOCK_API_SERVER_BASE_URL = "http://localhost:8888"
+OAUTH_TEAM_COUNT = 100
+
+TARGETS = ["app", "async_app", "wsgi", "asgi", "dev_server"]
+SCENARIOS = ["events", "block_actions", "view_submission", "commands", "lazy", "oauth"]
+
+# (content type, raw body)
+Payload = Tuple[str, bytes]
+
+
+# ------------------------------------------------
+# Payloads
+# ------------------------------------------------
+
+
+def event_payload(team_id: str) -> Payload:
+    body = {
+        "token": "verification_token",
+        "team_id": team_id,
+        "api_app_id": "A111",
+        "event": {
+            "type": "app_mention",
+            "user": "W222",
+            "text": "<@W111> Hi there!",
+            "ts": "1595926230.009600",
+            "channel": "C111",
+            "event_ts": "1595926230.009600",
+        },
+        "type": "event_callback",
+        "event_id": "Ev111",
+        "event_time": 1595926230,
+        "authorizations": [{"team_id": team_id, "user_id": "W111", "is_bot": True, "is_enterprise_install": False}],
+    }
+    return "application/json", json.dumps(body).encode("utf-8")
+
+
+def block_actions_payload(action_id: str) -> Payload:
+    body = {
+        "type": "block_actions",
+        "team": {"id": "T111", "domain": "workspace-domain"},
+        "user": {"id": "W111", "team_id": "T111"},
+        "api_app_id": "A111",
+        "channel": {"id": "C111", "name": "general"},
+        "response_url": "https://hooks.slack.com/actions/T111/111/xxx",
+        "trigger_id": "111.222.xxx",
+        "actions": [{"type": "button", "action_id": action_id, "block_id": "b", "action_ts": "111.222", "value": "v"}],
+    }
+    return "application/x-www-form-urlencoded", f"payload={quote(json.dumps(body))}".encode("utf-8")
+
+
+def view_submission_payload() -> Payload:
+    values = {f"block-{i}": {f"input-{i}": {"type": "plain_text_input", "value": "x" * 20}} for i in range(10)}
+    body = {
+        "type": "view_submission",
+        "team": {"id": "T111", "domain": "workspace-domain"},
+        "user": {"id": "W111", "team_id": "T111"},
+        "api_app_id": "A111",
+        "trigger_id": "111.222.xxx",
+        "view": {
+            "id": "V111",
+            "type": "modal",
+            "callback_id": "view-id",
+            "blocks": [{"type": "input", "block_id": f"block-{i}"} for i in range(10)],
+            "state": {"values": values},
+        },
+    }
+    return "application/x-www-form-urlencoded", f"payload={quote(json.dumps(body))}".encode("utf-8")
+
+
+def command_payload() -> Payload:
+    body = {
+        "token": "verification_token",
+        "team_id": "T111",
+        "team_domain": "workspace-domain",
+        "channel_id": "C111",
+        "channel_name": "general",
+        "user_id": "W111",
+        "command": "/hello-world",
+        "text": "Hi there!",
+        "response_url": "https://hooks.slack.com/commands/T111/111/xxx",
+        "trigger_id": "111.222.xxx",
+    }
+    return "application/x-www-form-urlencoded", urlencode(body).encode("utf-8")
+
+
+def build_payloads(scenario: str) -> List[Payload]:
+    if scenario == "events":
+        return [event_payload("T111")]
+    if scenario == "block_actions":
+        return [block_actions_payload("button")]
+    if scenario == "view_submission":
+        return [view_submission_payload()]
+    if scenario == "commands":
+        return [command_payload()]
+    if scenario == "lazy":
+        return [block_actions_payload("lazy-button")]
+    if scenario == "oauth":
+        return [event_payload(f"T{i:04d}") for i in range(OAUTH_TEAM_COUNT)]
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def build_headers(content_type: str, raw_body: bytes) -> Dict[str, str]:
+    timestamp = str(int(time.time()))
+    signature = SignatureVerifier(SIGNING_SECRET).generate_signature(timestamp=timestamp, body=raw_body)
+    return {
+        "content-type": content_type,
+        "x-slack-signature": signature,  # type: ignore[dict-item]
+        "x-slack-request-timestamp": timestamp,
+    }
+
+
+# ------------------------------------------------
+# Apps
+# ------------------------------------------------
+
+
+class QuietMockHandler(MockHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def start_mock_web_api_server() -> SimpleNamespace:
+    # The same as tests.mock_web_api_server.setup_mock_web_api_server() except the access logs
+    mock_server = SimpleNamespace(server_started=threading.Event(), received_requests=ReceivedRequests(Queue()))
+    mock_server.thread = MockServerThread(
+        mock_server.received_requests.queue, mock_server, handler=QuietMockHandler  # type: ignore[arg-type]
+    )
+    mock_server.thread.start()
+    mock_server.server_started.wait()
+    return mock_server
+
+
+def build_installation_store(database: str) -> SQLite3InstallationStore:
+    store = SQLite3InstallationStore(database=database, client_id="111.222")
+    for i in range(OAUTH_TEAM_COUNT):
+        store.save(
+            Installation(
+                app_id="A111",
+                team_id=f"T{i:04d}",
+                user_id="W111",
+                bot_token=f"xoxb-valid-T{i:04d}",
+                bot_id="B111",
+                bot_user_id="W111",
+                bot_scopes=["app_mentions:read", "chat:write", "commands"],
+            )
+        )
+    return store
+
+
+def build_app(installation_store: Optional[SQLite3InstallationStore] = None) -> App:
+    if installation_store is not None:
+        app = App(
+            signing_secret=SIGNING_SECRET,
+            installation_store=installation_store,
+            client=WebClient(base_url=MOCK_API_SERVER_BASE_URL),
+            process_before_response=True,
+        )
+    else:
+        app = App(
+            signing_secret=SIGNING_SECRET,
+            client=WebClient(token=VALID_TOKEN, base_url=MOCK_API_SERVER_BASE_URL),
+            process_before_response=True,
+        )
+
+    @app.event("app_mention")
+    def handle_app_mention(body: dict):
+        pass
+
+    @app.action("button")
+    def handle_button(ack):
+        ack()
+
+    @app.view("view-id")
+    def handle_view_submission(ack):
+        ack()
+
+    @app.command("/hello-world")
+    def handle_command(ack):
+        ack("Hello!")
+
+    def lazy_function(body: dict):
+        pass
+
+    app.action("lazy-button")(ack=lambda ack: ack(), lazy=[lazy_function])
+    return app
+
+
+def build_async_app(installation_store: Optional[SQLite3InstallationStore] = None) -> AsyncApp:
+    if installation_store is not None:
+        app = AsyncApp(
+            signing_secret=SIGNING_SECRET,
+            installation_store=installation_store,
+            client=AsyncWebClient(base_url=MOCK_API_SERVER_BASE_URL),
+            process_before_response=True,
+        )
+    else:
+        app = AsyncApp(
+            signing_secret=SIGNING_SECRET,
+            client=AsyncWebClient(token=VALID_TOKEN, base_url=MOCK_API_SERVER_BASE_URL),
+            process_before_response=True,
+        )
+
+    @app.event("app_mention")
+    async def handle_app_mention(body: dict):
+        pass
+
+    @app.action("button")
+    async def handle_button(ack):
+        await ack()
+
+    @app.view("view-id")
+    async def handle_view_submission(ack):
+        await ack()
+
+    @app.command("/hello-world")
+    async def handle_command(ack):
+        await ack("Hello!")
+
+    async def lazy_ack(ack):
+        await ack()
+
+    async def lazy_function(body: dict):
+        pass
+
+    app.action("lazy-button")(ack=lazy_ack, lazy=[lazy_function])
+    return app
+
+
+# ------------------------------------------------
+# Targets
+# ------------------------------------------------
+
+# Handles the n-th request and returns the response status
+SyncSender = Callable[[int], int]
+
+
+def app_sender(app: App, payloads: List[Payload]) -> SyncSender:
+    requests = [(raw_body, build_headers(content_type, raw_body)) for content_type, raw_body in payloads]
+
+    def send(n: int) -> int:
+        raw_body, headers = requests[n % len(requests)]
+        return app.dispatch(BoltRequest(body=raw_body, headers=headers)).status  # type: ignore[arg-type]
+
+    return send
+
+
+def wsgi_sender(app: App, payloads: List[Payload]) -> SyncSender:
+    handler = SlackRequestHandler(app)
+    requests = []
+    for content_type, raw_body in payloads:
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "PATH_INFO": "/slack/events",
+            "QUERY_STRING": "",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "CONTENT_LENGTH": str(len(raw_body)),
+            "CONTENT_TYPE": content_type,
+        }
+        for name, value in build_headers(content_type, raw_body).items():
+            if name != "content-type":
+                environ["HTTP_" + name.upper().replace("-", "_")] = value
+        requests.append((raw_body, environ))
+
+    def send(n: int) -> int:
+        raw_body, environ = requests[n % len(requests)]
+        statuses: List[str] = []
+
+        def start_response(status: str, headers: list) -> None:
+            statuses.append(status)
+
+        handler(dict(environ, **{"wsgi.input": io.BytesIO(raw_body)}), start_response)  # type: ignore[arg-type]
+        return int(statuses[0].split(" ", 1)[0])
+
+    return send
+
+
+def dev_server_sender(app: App, payloads: List[Payload]) -> SyncSender:
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        port = s.getsockname()[1]
+    server = SlackAppDevelopmentServer(port=port, path="/slack/events", app=app, http_server_logger_enabled=False)
+    with redirect_stdout(io.StringIO()):  # the boot message
+        threading.Thread(target=server.start, daemon=True).start()
+        time.sleep(0.1)
+    requests = [(raw_body, build_headers(content_type, raw_body)) for content_type, raw_body in payloads]
+
+    def send(n: int) -> int:
+        raw_body, headers = requests[n % len(requests)]
+        # The development server closes the connection for each request
+        connection = HTTPConnection("localhost", port)
+        try:
+            connection.request("POST", "/slack/events", body=raw_body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        finally:
+            connection.close()
+
+    return send
+
+
+# Handles the n-th request and returns the response status
+AsyncSender = Callable[[int], Any]
+
+
+def async_app_sender(app: AsyncApp, payloads: List[Payload]) -> AsyncSender:
+    requests = [(raw_body, build_headers(content_type, raw_body)) for content_type, raw_body in payloads]
+
+    async def send(n: int) -> int:
+        raw_body, headers = requests[n % len(requests)]
+        return (await app.async_dispatch(AsyncBoltRequest(body=raw_body, headers=headers))).status  # type: ignore[arg-type]
+
+    return send
+
+
+def asgi_sender(app: AsyncApp, payloads: List[Payload]) -> AsyncSender:
+    handler = AsyncSlackRequestHandler(app)
+    requests = []
+    for content_type, raw_body in payloads:
+        headers = [(k.encode("utf-8"), v.encode("utf-8")) for k, v in build_headers(content_type, raw_body).items()]
+        scope: Dict[str, Any] = {
+            "type": "http",
+            "method": "POST",
+            "path": "/slack/events",
+            "query_string": b"",
+            "headers": headers,
+        }
+        requests.append((raw_body, scope))
+
+    async def send(n: int) -> int:
+        raw_body, scope = requests[n % len(requests)]
+        messages: List[dict] = []
+
+        async def receive() -> dict:
+            return {"type": "http.request", "body": raw_body, "more_body": False}
+
+        async def send_message(message: dict) -> None:
+            messages.append(message)
+
+        await handler(scope, receive, send_message)
+        return messages[0]["status"]
+
+    return send
+
+
+# ------------------------------------------------
+# Measurement
+# ------------------------------------------------
+
+
+def summarize(target: str, scenario: str, millis: List[float], elapsed: float, allocated: List[int]) -> Dict[str, Any]:
+    quantiles = statistics.quantiles(millis, n=100)
+    return {
+        "target": target,
+        "scenario": scenario,
+        "requests": len(millis),
+        "requests_per_second": round(len(millis) / elapsed, 1),
+        "p50_ms": round(quantiles[49], 3),
+        "p99_ms": round(quantiles[98], 3),
+        "allocated_kib_per_request": round(statistics.mean(allocated) / 1024, 1),
+    }
+
+
+def run_sync(send: SyncSender, count: int, alloc_count: int) -> Tuple[List[float], float, List[int]]:
+    for n in range(min(count, 50)):  # warm up
+        assert send(n) == 200
+
+    millis = []
+    started = time.perf_counter()
+    for n in range(count):
+        request_started = time.perf_counter()
+        status = send(n)
+        millis.append((time.perf_counter() - request_started) * 1000)
+        assert status == 200, status
+    elapsed = time.perf_counter() - started
+
+    allocated = []
+    tracemalloc.start()
+    try:
+        for n in range(alloc_count):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            send(n)
+            allocated.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return millis, elapsed, allocated
+
+
+async def run_async(send: AsyncSender, count: int, alloc_count: int) -> Tuple[List[float], float, List[int]]:
+    for n in range(min(count, 50)):  # warm up
+        assert await send(n) == 200
+
+    millis = []
+    started = time.perf_counter()
+    for n in range(count):
+        request_started = time.perf_counter()
+        status = await send(n)
+        millis.append((time.perf_counter() - request_started) * 1000)
+        assert status == 200, status
+    elapsed = time.perf_counter() - started
+
+    allocated = []
+    tracemalloc.start()
+    try:
+        for n in range(alloc_count):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await send(n)
+            allocated.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return millis, elapsed, allocated
+
+
+def benchmark(target: str, scenario: str, count: int, alloc_count: int, database: str) -> Dict[str, Any]:
+    payloads = build_payloads(scenario)
+    store = build_installation_store(database) if scenario == "oauth" else None
+    if target in ("async_app", "asgi"):
+        async_app = build_async_app(store)
+        async_sender = async_app_sender if target == "async_app" else asgi_sender
+        result = asyncio.run(run_async(async_sender(async_app, payloads), count, alloc_count))
+    else:
+        app = build_app(store)
+        sync_sender = {"app": app_sender, "wsgi": wsgi_sender, "dev_server": dev_server_sender}[target]
+        result = run_sync(sync_sender(app, payloads), count, alloc_count)
+        app.listener_runner.listener_executor.shutdown()
+    return summarize(target, scenario, *result)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks the request dispatch pipeline")
+    parser.add_argument("--targets", default=",".join(TARGETS), help=f"comma-separated ({', '.join(TARGETS)})")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"comma-separated ({', '.join(SCENARIOS)})")
+    parser.add_argument("--count", type=int, default=1000, help="the number of requests per measurement")
+    parser.add_argument("--alloc-count", type=int, default=100, help="the number of requests to trace allocations")
+    parser.add_argument("--json", dest="json_path", help="the file to write the results in JSON format")
+    args = parser.parse_args()
+
+    mock_server = start_mock_web_api_server()
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            print(f"{'target':<11} {'scenario':<16} {'req/s':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'KiB/req':>8}")
+            for target in args.targets.split(","):
+                for scenario in args.scenarios.split(","):
+                    database = f"{tmpdir}/{target}-{scenario}.db"
+                    r = benchmark(target, scenario, args.count, args.alloc_count, database)
+                    results.append(r)
+                    print(
+                        f"{target:<11} {scenario:<16} {r['requests_per_second']:>9.1f} {r['p50_ms']:>9.3f} "
+                        f"{r['p99_ms']:>9.3f} {r['allocated_kib_per_request']:>8.1f}"
+                    )
+    finally:
+        cleanup_mock_web_api_server(mock_server)  # type: ignore[arg-type]
+
+    if args.json_path is not None:
+        with open(args.json_path, "w") as f:
+            json.dump(
+                {
+                    "slack_bolt": __version__,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "count": args.count,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
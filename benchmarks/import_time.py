@@ -0,0 +1,96 @@
+"""Import-time benchmark for the common entry points of slack_bolt.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 20 --json results.json
+    python benchmarks/import_time.py --max-ms 500
+
+This script runs `python -X importtime -c "<statement>"` in fresh processes for each entry point, such as
+`from slack_bolt import App` and `from slack_bolt.adapter.aws_lambda import SlackRequestHandler`, and reports
+the median of the total import time (excluding the modules imported by the interpreter startup) and the number
+of the imported modules. The number of modules does not fluctuate between runs, so it is a good signal for
+detecting a regression such as an eager import of a rarely used subsystem.
+
+The --max-ms option makes the script exit with status 1 when any median exceeds the given milliseconds.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+
+ENTRY_POINTS: Dict[str, str] = {
+    "slack_bolt": "import slack_bolt",
+    "App": "from slack_bolt import App",
+    "AsyncApp": "from slack_bolt.async_app import AsyncApp",
+    "aws_lambda": "from slack_bolt.adapter.aws_lambda import SlackRequestHandler",
+    "socket_mode": "from slack_bolt.adapter.socket_mode import SocketModeHandler",
+}
+
+
+def run_importtime(statement: str) -> List[Tuple[str, int, bool]]:
+    """Returns (module name, cumulative microseconds, whether it is a top-level import) for each imported module."""
+    # Prepend the project root so that this checkout is measured rather than an installed package
+    code = f"import sys; sys.path.insert(0, {PROJECT_ROOT!r}); {statement}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    entries: List[Tuple[str, int, bool]] = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line.replace("import time:", "", 1).split("|")
+        # The nested imports are indented by two spaces per level
+        entries.append((name.strip(), int(cumulative), not name.startswith("  ")))
+    return entries
+
+
+def measure(statement: str, startup_modules: Set[str], repeat: int) -> Tuple[float, int]:
+    durations: List[float] = []
+    module_count = 0
+    for _ in range(repeat):
+        entries = [e for e in run_importtime(statement) if e[0] not in startup_modules]
+        durations.append(sum(cumulative for _, cumulative, top_level in entries if top_level) / 1000)
+        module_count = len(entries)
+    return statistics.median(durations), module_count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks the import time of slack_bolt")
+    parser.add_argument(
+        "--entry-points", default=",".join(ENTRY_POINTS), help=f"comma-separated ({', '.join(ENTRY_POINTS)})"
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="the number of processes per entry point")
+    parser.add_argument("--max-ms", type=float, help="exits with status 1 when a median exceeds this value")
+    parser.add_argument("--json", dest="json_path", help="the file to write the results in JSON format")
+    args = parser.parse_args()
+
+    # The modules already imported by the interpreter startup (e.g., site, encodings)
+    startup_modules = {name for name, _, _ in run_importtime("pass")}
+
+    results = []
+    print(f"{'entry point':<14} {'median (ms)':>12} {'modules':>8}")
+    for key in args.entry_points.split(","):
+        median_ms, module_count = measure(ENTRY_POINTS[key], startup_modules, args.repeat)
+        results.append({"entry_point": key, "statement": ENTRY_POINTS[key], "median_ms": median_ms, "modules": module_count})
+        print(f"{key:<14} {median_ms:>12.1f} {module_count:>8}")
+
+    if args.json_path is not None:
+        with open(args.json_path, "w") as f:
+            json.dump({"python": platform.python_version(), "repeat": args.repeat, "results": results}, f, indent=2)
+
+    if args.max_ms is not None:
+        exceeded = [r["entry_point"] for r in results if r["median_ms"] > args.max_ms]
+        if len(exceeded) > 0:
+            print(f"Exceeded {args.max_ms} ms: {', '.join(exceeded)}")
+            sys.exit(1)
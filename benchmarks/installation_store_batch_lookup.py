@@ -0,0 +1,184 @@
+"""Benchmark for the installation store lookups done by `InstallationStoreAuthorize`.
+
+    python benchmarks/installation_store_batch_lookup.py
+
+This script saves a bot installation and a user installation to the SQLite3 database used by `OAuthFlow.sqlite3()`,
+and then authorizes requests from the user, which require both installations. The "find_installation" rows use
+the built-in `SQLite3InstallationStore` as-is, while the "find_installations" rows use a subclass implementing
+`BatchInstallationStore`, which loads both installations with a single query.
+As SQLite3 runs in the same process, each connection can be delayed to emulate the round-trips to a database server.
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from slack_sdk import WebClient  # noqa: E402
+from slack_sdk.oauth.installation_store import Installation  # noqa: E402
+from slack_sdk.oauth.installation_store.sqlite3 import SQLite3InstallationStore  # noqa: E402
+
+from slack_bolt import BoltContext  # noqa: E402
+from slack_bolt.authorization.authorize import InstallationStoreAuthorize  # noqa: E402
+from slack_bolt.authorization.batch_installation_store import BatchInstallationStore, InstallationQuery  # noqa: E402
+from slack_bolt.oauth import OAuthFlow  # noqa: E402
+
+REQUEST_COUNT = 1000
+
+COLUMNS = [
+    "app_id",
+    "enterprise_id",
+    "enterprise_name",
+    "enterprise_url",
+    "team_id",
+    "team_name",
+    "bot_token",
+    "bot_id",
+    "bot_user_id",
+    "bot_scopes",
+    "bot_refresh_token",
+    "bot_token_expires_at",
+    "user_id",
+    "user_token",
+    "user_scopes",
+    "user_refresh_token",
+    "user_token_expires_at",
+    "incoming_webhook_url",
+    "incoming_webhook_channel",
+    "incoming_webhook_channel_id",
+    "incoming_webhook_configuration_url",
+    "is_enterprise_install",
+    "token_type",
+    "installed_at",
+]
+BOT_COLUMNS = ["bot_token", "bot_id", "bot_user_id", "bot_scopes", "bot_refresh_token", "bot_token_expires_at"]
+
+
+class BatchSQLite3InstallationStore(SQLite3InstallationStore, BatchInstallationStore):
+    def find_installations(self, *, queries: Sequence[InstallationQuery]) -> Sequence[Optional[Installation]]:
+        # Each query becomes a sub-select returning its latest row; a user's installation also needs
+        # the latest bot token in the workspace, which SQLite3InstallationStore#find_installation() loads as well
+        sub_selects: List[str] = []
+        params: List[object] = []
+        for index, query in enumerate(queries):
+            enterprise_id = query.enterprise_id or ""
+            team_id = "" if query.is_enterprise_install or query.team_id is None else query.team_id
+            user_condition = "" if query.user_id is None else "and user_id = ?"
+            sub_selects.append(f"""select * from (
+                    select ? as query_index, 0 as is_bot_row, {", ".join(COLUMNS)} from slack_installations
+                    where client_id = ? and enterprise_id = ? and team_id = ? {user_condition}
+                    order by installed_at desc limit 1
+                )""")
+            params.extend([index, self.client_id, enterprise_id, team_id])
+            if query.user_id is not None:
+                params.append(query.user_id)
+                sub_selects.append(f"""select * from (
+                        select ? as query_index, 1 as is_bot_row, {", ".join(COLUMNS)} from slack_installations
+                        where client_id = ? and enterprise_id = ? and team_id = ? and bot_token is not null
+                        order by installed_at desc limit 1
+                    )""")
+                params.extend([index, self.client_id, enterprise_id, team_id])
+
+        installations: List[Optional[Installation]] = [None] * len(queries)
+        bot_rows = {}
+        with self.connect() as conn:
+            for row in conn.execute(" union all ".join(sub_selects), params):
+                values = dict(zip(COLUMNS, row[2:]))
+                if row[1] == 1:
+                    bot_rows[row[0]] = values
+                else:
+                    installations[row[0]] = Installation(**values)
+        for index, values in bot_rows.items():
+            installation = installations[index]
+            if installation is not None:
+                for name in BOT_COLUMNS:
+                    setattr(installation, name, values[name])
+        return installations
+
+
+def delay_connections(store: SQLite3InstallationStore, latency_seconds: float) -> None:
+    connect = store.connect
+
+    def delayed_connect():
+        store.connection_count += 1  # type: ignore[attr-defined]
+        if latency_seconds > 0:
+            time.sleep(latency_seconds)
+        return connect()
+
+    store.connection_count = 0  # type: ignore[attr-defined]
+    store.connect = delayed_connect  # type: ignore[method-assign]
+
+
+def save_installations(store: SQLite3InstallationStore) -> None:
+    now = time.time()
+    store.save(
+        Installation(
+            app_id="A111",
+            team_id="T111",
+            team_name="Workspace",
+            bot_token="xoxb-valid",
+            bot_id="B111",
+            bot_user_id="W000",
+            bot_scopes=["commands", "chat:write"],
+            user_id="W111",
+            user_token="xoxp-installer",
+            user_scopes=["search:read"],
+            installed_at=now - 10,
+        )
+    )
+    store.save(
+        Installation(
+            app_id="A111",
+            team_id="T111",
+            team_name="Workspace",
+            user_id="W222",
+            user_token="xoxp-valid",
+            user_scopes=["search:read"],
+            installed_at=now - 20,
+        )
+    )
+
+
+def measure(store: SQLite3InstallationStore) -> float:
+    authorize = InstallationStoreAuthorize(
+        logger=logging.getLogger(__name__),
+        installation_store=store,
+        single_flight_enabled=False,
+        # The results are built from the stored data so that no auth.test API calls are made
+        auth_test_mode="fallback",
+    )
+    context = BoltContext()
+    context["client"] = WebClient(token=None)
+
+    def run():
+        return authorize(context=context, enterprise_id=None, team_id="T111", user_id="W222")
+
+    result = run()
+    assert result is not None and result.bot_token == "xoxb-valid" and result.user_token == "xoxp-valid"
+    store.connection_count = 0  # type: ignore[attr-defined]
+    started_at = time.perf_counter()
+    for _ in range(REQUEST_COUNT):
+        run()
+    return (time.perf_counter() - started_at) / REQUEST_COUNT * 1_000_000
+
+
+if __name__ == "__main__":
+    print(f"{'store':<20} {'latency (ms)':>12} {'per request (us)':>17} {'connections':>12}")
+    with tempfile.TemporaryDirectory() as dir:
+        database = f"{dir}/installations.db"
+        flow = OAuthFlow.sqlite3(database=database, client_id="111.222", client_secret="secret")
+        built_in_store: SQLite3InstallationStore = flow.settings.installation_store  # type: ignore[assignment]
+        save_installations(built_in_store)
+        for latency_ms in [0, 1]:
+            for label, store in [
+                ("find_installation", SQLite3InstallationStore(database=database, client_id="111.222")),
+                ("find_installations", BatchSQLite3InstallationStore(database=database, client_id="111.222")),
+            ]:
+                delay_connections(store, latency_ms / 1000)
+                elapsed = measure(store)
+                connections = store.connection_count / REQUEST_COUNT  # type: ignore[attr-defined]
+                print(f"{label:<20} {latency_ms:>12} {elapsed:>17.1f} {connections:>12.1f}")
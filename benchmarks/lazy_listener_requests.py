@@ -0,0 +1,75 @@
+"""Micro-benchmark for building the requests passed to lazy listener functions.
+
+    python benchmarks/lazy_listener_requests.py
+
+This script builds the requests for 3 lazy functions from a view_submission request with a large state,
+and compares the former deep-copy approach with `BoltRequest#to_lazy_request()` in both time and memory.
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+from urllib.parse import quote
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from slack_bolt import BoltRequest  # noqa: E402
+from slack_bolt.authorization import AuthorizeResult  # noqa: E402
+from slack_bolt.util.utils import create_copy  # noqa: E402
+
+LAZY_FUNCTION_COUNT = 3
+
+
+def build_body(input_count: int) -> dict:
+    values = {f"block-{i}": {f"input-{i}": {"type": "plain_text_input", "value": "x" * 100}} for i in range(input_count)}
+    return {
+        "type": "view_submission",
+        "team": {"id": "T111", "domain": "workspace-domain"},
+        "user": {"id": "W111", "team_id": "T111"},
+        "api_app_id": "A111",
+        "trigger_id": "111.222.xxx",
+        "view": {
+            "id": "V111",
+            "type": "modal",
+            "callback_id": "view-id",
+            "blocks": [{"type": "input", "block_id": f"block-{i}"} for i in range(input_count)],
+            "state": {"values": values},
+        },
+    }
+
+
+def build_request(input_count: int) -> BoltRequest:
+    request = BoltRequest(body=f"payload={quote(json.dumps(build_body(input_count)))}")
+    request.context.set_authorize_result(AuthorizeResult(enterprise_id=None, team_id="T111", bot_token="xoxb-dummy"))
+    request.context["token"] = "xoxb-dummy"
+    return request
+
+
+def deep_copy(request: BoltRequest) -> List[BoltRequest]:
+    return [create_copy(request.to_copyable()) for _ in range(LAZY_FUNCTION_COUNT)]
+
+
+def lazy_request(request: BoltRequest) -> List[BoltRequest]:
+    return [request.to_lazy_request(f"lazy_{i}") for i in range(LAZY_FUNCTION_COUNT)]
+
+
+def measure(func: Callable[[BoltRequest], List[BoltRequest]], request: BoltRequest, number: int):
+    elapsed = min(timeit.repeat(lambda: func(request), number=number, repeat=5)) / number * 1_000_000
+    tracemalloc.start()
+    copies = func(request)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(copies) == LAZY_FUNCTION_COUNT
+    return elapsed, allocated / 1024
+
+
+if __name__ == "__main__":
+    print(f"{'inputs':>7} {'mode':>13} {'us/req':>9} {'KiB/req':>9}")
+    for input_count, number in [(10, 500), (100, 100), (1000, 10)]:
+        request = build_request(input_count)
+        for name, func in [("deep copy", deep_copy), ("lazy request", lazy_request)]:
+            elapsed, kib = measure(func, request, number)
+            print(f"{input_count:>7} {name:>13} {elapsed:>9.1f} {kib:>9.1f}")
@@ -0,0 +1,80 @@
+"""Micro-benchmark for the per-request cost of built-in listener matchers.
+
+    python benchmarks/listener_matchers.py
+
+This script evaluates all the primary matchers of 10/100/1000 `block_actions` listeners against a single request
+in three ways: building all the available kwargs for every matcher invocation, passing only the request body,
+and passing only the `PayloadKind` extracted at the request construction (the built-in matchers' default).
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+from urllib.parse import quote
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from slack_bolt import BoltRequest, BoltResponse  # noqa: E402
+from slack_bolt.context.ack import Ack  # noqa: E402
+from slack_bolt.listener_matcher.builtins import _compile, block_action, build_listener_matcher  # noqa: E402
+from slack_bolt.request.payload_utils import is_block_actions  # noqa: E402
+
+body = {
+    "type": "block_actions",
+    "team": {"id": "T111", "domain": "workspace-domain"},
+    "user": {"id": "W111", "team_id": "T111"},
+    "channel": {"id": "C111", "name": "general"},
+    "response_url": "https://hooks.slack.com/actions/T111/111/xxx",
+    "actions": [
+        {
+            "type": "button",
+            "action_id": "action-999",
+            "block_id": "b",
+            "action_ts": "111.222",
+            "value": "v",
+        }
+    ],
+}
+
+
+def build_request() -> BoltRequest:
+    request = BoltRequest(body=f"payload={quote(json.dumps(body))}")
+    request.context["ack"] = Ack()
+    return request
+
+
+def build_body_matcher(action_id: str, body_only: bool):
+    # The former implementation of the built-in block_actions matcher
+    action_id_matches = _compile(action_id)
+
+    def func(body):
+        return is_block_actions(body) and action_id_matches(body["actions"][0]["action_id"])
+
+    matcher = build_listener_matcher(func, asyncio=False)
+    matcher.body_only = body_only  # type: ignore[attr-defined]
+    return matcher
+
+
+def run(listener_count: int, mode: str, number: int) -> float:
+    if mode == "payload-kind":
+        matchers = [block_action(f"action-{i}") for i in range(listener_count)]
+    else:
+        matchers = [build_body_matcher(f"action-{i}", mode == "body-only") for i in range(listener_count)]
+    request = build_request()
+    response = BoltResponse(status=200)
+
+    def match_all():
+        for m in matchers:
+            m.matches(request, response)
+
+    elapsed = min(timeit.repeat(match_all, number=number, repeat=5))
+    return elapsed / number * 1_000_000
+
+
+if __name__ == "__main__":
+    modes = ["kwargs", "body-only", "payload-kind"]
+    print(f"{'listeners':>10}" + "".join(f" {mode + ' (us/req)':>22}" for mode in modes))
+    for count, number in [(10, 2000), (100, 200), (1000, 20)]:
+        results = [run(count, mode, number) for mode in modes]
+        print(f"{count:>10}" + "".join(f" {r:>22.1f}" for r in results))
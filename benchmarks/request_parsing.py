@@ -0,0 +1,219 @@
+"""Micro-benchmark for parsing incoming request bodies.
+
+    python benchmarks/request_parsing.py
+
+This script parses the raw bodies of typical Slack payloads (Events API, slash commands, block_actions,
+and view_submission with a large state) with the former implementation, which parsed all the form parameters
+before decoding the "payload" one, and with `parse_body()` using each installed JSON codec.
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, quote, urlencode
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from slack_bolt.request.internals import parse_body  # noqa: E402
+from slack_bolt.util.json_codec import build_json_codec, set_json_codec  # noqa: E402
+
+team = {"id": "T03E94MJU", "domain": "workspace-domain", "enterprise_id": "E111"}
+user = {"id": "W111", "username": "primary-owner", "name": "primary-owner", "team_id": "T03E94MJU"}
+
+event_body = {
+    "token": "verification-token",
+    "team_id": "T03E94MJU",
+    "enterprise_id": "E111",
+    "api_app_id": "A111",
+    "event": {
+        "client_msg_id": "a8744611-0210-4f85-9f15-5faf7fb225c8",
+        "type": "app_mention",
+        "text": "<@W111> Hi there! Could you summarize the discussion in this thread?",
+        "user": "W222",
+        "ts": "1595926230.009600",
+        "team": "T03E94MJU",
+        "blocks": [
+            {
+                "type": "rich_text",
+                "block_id": "Rd3",
+                "elements": [
+                    {
+                        "type": "rich_text_section",
+                        "elements": [
+                            {"type": "user", "user_id": "W111"},
+                            {"type": "text", "text": " Hi there! Could you summarize the discussion in this thread?"},
+                        ],
+                    }
+                ],
+            }
+        ],
+        "channel": "C111",
+        "event_ts": "1595926230.009600",
+    },
+    "type": "event_callback",
+    "event_id": "Ev111",
+    "event_time": 1595926230,
+    "authorizations": [
+        {
+            "enterprise_id": "E111",
+            "team_id": "T03E94MJU",
+            "user_id": "W111",
+            "is_bot": True,
+            "is_enterprise_install": False,
+        }
+    ],
+    "is_ext_shared_channel": False,
+    "event_context": "1-app_mention-T03E94MJU-C111",
+}
+
+command_body = {
+    "token": "verification-token",
+    "team_id": "T03E94MJU",
+    "team_domain": "workspace-domain",
+    "enterprise_id": "E111",
+    "enterprise_name": "Org Name",
+    "channel_id": "C111",
+    "channel_name": "general",
+    "user_id": "W111",
+    "user_name": "primary-owner",
+    "command": "/hello-world",
+    "text": "Hi there! This is a slash command with some arguments",
+    "api_app_id": "A111",
+    "is_enterprise_install": "false",
+    "response_url": "https://hooks.slack.com/commands/T03E94MJU/111/xxx",
+    "trigger_id": "111.111.xxx",
+}
+
+
+def build_blocks(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "type": "input",
+            "block_id": f"block-{i}",
+            "label": {"type": "plain_text", "text": f"Question {i}", "emoji": True},
+            "optional": False,
+            "dispatch_action": False,
+            "element": {
+                "type": "plain_text_input",
+                "action_id": f"input-{i}",
+                "dispatch_action_config": {"trigger_actions_on": ["on_enter_pressed"]},
+            },
+        }
+        for i in range(count)
+    ]
+
+
+block_actions_body = {
+    "type": "block_actions",
+    "user": user,
+    "api_app_id": "A111",
+    "token": "verification-token",
+    "container": {"type": "message", "message_ts": "111.222", "channel_id": "C111", "is_ephemeral": False},
+    "trigger_id": "111.222.xxx",
+    "team": team,
+    "enterprise": {"id": "E111", "name": "Org Name"},
+    "is_enterprise_install": False,
+    "channel": {"id": "C111", "name": "general"},
+    "message": {
+        "bot_id": "B111",
+        "type": "message",
+        "text": "This content can't be displayed.",
+        "user": "W111",
+        "ts": "111.222",
+        "team": "T03E94MJU",
+        "blocks": build_blocks(10),
+    },
+    "state": {"values": {}},
+    "response_url": "https://hooks.slack.com/actions/T03E94MJU/111/xxx",
+    "actions": [
+        {
+            "action_id": "button",
+            "block_id": "b",
+            "text": {"type": "plain_text", "text": "Click Me", "emoji": True},
+            "value": "click_me_123",
+            "type": "button",
+            "action_ts": "111.222",
+        }
+    ],
+}
+
+view_submission_body = {
+    "type": "view_submission",
+    "team": team,
+    "user": user,
+    "api_app_id": "A111",
+    "token": "verification-token",
+    "trigger_id": "111.222.xxx",
+    "view": {
+        "id": "V111",
+        "team_id": "T03E94MJU",
+        "type": "modal",
+        "blocks": build_blocks(50),
+        "private_metadata": "",
+        "callback_id": "view-id",
+        "state": {
+            "values": {
+                f"block-{i}": {f"input-{i}": {"type": "plain_text_input", "value": "Lorem ipsum dolor sit amet " * 10}}
+                for i in range(50)
+            }
+        },
+        "hash": "156772938.1827394",
+        "title": {"type": "plain_text", "text": "My App", "emoji": True},
+        "submit": {"type": "plain_text", "text": "Submit", "emoji": True},
+        "root_view_id": "V111",
+        "app_id": "A111",
+        "bot_id": "B111",
+    },
+    "response_urls": [],
+    "is_enterprise_install": False,
+    "enterprise": {"id": "E111", "name": "Org Name"},
+}
+
+payloads: List[Tuple[str, str, Optional[str]]] = [
+    ("event_callback", json.dumps(event_body), "application/json"),
+    ("command", urlencode(command_body), "application/x-www-form-urlencoded"),
+    ("block_actions", f"payload={quote(json.dumps(block_actions_body))}", "application/x-www-form-urlencoded"),
+    ("view_submission", f"payload={quote(json.dumps(view_submission_body))}", "application/x-www-form-urlencoded"),
+]
+
+
+def legacy_parse_body(body: str, content_type: Optional[str]) -> Dict[str, Any]:
+    if (content_type is not None and content_type == "application/json") or body.startswith("{"):
+        return json.loads(body)
+    if "payload" in body:
+        payload = dict(parse_qsl(body, keep_blank_values=True)).get("payload")
+        return json.loads(payload) if payload is not None else {}
+    return dict(parse_qsl(body, keep_blank_values=True))
+
+
+def measure(func: Callable[[str, Optional[str]], Dict[str, Any]], body: str, content_type: Optional[str]) -> float:
+    number = 200
+    elapsed = min(timeit.repeat(lambda: func(body, content_type), number=number, repeat=5))
+    return elapsed / number * 1_000_000
+
+
+def installed_codecs() -> List[str]:
+    names = ["json"]
+    for name in ["orjson", "ujson"]:
+        try:
+            build_json_codec(name)
+            names.append(name)
+        except Exception:
+            pass
+    return names
+
+
+if __name__ == "__main__":
+    codecs = installed_codecs()
+    modes = ["legacy"] + codecs
+    print(f"{'payload':>16} {'bytes':>7}" + "".join(f" {mode + ' (us)':>12}" for mode in modes))
+    for name, body, content_type in payloads:
+        assert parse_body(body, content_type) == legacy_parse_body(body, content_type)
+        results = [measure(legacy_parse_body, body, content_type)]
+        for codec in codecs:
+            set_json_codec(codec)
+            results.append(measure(parse_body, body, content_type))
+        set_json_codec("json")
+        print(f"{name:>16} {len(body):>7}" + "".join(f" {r:>12.1f}" for r in results))
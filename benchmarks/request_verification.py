@@ -0,0 +1,46 @@
+"""Micro-benchmark for verifying the signatures of incoming requests.
+
+    python benchmarks/request_verification.py
+
+This script compares slack_sdk's `SignatureVerifier` with `PreparedSignatureVerifier` used by `RequestVerification`
+for 1KB and 100KB bodies given as either str or bytes, and for requests with stale timestamps.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+from time import time
+from typing import Union
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from slack_sdk.signature import SignatureVerifier  # noqa: E402
+
+from slack_bolt.middleware.request_verification.signature_verifier import PreparedSignatureVerifier  # noqa: E402
+
+SIGNING_SECRET = "8f742231b10e8888abcd99yyyzzz85a5"
+
+
+def measure(verifier: SignatureVerifier, body: Union[str, bytes], timestamp: str, signature: str, number: int) -> float:
+    expected = timestamp != "0"
+    assert verifier.is_valid(body, timestamp, signature) is expected
+    elapsed = min(timeit.repeat(lambda: verifier.is_valid(body, timestamp, signature), number=number, repeat=5))
+    return elapsed / number * 1_000_000
+
+
+if __name__ == "__main__":
+    sdk_verifier = SignatureVerifier(signing_secret=SIGNING_SECRET)
+    prepared_verifier = PreparedSignatureVerifier(signing_secret=SIGNING_SECRET)
+    print(f"{'body':<16} {'SignatureVerifier (us)':>24} {'PreparedSignatureVerifier (us)':>32}")
+    for size in [1_000, 100_000]:
+        body = "payload=" + "x" * (size - 8)
+        timestamp = str(int(time()))
+        signature = sdk_verifier.generate_signature(timestamp=timestamp, body=body)  # type: ignore[assignment]
+        number = 20_000 if size <= 1_000 else 500
+        for label, given_body in [("str", body), ("bytes", body.encode("utf-8"))]:
+            sdk = measure(sdk_verifier, given_body, timestamp, signature, number)
+            prepared = measure(prepared_verifier, given_body, timestamp, signature, number)
+            print(f"{f'{size // 1000}KB {label}':<16} {sdk:>24.2f} {prepared:>32.2f}")
+        sdk = measure(sdk_verifier, body, "0", signature, number)
+        prepared = measure(prepared_verifier, body, "0", signature, number)
+        print(f"{f'{size // 1000}KB stale':<16} {sdk:>24.2f} {prepared:>32.2f}")
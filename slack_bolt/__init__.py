@@ -6,33 +6,78 @@ A Python framework to build Slack apps in a flash with the latest platform featu
 * The class representing a Bolt app: `slack_bolt.app.app`
 """  # noqa: E501
 
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 # Don't add async module imports here
-from .app import App
-from .context import BoltContext
-from .context.ack import Ack
-from .context.complete import Complete
-from .context.fail import Fail
-from .context.respond import Respond
-from .context.say import Say
-from .context.say_stream import SayStream
-from .kwargs_injection import Args
-from .listener import Listener
-from .listener_matcher import CustomListenerMatcher
-from .request import BoltRequest
-from .response import BoltResponse
-
-# AI Agents & Assistants
-from .middleware.assistant.assistant import (
-    Assistant,
-)
-from .context.assistant.thread_context import AssistantThreadContext
-from .context.assistant.thread_context_store.store import AssistantThreadContextStore
-from .context.assistant.thread_context_store.file import FileAssistantThreadContextStore
-
-from .context.set_status import SetStatus
-from .context.set_title import SetTitle
-from .context.set_suggested_prompts import SetSuggestedPrompts
-from .context.save_thread_context import SaveThreadContext
+if TYPE_CHECKING:
+    from .app import App
+    from .context import BoltContext
+    from .context.ack import Ack
+    from .context.complete import Complete
+    from .context.fail import Fail
+    from .context.respond import Respond
+    from .context.say import Say
+    from .context.say_stream import SayStream
+    from .kwargs_injection import Args
+    from .listener import Listener
+    from .listener_matcher import CustomListenerMatcher
+    from .request import BoltRequest
+    from .response import BoltResponse
+
+    # AI Agents & Assistants
+    from .middleware.assistant.assistant import (
+        Assistant,
+    )
+    from .context.assistant.thread_context import AssistantThreadContext
+    from .context.assistant.thread_context_store.store import AssistantThreadContextStore
+    from .context.assistant.thread_context_store.file import FileAssistantThreadContextStore
+
+    from .context.set_status import SetStatus
+    from .context.set_title import SetTitle
+    from .context.set_suggested_prompts import SetSuggestedPrompts
+    from .context.save_thread_context import SaveThreadContext
+
+# The attributes are imported on first access (PEP 562) so that importing a submodule such as
+# slack_bolt.adapter.aws_lambda or slack_bolt.request does not load the whole App class and its dependencies.
+_lazy_attributes: Dict[str, str] = {
+    "App": ".app",
+    "BoltContext": ".context",
+    "Ack": ".context.ack",
+    "Complete": ".context.complete",
+    "Fail": ".context.fail",
+    "Respond": ".context.respond",
+    "Say": ".context.say",
+    "SayStream": ".context.say_stream",
+    "Args": ".kwargs_injection",
+    "Listener": ".listener",
+    "CustomListenerMatcher": ".listener_matcher",
+    "BoltRequest": ".request",
+    "BoltResponse": ".response",
+    "Assistant": ".middleware.assistant.assistant",
+    "AssistantThreadContext": ".context.assistant.thread_context",
+    "AssistantThreadContextStore": ".context.assistant.thread_context_store.store",
+    "FileAssistantThreadContextStore": ".context.assistant.thread_context_store.file",
+    "SetStatus": ".context.set_status",
+    "SetTitle": ".context.set_title",
+    "SetSuggestedPrompts": ".context.set_suggested_prompts",
+    "SaveThreadContext": ".context.save_thread_context",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _lazy_attributes.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache the value so that __getattr__ is not called for the name again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_lazy_attributes))
+
 
 __all__ = [
     "App",
@@ -8,7 +8,7 @@ from slack_bolt.response import BoltResponse
 
 async def to_bolt_request(request: web.Request) -> AsyncBoltRequest:
     return AsyncBoltRequest(
-        body=await request.text(),
+        body=await request.read(),
         query=request.query_string,
         headers=request.headers,  # type: ignore[arg-type]
     )
@@ -35,15 +35,21 @@ class AsyncSlackRequestHandler(SlackRequestHandler):
 
     async def dispatch(self, request: AsgiHttpRequest) -> BoltResponse:
         return await self.app.async_dispatch(
-            AsyncBoltRequest(body=await request.get_raw_body(), query=request.query_string, headers=request.get_headers())
+            AsyncBoltRequest(
+                body=await request.get_raw_body_bytes(), query=request.query_string, headers=request.get_headers()
+            )
         )
 
     async def handle_installation(self, request: AsgiHttpRequest) -> BoltResponse:
         return await self.app.oauth_flow.handle_installation(  # type: ignore[union-attr]
-            AsyncBoltRequest(body=await request.get_raw_body(), query=request.query_string, headers=request.get_headers())
+            AsyncBoltRequest(
+                body=await request.get_raw_body_bytes(), query=request.query_string, headers=request.get_headers()
+            )
         )
 
     async def handle_callback(self, request: AsgiHttpRequest) -> BoltResponse:
         return await self.app.oauth_flow.handle_callback(  # type: ignore[union-attr]
-            AsyncBoltRequest(body=await request.get_raw_body(), query=request.query_string, headers=request.get_headers())
+            AsyncBoltRequest(
+                body=await request.get_raw_body_bytes(), query=request.query_string, headers=request.get_headers()
+            )
         )
@@ -34,15 +34,15 @@ class SlackRequestHandler(BaseSlackRequestHandler):
 
     async def dispatch(self, request: AsgiHttpRequest) -> BoltResponse:
         return self.app.dispatch(
-            BoltRequest(body=await request.get_raw_body(), query=request.query_string, headers=request.get_headers())
+            BoltRequest(body=await request.get_raw_body_bytes(), query=request.query_string, headers=request.get_headers())
         )
 
     async def handle_installation(self, request: AsgiHttpRequest) -> BoltResponse:
         return self.app.oauth_flow.handle_installation(  # type: ignore[union-attr]
-            BoltRequest(body=await request.get_raw_body(), query=request.query_string, headers=request.get_headers())
+            BoltRequest(body=await request.get_raw_body_bytes(), query=request.query_string, headers=request.get_headers())
         )
 
     async def handle_callback(self, request: AsgiHttpRequest) -> BoltResponse:
         return self.app.oauth_flow.handle_callback(  # type: ignore[union-attr]
-            BoltRequest(body=await request.get_raw_body(), query=request.query_string, headers=request.get_headers())
+            BoltRequest(body=await request.get_raw_body_bytes(), query=request.query_string, headers=request.get_headers())
         )
@@ -1,4 +1,4 @@
-from typing import Callable, Dict, Iterable, Sequence, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
 
 from .utils import scope_type, ENCODING
 
@@ -15,14 +15,18 @@ class AsgiHttpRequest:
         return {str(header[0], ENCODING): str(header[1], (ENCODING)) for header in self.raw_headers}
 
     async def get_raw_body(self) -> str:
-        chunks = bytearray()
+        return (await self.get_raw_body_bytes()).decode(ENCODING)
+
+    async def get_raw_body_bytes(self) -> bytes:
+        chunks: List[bytes] = []
         while True:
             chunk: Dict[str, Union[str, bytes]] = await self.receive()
 
             if chunk["type"] != "http.request":
                 raise Exception("Body chunks could not be received from asgi server")
 
-            chunks.extend(chunk.get("body", b""))  # type: ignore[arg-type]
+            chunks.append(chunk.get("body", b""))  # type: ignore[arg-type]
             if not chunk.get("more_body", False):
                 break
-        return bytes(chunks).decode(ENCODING)
+        # Most request bodies arrive in a single chunk, which is returned without copying
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
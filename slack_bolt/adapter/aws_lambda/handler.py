@@ -1,15 +1,17 @@
 import base64
 import logging
-from typing import Dict, Any, Sequence
+from typing import TYPE_CHECKING, Dict, Any, Sequence
 
 from slack_bolt.adapter.aws_lambda.internals import _first_value
 from slack_bolt.adapter.aws_lambda.lazy_listener_runner import LambdaLazyListenerRunner
 from slack_bolt.app import App
 from slack_bolt.logger import get_bolt_app_logger
-from slack_bolt.oauth import OAuthFlow
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
 
+if TYPE_CHECKING:
+    from slack_bolt.oauth import OAuthFlow
+
 
 class SlackRequestHandler:
     def __init__(self, app: App):
@@ -38,7 +40,7 @@ class SlackRequestHandler:
             return not_found()
         if method == "GET":
             if self.app.oauth_flow is not None:
-                oauth_flow: OAuthFlow = self.app.oauth_flow
+                oauth_flow: "OAuthFlow" = self.app.oauth_flow
                 bolt_req: BoltRequest = to_bolt_request(event)
                 query = bolt_req.query
                 is_callback = query is not None and (
@@ -73,7 +75,7 @@ class SlackRequestHandler:
 def to_bolt_request(event) -> BoltRequest:
     body = event.get("body", "")
     if event["isBase64Encoded"]:
-        body = base64.b64decode(body).decode("utf-8")
+        body = base64.b64decode(body)
     cookies: Sequence[str] = event.get("cookies", [])
     if cookies is None or len(cookies) == 0:
         # In the case of format v1
@@ -2,8 +2,6 @@ import json
 from logging import Logger
 from typing import Callable, Optional, Any
 
-import boto3  # type: ignore[import-untyped]
-
 from slack_bolt import BoltRequest
 from slack_bolt.lazy_listener import LazyListenerRunner
 
@@ -15,6 +13,9 @@ class LambdaLazyListenerRunner(LazyListenerRunner):
 
     def start(self, function: Callable[..., None], request: BoltRequest) -> None:
         if self.lambda_client is None:
+            # boto3 takes long to import; defer it until a lazy listener runs for the first time
+            import boto3  # type: ignore[import-untyped]
+
             self.lambda_client = boto3.client("lambda")
 
         event: dict = request.context["lambda_request"]
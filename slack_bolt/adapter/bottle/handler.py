@@ -7,11 +7,8 @@ from slack_bolt.response import BoltResponse
 
 
 def to_bolt_request(req: Request) -> BoltRequest:
-    body = req.body.read()
-    if isinstance(body, bytes):
-        body = body.decode("utf-8")
     return BoltRequest(
-        body=body,
+        body=req.body.read(),
         query=req.query_string,
         headers=req.headers,
     )
@@ -24,10 +24,8 @@ from slack_bolt.response import BoltResponse
 
 
 def to_bolt_request(req: HttpRequest) -> BoltRequest:
-    raw_body: bytes = req.body
-    body: str = raw_body.decode("utf-8") if raw_body else ""
     return BoltRequest(
-        body=body,
+        body=req.body,
         query=req.META["QUERY_STRING"],
         headers=req.headers,
     )
@@ -106,7 +104,7 @@ class DjangoThreadLazyListenerRunner(ThreadLazyListenerRunner):
             finally:
                 release_thread_local_connections(request.context.logger, "lazy-listener-completion")
 
-        self.executor.submit(wrapped_func)
+        self._submit(function, wrapped_func)
 
 
 class SlackRequestHandler:
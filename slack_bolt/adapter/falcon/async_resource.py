@@ -52,7 +52,7 @@ class AsyncSlackAppResource:
 
     async def _to_bolt_request(self, req: Request) -> AsyncBoltRequest:
         return AsyncBoltRequest(
-            body=(await req.stream.read(req.content_length or 0)).decode("utf-8"),
+            body=await req.stream.read(req.content_length or 0),
             query=req.query_string,
             headers={k.lower(): v for k, v in req.headers.items()},
         )
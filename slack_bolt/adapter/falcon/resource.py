@@ -46,7 +46,7 @@ class SlackAppResource:
 
     def _to_bolt_request(self, req: Request) -> BoltRequest:
         return BoltRequest(
-            body=req.stream.read(req.content_length or 0).decode("utf-8"),
+            body=req.stream.read(req.content_length or 0),
             query=req.query_string,
             headers={k.lower(): v for k, v in req.headers.items()},
         )
@@ -8,7 +8,7 @@ from slack_bolt.response import BoltResponse
 
 def to_bolt_request(req: Request) -> BoltRequest:
     return BoltRequest(
-        body=req.get_data(as_text=True),
+        body=req.get_data(),
         query=req.query_string.decode("utf-8"),
         headers=req.headers,  # type: ignore[arg-type]
     )
@@ -8,14 +8,8 @@ from slack_bolt.oauth import OAuthFlow
 
 
 def to_bolt_request(request: Request) -> BoltRequest:
-    body: str = ""
-    if request.body is not None:
-        if isinstance(request.body, bytes):
-            body = request.body.decode("utf-8")
-        else:
-            body = request.body
     bolt_req = BoltRequest(
-        body=body,
+        body=request.body if request.body is not None else "",
         query=request.query_string,
         headers=request.headers,
     )
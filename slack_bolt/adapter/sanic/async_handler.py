@@ -11,7 +11,7 @@ from slack_bolt.oauth.async_oauth_flow import AsyncOAuthFlow
 
 def to_async_bolt_request(req: Request, addition_context_properties: Optional[Dict[str, Any]] = None) -> AsyncBoltRequest:
     request = AsyncBoltRequest(
-        body=req.body.decode("utf-8"),
+        body=req.body,
         query=req.query_string,
         headers=req.headers,  # type: ignore[arg-type]
     )
@@ -12,12 +12,15 @@ from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode.async_base_handler import AsyncBaseSocketModeHandler
+from slack_bolt.adapter.socket_mode.async_dispatch_scheduler import AsyncDispatchScheduler
 from slack_bolt.adapter.socket_mode.async_internals import (
     send_async_response,
     run_async_bolt_app,
+    schedule_async_bolt_app,
 )
 from slack_bolt.adapter.socket_mode.internals import run_bolt_app
 from slack_bolt.app.async_app import AsyncApp
+from slack_bolt.logger.messages import warning_dispatch_scheduler_without_process_before_response
 from slack_bolt.response import BoltResponse
 
 
@@ -76,8 +79,12 @@ class AsyncSocketModeHandler(AsyncBaseSocketModeHandler):
         proxy: Optional[str] = None,
         ping_interval: float = 10,
         loop: Optional[AbstractEventLoop] = None,
+        dispatch_scheduler: Optional[AsyncDispatchScheduler] = None,
     ):
+        if dispatch_scheduler is not None and not app.process_before_response:
+            app.logger.warning(warning_dispatch_scheduler_without_process_before_response())
         self.app = app
+        self.dispatch_scheduler = dispatch_scheduler
         self.app_token = app_token or os.environ["SLACK_APP_TOKEN"]
         self.client = SocketModeClient(
             app_token=self.app_token,
@@ -91,5 +98,8 @@ class AsyncSocketModeHandler(AsyncBaseSocketModeHandler):
 
     async def handle(self, client: SocketModeClient, req: SocketModeRequest) -> None:  # type: ignore[override]
         start = time()
+        if self.dispatch_scheduler is not None:
+            schedule_async_bolt_app(self.dispatch_scheduler, self.app, client, req, start)
+            return
         bolt_resp: BoltResponse = await run_async_bolt_app(self.app, req)
         await send_async_response(client, req, bolt_resp, start)
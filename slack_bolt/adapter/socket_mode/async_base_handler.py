@@ -2,12 +2,13 @@
 
 import asyncio
 import logging
-from typing import Union
+from typing import Optional, Union
 
 from slack_sdk.socket_mode.async_client import AsyncBaseSocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
 
 from slack_bolt import App
+from slack_bolt.adapter.socket_mode.async_dispatch_scheduler import AsyncDispatchScheduler
 from slack_bolt.app.async_app import AsyncApp
 from slack_bolt.util.utils import get_boot_message
 
@@ -15,6 +16,7 @@ from slack_bolt.util.utils import get_boot_message
 class AsyncBaseSocketModeHandler:
     app: Union[App, AsyncApp]
     client: AsyncBaseSocketModeClient
+    dispatch_scheduler: Optional[AsyncDispatchScheduler] = None
 
     async def handle(self, client: AsyncBaseSocketModeClient, req: SocketModeRequest) -> None:
         """Handles Socket Mode envelope requests through a WebSocket connection.
@@ -35,6 +37,9 @@ class AsyncBaseSocketModeHandler:
 
     async def close_async(self):
         """Disconnects from the Socket Mode server and cleans the resources this instance holds up"""
+        if self.dispatch_scheduler is not None:
+            # Complete the envelopes waiting in the lanes while the connection is still available
+            await self.dispatch_scheduler.shutdown()
         await self.client.close()
 
     async def start_async(self):
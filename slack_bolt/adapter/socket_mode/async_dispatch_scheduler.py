@@ -0,0 +1,142 @@
+"""The asyncio-based scheduler that runs Socket Mode envelopes concurrently while keeping the order per channel.
+
+    from slack_bolt.async_app import AsyncApp
+    from slack_bolt.adapter.socket_mode.aiohttp import AsyncSocketModeHandler
+    from slack_bolt.adapter.socket_mode.async_dispatch_scheduler import AsyncDispatchScheduler
+
+    app = AsyncApp(process_before_response=True)
+    await AsyncSocketModeHandler(app, dispatch_scheduler=AsyncDispatchScheduler(lanes=20)).start_async()
+
+A lane runs `app.async_dispatch()`, which returns when ack() is called unless `process_before_response` is True.
+The rest of the listener runs in a separate task, so the lanes keep the order of only the acks in that case.
+Set `process_before_response=True` to run the whole listeners in order; the handler logs a warning otherwise.
+The handler submits an envelope without awaiting anything, so the submissions follow the order of arrival.
+"""
+
+import asyncio
+import itertools
+import time
+from logging import Logger
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from slack_bolt.adapter.socket_mode.dispatch_scheduler import DispatchSchedulerMetrics
+from slack_bolt.logger import get_bolt_logger
+from slack_bolt.request.async_request import AsyncBoltRequest
+
+
+def default_async_dispatch_key(request: AsyncBoltRequest) -> Optional[str]:
+    """Returns the channel ID of the request, so that the requests in the same channel are processed in order."""
+    return request.context.channel_id
+
+
+class AsyncDispatchScheduler:
+    lanes: int
+    max_lane_queue_size: int
+    key: Callable[[AsyncBoltRequest], Optional[str]]
+    metrics: DispatchSchedulerMetrics
+
+    def __init__(
+        self,
+        *,
+        lanes: int = 10,
+        max_lane_queue_size: int = 100,
+        key: Optional[Callable[[AsyncBoltRequest], Optional[str]]] = None,
+        metrics: Optional[DispatchSchedulerMetrics] = None,
+        logger: Optional[Logger] = None,
+    ):
+        """Runs Socket Mode envelopes on the ordered worker lanes, which are asyncio tasks.
+
+        This works in the same way as `DispatchScheduler`. The lane tasks start in the running event loop
+        when the first envelope is submitted.
+
+        Args:
+            lanes: The number of the worker lanes (Default: 10)
+            max_lane_queue_size: The max number of the envelopes waiting in a lane (Default: 100)
+            key: The function to return the ordering key of a request (Default: the channel ID);
+                e.g., `lambda req: req.context.thread_ts or req.context.channel_id` keeps the order per thread
+            metrics: The hooks to observe this scheduler
+            logger: The logger
+        """
+        if lanes < 1:
+            raise ValueError("lanes must be 1 or greater")
+        self.lanes = lanes
+        self.max_lane_queue_size = max_lane_queue_size
+        self.key = key or default_async_dispatch_key
+        self.metrics = metrics or DispatchSchedulerMetrics()
+        self.logger = logger or get_bolt_logger(AsyncDispatchScheduler)
+        self._round_robin = itertools.count()
+        self._shutdown = False
+        # asyncio.Queue must be created in the running event loop on Python 3.9 or older
+        self._queues: List["asyncio.Queue[Optional[Tuple[float, Callable[[], Awaitable[None]]]]]"] = []
+        self._tasks: List["asyncio.Task[None]"] = []
+
+    def lane_depths(self) -> List[int]:
+        """Returns the number of the envelopes waiting in each lane."""
+        if len(self._queues) == 0:
+            return [0] * self.lanes
+        return [q.qsize() for q in self._queues]
+
+    def lane_for(self, key: Optional[str]) -> int:
+        """Returns the index of the lane for the given key."""
+        if key is None:
+            return next(self._round_robin) % self.lanes
+        return hash(key) % self.lanes
+
+    def submit(self, request: AsyncBoltRequest, fn: Callable[[], Awaitable[None]]) -> bool:
+        """Schedules the processing of an envelope. This method must be called in the running event loop.
+
+        Args:
+            request: The request built from the envelope, which is passed to the key function
+            fn: The coroutine function to dispatch the request and to send the response
+
+        Returns:
+            False if the envelope is rejected due to the full lane or the shutdown
+        """
+        key = self.key(request)
+        lane = self.lane_for(key)
+        if not self._shutdown:
+            if len(self._queues) == 0:
+                self._start_lanes()
+            q = self._queues[lane]
+            try:
+                q.put_nowait((time.perf_counter(), fn))
+                self.metrics.record_lane_depth(lane=lane, depth=q.qsize())
+                return True
+            except asyncio.QueueFull:
+                pass
+        self.metrics.record_rejection(lane=lane, key=key)
+        return False
+
+    async def shutdown(self, wait: bool = True) -> None:
+        """Stops accepting new envelopes. The envelopes already in the lanes are processed.
+
+        Args:
+            wait: Waits until all the lanes complete the envelopes if True
+        """
+        self._shutdown = True
+        for q in self._queues:
+            # This waits for a free slot if the lane is full
+            await q.put(None)
+        if wait and len(self._tasks) > 0:
+            await asyncio.gather(*self._tasks)
+
+    def _start_lanes(self) -> None:
+        for lane in range(self.lanes):
+            q: "asyncio.Queue[Optional[Tuple[float, Callable[[], Awaitable[None]]]]]" = asyncio.Queue(
+                maxsize=self.max_lane_queue_size
+            )
+            self._queues.append(q)
+            self._tasks.append(asyncio.ensure_future(self._run_lane(lane, q)))
+
+    async def _run_lane(self, lane: int, q: "asyncio.Queue[Optional[Tuple[float, Callable[[], Awaitable[None]]]]]") -> None:
+        while True:
+            item = await q.get()
+            if item is None:
+                return
+            submitted_at, fn = item
+            self.metrics.record_lane_depth(lane=lane, depth=q.qsize())
+            self.metrics.record_queue_wait(lane=lane, seconds=time.perf_counter() - submitted_at)
+            try:
+                await fn()
+            except Exception as e:
+                self.logger.exception(f"Failed to process a Socket Mode envelope in lane {lane} (error: {e})")
@@ -1,6 +1,5 @@
 """Internal functions"""
 
-import json
 import logging
 from time import time
 
@@ -8,18 +7,43 @@ from slack_sdk.socket_mode.async_client import AsyncBaseSocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
 
+from slack_bolt.adapter.socket_mode.async_dispatch_scheduler import AsyncDispatchScheduler
 from slack_bolt.adapter.socket_mode.internals import build_headers
 from slack_bolt.app.async_app import AsyncApp
 from slack_bolt.request.async_request import AsyncBoltRequest
 from slack_bolt.response import BoltResponse
+from slack_bolt.util.json_codec import json_loads
+
+
+def build_async_bolt_request(req: SocketModeRequest) -> AsyncBoltRequest:
+    return AsyncBoltRequest(mode="socket_mode", body=req.payload, headers=build_headers(req))
 
 
 async def run_async_bolt_app(app: AsyncApp, req: SocketModeRequest):
-    bolt_req: AsyncBoltRequest = AsyncBoltRequest(mode="socket_mode", body=req.payload, headers=build_headers(req))
+    bolt_req: AsyncBoltRequest = build_async_bolt_request(req)
     bolt_resp: BoltResponse = await app.async_dispatch(bolt_req)
     return bolt_resp
 
 
+def schedule_async_bolt_app(
+    scheduler: AsyncDispatchScheduler,
+    app: AsyncApp,
+    client: AsyncBaseSocketModeClient,
+    req: SocketModeRequest,
+    start_time: float,
+) -> None:
+    bolt_req: AsyncBoltRequest = build_async_bolt_request(req)
+
+    async def process() -> None:
+        bolt_resp: BoltResponse = await app.async_dispatch(bolt_req)
+        await send_async_response(client, req, bolt_resp, start_time)
+
+    if not scheduler.submit(bolt_req, process):
+        client.logger.warning(
+            f"Skipped a Socket Mode envelope as the dispatch lane is full (envelope_id: {req.envelope_id})"
+        )
+
+
 async def send_async_response(
     client: AsyncBaseSocketModeClient,
     req: SocketModeRequest,
@@ -31,7 +55,7 @@ async def send_async_response(
         if bolt_resp.body is None or len(bolt_resp.body) == 0:
             await client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
         elif content_type.startswith("application/json"):
-            dict_body = json.loads(bolt_resp.body)
+            dict_body = json_loads(bolt_resp.body)
             await client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id, payload=dict_body))
         else:
             await client.send_socket_mode_response(
@@ -6,17 +6,20 @@ import logging
 import signal
 import sys
 from threading import Event
+from typing import Optional
 
 from slack_sdk.socket_mode.client import BaseSocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
 
 from slack_bolt import App
+from slack_bolt.adapter.socket_mode.dispatch_scheduler import DispatchScheduler
 from slack_bolt.util.utils import get_boot_message
 
 
 class BaseSocketModeHandler:
     app: App
     client: BaseSocketModeClient
+    dispatch_scheduler: Optional[DispatchScheduler] = None
 
     def handle(self, client: BaseSocketModeClient, req: SocketModeRequest) -> None:
         """Handles Socket Mode envelope requests through a WebSocket connection.
@@ -37,6 +40,9 @@ class BaseSocketModeHandler:
 
     def close(self):
         """Disconnects from the Socket Mode server and cleans the resources this instance holds up"""
+        if self.dispatch_scheduler is not None:
+            # Complete the envelopes waiting in the lanes while the connection is still available
+            self.dispatch_scheduler.shutdown()
         self.client.close()
 
     def start(self):
@@ -11,7 +11,13 @@ from slack_sdk.socket_mode.builtin import SocketModeClient
 
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode.base_handler import BaseSocketModeHandler
-from slack_bolt.adapter.socket_mode.internals import run_bolt_app, send_response
+from slack_bolt.adapter.socket_mode.dispatch_scheduler import DispatchScheduler
+from slack_bolt.adapter.socket_mode.internals import run_bolt_app, schedule_bolt_app, send_response
+from slack_bolt.error import BoltError
+from slack_bolt.logger.messages import (
+    error_dispatch_scheduler_concurrency,
+    warning_dispatch_scheduler_without_process_before_response,
+)
 from slack_bolt.response import BoltResponse
 
 
@@ -34,7 +40,8 @@ class SocketModeHandler(BaseSocketModeHandler):
         ping_pong_trace_enabled: bool = False,
         ping_interval: float = 10,
         receive_buffer_size: int = 1024,
-        concurrency: int = 10,
+        concurrency: Optional[int] = None,
+        dispatch_scheduler: Optional[DispatchScheduler] = None,
     ):
         """Socket Mode adapter for Bolt apps
 
@@ -51,9 +58,19 @@ class SocketModeHandler(BaseSocketModeHandler):
             ping_pong_trace_enabled: True if trace-logging for all ping-pong communications
             ping_interval: The ping-pong internal (seconds)
             receive_buffer_size: The data length for a single socket recv operation
-            concurrency: The size of the underlying thread pool
+            concurrency: The size of the underlying thread pool (Default: 10, or 1 when dispatch_scheduler is given)
+            dispatch_scheduler: The scheduler to process the envelopes on the ordered lanes
+                (Default: None, which processes them in the thread pool without ordering);
+                concurrency must be 1 with a scheduler so that the envelopes are submitted in the order of arrival
         """
+        if dispatch_scheduler is not None:
+            if concurrency is not None and concurrency > 1:
+                raise BoltError(error_dispatch_scheduler_concurrency(concurrency))
+            concurrency = 1
+            if not app.process_before_response:
+                app.logger.warning(warning_dispatch_scheduler_without_process_before_response())
         self.app = app
+        self.dispatch_scheduler = dispatch_scheduler
         self.app_token = app_token or os.environ["SLACK_APP_TOKEN"]
         self.client = SocketModeClient(
             app_token=self.app_token,
@@ -67,11 +84,14 @@ class SocketModeHandler(BaseSocketModeHandler):
             ping_pong_trace_enabled=ping_pong_trace_enabled,
             ping_interval=ping_interval,
             receive_buffer_size=receive_buffer_size,
-            concurrency=concurrency,
+            concurrency=concurrency if concurrency is not None else 10,
         )
         self.client.socket_mode_request_listeners.append(self.handle)  # type: ignore[arg-type]
 
     def handle(self, client: SocketModeClient, req: SocketModeRequest) -> None:  # type: ignore[override]
         start = time()
+        if self.dispatch_scheduler is not None:
+            schedule_bolt_app(self.dispatch_scheduler, self.app, client, req, start)
+            return
         bolt_resp: BoltResponse = run_bolt_app(self.app, req)
         send_response(client, req, bolt_resp, start)
@@ -0,0 +1,177 @@
+"""The scheduler that runs Socket Mode envelopes concurrently while keeping the order per channel.
+
+    from slack_bolt import App
+    from slack_bolt.adapter.socket_mode import SocketModeHandler
+    from slack_bolt.adapter.socket_mode.dispatch_scheduler import DispatchScheduler
+
+    app = App(process_before_response=True)
+    SocketModeHandler(app, dispatch_scheduler=DispatchScheduler(lanes=20)).start()
+
+A lane runs `app.dispatch()`, which returns when ack() is called unless `process_before_response` is True.
+The rest of the listener runs in the app's listener executor, so the lanes keep the order of only the acks in that case.
+Set `process_before_response=True` to run the whole listeners in order; the handler logs a warning otherwise.
+The handler runs the underlying client with `concurrency=1`, so that the envelopes are submitted in the order of arrival.
+"""
+
+import itertools
+import time
+from logging import Logger
+from queue import Full, Queue
+from threading import Thread
+from typing import Callable, List, Optional, Tuple
+
+from slack_bolt.logger import get_bolt_logger
+from slack_bolt.request import BoltRequest
+
+
+class DispatchSchedulerMetrics:
+    """The hooks to observe `DispatchScheduler` and `AsyncDispatchScheduler`. All the methods do nothing by default,
+    so that you can override only the ones you need. The methods are called on the request-handling path,
+    so the implementation must be thread-safe and must not block.
+    """
+
+    def record_lane_depth(self, *, lane: int, depth: int) -> None:
+        """Records the number of the envelopes waiting in a lane whenever one is enqueued or dequeued.
+
+        Args:
+            lane: The index of the lane
+            depth: The number of the envelopes waiting in the lane (excluding the running one)
+        """
+        pass
+
+    def record_queue_wait(self, *, lane: int, seconds: float) -> None:
+        """Records the duration between the submission of an envelope and the beginning of its processing.
+
+        Args:
+            lane: The index of the lane
+            seconds: The queue wait time in seconds
+        """
+        pass
+
+    def record_rejection(self, *, lane: int, key: Optional[str]) -> None:
+        """Records an envelope rejected due to the full lane.
+
+        Args:
+            lane: The index of the lane
+            key: The key of the envelope
+        """
+        pass
+
+
+def default_dispatch_key(request: BoltRequest) -> Optional[str]:
+    """Returns the channel ID of the request, so that the requests in the same channel are processed in order."""
+    return request.context.channel_id
+
+
+class DispatchScheduler:
+    lanes: int
+    max_lane_queue_size: int
+    key: Callable[[BoltRequest], Optional[str]]
+    metrics: DispatchSchedulerMetrics
+
+    def __init__(
+        self,
+        *,
+        lanes: int = 10,
+        max_lane_queue_size: int = 100,
+        key: Optional[Callable[[BoltRequest], Optional[str]]] = None,
+        metrics: Optional[DispatchSchedulerMetrics] = None,
+        logger: Optional[Logger] = None,
+        thread_name_prefix: str = "slack_bolt_socket_mode_lane",
+    ):
+        """Runs Socket Mode envelopes on the ordered worker lanes.
+
+        An envelope goes to the lane chosen by its key, and each lane is a single thread processing the envelopes
+        one by one. Thus, the envelopes with the same key are processed in the order of arrival,
+        while the ones with different keys can be processed concurrently.
+        The envelopes without a key are distributed to the lanes in a round-robin manner.
+
+        When the queue of a lane is full, the envelope is rejected and is not acknowledged;
+        Slack retries the delivery of Events API payloads in the case.
+
+        Args:
+            lanes: The number of the worker lanes (Default: 10)
+            max_lane_queue_size: The max number of the envelopes waiting in a lane (Default: 100)
+            key: The function to return the ordering key of a request (Default: the channel ID);
+                e.g., `lambda req: req.context.thread_ts or req.context.channel_id` keeps the order per thread
+            metrics: The hooks to observe this scheduler
+            logger: The logger
+            thread_name_prefix: The name prefix of the lane threads
+        """
+        if lanes < 1:
+            raise ValueError("lanes must be 1 or greater")
+        self.lanes = lanes
+        self.max_lane_queue_size = max_lane_queue_size
+        self.key = key or default_dispatch_key
+        self.metrics = metrics or DispatchSchedulerMetrics()
+        self.logger = logger or get_bolt_logger(DispatchScheduler)
+        self._round_robin = itertools.count()
+        self._shutdown = False
+        self._queues: List["Queue[Optional[Tuple[float, Callable[[], None]]]]"] = []
+        self._threads: List[Thread] = []
+        for lane in range(lanes):
+            q: "Queue[Optional[Tuple[float, Callable[[], None]]]]" = Queue(maxsize=max_lane_queue_size)
+            thread = Thread(target=self._run_lane, args=(lane, q), name=f"{thread_name_prefix}_{lane}", daemon=True)
+            self._queues.append(q)
+            self._threads.append(thread)
+            thread.start()
+
+    def lane_depths(self) -> List[int]:
+        """Returns the number of the envelopes waiting in each lane."""
+        return [q.qsize() for q in self._queues]
+
+    def lane_for(self, key: Optional[str]) -> int:
+        """Returns the index of the lane for the given key."""
+        if key is None:
+            return next(self._round_robin) % self.lanes
+        return hash(key) % self.lanes
+
+    def submit(self, request: BoltRequest, fn: Callable[[], None]) -> bool:
+        """Schedules the processing of an envelope.
+
+        Args:
+            request: The request built from the envelope, which is passed to the key function
+            fn: The function to dispatch the request and to send the response
+
+        Returns:
+            False if the envelope is rejected due to the full lane or the shutdown
+        """
+        key = self.key(request)
+        lane = self.lane_for(key)
+        q = self._queues[lane]
+        if not self._shutdown:
+            try:
+                q.put_nowait((time.perf_counter(), fn))
+                self.metrics.record_lane_depth(lane=lane, depth=q.qsize())
+                return True
+            except Full:
+                pass
+        self.metrics.record_rejection(lane=lane, key=key)
+        return False
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops accepting new envelopes. The envelopes already in the lanes are processed.
+
+        Args:
+            wait: Blocks until all the lanes complete the envelopes if True
+        """
+        self._shutdown = True
+        for q in self._queues:
+            # This waits for a free slot if the lane is full
+            q.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _run_lane(self, lane: int, q: "Queue[Optional[Tuple[float, Callable[[], None]]]]") -> None:
+        while True:
+            item = q.get()
+            if item is None:
+                return
+            submitted_at, fn = item
+            self.metrics.record_lane_depth(lane=lane, depth=q.qsize())
+            self.metrics.record_queue_wait(lane=lane, seconds=time.perf_counter() - submitted_at)
+            try:
+                fn()
+            except Exception as e:
+                self.logger.exception(f"Failed to process a Socket Mode envelope in lane {lane} (error: {e})")
@@ -1,6 +1,5 @@
 """Internal functions"""
 
-import json
 import logging
 from time import time
 from typing import Dict, Optional, Sequence, Union
@@ -9,9 +8,11 @@ from slack_sdk.socket_mode.client import BaseSocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
 
+from slack_bolt.adapter.socket_mode.dispatch_scheduler import DispatchScheduler
 from slack_bolt.app import App
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
+from slack_bolt.util.json_codec import json_loads
 
 
 def build_headers(req: SocketModeRequest) -> Optional[Dict[str, Union[str, Sequence[str]]]]:
@@ -24,12 +25,35 @@ def build_headers(req: SocketModeRequest) -> Optional[Dict[str, Union[str, Seque
     return headers or None
 
 
+def build_bolt_request(req: SocketModeRequest) -> BoltRequest:
+    return BoltRequest(mode="socket_mode", body=req.payload, headers=build_headers(req))
+
+
 def run_bolt_app(app: App, req: SocketModeRequest):
-    bolt_req: BoltRequest = BoltRequest(mode="socket_mode", body=req.payload, headers=build_headers(req))
+    bolt_req: BoltRequest = build_bolt_request(req)
     bolt_resp: BoltResponse = app.dispatch(bolt_req)
     return bolt_resp
 
 
+def schedule_bolt_app(
+    scheduler: DispatchScheduler,
+    app: App,
+    client: BaseSocketModeClient,
+    req: SocketModeRequest,
+    start_time: float,
+) -> None:
+    bolt_req: BoltRequest = build_bolt_request(req)
+
+    def process() -> None:
+        bolt_resp: BoltResponse = app.dispatch(bolt_req)
+        send_response(client, req, bolt_resp, start_time)
+
+    if not scheduler.submit(bolt_req, process):
+        client.logger.warning(
+            f"Skipped a Socket Mode envelope as the dispatch lane is full (envelope_id: {req.envelope_id})"
+        )
+
+
 def send_response(
     client: BaseSocketModeClient,
     req: SocketModeRequest,
@@ -41,7 +65,7 @@ def send_response(
         if bolt_resp.body is None or len(bolt_resp.body) == 0:
             client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
         elif content_type.startswith("application/json"):
-            dict_body = json.loads(bolt_resp.body)
+            dict_body = json_loads(bolt_resp.body)
             client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id, payload=dict_body))
         else:
             client.send_socket_mode_response(
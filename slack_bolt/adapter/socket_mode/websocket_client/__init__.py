@@ -11,7 +11,13 @@ from slack_sdk.socket_mode.websocket_client import SocketModeClient
 
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode.base_handler import BaseSocketModeHandler
-from slack_bolt.adapter.socket_mode.internals import run_bolt_app, send_response
+from slack_bolt.adapter.socket_mode.dispatch_scheduler import DispatchScheduler
+from slack_bolt.adapter.socket_mode.internals import run_bolt_app, schedule_bolt_app, send_response
+from slack_bolt.error import BoltError
+from slack_bolt.logger.messages import (
+    error_dispatch_scheduler_concurrency,
+    warning_dispatch_scheduler_without_process_before_response,
+)
 from slack_bolt.response import BoltResponse
 
 
@@ -27,12 +33,13 @@ class SocketModeHandler(BaseSocketModeHandler):
         logger: Optional[Logger] = None,
         web_client: Optional[WebClient] = None,
         ping_interval: float = 10,
-        concurrency: int = 10,
+        concurrency: Optional[int] = None,
         http_proxy_host: Optional[str] = None,
         http_proxy_port: Optional[int] = None,
         http_proxy_auth: Optional[Tuple[str, str]] = None,
         proxy_type: Optional[str] = None,
         trace_enabled: bool = False,
+        dispatch_scheduler: Optional[DispatchScheduler] = None,
     ):
         """Socket Mode adapter for Bolt apps
 
@@ -42,21 +49,31 @@ class SocketModeHandler(BaseSocketModeHandler):
             logger: Custom logger
             web_client: custom `slack_sdk.web.WebClient` instance
             ping_interval: The ping-pong internal (seconds)
-            concurrency: The size of the underlying thread pool
+            concurrency: The size of the underlying thread pool (Default: 10, or 1 when dispatch_scheduler is given)
             http_proxy_host: HTTP proxy host
             http_proxy_port: HTTP proxy port
             http_proxy_auth: HTTP proxy authentication (username, password)
             proxy_type: Proxy type
             trace_enabled: True if trace-level logging is enabled
+            dispatch_scheduler: The scheduler to process the envelopes on the ordered lanes
+                (Default: None, which processes them in the thread pool without ordering);
+                concurrency must be 1 with a scheduler so that the envelopes are submitted in the order of arrival
         """
+        if dispatch_scheduler is not None:
+            if concurrency is not None and concurrency > 1:
+                raise BoltError(error_dispatch_scheduler_concurrency(concurrency))
+            concurrency = 1
+            if not app.process_before_response:
+                app.logger.warning(warning_dispatch_scheduler_without_process_before_response())
         self.app = app
+        self.dispatch_scheduler = dispatch_scheduler
         self.app_token = app_token or os.environ["SLACK_APP_TOKEN"]
         self.client = SocketModeClient(
             app_token=self.app_token,
             logger=logger if logger is not None else app.logger,
             web_client=web_client if web_client is not None else app.client,
             ping_interval=ping_interval,
-            concurrency=concurrency,
+            concurrency=concurrency if concurrency is not None else 10,
             http_proxy_host=http_proxy_host,
             http_proxy_port=http_proxy_port,
             http_proxy_auth=http_proxy_auth,
@@ -67,5 +84,8 @@ class SocketModeHandler(BaseSocketModeHandler):
 
     def handle(self, client: SocketModeClient, req: SocketModeRequest) -> None:  # type: ignore[override]
         start = time()
+        if self.dispatch_scheduler is not None:
+            schedule_bolt_app(self.dispatch_scheduler, self.app, client, req, start)
+            return
         bolt_resp: BoltResponse = run_bolt_app(self.app, req)
         send_response(client, req, bolt_resp, start)
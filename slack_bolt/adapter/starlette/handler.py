@@ -13,7 +13,7 @@ def to_bolt_request(
     addition_context_properties: Optional[Dict[str, Any]] = None,
 ) -> BoltRequest:
     request = BoltRequest(
-        body=body.decode("utf-8"),
+        body=body,
         query=req.query_params,  # type: ignore[arg-type]
         headers=req.headers,  # type: ignore[arg-type]
     )
@@ -38,7 +38,7 @@ class AsyncSlackOAuthHandler(RequestHandler):
 
 def to_async_bolt_request(req: HTTPServerRequest) -> AsyncBoltRequest:
     return AsyncBoltRequest(
-        body=req.body.decode("utf-8") if req.body else "",
+        body=req.body if req.body else "",
         query=req.query,
         headers=req.headers,  # type: ignore[arg-type]
     )
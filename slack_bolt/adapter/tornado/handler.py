@@ -39,7 +39,7 @@ class SlackOAuthHandler(RequestHandler):
 
 def to_bolt_request(req: HTTPServerRequest) -> BoltRequest:
     return BoltRequest(
-        body=req.body.decode("utf-8") if req.body else "",
+        body=req.body if req.body else "",
         query=req.query,
         headers=req.headers,  # type: ignore[arg-type]
     )
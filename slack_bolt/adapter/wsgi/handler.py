@@ -40,17 +40,17 @@ class SlackRequestHandler:
 
     def dispatch(self, request: WsgiHttpRequest) -> BoltResponse:
         return self.app.dispatch(
-            BoltRequest(body=request.get_body(), query=request.query_string, headers=request.get_headers())
+            BoltRequest(body=request.get_body_bytes(), query=request.query_string, headers=request.get_headers())
         )
 
     def handle_installation(self, request: WsgiHttpRequest) -> BoltResponse:
         return self.app.oauth_flow.handle_installation(  # type: ignore[union-attr]
-            BoltRequest(body=request.get_body(), query=request.query_string, headers=request.get_headers())
+            BoltRequest(body=request.get_body_bytes(), query=request.query_string, headers=request.get_headers())
         )
 
     def handle_callback(self, request: WsgiHttpRequest) -> BoltResponse:
         return self.app.oauth_flow.handle_callback(  # type: ignore[union-attr]
-            BoltRequest(body=request.get_body(), query=request.query_string, headers=request.get_headers())
+            BoltRequest(body=request.get_body_bytes(), query=request.query_string, headers=request.get_headers())
         )
 
     def _get_http_response(self, request: WsgiHttpRequest) -> WsgiHttpResponse:
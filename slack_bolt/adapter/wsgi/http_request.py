@@ -34,7 +34,10 @@ class WsgiHttpRequest:
         return headers
 
     def get_body(self) -> str:
+        return self.get_body_bytes().decode(ENCODING)
+
+    def get_body_bytes(self) -> bytes:
         if "wsgi.input" not in self.environ:
-            return ""
+            return b""
         content_length = int(self.environ.get("CONTENT_LENGTH") or 0)
-        return self.environ["wsgi.input"].read(content_length).decode(ENCODING)
+        return self.environ["wsgi.input"].read(content_length)
@@ -1,13 +1,10 @@
 import inspect
-import json
 import logging
 import os
 import time
 import warnings
 from concurrent.futures import Executor
-from concurrent.futures.thread import ThreadPoolExecutor
-from http.server import SimpleHTTPRequestHandler, HTTPServer
-from typing import List, Union, Pattern, Callable, Dict, Optional, Sequence, Any
+from typing import TYPE_CHECKING, List, Union, Pattern, Callable, Dict, Optional, Sequence, Any
 
 from slack_sdk.errors import SlackApiError
 from slack_sdk.oauth.installation_store import InstallationStore
@@ -19,6 +16,8 @@ from slack_bolt.authorization.authorize import (
     InstallationStoreAuthorize,
     CallableAuthorize,
 )
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
+from slack_bolt.authorization.token_rotation_scheduler import TokenRotationScheduler
 
 from slack_bolt.context.assistant.thread_context_store.store import AssistantThreadContextStore
 
@@ -31,13 +30,16 @@ from slack_bolt.listener.listener_start_handler import DefaultListenerStartHandl
 from slack_bolt.listener.listener_completion_handler import (
     DefaultListenerCompletionHandler,
 )
+from slack_bolt.listener.listener_executor import ListenerExecutor
 from slack_bolt.listener.listener_error_handler import (
     DefaultListenerErrorHandler,
     CustomListenerErrorHandler,
 )
+from slack_bolt.listener.routing_index import ListenerRoutingIndex
 from slack_bolt.listener.thread_runner import ThreadListenerRunner
 from slack_bolt.listener_matcher import CustomListenerMatcher
 from slack_bolt.listener_matcher import builtins as builtin_matchers
+from slack_bolt.listener_matcher.builtins import BuiltinListenerMatcher
 from slack_bolt.listener_matcher.listener_matcher import ListenerMatcher
 from slack_bolt.logger import get_bolt_app_logger, get_bolt_logger
 from slack_bolt.logger.messages import (
@@ -48,11 +50,13 @@ from slack_bolt.logger.messages import (
     error_token_required,
     warning_unhandled_request,
     debug_checking_listener,
-    debug_applying_middleware,
     debug_running_listener,
     error_unexpected_listener_middleware,
     error_client_invalid_type,
     error_authorize_conflicts,
+    error_background_token_rotation_unavailable,
+    error_authorize_options_conflicts,
+    error_middleware_metrics_conflicts,
     warning_bot_only_conflicts,
     debug_return_listener_middleware_response,
     info_default_oauth_settings_loaded,
@@ -71,7 +75,8 @@ from slack_bolt.middleware import (
     AttachingFunctionToken,
     AttachingConversationKwargs,
 )
-from slack_bolt.middleware.assistant import Assistant
+from slack_bolt.middleware.middleware_chain import MiddlewareChain
+from slack_bolt.util.phase_observer import MiddlewareMetrics, PhaseObserver
 from slack_bolt.middleware.message_listener_matches import MessageListenerMatches
 from slack_bolt.middleware.middleware_error_handler import (
     DefaultMiddlewareErrorHandler,
@@ -79,18 +84,24 @@ from slack_bolt.middleware.middleware_error_handler import (
     MiddlewareErrorHandler,
 )
 from slack_bolt.middleware.url_verification import UrlVerification
-from slack_bolt.oauth import OAuthFlow
-from slack_bolt.oauth.internals import select_consistent_installation_store
-from slack_bolt.oauth.oauth_settings import OAuthSettings
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
+from slack_bolt.util.web_client_pool import WebClientPool
+from slack_bolt.util.json_codec import json_dumps
 from slack_bolt.util.utils import (
     create_web_client,
     get_boot_message,
     get_name_for_callable,
 )
-from slack_bolt.workflows.step import WorkflowStep, WorkflowStepMiddleware
-from slack_bolt.workflows.step.step import WorkflowStepBuilder
+
+# The rarely used subsystems (OAuth, assistant, steps from apps, and the development server)
+# are imported when they are used for the first time, which shortens the cold start on FaaS.
+if TYPE_CHECKING:
+    from slack_bolt.middleware.assistant import Assistant
+    from slack_bolt.oauth import OAuthFlow
+    from slack_bolt.oauth.oauth_settings import OAuthSettings
+    from slack_bolt.workflows.step import WorkflowStep
+    from slack_bolt.workflows.step.step import WorkflowStepBuilder
 
 
 class App:
@@ -117,6 +128,15 @@ class App:
         installation_store: Optional[InstallationStore] = None,
         # for either only bot scope usage or v1.0.x compatibility
         installation_store_bot_only: Optional[bool] = None,
+        # for customizing the authorize built with installation_store
+        authorize_result_cache: Optional[AuthorizeResultCache] = None,
+        single_flight_enabled: Optional[bool] = None,
+        auth_test_mode: Optional[str] = None,
+        auth_test_verification_interval_seconds: Optional[float] = None,
+        # Rotates expiring tokens off the request path
+        background_token_rotation_enabled: bool = False,
+        # for single-workspace apps
+        auth_test_refresh_interval_seconds: Optional[float] = None,
         # for customizing the built-in middleware
         request_verification_enabled: bool = True,
         ignoring_self_events_enabled: bool = True,
@@ -125,8 +145,8 @@ class App:
         url_verification_enabled: bool = True,
         attaching_function_token_enabled: bool = True,
         # for the OAuth flow
-        oauth_settings: Optional[OAuthSettings] = None,
-        oauth_flow: Optional[OAuthFlow] = None,
+        oauth_settings: Optional["OAuthSettings"] = None,
+        oauth_flow: Optional["OAuthFlow"] = None,
         # No need to set (the value is used only in response to ssl_check requests)
         verification_token: Optional[str] = None,
         # Set this one only when you want to customize the executor
@@ -134,6 +154,10 @@ class App:
         # for AI Agents & Assistants
         assistant_thread_context_store: Optional[AssistantThreadContextStore] = None,
         attaching_conversation_kwargs_enabled: bool = True,
+        # Set this one only when you want to reuse the WebClient instances across requests
+        web_client_pool_size: Optional[int] = None,
+        middleware_metrics: Optional[MiddlewareMetrics] = None,
+        phase_observer: Optional[PhaseObserver] = None,
     ):
         """Bolt App that provides functionalities to register middleware/listeners.
 
@@ -179,6 +203,23 @@ class App:
                 when the app is installed but the installation is not managed by this app's installation store
             installation_store: The module offering save/find operations of installation data
             installation_store_bot_only: Use `InstallationStore#find_bot()` if True (Default: False)
+            authorize_result_cache: Set `AuthorizeResultCache` if you would like to cache the authorize results
+                in memory and to customize the cache size and TTLs (Default: None, which disables the cache).
+                This option and the following three apply to the `authorize` built with `installation_store`;
+                set them in `OAuthSettings` instead when the `authorize` is built from the OAuth settings
+            single_flight_enabled: Set False if you would like concurrent requests for the same user/workspace
+                to load the installation on their own (Default: True)
+            auth_test_mode: "always" calls `auth.test` API for every authorize result built from the installation store,
+                while "fallback" calls it only when the stored data lacks fields such as bot_user_id (Default: "always")
+            auth_test_verification_interval_seconds: The interval in seconds to verify the tokens with `auth.test` API
+                even when auth_test_mode is "fallback" (Default: None, which never verifies them)
+            background_token_rotation_enabled: True if you would like to refresh the expiring tokens of
+                the installations seen by the app in a background thread instead of doing so while handling requests.
+                This requires token rotation settings (client_id/client_secret) for the installation store
+                (Default: False)
+            auth_test_refresh_interval_seconds: The interval in seconds to call `auth.test` API again
+                in a single-workspace app, so that changes such as newly granted scopes are reflected
+                without restarting the app (Default: never; it's refreshed only on token revocation events)
             request_verification_enabled: False if you would like to disable the built-in middleware (Default: True).
                 `RequestVerification` is a built-in middleware that verifies the signature in HTTP Mode requests.
                 Make sure if it's safe enough when you turn a built-in middleware off.
@@ -203,10 +244,21 @@ class App:
             oauth_settings: The settings related to Slack app installation flow (OAuth flow)
             oauth_flow: Instantiated `slack_bolt.oauth.OAuthFlow`. This is always prioritized over oauth_settings.
             verification_token: Deprecated verification mechanism. This can be used only for ssl_check requests.
-            listener_executor: Custom executor to run background tasks. If absent, the default `ThreadPoolExecutor` will
-                be used.
+            listener_executor: Custom executor to run background tasks. If absent, the default `ListenerExecutor` will
+                be used, which runs 5 worker threads as the previous default `ThreadPoolExecutor` did.
+                Pass a `ListenerExecutor` with your own settings to configure the number of workers,
+                the queue size, the per-listener concurrency limits, and the metrics hooks.
             assistant_thread_context_store: Custom AssistantThreadContext store (Default: the built-in implementation,
                 which uses a parent message's metadata to store the latest context)
+            web_client_pool_size: The max number of `WebClient` instances to reuse across requests.
+                If set, the app keeps a bounded LRU pool of the instances keyed by (token, team_id)
+                instead of creating a new instance for every request (Default: None, which means no pooling).
+                Note that the token of a pooled instance cannot be modified; replace `context.client` instead.
+            middleware_metrics: The hooks to measure the time spent in each global middleware.
+                `PhaseObserver` implements these hooks as well, so pass either this or phase_observer
+            phase_observer: The observer notified of the time spent in each phase of handling a request,
+                such as global middleware, listener matching, listener middleware, and listener functions
+                (Default: None, which means no time measurement)
         """
         if signing_secret is None:
             signing_secret = os.environ.get("SLACK_SIGNING_SECRET", "")
@@ -222,6 +274,11 @@ class App:
         # The framework logger is supposed to be used for the internal logging.
         # Also, it's accessible via `app.logger` as the app's singleton logger.
         self._framework_logger = logger or get_bolt_logger(App)
+        # The logger passed to listeners as `logger` is configured here only once.
+        # As get_bolt_app_logger() caches it, the per-request lookup in _init_context() does not
+        # acquire the logging module lock; only the level and the disabled flag are synchronized with the base logger.
+        # Call slack_bolt.logger.clear_logger_cache() after changing the handlers or filters of the base logger.
+        get_bolt_app_logger(app_name=self._name, base_logger=self._base_logger)
         self._raise_error_for_unhandled_request = raise_error_for_unhandled_request
 
         self._token: Optional[str] = token
@@ -240,6 +297,10 @@ class App:
                 logger=self._framework_logger,
             )
 
+        self._web_client_pool: Optional[WebClientPool] = None
+        if web_client_pool_size is not None:
+            self._web_client_pool = WebClientPool(template=self._client, max_size=web_client_pool_size)
+
         # --------------------------------------
         # Authorize & OAuthFlow initialization
         # --------------------------------------
@@ -268,6 +329,18 @@ class App:
                     raise BoltError(error_authorize_conflicts())
                 self._authorize = CallableAuthorize(logger=self._framework_logger, func=authorize)
 
+        # The options for the installation store based authorize, which are given in the top-level arguments
+        authorize_options: Dict[str, Any] = {
+            name: value
+            for name, value in {
+                "authorize_result_cache": authorize_result_cache,
+                "single_flight_enabled": single_flight_enabled,
+                "auth_test_mode": auth_test_mode,
+                "auth_test_verification_interval_seconds": auth_test_verification_interval_seconds,
+            }.items()
+            if value is not None
+        }
+
         self._installation_store: Optional[InstallationStore] = installation_store
         if self._installation_store is not None and self._authorize is None:
             settings = oauth_flow.settings if oauth_flow is not None else oauth_settings
@@ -279,23 +352,32 @@ class App:
                 bot_only=installation_store_bot_only or False,
                 client=self._client,  # for proxy use cases etc.
                 user_token_resolution=(settings.user_token_resolution if settings is not None else "authed_user"),
+                **authorize_options,
             )
+        elif (
+            len(authorize_options) > 0 and self._authorize is None and (oauth_settings is not None or oauth_flow is not None)
+        ):
+            raise BoltError(error_authorize_options_conflicts())
 
-        self._oauth_flow: Optional[OAuthFlow] = None
+        self._oauth_flow: Optional["OAuthFlow"] = None
 
         if (
             oauth_settings is None
             and os.environ.get("SLACK_CLIENT_ID") is not None
             and os.environ.get("SLACK_CLIENT_SECRET") is not None
         ):
+            from slack_bolt.oauth.oauth_settings import OAuthSettings
+
             # initialize with the default settings
-            oauth_settings = OAuthSettings()
+            oauth_settings = OAuthSettings(**authorize_options)
 
             if oauth_flow is None and installation_store is None:
                 # show info-level log for avoiding confusions
                 self._framework_logger.info(info_default_oauth_settings_loaded())
 
         if oauth_flow is not None:
+            from slack_bolt.oauth.internals import select_consistent_installation_store
+
             self._oauth_flow = oauth_flow
             installation_store = select_consistent_installation_store(
                 client_id=self._oauth_flow.client_id,
@@ -312,6 +394,9 @@ class App:
             if self._authorize is None:
                 self._authorize = self._oauth_flow.settings.authorize
         elif oauth_settings is not None:
+            from slack_bolt.oauth import OAuthFlow
+            from slack_bolt.oauth.internals import select_consistent_installation_store
+
             installation_store = select_consistent_installation_store(
                 client_id=oauth_settings.client_id,
                 app_store=self._installation_store,
@@ -339,19 +424,47 @@ class App:
                 self._oauth_flow.settings.installation_store_bot_only = app_bot_only
                 self._authorize.bot_only = app_bot_only  # type: ignore[union-attr]
 
+        authorize_result_cache = (
+            self._authorize.authorize_result_cache if isinstance(self._authorize, InstallationStoreAuthorize) else None
+        )
+        if self._oauth_flow is not None and authorize_result_cache is not None:
+            # The app's authorize can be a different one from the OAuth settings' (e.g., installation_store is given)
+            self._oauth_flow.authorize_result_cache = authorize_result_cache
+
         self._tokens_revocation_listeners: Optional[TokenRevocationListeners] = None
         if self._installation_store is not None:
-            self._tokens_revocation_listeners = TokenRevocationListeners(self._installation_store)
+            self._tokens_revocation_listeners = TokenRevocationListeners(
+                self._installation_store,
+                authorize_result_cache=authorize_result_cache,
+            )
+
+        if background_token_rotation_enabled:
+            if not isinstance(self._authorize, InstallationStoreAuthorize) or self._authorize.token_rotator is None:
+                raise BoltError(error_background_token_rotation_unavailable())
+            if self._authorize.token_rotation_scheduler is None:
+                self._authorize.token_rotation_scheduler = TokenRotationScheduler(
+                    installation_store=self._authorize.installation_store,
+                    token_rotator=self._authorize.token_rotator,
+                    token_rotation_expiration_minutes=self._authorize.token_rotation_expiration_minutes,
+                    logger=self._framework_logger,
+                )
 
         # --------------------------------------
         # Middleware Initialization
         # --------------------------------------
 
         self._middleware_list: List[Middleware] = []
+        if middleware_metrics is not None and phase_observer is not None and middleware_metrics is not phase_observer:
+            raise BoltError(error_middleware_metrics_conflicts())
+        # PhaseObserver receives the time spent in each global middleware as a MiddlewareMetrics
+        self._middleware_metrics = middleware_metrics if middleware_metrics is not None else phase_observer
+        self._phase_observer = phase_observer
+        self._middleware_chain = MiddlewareChain([])
         self._listeners: List[Listener] = []
+        self._listener_routing_index: ListenerRoutingIndex[Listener] = ListenerRoutingIndex()
 
         if listener_executor is None:
-            listener_executor = ThreadPoolExecutor(max_workers=5)
+            listener_executor = ListenerExecutor()
 
         self._assistant_thread_context_store = assistant_thread_context_store
         self._attaching_conversation_kwargs_enabled = attaching_conversation_kwargs_enabled
@@ -367,7 +480,9 @@ class App:
             lazy_listener_runner=ThreadLazyListenerRunner(
                 logger=self._framework_logger,
                 executor=listener_executor,
+                phase_observer=phase_observer,
             ),
+            phase_observer=phase_observer,
         )
         self._middleware_error_handler: MiddlewareErrorHandler = DefaultMiddlewareErrorHandler(
             logger=self._framework_logger,
@@ -383,6 +498,7 @@ class App:
             url_verification_enabled=url_verification_enabled,
             attaching_function_token_enabled=attaching_function_token_enabled,
             user_facing_authorize_error_message=user_facing_authorize_error_message,
+            auth_test_refresh_interval_seconds=auth_test_refresh_interval_seconds,
         )
 
     def _init_middleware_list(
@@ -395,6 +511,7 @@ class App:
         url_verification_enabled: bool = True,
         attaching_function_token_enabled: bool = True,
         user_facing_authorize_error_message: Optional[str] = None,
+        auth_test_refresh_interval_seconds: Optional[float] = None,
     ):
         if self._init_middleware_list_done:
             return
@@ -424,6 +541,7 @@ class App:
                             auth_test_result=auth_test_result,
                             base_logger=self._base_logger,
                             user_facing_authorize_error_message=user_facing_authorize_error_message,
+                            auth_test_refresh_interval_seconds=auth_test_refresh_interval_seconds,
                         )
                     )
                 except SlackApiError as err:
@@ -461,8 +579,17 @@ class App:
             self._middleware_list.append(UrlVerification(base_logger=self._base_logger))
         if attaching_function_token_enabled is True:
             self._middleware_list.append(AttachingFunctionToken())
+        self._compile_middleware_chain()
         self._init_middleware_list_done = True
 
+    def _compile_middleware_chain(self) -> None:
+        # The chain needs to be compiled again whenever the middleware list is changed
+        self._middleware_chain = MiddlewareChain(
+            self._middleware_list,
+            logger=self._framework_logger,
+            metrics=self._middleware_metrics,
+        )
+
     # -------------------------
     # accessors
 
@@ -472,7 +599,7 @@ class App:
         return self._name
 
     @property
-    def oauth_flow(self) -> Optional[OAuthFlow]:
+    def oauth_flow(self) -> Optional["OAuthFlow"]:
         """Configured `OAuthFlow` object if exists."""
         return self._oauth_flow
 
@@ -532,6 +659,14 @@ class App:
         )
         self._development_server.start()
 
+    def stop(self) -> None:
+        """Stops the background threads started by this app, such as the one for `background_token_rotation_enabled`.
+        Call this method when shutting down your app. The app can still handle requests afterwards,
+        but the expiring tokens are rotated only while handling requests.
+        """
+        if isinstance(self._authorize, InstallationStoreAuthorize) and self._authorize.token_rotation_scheduler is not None:
+            self._authorize.token_rotation_scheduler.shutdown()
+
     # -------------------------
     # main dispatcher
 
@@ -545,51 +680,63 @@ class App:
             The response generated by this Bolt app
         """
         starting_time = time.time()
+        phase_observer = self._phase_observer
+        dispatch_started_at = time.perf_counter() if phase_observer is not None else 0.0
         self._init_context(req)
 
         resp: Optional[BoltResponse] = BoltResponse(status=200, body="")
-        middleware_state = {"next_called": False}
-
-        def middleware_next():
-            middleware_state["next_called"] = True
-
         try:
-            for middleware in self._middleware_list:
-                middleware_state["next_called"] = False
-                if self._framework_logger.level <= logging.DEBUG:
-                    self._framework_logger.debug(debug_applying_middleware(middleware.name))
-                resp = middleware.process(req=req, resp=resp, next=middleware_next)  # type: ignore[arg-type]
-                if not middleware_state["next_called"]:
-                    if resp is None:
-                        # next() method was not called without providing the response to return to Slack
-                        # This should not be an intentional handling in usual use cases.
-                        resp = BoltResponse(status=404, body={"error": "no next() calls in middleware"})
-                        if self._raise_error_for_unhandled_request is True:
-                            try:
-                                raise BoltUnhandledRequestError(
-                                    request=req,
-                                    current_response=resp,
-                                    last_global_middleware_name=middleware.name,
-                                )
-                            except BoltUnhandledRequestError as e:
-                                self._listener_runner.listener_error_handler.handle(
-                                    error=e,
-                                    request=req,
-                                    response=resp,
-                                )
-                            return resp
-                        self._framework_logger.warning(warning_unhandled_by_global_middleware(middleware.name, req))
+            resp, stopped_at = self._middleware_chain.run(req=req, resp=resp)
+            if stopped_at is not None:
+                if resp is None:
+                    middleware_name = self._middleware_chain.names[stopped_at]
+                    # next() method was not called without providing the response to return to Slack
+                    # This should not be an intentional handling in usual use cases.
+                    resp = BoltResponse(status=404, body={"error": "no next() calls in middleware"})
+                    if self._raise_error_for_unhandled_request is True:
+                        try:
+                            raise BoltUnhandledRequestError(
+                                request=req,
+                                current_response=resp,
+                                last_global_middleware_name=middleware_name,
+                            )
+                        except BoltUnhandledRequestError as e:
+                            self._listener_runner.listener_error_handler.handle(
+                                error=e,
+                                request=req,
+                                response=resp,
+                            )
                         return resp
+                    self._framework_logger.warning(warning_unhandled_by_global_middleware(middleware_name, req))
                     return resp
+                return resp
 
-            for listener in self._listeners:
+            matching_seconds = 0.0
+            for listener in self._listener_routing_index.candidates(req.payload_kind):
                 listener_name = get_name_for_callable(listener.ack_function)
                 self._framework_logger.debug(debug_checking_listener(listener_name))
-                if listener.matches(req=req, resp=resp):  # type: ignore[arg-type]
+                if phase_observer is None:
+                    matched = listener.matches(req=req, resp=resp)  # type: ignore[arg-type]
+                else:
+                    matching_started_at = time.perf_counter()
+                    matched = listener.matches(req=req, resp=resp)  # type: ignore[arg-type]
+                    matching_seconds += time.perf_counter() - matching_started_at
+                if matched:
                     # run all the middleware attached to this listener first
-                    middleware_resp, next_was_not_called = listener.run_middleware(
-                        req=req, resp=resp  # type: ignore[arg-type]
-                    )
+                    if phase_observer is None:
+                        middleware_resp, next_was_not_called = listener.run_middleware(
+                            req=req, resp=resp  # type: ignore[arg-type]
+                        )
+                    else:
+                        phase_observer.on_phase(req, "listener_matching", matching_seconds)
+                        matching_seconds = 0.0
+                        middleware_started_at = time.perf_counter()
+                        middleware_resp, next_was_not_called = listener.run_middleware(
+                            req=req, resp=resp  # type: ignore[arg-type]
+                        )
+                        phase_observer.on_phase(
+                            req, f"listener_middleware:{listener_name}", time.perf_counter() - middleware_started_at
+                        )
                     if next_was_not_called:
                         if middleware_resp is not None:
                             if self._framework_logger.level <= logging.DEBUG:
@@ -618,6 +765,8 @@ class App:
                     if listener_response is not None:
                         return listener_response
 
+            if phase_observer is not None and matching_seconds > 0:
+                phase_observer.on_phase(req, "listener_matching", matching_seconds)
             if resp is None:
                 resp = BoltResponse(status=404, body={"error": "unhandled request"})
             if self._raise_error_for_unhandled_request is True:
@@ -642,6 +791,9 @@ class App:
                 response=resp,
             )
             return resp
+        finally:
+            if phase_observer is not None:
+                phase_observer.on_phase(req, "dispatch", time.perf_counter() - dispatch_started_at)
 
     def _handle_unmatched_requests(self, req: BoltRequest, resp: BoltResponse) -> BoltResponse:
         self._framework_logger.warning(warning_unhandled_request(req))
@@ -681,6 +833,9 @@ class App:
             if isinstance(middleware_or_callable, Middleware):
                 middleware: Middleware = middleware_or_callable
                 self._middleware_list.append(middleware)
+                self._compile_middleware_chain()
+                from slack_bolt.middleware.assistant import Assistant
+
                 if isinstance(middleware, Assistant) and middleware.thread_context_store is not None:
                     self._assistant_thread_context_store = middleware.thread_context_store
             elif callable(middleware_or_callable):
@@ -691,6 +846,7 @@ class App:
                         base_logger=self._base_logger,
                     )
                 )
+                self._compile_middleware_chain()
                 return middleware_or_callable
             else:
                 raise BoltError(f"Unexpected type for a middleware ({type(middleware_or_callable)})")
@@ -699,7 +855,7 @@ class App:
     # -------------------------
     # AI Agents & Assistants
 
-    def assistant(self, assistant: Assistant) -> Optional[Callable]:
+    def assistant(self, assistant: "Assistant") -> Optional[Callable]:
         return self.middleware(assistant)
 
     # -------------------------
@@ -707,7 +863,7 @@ class App:
 
     def step(
         self,
-        callback_id: Union[str, Pattern, WorkflowStep, WorkflowStepBuilder],
+        callback_id: Union[str, Pattern, "WorkflowStep", "WorkflowStepBuilder"],
         edit: Optional[Union[Callable[..., Optional[BoltResponse]], Listener, Sequence[Callable]]] = None,
         save: Optional[Union[Callable[..., Optional[BoltResponse]], Listener, Sequence[Callable]]] = None,
         execute: Optional[Union[Callable[..., Optional[BoltResponse]], Listener, Sequence[Callable]]] = None,
@@ -754,6 +910,9 @@ class App:
             ),
             category=DeprecationWarning,
         )
+        from slack_bolt.workflows.step import WorkflowStep, WorkflowStepMiddleware
+        from slack_bolt.workflows.step.step import WorkflowStepBuilder
+
         step = callback_id
         if isinstance(callback_id, (str, Pattern)):
             step = WorkflowStep(
@@ -1383,19 +1542,24 @@ class App:
         # (`self._client` a.k.a. `app.client` is a singleton object per an App instance)
         # Thus, we've changed the behavior to create a new instance per request regardless of token argument
         # in the App initialization starting v1.15.
-        # The overhead brought by this change is slight so that we believe that it is ignorable in any cases.
-        client_per_request: WebClient = WebClient(
-            token=self._token,  # this can be None, and it can be set later on
-            base_url=self._client.base_url,
-            timeout=self._client.timeout,
-            ssl=self._client.ssl,
-            proxy=self._client.proxy,
-            headers=self._client.headers,
-            team_id=req.context.team_id,
-            logger=self._client.logger,
-            retry_handlers=self._client.retry_handlers.copy() if self._client.retry_handlers is not None else None,
-        )
-        req.context["client"] = client_per_request
+        # The overhead brought by this change is slight, but it can matter for apps that handle lots of requests.
+        # For those, the optional pool shares WebClient instances per (token, team_id) instead.
+        # The token of a pooled instance is never modified; the authorization middleware replaces it instead.
+        if self._web_client_pool is not None:
+            req.context["client"] = self._web_client_pool.get(token=self._token, team_id=req.context.team_id)
+        else:
+            client_per_request: WebClient = WebClient(
+                token=self._token,  # this can be None, and it can be set later on
+                base_url=self._client.base_url,
+                timeout=self._client.timeout,
+                ssl=self._client.ssl,
+                proxy=self._client.proxy,
+                headers=self._client.headers,
+                team_id=req.context.team_id,
+                logger=self._client.logger,
+                retry_handlers=self._client.retry_handlers.copy() if self._client.retry_handlers is not None else None,
+            )
+            req.context["client"] = client_per_request
 
         # Most apps do not need this "listener_runner" instance.
         # It is intended for apps that start lazy listeners from their custom global middleware.
@@ -1442,18 +1606,19 @@ class App:
             else:
                 raise ValueError(error_unexpected_listener_middleware(type(m)))
 
-        self._listeners.append(
-            CustomListener(
-                app_name=self.name,
-                ack_function=functions.pop(0),
-                lazy_functions=functions,  # type: ignore[arg-type]
-                matchers=listener_matchers,
-                middleware=listener_middleware,
-                auto_acknowledgement=auto_acknowledgement,
-                ack_timeout=ack_timeout,
-                base_logger=self._base_logger,
-            )
+        listener = CustomListener(
+            app_name=self.name,
+            ack_function=functions.pop(0),
+            lazy_functions=functions,  # type: ignore[arg-type]
+            matchers=listener_matchers,
+            middleware=listener_middleware,
+            auto_acknowledgement=auto_acknowledgement,
+            ack_timeout=ack_timeout,
+            base_logger=self._base_logger,
         )
+        self._listeners.append(listener)
+        routing_keys = primary_matcher.routing_keys if isinstance(primary_matcher, BuiltinListenerMatcher) else None
+        self._listener_routing_index.add(listener, routing_keys)
         return value_to_return
 
 
@@ -1466,7 +1631,7 @@ class SlackAppDevelopmentServer:
         port: int,
         path: str,
         app: App,
-        oauth_flow: Optional[OAuthFlow] = None,
+        oauth_flow: Optional["OAuthFlow"] = None,
         http_server_logger_enabled: bool = True,
     ):
         """Slack App Development Server
@@ -1489,13 +1654,15 @@ class SlackAppDevelopmentServer:
         self._port: int = port
         self._bolt_endpoint_path: str = path
         self._bolt_app: App = app
-        self._bolt_oauth_flow: Optional[OAuthFlow] = oauth_flow
+        self._bolt_oauth_flow: Optional["OAuthFlow"] = oauth_flow
         self._http_server_logger_enabled = http_server_logger_enabled
 
+        from http.server import SimpleHTTPRequestHandler, HTTPServer
+
         _port: int = self._port
         _bolt_endpoint_path: str = self._bolt_endpoint_path
         _bolt_app: App = self._bolt_app
-        _bolt_oauth_flow: Optional[OAuthFlow] = self._bolt_oauth_flow
+        _bolt_oauth_flow: Optional["OAuthFlow"] = self._bolt_oauth_flow
         _http_server_logger_enabled = self._http_server_logger_enabled
 
         class SlackAppHandler(SimpleHTTPRequestHandler):
@@ -1536,7 +1703,7 @@ class SlackAppDevelopmentServer:
                     return
 
                 len_header = self.headers.get("Content-Length") or 0
-                request_body = self.rfile.read(int(len_header)).decode("utf-8")
+                request_body = self.rfile.read(int(len_header))
                 bolt_req = BoltRequest(
                     body=request_body,
                     query=query,
@@ -1561,7 +1728,7 @@ class SlackAppDevelopmentServer:
             ):
                 self.send_response(status)
 
-                response_body = body if isinstance(body, str) else json.dumps(body)
+                response_body = body if isinstance(body, str) else json_dumps(body)
                 body_bytes = response_body.encode("utf-8")
 
                 for k, vs in headers.items():
@@ -2,12 +2,9 @@ import inspect
 import logging
 import os
 import time
-from typing import Optional, List, Union, Callable, Pattern, Dict, Awaitable, Sequence, Any
+from typing import TYPE_CHECKING, Optional, List, Union, Callable, Pattern, Dict, Awaitable, Sequence, Any
 import warnings
 
-from aiohttp import web
-
-from slack_bolt.app.async_server import AsyncSlackAppServer
 from slack_bolt.context.assistant.thread_context_store.async_store import (
     AsyncAssistantThreadContextStore,
 )
@@ -19,7 +16,8 @@ from slack_bolt.listener.async_listener_completion_handler import (
     AsyncDefaultListenerCompletionHandler,
 )
 from slack_bolt.listener.asyncio_runner import AsyncioListenerRunner
-from slack_bolt.middleware.assistant.async_assistant import AsyncAssistant
+from slack_bolt.middleware.async_middleware_chain import AsyncMiddlewareChain
+from slack_bolt.util.phase_observer import MiddlewareMetrics, PhaseObserver
 from slack_bolt.middleware.async_middleware_error_handler import (
     AsyncCustomMiddlewareErrorHandler,
     AsyncDefaultMiddlewareErrorHandler,
@@ -28,13 +26,7 @@ from slack_bolt.middleware.async_middleware_error_handler import (
 from slack_bolt.middleware.message_listener_matches.async_message_listener_matches import (
     AsyncMessageListenerMatches,
 )
-from slack_bolt.oauth.async_internals import select_consistent_installation_store
 from slack_bolt.util.utils import get_name_for_callable, is_callable_coroutine
-from slack_bolt.workflows.step.async_step import (
-    AsyncWorkflowStep,
-    AsyncWorkflowStepBuilder,
-)
-from slack_bolt.workflows.step.async_step_middleware import AsyncWorkflowStepMiddleware
 from slack_sdk.oauth.installation_store.async_installation_store import (
     AsyncInstallationStore,
 )
@@ -46,6 +38,8 @@ from slack_bolt.authorization.async_authorize import (
     AsyncCallableAuthorize,
     AsyncInstallationStoreAuthorize,
 )
+from slack_bolt.authorization.async_token_rotation_scheduler import AsyncTokenRotationScheduler
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
 from slack_bolt.error import BoltError, BoltUnhandledRequestError
 from slack_bolt.logger.messages import (
     error_oauth_flow_or_authorize_required,
@@ -59,6 +53,9 @@ from slack_bolt.logger.messages import (
     error_listener_function_must_be_coro_func,
     error_client_invalid_type_async,
     error_authorize_conflicts,
+    error_background_token_rotation_unavailable,
+    error_authorize_options_conflicts,
+    error_middleware_metrics_conflicts,
     error_oauth_settings_invalid_type_async,
     error_oauth_flow_invalid_type_async,
     warning_bot_only_conflicts,
@@ -70,11 +67,13 @@ from slack_bolt.logger.messages import (
 )
 from slack_bolt.lazy_listener.asyncio_runner import AsyncioLazyListenerRunner
 from slack_bolt.listener.async_listener import AsyncListener, AsyncCustomListener
+from slack_bolt.listener.routing_index import ListenerRoutingIndex
 from slack_bolt.listener.async_listener_error_handler import (
     AsyncDefaultListenerErrorHandler,
     AsyncCustomListenerErrorHandler,
 )
 from slack_bolt.listener_matcher import builtins as builtin_matchers
+from slack_bolt.listener_matcher.builtins import BuiltinListenerMatcher
 from slack_bolt.listener_matcher.async_listener_matcher import (
     AsyncListenerMatcher,
     AsyncCustomListenerMatcher,
@@ -98,11 +97,21 @@ from slack_bolt.middleware.authorization.async_multi_teams_authorization import
 from slack_bolt.middleware.authorization.async_single_team_authorization import (
     AsyncSingleTeamAuthorization,
 )
-from slack_bolt.oauth.async_oauth_flow import AsyncOAuthFlow
-from slack_bolt.oauth.async_oauth_settings import AsyncOAuthSettings
 from slack_bolt.request.async_request import AsyncBoltRequest
 from slack_bolt.response import BoltResponse
 from slack_bolt.util.async_utils import create_async_web_client
+from slack_bolt.util.async_web_client_pool import AsyncWebClientPool
+
+# The rarely used subsystems (OAuth, assistant, steps from apps, and the AIOHTTP development server)
+# are imported when they are used for the first time, which shortens the cold start on FaaS.
+if TYPE_CHECKING:
+    from aiohttp import web
+
+    from slack_bolt.app.async_server import AsyncSlackAppServer
+    from slack_bolt.middleware.assistant.async_assistant import AsyncAssistant
+    from slack_bolt.oauth.async_oauth_flow import AsyncOAuthFlow
+    from slack_bolt.oauth.async_oauth_settings import AsyncOAuthSettings
+    from slack_bolt.workflows.step.async_step import AsyncWorkflowStep, AsyncWorkflowStepBuilder
 
 
 class AsyncApp:
@@ -128,6 +137,15 @@ class AsyncApp:
         installation_store: Optional[AsyncInstallationStore] = None,
         # for either only bot scope usage or v1.0.x compatibility
         installation_store_bot_only: Optional[bool] = None,
+        # for customizing the authorize built with installation_store
+        authorize_result_cache: Optional[AuthorizeResultCache] = None,
+        single_flight_enabled: Optional[bool] = None,
+        auth_test_mode: Optional[str] = None,
+        auth_test_verification_interval_seconds: Optional[float] = None,
+        # Rotates expiring tokens off the request path
+        background_token_rotation_enabled: bool = False,
+        # for single-workspace apps
+        auth_test_refresh_interval_seconds: Optional[float] = None,
         # for customizing the built-in middleware
         request_verification_enabled: bool = True,
         ignoring_self_events_enabled: bool = True,
@@ -136,13 +154,17 @@ class AsyncApp:
         url_verification_enabled: bool = True,
         attaching_function_token_enabled: bool = True,
         # for the OAuth flow
-        oauth_settings: Optional[AsyncOAuthSettings] = None,
-        oauth_flow: Optional[AsyncOAuthFlow] = None,
+        oauth_settings: Optional["AsyncOAuthSettings"] = None,
+        oauth_flow: Optional["AsyncOAuthFlow"] = None,
         # No need to set (the value is used only in response to ssl_check requests)
         verification_token: Optional[str] = None,
         # for AI Agents & Assistants
         assistant_thread_context_store: Optional[AsyncAssistantThreadContextStore] = None,
         attaching_conversation_kwargs_enabled: bool = True,
+        # Set this one only when you want to reuse the AsyncWebClient instances across requests
+        web_client_pool_size: Optional[int] = None,
+        middleware_metrics: Optional[MiddlewareMetrics] = None,
+        phase_observer: Optional[PhaseObserver] = None,
     ):
         """Bolt App that provides functionalities to register middleware/listeners.
 
@@ -187,6 +209,23 @@ class AsyncApp:
                 when the app is installed but the installation is not managed by this app's installation store
             installation_store: The module offering save/find operations of installation data
             installation_store_bot_only: Use `AsyncInstallationStore#async_find_bot()` if True (Default: False)
+            authorize_result_cache: Set `AuthorizeResultCache` if you would like to cache the authorize results
+                in memory and to customize the cache size and TTLs (Default: None, which disables the cache).
+                This option and the following three apply to the `authorize` built with `installation_store`;
+                set them in `AsyncOAuthSettings` instead when the `authorize` is built from the OAuth settings
+            single_flight_enabled: Set False if you would like concurrent requests for the same user/workspace
+                to load the installation on their own (Default: True)
+            auth_test_mode: "always" calls `auth.test` API for every authorize result built from the installation store,
+                while "fallback" calls it only when the stored data lacks fields such as bot_user_id (Default: "always")
+            auth_test_verification_interval_seconds: The interval in seconds to verify the tokens with `auth.test` API
+                even when auth_test_mode is "fallback" (Default: None, which never verifies them)
+            background_token_rotation_enabled: True if you would like to refresh the expiring tokens of
+                the installations seen by the app in a background task instead of doing so while handling requests.
+                This requires token rotation settings (client_id/client_secret) for the installation store
+                (Default: False)
+            auth_test_refresh_interval_seconds: The interval in seconds to call `auth.test` API again
+                in a single-workspace app, so that changes such as newly granted scopes are reflected
+                without restarting the app (Default: never; it's refreshed only on token revocation events)
             request_verification_enabled: False if you would like to disable the built-in middleware (Default: True).
                 `AsyncRequestVerification` is a built-in middleware that verifies the signature in HTTP Mode requests.
                 Make sure if it's safe enough when you turn a built-in middleware off.
@@ -213,6 +252,16 @@ class AsyncApp:
             verification_token: Deprecated verification mechanism. This can be used only for ssl_check requests.
             assistant_thread_context_store: Custom AssistantThreadContext store (Default: the built-in implementation,
                 which uses a parent message's metadata to store the latest context)
+            web_client_pool_size: The max number of `AsyncWebClient` instances to reuse across requests.
+                If set, the app keeps a bounded LRU pool of the instances keyed by (token, team_id)
+                instead of creating a new instance for every request (Default: None, which means no pooling).
+                Note that the token of a pooled instance cannot be modified; replace `context.client` instead.
+                All the pooled instances share a single aiohttp session. Call `close_web_client_pool()` to close it.
+            middleware_metrics: The hooks to measure the time spent in each global middleware.
+                `PhaseObserver` implements these hooks as well, so pass either this or phase_observer
+            phase_observer: The observer notified of the time spent in each phase of handling a request,
+                such as global middleware, listener matching, listener middleware, and listener functions
+                (Default: None, which means no time measurement)
         """
         if signing_secret is None:
             signing_secret = os.environ.get("SLACK_SIGNING_SECRET", "")
@@ -227,6 +276,11 @@ class AsyncApp:
         # The framework logger is supposed to be used for the internal logging.
         # Also, it's accessible via `app.logger` as the app's singleton logger.
         self._framework_logger = logger or get_bolt_logger(AsyncApp)
+        # The logger passed to listeners as `logger` is configured here only once.
+        # As get_bolt_app_logger() caches it, the per-request lookup in _init_context() does not
+        # acquire the logging module lock; only the level and the disabled flag are synchronized with the base logger.
+        # Call slack_bolt.logger.clear_logger_cache() after changing the handlers or filters of the base logger.
+        get_bolt_app_logger(app_name=self._name, base_logger=self._base_logger)
         self._raise_error_for_unhandled_request = raise_error_for_unhandled_request
 
         self._token: Optional[str] = token
@@ -245,6 +299,10 @@ class AsyncApp:
                 logger=self._framework_logger,
             )
 
+        self._web_client_pool: Optional[AsyncWebClientPool] = None
+        if web_client_pool_size is not None:
+            self._web_client_pool = AsyncWebClientPool(template=self._async_client, max_size=web_client_pool_size)
+
         # --------------------------------------
         # Authorize & OAuthFlow initialization
         # --------------------------------------
@@ -273,6 +331,18 @@ class AsyncApp:
                     raise BoltError(error_authorize_conflicts())
                 self._async_authorize = AsyncCallableAuthorize(logger=self._framework_logger, func=authorize)
 
+        # The options for the installation store based authorize, which are given in the top-level arguments
+        authorize_options: Dict[str, Any] = {
+            name: value
+            for name, value in {
+                "authorize_result_cache": authorize_result_cache,
+                "single_flight_enabled": single_flight_enabled,
+                "auth_test_mode": auth_test_mode,
+                "auth_test_verification_interval_seconds": auth_test_verification_interval_seconds,
+            }.items()
+            if value is not None
+        }
+
         self._async_installation_store: Optional[AsyncInstallationStore] = installation_store
         if self._async_installation_store is not None and self._async_authorize is None:
             settings = oauth_flow.settings if oauth_flow is not None else oauth_settings
@@ -284,23 +354,35 @@ class AsyncApp:
                 bot_only=installation_store_bot_only or False,
                 client=self._async_client,  # for proxy use cases etc.
                 user_token_resolution=(settings.user_token_resolution if settings is not None else "authed_user"),
+                **authorize_options,
             )
+        elif (
+            len(authorize_options) > 0
+            and self._async_authorize is None
+            and (oauth_settings is not None or oauth_flow is not None)
+        ):
+            raise BoltError(error_authorize_options_conflicts())
 
-        self._async_oauth_flow: Optional[AsyncOAuthFlow] = None
+        self._async_oauth_flow: Optional["AsyncOAuthFlow"] = None
 
         if (
             oauth_settings is None
             and os.environ.get("SLACK_CLIENT_ID") is not None
             and os.environ.get("SLACK_CLIENT_SECRET") is not None
         ):
+            from slack_bolt.oauth.async_oauth_settings import AsyncOAuthSettings
+
             # initialize with the default settings
-            oauth_settings = AsyncOAuthSettings()
+            oauth_settings = AsyncOAuthSettings(**authorize_options)
 
             if oauth_flow is None and installation_store is None:
                 # show info-level log for avoiding confusions
                 self._framework_logger.info(info_default_oauth_settings_loaded())
 
         if oauth_flow:
+            from slack_bolt.oauth.async_internals import select_consistent_installation_store
+            from slack_bolt.oauth.async_oauth_flow import AsyncOAuthFlow
+
             if not isinstance(oauth_flow, AsyncOAuthFlow):
                 raise BoltError(error_oauth_flow_invalid_type_async())
 
@@ -320,6 +402,10 @@ class AsyncApp:
             if self._async_authorize is None:
                 self._async_authorize = self._async_oauth_flow.settings.authorize
         elif oauth_settings is not None:
+            from slack_bolt.oauth.async_internals import select_consistent_installation_store
+            from slack_bolt.oauth.async_oauth_flow import AsyncOAuthFlow
+            from slack_bolt.oauth.async_oauth_settings import AsyncOAuthSettings
+
             if not isinstance(oauth_settings, AsyncOAuthSettings):
                 raise BoltError(error_oauth_settings_invalid_type_async())
 
@@ -351,16 +437,49 @@ class AsyncApp:
                 self._async_oauth_flow.settings.installation_store_bot_only = app_bot_only
                 self._async_authorize.bot_only = app_bot_only  # type: ignore[union-attr]
 
+        authorize_result_cache = (
+            self._async_authorize.authorize_result_cache
+            if isinstance(self._async_authorize, AsyncInstallationStoreAuthorize)
+            else None
+        )
+        if self._async_oauth_flow is not None and authorize_result_cache is not None:
+            # The app's authorize can be a different one from the OAuth settings' (e.g., installation_store is given)
+            self._async_oauth_flow.authorize_result_cache = authorize_result_cache
+
         self._async_tokens_revocation_listeners: Optional[AsyncTokenRevocationListeners] = None
         if self._async_installation_store is not None:
-            self._async_tokens_revocation_listeners = AsyncTokenRevocationListeners(self._async_installation_store)
+            self._async_tokens_revocation_listeners = AsyncTokenRevocationListeners(
+                self._async_installation_store,
+                authorize_result_cache=authorize_result_cache,
+            )
+
+        if background_token_rotation_enabled:
+            if (
+                not isinstance(self._async_authorize, AsyncInstallationStoreAuthorize)
+                or self._async_authorize.token_rotator is None
+            ):
+                raise BoltError(error_background_token_rotation_unavailable())
+            if self._async_authorize.token_rotation_scheduler is None:
+                self._async_authorize.token_rotation_scheduler = AsyncTokenRotationScheduler(
+                    installation_store=self._async_authorize.installation_store,
+                    token_rotator=self._async_authorize.token_rotator,
+                    token_rotation_expiration_minutes=self._async_authorize.token_rotation_expiration_minutes,
+                    logger=self._framework_logger,
+                )
 
         # --------------------------------------
         # Middleware Initialization
         # --------------------------------------
 
         self._async_middleware_list: List[AsyncMiddleware] = []
+        if middleware_metrics is not None and phase_observer is not None and middleware_metrics is not phase_observer:
+            raise BoltError(error_middleware_metrics_conflicts())
+        # PhaseObserver receives the time spent in each global middleware as a MiddlewareMetrics
+        self._middleware_metrics = middleware_metrics if middleware_metrics is not None else phase_observer
+        self._phase_observer = phase_observer
+        self._async_middleware_chain = AsyncMiddlewareChain([])
         self._async_listeners: List[AsyncListener] = []
+        self._listener_routing_index: ListenerRoutingIndex[AsyncListener] = ListenerRoutingIndex()
 
         self._assistant_thread_context_store = assistant_thread_context_store
         self._attaching_conversation_kwargs_enabled = attaching_conversation_kwargs_enabled
@@ -374,7 +493,9 @@ class AsyncApp:
             listener_completion_handler=AsyncDefaultListenerCompletionHandler(logger=self._framework_logger),
             lazy_listener_runner=AsyncioLazyListenerRunner(
                 logger=self._framework_logger,
+                phase_observer=phase_observer,
             ),
+            phase_observer=phase_observer,
         )
         self._async_middleware_error_handler: AsyncMiddlewareErrorHandler = AsyncDefaultMiddlewareErrorHandler(
             logger=self._framework_logger,
@@ -389,9 +510,10 @@ class AsyncApp:
             url_verification_enabled=url_verification_enabled,
             attaching_function_token_enabled=attaching_function_token_enabled,
             user_facing_authorize_error_message=user_facing_authorize_error_message,
+            auth_test_refresh_interval_seconds=auth_test_refresh_interval_seconds,
         )
 
-        self._server: Optional[AsyncSlackAppServer] = None
+        self._server: Optional["AsyncSlackAppServer"] = None
 
     def _init_async_middleware_list(
         self,
@@ -402,6 +524,7 @@ class AsyncApp:
         url_verification_enabled: bool = True,
         attaching_function_token_enabled: bool = True,
         user_facing_authorize_error_message: Optional[str] = None,
+        auth_test_refresh_interval_seconds: Optional[float] = None,
     ):
         if self._init_middleware_list_done:
             return
@@ -425,6 +548,7 @@ class AsyncApp:
                     AsyncSingleTeamAuthorization(
                         base_logger=self._base_logger,
                         user_facing_authorize_error_message=user_facing_authorize_error_message,
+                        auth_test_refresh_interval_seconds=auth_test_refresh_interval_seconds,
                     )
                 )
             elif self._async_authorize is not None:
@@ -460,8 +584,17 @@ class AsyncApp:
             self._async_middleware_list.append(AsyncUrlVerification(base_logger=self._base_logger))
         if attaching_function_token_enabled is True:
             self._async_middleware_list.append(AsyncAttachingFunctionToken())
+        self._compile_async_middleware_chain()
         self._init_middleware_list_done = True
 
+    def _compile_async_middleware_chain(self) -> None:
+        # The chain needs to be compiled again whenever the middleware list is changed
+        self._async_middleware_chain = AsyncMiddlewareChain(
+            self._async_middleware_list,
+            logger=self._framework_logger,
+            metrics=self._middleware_metrics,
+        )
+
     # -------------------------
     # accessors
 
@@ -471,7 +604,7 @@ class AsyncApp:
         return self._name
 
     @property
-    def oauth_flow(self) -> Optional[AsyncOAuthFlow]:
+    def oauth_flow(self) -> Optional["AsyncOAuthFlow"]:
         """Configured `OAuthFlow` object if exists."""
         return self._async_oauth_flow
 
@@ -480,6 +613,12 @@ class AsyncApp:
         """The singleton `slack_sdk.web.async_client.AsyncWebClient` instance in this app."""
         return self._async_client
 
+    async def close_web_client_pool(self) -> None:
+        """Closes the aiohttp session shared by the pooled `AsyncWebClient` instances.
+        This method does nothing unless `web_client_pool_size` is set."""
+        if self._web_client_pool is not None:
+            await self._web_client_pool.close()
+
     @property
     def logger(self) -> logging.Logger:
         """The logger this app uses."""
@@ -502,14 +641,12 @@ class AsyncApp:
     # -------------------------
     # standalone server
 
-    from .async_server import AsyncSlackAppServer
-
     def server(
         self,
         port: int = 3000,
         path: str = "/slack/events",
         host: Optional[str] = None,
-    ) -> AsyncSlackAppServer:
+    ) -> "AsyncSlackAppServer":
         """Configure a web server using AIOHTTP.
         Refer to https://docs.aiohttp.org/ for more details about AIOHTTP.
 
@@ -519,6 +656,8 @@ class AsyncApp:
             host: The hostname to serve the web endpoints. (Default: 0.0.0.0)
         """
         if self._server is None or self._server.port != port or self._server.path != path:
+            from slack_bolt.app.async_server import AsyncSlackAppServer
+
             self._server = AsyncSlackAppServer(
                 port=port,
                 path=path,
@@ -527,7 +666,7 @@ class AsyncApp:
             )
         return self._server
 
-    def web_app(self, path: str = "/slack/events", port: int = 3000) -> web.Application:
+    def web_app(self, path: str = "/slack/events", port: int = 3000) -> "web.Application":
         """Returns a `web.Application` instance for aiohttp-devtools users.
 
             from slack_bolt.async_app import AsyncApp
@@ -560,6 +699,17 @@ class AsyncApp:
         """
         self.server(port=port, path=path, host=host).start()
 
+    async def stop(self) -> None:
+        """Stops the background tasks started by this app, such as the one for `background_token_rotation_enabled`.
+        Call this method when shutting down your app. The app can still handle requests afterwards,
+        but the expiring tokens are rotated only while handling requests.
+        """
+        if (
+            isinstance(self._async_authorize, AsyncInstallationStoreAuthorize)
+            and self._async_authorize.token_rotation_scheduler is not None
+        ):
+            await self._async_authorize.token_rotation_scheduler.shutdown()
+
     # -------------------------
     # main dispatcher
 
@@ -573,53 +723,63 @@ class AsyncApp:
             The response generated by this Bolt app.
         """
         starting_time = time.time()
+        phase_observer = self._phase_observer
+        dispatch_started_at = time.perf_counter() if phase_observer is not None else 0.0
         self._init_context(req)
 
         resp: Optional[BoltResponse] = BoltResponse(status=200, body="")
-        middleware_state = {"next_called": False}
-
-        async def async_middleware_next():
-            middleware_state["next_called"] = True
-
         try:
-            for middleware in self._async_middleware_list:
-                middleware_state["next_called"] = False
-                if self._framework_logger.level <= logging.DEBUG:
-                    self._framework_logger.debug(f"Applying {middleware.name}")
-                resp = await middleware.async_process(
-                    req=req, resp=resp, next=async_middleware_next  # type: ignore[arg-type]
-                )
-                if not middleware_state["next_called"]:
-                    if resp is None:
-                        # next() method was not called without providing the response to return to Slack
-                        # This should not be an intentional handling in usual use cases.
-                        resp = BoltResponse(status=404, body={"error": "no next() calls in middleware"})
-                        if self._raise_error_for_unhandled_request is True:
-                            try:
-                                raise BoltUnhandledRequestError(
-                                    request=req,
-                                    current_response=resp,
-                                    last_global_middleware_name=middleware.name,
-                                )
-                            except BoltUnhandledRequestError as e:
-                                await self._async_listener_runner.listener_error_handler.handle(
-                                    error=e,
-                                    request=req,
-                                    response=resp,
-                                )
-                            return resp
-                        self._framework_logger.warning(warning_unhandled_by_global_middleware(middleware.name, req))
+            resp, stopped_at = await self._async_middleware_chain.run(req=req, resp=resp)
+            if stopped_at is not None:
+                if resp is None:
+                    middleware_name = self._async_middleware_chain.names[stopped_at]
+                    # next() method was not called without providing the response to return to Slack
+                    # This should not be an intentional handling in usual use cases.
+                    resp = BoltResponse(status=404, body={"error": "no next() calls in middleware"})
+                    if self._raise_error_for_unhandled_request is True:
+                        try:
+                            raise BoltUnhandledRequestError(
+                                request=req,
+                                current_response=resp,
+                                last_global_middleware_name=middleware_name,
+                            )
+                        except BoltUnhandledRequestError as e:
+                            await self._async_listener_runner.listener_error_handler.handle(
+                                error=e,
+                                request=req,
+                                response=resp,
+                            )
                         return resp
+                    self._framework_logger.warning(warning_unhandled_by_global_middleware(middleware_name, req))
                     return resp
+                return resp
 
-            for listener in self._async_listeners:
+            matching_seconds = 0.0
+            for listener in self._listener_routing_index.candidates(req.payload_kind):
                 listener_name = get_name_for_callable(listener.ack_function)
                 self._framework_logger.debug(debug_checking_listener(listener_name))
-                if await listener.async_matches(req=req, resp=resp):  # type: ignore[arg-type]
+                if phase_observer is None:
+                    matched = await listener.async_matches(req=req, resp=resp)  # type: ignore[arg-type]
+                else:
+                    matching_started_at = time.perf_counter()
+                    matched = await listener.async_matches(req=req, resp=resp)  # type: ignore[arg-type]
+                    matching_seconds += time.perf_counter() - matching_started_at
+                if matched:
                     # run all the middleware attached to this listener first
-                    middleware_resp, next_was_not_called = await listener.run_async_middleware(
-                        req=req, resp=resp  # type: ignore[arg-type]
-                    )
+                    if phase_observer is None:
+                        middleware_resp, next_was_not_called = await listener.run_async_middleware(
+                            req=req, resp=resp  # type: ignore[arg-type]
+                        )
+                    else:
+                        phase_observer.on_phase(req, "listener_matching", matching_seconds)
+                        matching_seconds = 0.0
+                        middleware_started_at = time.perf_counter()
+                        middleware_resp, next_was_not_called = await listener.run_async_middleware(
+                            req=req, resp=resp  # type: ignore[arg-type]
+                        )
+                        phase_observer.on_phase(
+                            req, f"listener_middleware:{listener_name}", time.perf_counter() - middleware_started_at
+                        )
                     if next_was_not_called:
                         if middleware_resp is not None:
                             if self._framework_logger.level <= logging.DEBUG:
@@ -648,6 +808,8 @@ class AsyncApp:
                     if listener_response is not None:
                         return listener_response
 
+            if phase_observer is not None and matching_seconds > 0:
+                phase_observer.on_phase(req, "listener_matching", matching_seconds)
             if resp is None:
                 resp = BoltResponse(status=404, body={"error": "unhandled request"})
             if self._raise_error_for_unhandled_request is True:
@@ -673,6 +835,9 @@ class AsyncApp:
                 response=resp,
             )
             return resp
+        finally:
+            if phase_observer is not None:
+                phase_observer.on_phase(req, "dispatch", time.perf_counter() - dispatch_started_at)
 
     def _handle_unmatched_requests(self, req: AsyncBoltRequest, resp: BoltResponse) -> BoltResponse:
         self._framework_logger.warning(warning_unhandled_request(req))
@@ -708,6 +873,9 @@ class AsyncApp:
             if isinstance(middleware_or_callable, AsyncMiddleware):
                 middleware: AsyncMiddleware = middleware_or_callable
                 self._async_middleware_list.append(middleware)
+                self._compile_async_middleware_chain()
+                from slack_bolt.middleware.assistant.async_assistant import AsyncAssistant
+
                 if isinstance(middleware, AsyncAssistant) and middleware.thread_context_store is not None:
                     self._assistant_thread_context_store = middleware.thread_context_store
             elif callable(middleware_or_callable):
@@ -718,12 +886,13 @@ class AsyncApp:
                         base_logger=self._base_logger,
                     )
                 )
+                self._compile_async_middleware_chain()
                 return middleware_or_callable
             else:
                 raise BoltError(f"Unexpected type for a middleware ({type(middleware_or_callable)})")
         return None
 
-    def assistant(self, assistant: AsyncAssistant) -> Optional[Callable]:
+    def assistant(self, assistant: "AsyncAssistant") -> Optional[Callable]:
         return self.middleware(assistant)
 
     # -------------------------
@@ -731,7 +900,7 @@ class AsyncApp:
 
     def step(
         self,
-        callback_id: Union[str, Pattern, AsyncWorkflowStep, AsyncWorkflowStepBuilder],
+        callback_id: Union[str, Pattern, "AsyncWorkflowStep", "AsyncWorkflowStepBuilder"],
         edit: Optional[Union[Callable[..., Optional[BoltResponse]], AsyncListener, Sequence[Callable]]] = None,
         save: Optional[Union[Callable[..., Optional[BoltResponse]], AsyncListener, Sequence[Callable]]] = None,
         execute: Optional[Union[Callable[..., Optional[BoltResponse]], AsyncListener, Sequence[Callable]]] = None,
@@ -777,6 +946,9 @@ class AsyncApp:
             ),
             category=DeprecationWarning,
         )
+        from slack_bolt.workflows.step.async_step import AsyncWorkflowStep, AsyncWorkflowStepBuilder
+        from slack_bolt.workflows.step.async_step_middleware import AsyncWorkflowStepMiddleware
+
         step = callback_id
         if isinstance(callback_id, (str, Pattern)):
             step = AsyncWorkflowStep(
@@ -1415,23 +1587,28 @@ class AsyncApp:
         # (`self._client` a.k.a. `app.client` is a singleton object per an App instance)
         # Thus, we've changed the behavior to create a new instance per request regardless of token argument
         # in the App initialization starting v1.15.
-        # The overhead brought by this change is slight so that we believe that it is ignorable in any cases.
-        client_per_request: AsyncWebClient = AsyncWebClient(
-            token=self._token,  # this can be None, and it can be set later on
-            base_url=self._async_client.base_url,
-            timeout=self._async_client.timeout,
-            ssl=self._async_client.ssl,
-            proxy=self._async_client.proxy,
-            session=self._async_client.session,
-            trust_env_in_session=self._async_client.trust_env_in_session,
-            headers=self._async_client.headers,
-            team_id=req.context.team_id,
-            logger=self._async_client.logger,
-            retry_handlers=(
-                self._async_client.retry_handlers.copy() if self._async_client.retry_handlers is not None else None
-            ),
-        )
-        req.context["client"] = client_per_request
+        # The overhead brought by this change is slight, but it can matter for apps that handle lots of requests.
+        # For those, the optional pool shares AsyncWebClient instances per (token, team_id) instead.
+        # The token of a pooled instance is never modified; the authorization middleware replaces it instead.
+        if self._web_client_pool is not None:
+            req.context["client"] = self._web_client_pool.get(token=self._token, team_id=req.context.team_id)
+        else:
+            client_per_request: AsyncWebClient = AsyncWebClient(
+                token=self._token,  # this can be None, and it can be set later on
+                base_url=self._async_client.base_url,
+                timeout=self._async_client.timeout,
+                ssl=self._async_client.ssl,
+                proxy=self._async_client.proxy,
+                session=self._async_client.session,
+                trust_env_in_session=self._async_client.trust_env_in_session,
+                headers=self._async_client.headers,
+                team_id=req.context.team_id,
+                logger=self._async_client.logger,
+                retry_handlers=(
+                    self._async_client.retry_handlers.copy() if self._async_client.retry_handlers is not None else None
+                ),
+            )
+            req.context["client"] = client_per_request
 
         # Most apps do not need this "listener_runner" instance.
         # It is intended for apps that start lazy listeners from their custom global middleware.
@@ -1483,17 +1660,18 @@ class AsyncApp:
             else:
                 raise ValueError(error_unexpected_listener_middleware(type(m)))
 
-        self._async_listeners.append(
-            AsyncCustomListener(
-                app_name=self.name,
-                ack_function=functions.pop(0),
-                lazy_functions=functions,  # type: ignore[arg-type]
-                matchers=listener_matchers,
-                middleware=listener_middleware,
-                auto_acknowledgement=auto_acknowledgement,
-                ack_timeout=ack_timeout,
-                base_logger=self._base_logger,
-            )
+        listener = AsyncCustomListener(
+            app_name=self.name,
+            ack_function=functions.pop(0),
+            lazy_functions=functions,  # type: ignore[arg-type]
+            matchers=listener_matchers,
+            middleware=listener_middleware,
+            auto_acknowledgement=auto_acknowledgement,
+            ack_timeout=ack_timeout,
+            base_logger=self._base_logger,
         )
+        self._async_listeners.append(listener)
+        routing_keys = primary_matcher.routing_keys if isinstance(primary_matcher, BuiltinListenerMatcher) else None
+        self._listener_routing_index.add(listener, routing_keys)
 
         return value_to_return
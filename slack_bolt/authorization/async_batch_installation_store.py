@@ -0,0 +1,27 @@
+from typing import Optional, Sequence
+
+from slack_sdk.oauth.installation_store.models.installation import Installation
+
+from .batch_installation_store import InstallationQuery
+
+
+class AsyncBatchInstallationStore:
+    """An optional capability of `AsyncInstallationStore`, which loads several installations at once.
+    Refer to `BatchInstallationStore` for details.
+    """
+
+    async def async_find_installations(
+        self,
+        *,
+        queries: Sequence[InstallationQuery],
+    ) -> Sequence[Optional[Installation]]:
+        """Finds the installations for the given queries.
+
+        Args:
+            queries: The arguments of `async_find_installation()` calls
+
+        Returns:
+            The results in the same order as the queries. Each item must be the same as what
+            `async_find_installation()` returns for the query (None if not found).
+        """
+        raise NotImplementedError()
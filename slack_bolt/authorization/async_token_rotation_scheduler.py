@@ -0,0 +1,207 @@
+import asyncio
+import time
+from logging import Logger
+from typing import Any, Dict, Optional, Union
+from weakref import WeakValueDictionary
+
+from slack_sdk.errors import SlackTokenRotationError
+from slack_sdk.oauth.installation_store.async_installation_store import AsyncInstallationStore
+from slack_sdk.oauth.installation_store.models.bot import Bot
+from slack_sdk.oauth.installation_store.models.installation import Installation
+from slack_sdk.oauth.token_rotation.async_rotator import AsyncTokenRotator
+
+from slack_bolt.logger import get_bolt_logger
+from .token_rotation_scheduler import TokenRotationKey, _bot_key, _expires_at, _installation_key
+
+
+class AsyncTokenRotationScheduler:
+    """Refreshes the tokens of the installations seen by `AsyncInstallationStoreAuthorize` in a background task.
+    Refer to `TokenRotationScheduler` for details.
+
+    The background task starts on the running event loop when the first installation with expiring tokens is seen.
+    It is restarted when it has finished or when the scheduler is used on another event loop.
+    Call `AsyncApp#stop()` (or `shutdown()`) to stop the background task.
+    """
+
+    installation_store: AsyncInstallationStore
+    token_rotator: AsyncTokenRotator
+    token_rotation_expiration_minutes: int
+    interval_seconds: float
+    inline_rotation_margin_seconds: float
+    logger: Logger
+
+    def __init__(
+        self,
+        *,
+        installation_store: AsyncInstallationStore,
+        token_rotator: AsyncTokenRotator,
+        token_rotation_expiration_minutes: int = 120,
+        interval_seconds: float = 60,
+        inline_rotation_margin_seconds: float = 30,
+        logger: Optional[Logger] = None,
+    ):
+        """
+        Args:
+            installation_store: The installation store to load and save installations
+            token_rotator: The token rotator
+            token_rotation_expiration_minutes: The tokens expiring within this period are rotated (Default: 120)
+            interval_seconds: The interval of the background scans (Default: 60)
+            inline_rotation_margin_seconds: A request rotates tokens by itself
+                only when they expire within this period (Default: 30)
+            logger: The logger
+        """
+        self.installation_store = installation_store
+        self.token_rotator = token_rotator
+        self.token_rotation_expiration_minutes = token_rotation_expiration_minutes
+        self.interval_seconds = interval_seconds
+        self.inline_rotation_margin_seconds = inline_rotation_margin_seconds
+        self.logger = logger or get_bolt_logger(AsyncTokenRotationScheduler)
+
+        self._expirations: Dict[TokenRotationKey, int] = {}
+        # A lock lives only while a task is rotating the installation's tokens
+        self._locks: "WeakValueDictionary[TokenRotationKey, asyncio.Lock]" = WeakValueDictionary()
+        self._task: Optional[asyncio.Task] = None
+        # The event loop that runs the background task
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped = False
+
+    async def rotate_if_necessary(
+        self,
+        installation: Installation,
+        *,
+        user_id: Optional[str] = None,
+    ) -> Optional[Installation]:
+        """Called by the authorize middleware instead of rotating the tokens of an installation inline.
+
+        Args:
+            installation: The installation loaded by the authorize middleware
+            user_id: The user_id used for loading the installation (None for the latest installation in a workspace)
+
+        Returns:
+            The latest installation data if it had to be refreshed inline, otherwise None
+        """
+        key = _installation_key(installation, user_id)
+        expires_at = _expires_at(installation)
+        if expires_at is not None and expires_at - time.time() > self.inline_rotation_margin_seconds:
+            # The tokens are still valid; the background task refreshes them before they expire
+            self._track(key, expires_at)
+            return None
+        return await self._rotate(key)
+
+    async def rotate_bot_if_necessary(self, bot: Bot) -> Optional[Bot]:
+        """The same as `rotate_if_necessary()` for the `AsyncInstallationStore#async_find_bot()` users."""
+        key = _bot_key(bot)
+        expires_at = _expires_at(bot)
+        if expires_at is not None and expires_at - time.time() > self.inline_rotation_margin_seconds:
+            self._track(key, expires_at)
+            return None
+        return await self._rotate(key)
+
+    async def rotate_expiring_tokens(self) -> int:
+        """Rotates the tokens nearing their expiration. The background task calls this method periodically.
+
+        Returns:
+            The number of the installations that were checked
+        """
+        threshold = time.time() + self.token_rotation_expiration_minutes * 60
+        keys = [key for key, expires_at in self._expirations.items() if expires_at <= threshold]
+        for key in keys:
+            try:
+                await self._rotate(key)
+            except SlackTokenRotationError as e:
+                # Usually unrecoverable; the next request for the installation will try it again
+                self.logger.error(f"Failed to rotate tokens in the background due to {e}")
+                self._expirations.pop(key, None)
+            except Exception as e:
+                self.logger.warning(f"Failed to rotate tokens in the background due to {e}")
+        return len(keys)
+
+    def start(self) -> None:
+        """Starts the background task on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._is_running_on(loop):
+            return
+        self._stopped = False
+        self._loop = loop
+        self._task = loop.create_task(self._run())
+
+    async def shutdown(self) -> None:
+        self._stopped = True
+        task = self._task
+        self._task = None
+        # The task on another loop cannot be cancelled here as the loop may no longer run
+        if task is not None and self._loop is asyncio.get_running_loop():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._loop = None
+
+    @property
+    def tracked_count(self) -> int:
+        return len(self._expirations)
+
+    # ------------------------------------------------
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.rotate_expiring_tokens()
+
+    def _track(self, key: TokenRotationKey, expires_at: int) -> None:
+        self._expirations[key] = expires_at
+        if not self._stopped and not self._is_running_on(asyncio.get_running_loop()):
+            self.start()
+
+    def _is_running_on(self, loop: asyncio.AbstractEventLoop) -> bool:
+        # asyncio.run() cancels the task at the end, and the task never runs again once its loop is closed
+        return self._task is not None and not self._task.done() and self._loop is loop
+
+    def _lock_for(self, key: TokenRotationKey) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    async def _rotate(self, key: TokenRotationKey) -> Any:
+        async with self._lock_for(key):
+            # Load the latest data as another task may have already rotated the tokens
+            kind, enterprise_id, team_id, user_id, is_enterprise_install = key
+            current: Optional[Union[Installation, Bot]]
+            if kind == "bot":
+                current = await self.installation_store.async_find_bot(
+                    enterprise_id=enterprise_id,
+                    team_id=team_id,
+                    is_enterprise_install=is_enterprise_install,
+                )
+                if current is not None:
+                    refreshed_bot = await self.token_rotator.perform_bot_token_rotation(
+                        bot=current,
+                        minutes_before_expiration=self.token_rotation_expiration_minutes,
+                    )
+                    if refreshed_bot is not None:
+                        await self.installation_store.async_save_bot(refreshed_bot)
+                        current = refreshed_bot
+            else:
+                current = await self.installation_store.async_find_installation(
+                    enterprise_id=enterprise_id,
+                    team_id=team_id,
+                    user_id=user_id,
+                    is_enterprise_install=is_enterprise_install,
+                )
+                if current is not None:
+                    refreshed = await self.token_rotator.perform_token_rotation(
+                        installation=current,
+                        minutes_before_expiration=self.token_rotation_expiration_minutes,
+                    )
+                    if refreshed is not None:
+                        await self.installation_store.async_save(refreshed)
+                        current = refreshed
+
+            expires_at = _expires_at(current) if current is not None else None
+            if expires_at is None:
+                self._expirations.pop(key, None)
+            else:
+                self._expirations[key] = expires_at
+            return current
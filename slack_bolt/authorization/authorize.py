@@ -1,5 +1,5 @@
 from logging import Logger
-from typing import Optional, Callable, Dict, Any, Sequence
+from typing import Optional, Callable, Dict, Any, Sequence, Union
 
 from slack_sdk.errors import SlackApiError, SlackTokenRotationError
 from slack_sdk.oauth import InstallationStore
@@ -10,8 +10,21 @@ from slack_sdk.web import WebClient
 
 from slack_bolt.authorization.authorize_args import AuthorizeArgs
 from slack_bolt.authorization.authorize_result import AuthorizeResult
+from slack_bolt.authorization.authorize_result_cache import (
+    AuthorizeResultCache,
+    AuthorizeResultCacheKey,
+    build_authorize_result_cache_key,
+)
+from slack_bolt.authorization.batch_installation_store import InstallationQuery, build_user_installation_query
+from slack_bolt.authorization.installation_identity import (
+    AuthTestVerificationSchedule,
+    auth_test_modes,
+    build_authorize_result_from_installation,
+)
+from slack_bolt.authorization.token_rotation_scheduler import TokenRotationScheduler
 from slack_bolt.context.context import BoltContext
 from slack_bolt.error import BoltError
+from slack_bolt.util.single_flight import SingleFlight
 from slack_bolt.util.utils import get_arg_names_of_callable
 
 
@@ -115,12 +128,18 @@ class InstallationStoreAuthorize(Authorize):
     you can expect that the `authorize` layer should work for you without any customization.
     """
 
-    authorize_result_cache: Dict[str, AuthorizeResult]
+    authorize_result_cache: Optional[AuthorizeResultCache]
+    auth_test_result_cache: Dict[str, AuthorizeResult]
+    auth_test_mode: str
+    auth_test_verification_schedule: AuthTestVerificationSchedule
+    single_flight: Optional[SingleFlight]
     bot_only: bool
     user_token_resolution: str
     find_installation_available: bool
+    find_installations_available: bool
     find_bot_available: bool
     token_rotator: Optional[TokenRotator]
+    token_rotation_scheduler: Optional[TokenRotationScheduler]
 
     _config_error_message: str = "InstallationStore with client_id/client_secret are required for token rotation"
 
@@ -135,7 +154,18 @@ class InstallationStoreAuthorize(Authorize):
         # For v1.0.x compatibility and people who still want its simplicity
         # use only InstallationStore#find_bot(enterprise_id, team_id)
         bot_only: bool = False,
+        # Memoizes the auth.test API results by token
         cache_enabled: bool = False,
+        # Caches the whole authorize results in front of the installation store (opt-in)
+        authorize_result_cache: Optional[AuthorizeResultCache] = None,
+        # Lets concurrent requests for the same user/workspace share a single lookup
+        single_flight_enabled: bool = True,
+        # "fallback" builds AuthorizeResult from the stored data and calls auth.test API only when it lacks fields
+        auth_test_mode: str = "always",
+        # Verifies the tokens with auth.test API periodically even when auth_test_mode is "fallback"
+        auth_test_verification_interval_seconds: Optional[float] = None,
+        # Refreshes expiring tokens in the background instead of doing so while handling requests
+        token_rotation_scheduler: Optional[TokenRotationScheduler] = None,
         client: Optional[WebClient] = None,
         # Since v1.27, user token resolution can be actor ID based when the mode is enabled
         user_token_resolution: str = "authed_user",
@@ -145,8 +175,12 @@ class InstallationStoreAuthorize(Authorize):
         self.bot_only = bot_only
         self.user_token_resolution = user_token_resolution
         self.cache_enabled = cache_enabled
-        self.authorize_result_cache = {}
+        self.auth_test_result_cache = {}
+        self.authorize_result_cache = authorize_result_cache
+        self.single_flight = SingleFlight() if single_flight_enabled else None
         self.find_installation_available = hasattr(installation_store, "find_installation")
+        # Optional capability (see BatchInstallationStore) to load several installations with a single call
+        self.find_installations_available = callable(getattr(installation_store, "find_installations", None))
         self.find_bot_available = hasattr(installation_store, "find_bot")
         if client_id is not None and client_secret is not None:
             self.token_rotator = TokenRotator(
@@ -157,6 +191,13 @@ class InstallationStoreAuthorize(Authorize):
         else:
             self.token_rotator = None
         self.token_rotation_expiration_minutes = token_rotation_expiration_minutes or 120
+        self.token_rotation_scheduler = token_rotation_scheduler
+        if auth_test_mode not in auth_test_modes:
+            raise BoltError(f"auth_test_mode must be one of {auth_test_modes} (given: {auth_test_mode})")
+        self.auth_test_mode = auth_test_mode
+        self.auth_test_verification_schedule = AuthTestVerificationSchedule(
+            interval_seconds=auth_test_verification_interval_seconds
+        )
 
     def __call__(
         self,
@@ -171,12 +212,71 @@ class InstallationStoreAuthorize(Authorize):
         actor_user_id: Optional[str] = None,
     ) -> Optional[AuthorizeResult]:
 
+        cache_key = build_authorize_result_cache_key(
+            enterprise_id=enterprise_id,
+            team_id=team_id,
+            user_id=user_id,
+            is_enterprise_install=context.is_enterprise_install,
+            actor_enterprise_id=actor_enterprise_id,
+            actor_team_id=actor_team_id,
+            actor_user_id=actor_user_id,
+        )
+        if self.authorize_result_cache is not None:
+            found, cached_result = self.authorize_result_cache.get(cache_key)
+            if found:
+                return cached_result
+
+        if self.single_flight is None:
+            return self._find_authorize_result(
+                context=context,
+                enterprise_id=enterprise_id,
+                team_id=team_id,
+                user_id=user_id,
+                actor_enterprise_id=actor_enterprise_id,
+                actor_team_id=actor_team_id,
+                actor_user_id=actor_user_id,
+                cache_key=cache_key,
+            )
+        # Concurrent requests for the same key share the installation store lookups and auth.test API calls
+        return self.single_flight.run(
+            cache_key,
+            lambda: self._find_authorize_result(
+                context=context,
+                enterprise_id=enterprise_id,
+                team_id=team_id,
+                user_id=user_id,
+                actor_enterprise_id=actor_enterprise_id,
+                actor_team_id=actor_team_id,
+                actor_user_id=actor_user_id,
+                cache_key=cache_key,
+            ),
+        )
+
+    def _find_authorize_result(
+        self,
+        *,
+        context: BoltContext,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        user_id: Optional[str],
+        actor_enterprise_id: Optional[str],
+        actor_team_id: Optional[str],
+        actor_user_id: Optional[str],
+        cache_key: AuthorizeResultCacheKey,
+    ) -> Optional[AuthorizeResult]:
+        cache = self.authorize_result_cache
         bot_token: Optional[str] = None
         user_token: Optional[str] = None
+        bot_token_expires_at: Optional[int] = None
+        user_token_expires_at: Optional[int] = None
         bot_scopes: Optional[Sequence[str]] = None
         user_scopes: Optional[Sequence[str]] = None
         latest_bot_installation: Optional[Installation] = None
         this_user_installation: Optional[Installation] = None
+        store_lookup_failed = False
+        # The data that holds the identity (e.g., bot_user_id) associated with each token
+        bot_identity_source: Optional[Union[Installation, Bot]] = None
+        user_identity_source: Optional[Installation] = None
 
         if not self.bot_only and self.find_installation_available:
             # Since v1.1, this is the default way.
@@ -184,11 +284,24 @@ class InstallationStoreAuthorize(Authorize):
             try:
                 # Note that this is the latest information for the org/workspace.
                 # The installer may not be the user associated with this incoming request.
-                latest_bot_installation = self.installation_store.find_installation(
+                latest_bot_installation_query = InstallationQuery(
                     enterprise_id=enterprise_id,
                     team_id=team_id,
                     is_enterprise_install=context.is_enterprise_install,
                 )
+                this_user_installation_query = build_user_installation_query(
+                    user_token_resolution=self.user_token_resolution,
+                    enterprise_id=enterprise_id,
+                    team_id=team_id,
+                    user_id=user_id,
+                    is_enterprise_install=context.is_enterprise_install,
+                    actor_enterprise_id=actor_enterprise_id,
+                    actor_team_id=actor_team_id,
+                    actor_user_id=actor_user_id,
+                )
+                # When the installation store supports it, the user's installation is loaded together in advance
+                prefetched = self._prefetch_installations([latest_bot_installation_query, this_user_installation_query])
+                latest_bot_installation = self._find_installation(latest_bot_installation_query, prefetched)
                 # If the user_token in the latest_installation is not for the user associated with this request,
                 # we'll fetch a different installation for the user below.
                 # The example use cases are:
@@ -197,13 +310,19 @@ class InstallationStoreAuthorize(Authorize):
                 if latest_bot_installation is not None:
                     # Save the latest bot token
                     bot_token = latest_bot_installation.bot_token  # this still can be None
+                    bot_identity_source = latest_bot_installation
+                    bot_token_expires_at = latest_bot_installation.bot_token_expires_at
                     user_token = latest_bot_installation.user_token  # this still can be None
+                    user_identity_source = latest_bot_installation
+                    user_token_expires_at = latest_bot_installation.user_token_expires_at
                     bot_scopes = latest_bot_installation.bot_scopes  # this still can be None
                     user_scopes = latest_bot_installation.user_scopes  # this still can be None
 
                     if latest_bot_installation.user_id != user_id:
                         # First off, remove the user token as the installer is a different user
                         user_token = None
+                        user_identity_source = None
+                        user_token_expires_at = None
                         user_scopes = None
                         latest_bot_installation.user_token = None
                         latest_bot_installation.user_refresh_token = None
@@ -212,24 +331,12 @@ class InstallationStoreAuthorize(Authorize):
 
                         # try to fetch the request user's installation
                         # to reflect the user's access token if exists
-                        if self.user_token_resolution == "actor":
-                            if actor_enterprise_id is not None or actor_team_id is not None:
-                                # Note that actor_team_id can be absent for app_mention events
-                                this_user_installation = self.installation_store.find_installation(
-                                    enterprise_id=actor_enterprise_id,
-                                    team_id=actor_team_id,
-                                    user_id=actor_user_id,
-                                    is_enterprise_install=None,
-                                )
-                        else:
-                            this_user_installation = self.installation_store.find_installation(
-                                enterprise_id=enterprise_id,
-                                team_id=team_id,
-                                user_id=user_id,
-                                is_enterprise_install=context.is_enterprise_install,
-                            )
+                        if this_user_installation_query is not None:
+                            this_user_installation = self._find_installation(this_user_installation_query, prefetched)
                         if this_user_installation is not None:
                             user_token = this_user_installation.user_token
+                            user_identity_source = this_user_installation
+                            user_token_expires_at = this_user_installation.user_token_expires_at
                             user_scopes = this_user_installation.user_scopes
                             if (
                                 latest_bot_installation.bot_token is None
@@ -240,12 +347,19 @@ class InstallationStoreAuthorize(Authorize):
                             ):
                                 # If latest_installation has a bot token, we never overwrite the value
                                 bot_token = this_user_installation.bot_token
+                                bot_identity_source = this_user_installation
+                                bot_token_expires_at = this_user_installation.bot_token_expires_at
                                 bot_scopes = this_user_installation.bot_scopes
 
                             # If token rotation is enabled, running rotation may be needed here
-                            refreshed = self._rotate_and_save_tokens_if_necessary(this_user_installation)
+                            refreshed = self._rotate_and_save_tokens_if_necessary(
+                                this_user_installation,
+                                user_id=this_user_installation.user_id,
+                            )
                             if refreshed is not None:
                                 user_token = refreshed.user_token
+                                user_identity_source = refreshed
+                                user_token_expires_at = refreshed.user_token_expires_at
                                 user_scopes = refreshed.user_scopes
                                 if (
                                     latest_bot_installation.bot_token is None
@@ -256,17 +370,23 @@ class InstallationStoreAuthorize(Authorize):
                                 ):
                                     # If latest_installation has a bot token, we never overwrite the value
                                     bot_token = refreshed.bot_token
+                                    bot_identity_source = refreshed
+                                    bot_token_expires_at = refreshed.bot_token_expires_at
                                     bot_scopes = refreshed.bot_scopes
 
                     # If token rotation is enabled, running rotation may be needed here
                     refreshed = self._rotate_and_save_tokens_if_necessary(latest_bot_installation)
                     if refreshed is not None:
                         bot_token = refreshed.bot_token
+                        bot_identity_source = refreshed
+                        bot_token_expires_at = refreshed.bot_token_expires_at
                         bot_scopes = refreshed.bot_scopes
                         if this_user_installation is None:
                             # Only when we don't have `this_user_installation` here,
                             # the `user_token` is for the user associated with this request
                             user_token = refreshed.user_token
+                            user_identity_source = refreshed
+                            user_token_expires_at = refreshed.user_token_expires_at
                             user_scopes = refreshed.user_scopes
 
             except SlackTokenRotationError as rotation_error:
@@ -293,18 +413,26 @@ class InstallationStoreAuthorize(Authorize):
                 )
                 if bot is not None:
                     bot_token = bot.bot_token
+                    bot_identity_source = bot
+                    bot_token_expires_at = bot.bot_token_expires_at
                     bot_scopes = bot.bot_scopes
                     if bot.bot_refresh_token is not None:
                         # Token rotation
                         if self.token_rotator is None:
                             raise BoltError(self._config_error_message)
-                        refreshed_bot = self.token_rotator.perform_bot_token_rotation(
-                            bot=bot,
-                            minutes_before_expiration=self.token_rotation_expiration_minutes,
-                        )
+                        if self.token_rotation_scheduler is not None:
+                            refreshed_bot = self.token_rotation_scheduler.rotate_bot_if_necessary(bot)
+                        else:
+                            refreshed_bot = self.token_rotator.perform_bot_token_rotation(
+                                bot=bot,
+                                minutes_before_expiration=self.token_rotation_expiration_minutes,
+                            )
+                            if refreshed_bot is not None:
+                                self.installation_store.save_bot(refreshed_bot)
                         if refreshed_bot is not None:
-                            self.installation_store.save_bot(refreshed_bot)
                             bot_token = refreshed_bot.bot_token
+                            bot_identity_source = refreshed_bot
+                            bot_token_expires_at = refreshed_bot.bot_token_expires_at
                             bot_scopes = refreshed_bot.bot_scopes
 
             except SlackTokenRotationError as rotation_error:
@@ -316,46 +444,99 @@ class InstallationStoreAuthorize(Authorize):
                 self.find_bot_available = False
             except Exception as e:
                 self.logger.info(f"Failed to call find_bot method: {e}")
+                store_lookup_failed = True
 
         token: Optional[str] = bot_token or user_token
         if token is None:
             # No valid token was found
             self._debug_log_for_not_found(enterprise_id, team_id)
+            if cache is not None and not store_lookup_failed:
+                cache.set_not_found(cache_key)
             return None
 
-        # Check cache to see if the bot object already exists
-        if self.cache_enabled and token in self.authorize_result_cache:
-            return self.authorize_result_cache[token]
-
-        try:
-            auth_test_api_response = context.client.auth_test(token=token)
-            user_auth_test_response = None
-            if user_token is not None and token != user_token:
-                user_auth_test_response = context.client.auth_test(token=user_token)
-            authorize_result = AuthorizeResult.from_auth_test_response(
-                auth_test_response=auth_test_api_response,
-                user_auth_test_response=user_auth_test_response,
+        authorize_result: Optional[AuthorizeResult] = None
+        if self.auth_test_mode == "fallback" and not self.auth_test_verification_schedule.is_due(token):
+            authorize_result = build_authorize_result_from_installation(
+                bot_identity_source=bot_identity_source,
+                user_identity_source=user_identity_source,
                 bot_token=bot_token,
                 user_token=user_token,
                 bot_scopes=bot_scopes,
                 user_scopes=user_scopes,
             )
-            if self.cache_enabled:
-                self.authorize_result_cache[token] = authorize_result
-            return authorize_result
-        except SlackApiError as err:
-            self.logger.debug(
-                f"The stored bot token for enterprise_id: {enterprise_id} team_id: {team_id} "
-                f"is no longer valid. (response: {err.response})"
-            )
-            return None
+        if authorize_result is None and self.cache_enabled and token in self.auth_test_result_cache:
+            authorize_result = self.auth_test_result_cache[token]
+        if authorize_result is None:
+            try:
+                auth_test_api_response = context.client.auth_test(token=token)
+                user_auth_test_response = None
+                if user_token is not None and token != user_token:
+                    user_auth_test_response = context.client.auth_test(token=user_token)
+                authorize_result = AuthorizeResult.from_auth_test_response(
+                    auth_test_response=auth_test_api_response,
+                    user_auth_test_response=user_auth_test_response,
+                    bot_token=bot_token,
+                    user_token=user_token,
+                    bot_scopes=bot_scopes,
+                    user_scopes=user_scopes,
+                )
+                self.auth_test_verification_schedule.record(token)
+                if self.cache_enabled:
+                    self.auth_test_result_cache[token] = authorize_result
+            except SlackApiError as err:
+                self.logger.debug(
+                    f"The stored bot token for enterprise_id: {enterprise_id} team_id: {team_id} "
+                    f"is no longer valid. (response: {err.response})"
+                )
+                return None
+
+        if cache is not None:
+            expires_at = min([e for e in (bot_token_expires_at, user_token_expires_at) if e is not None], default=None)
+            if expires_at is not None and self.token_rotator is not None:
+                # Let the following requests run token rotation before the tokens expire
+                expires_at -= self.token_rotation_expiration_minutes * 60
+            cache.set(cache_key, authorize_result, expires_at=expires_at)
+        return authorize_result
 
     # ------------------------------------------------
 
     def _debug_log_for_not_found(self, enterprise_id: Optional[str], team_id: Optional[str]):
         self.logger.debug("No installation data found " f"for enterprise_id: {enterprise_id} team_id: {team_id}")
 
-    def _rotate_and_save_tokens_if_necessary(self, installation: Optional[Installation]) -> Optional[Installation]:
+    def _prefetch_installations(
+        self,
+        queries: Sequence[Optional[InstallationQuery]],
+    ) -> Optional[Dict[InstallationQuery, Optional[Installation]]]:
+        unique_queries = list(dict.fromkeys(q for q in queries if q is not None))
+        if not self.find_installations_available or len(unique_queries) < 2:
+            return None
+        try:
+            installations = self.installation_store.find_installations(queries=unique_queries)  # type: ignore[attr-defined]
+        except NotImplementedError as _:
+            self.find_installations_available = False
+            return None
+        return dict(zip(unique_queries, installations))
+
+    def _find_installation(
+        self,
+        query: InstallationQuery,
+        prefetched: Optional[Dict[InstallationQuery, Optional[Installation]]],
+    ) -> Optional[Installation]:
+        if prefetched is not None and query in prefetched:
+            # A prefetched installation is used only once as the caller may modify it
+            return prefetched.pop(query)
+        return self.installation_store.find_installation(
+            enterprise_id=query.enterprise_id,
+            team_id=query.team_id,
+            user_id=query.user_id,
+            is_enterprise_install=query.is_enterprise_install,
+        )
+
+    def _rotate_and_save_tokens_if_necessary(
+        self,
+        installation: Optional[Installation],
+        user_id: Optional[str] = None,
+    ) -> Optional[Installation]:
         if installation is None or (installation.user_refresh_token is None and installation.bot_refresh_token is None):
             # No need to rotate tokens
             return None
@@ -364,6 +545,16 @@ class InstallationStoreAuthorize(Authorize):
             # Token rotation is required but this Bolt app is not properly configured
             raise BoltError(self._config_error_message)
 
+        if self.token_rotation_scheduler is not None:
+            refreshed_installation = self.token_rotation_scheduler.rotate_if_necessary(installation, user_id=user_id)
+            if refreshed_installation is not None and installation.user_token is None:
+                # Never return the user token that is not relevant to the request
+                refreshed_installation.user_token = None
+                refreshed_installation.user_refresh_token = None
+                refreshed_installation.user_token_expires_at = None
+                refreshed_installation.user_scopes = None
+            return refreshed_installation
+
         refreshed: Optional[Installation] = self.token_rotator.perform_token_rotation(
             installation=installation,
             minutes_before_expiration=self.token_rotation_expiration_minutes,
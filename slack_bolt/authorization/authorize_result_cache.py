@@ -0,0 +1,155 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional, Tuple
+
+from slack_bolt.authorization.authorize_result import AuthorizeResult
+
+AuthorizeResultCacheKey = Tuple[Any, ...]
+
+
+class AuthorizeResultCache:
+    """An in-memory LRU cache of `AuthorizeResult`s, which works in front of the `InstallationStore` lookups.
+
+    The entries are keyed by (enterprise_id, team_id, user_id, is_enterprise_install). Each entry expires
+    after `ttl_seconds`, or earlier when the cached tokens expire. An absent installation is cached as well
+    (negative entry) for a shorter period, so that requests from unknown workspaces do not hit the database every time.
+    All the operations are thread-safe and never block on I/O, so the same class can be used by the async authorize.
+
+    The entries for a workspace are removed when `OAuthFlow` saves its installation and when its tokens are revoked
+    or the app is uninstalled. Changes made by other processes are reflected after the TTL.
+
+    This cache is enabled only by passing an instance as `authorize_result_cache`. Note that
+    `InstallationStoreAuthorize#authorize_result_cache` used to be the dict of the auth.test API results keyed by token,
+    which `cache_enabled=True` still fills; the dict is now `InstallationStoreAuthorize#auth_test_result_cache`.
+    """
+
+    max_size: int
+    ttl_seconds: float
+    negative_ttl_seconds: float
+
+    hit_count: int
+    miss_count: int
+    eviction_count: int
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 10000,
+        ttl_seconds: float = 600,
+        negative_ttl_seconds: float = 30,
+    ):
+        """
+        Args:
+            max_size: The maximum number of entries; the least recently used one is evicted when exceeded
+            ttl_seconds: The lifetime of an entry in seconds
+            negative_ttl_seconds: The lifetime of an entry for an absent installation in seconds (0 disables it)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        # key -> (deadline in the monotonic clock, result or None for absent installations)
+        self._entries: "OrderedDict[AuthorizeResultCacheKey, Tuple[float, Optional[AuthorizeResult]]]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: AuthorizeResultCacheKey) -> Tuple[bool, Optional[AuthorizeResult]]:
+        """Looks up the entry for the key.
+
+        Returns:
+            A tuple of a flag telling if a live entry exists and the cached result
+            (None for a negative entry)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hit_count += 1
+                    return True, entry[1]
+                del self._entries[key]
+            self.miss_count += 1
+            return False, None
+
+    def set(
+        self,
+        key: AuthorizeResultCacheKey,
+        result: AuthorizeResult,
+        *,
+        expires_at: Optional[int] = None,
+    ) -> None:
+        """Saves an authorize result.
+
+        Args:
+            key: The cache key
+            result: The result to cache
+            expires_at: The epoch time (in seconds) after which the result must not be used
+                (e.g., when its tokens expire)
+        """
+        ttl_seconds = self.ttl_seconds
+        if expires_at is not None:
+            ttl_seconds = min(ttl_seconds, expires_at - time.time())
+        self._put(key, result, ttl_seconds)
+
+    def set_not_found(self, key: AuthorizeResultCacheKey) -> None:
+        """Saves a negative entry, which tells that no installation exists for the key."""
+        self._put(key, None, self.negative_ttl_seconds)
+
+    def invalidate(
+        self,
+        *,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        is_enterprise_install: Optional[bool] = False,
+    ) -> None:
+        """Removes all the entries for the workspace regardless of the users.
+        For an org-wide installation, all the entries for the organization are removed.
+        """
+        with self._lock:
+            if is_enterprise_install and enterprise_id is not None:
+                keys = [k for k in self._entries.keys() if k[0] == enterprise_id]
+            else:
+                keys = [k for k in self._entries.keys() if k[0] == enterprise_id and k[1] == team_id]
+            for key in keys:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _put(self, key: AuthorizeResultCacheKey, result: Optional[AuthorizeResult], ttl_seconds: float) -> None:
+        if ttl_seconds <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.eviction_count += 1
+
+
+def build_authorize_result_cache_key(
+    *,
+    enterprise_id: Optional[str],
+    team_id: Optional[str],
+    user_id: Optional[str],
+    is_enterprise_install: Optional[bool],
+    actor_enterprise_id: Optional[str] = None,
+    actor_team_id: Optional[str] = None,
+    actor_user_id: Optional[str] = None,
+) -> AuthorizeResultCacheKey:
+    # The actor_* values are available only when user_token_resolution: "actor" is set
+    return (
+        enterprise_id,
+        team_id,
+        user_id,
+        is_enterprise_install,
+        actor_enterprise_id,
+        actor_team_id,
+        actor_user_id,
+    )
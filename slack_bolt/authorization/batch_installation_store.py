@@ -0,0 +1,62 @@
+from typing import NamedTuple, Optional, Sequence
+
+from slack_sdk.oauth.installation_store.models.installation import Installation
+
+
+class InstallationQuery(NamedTuple):
+    """The arguments of a single `InstallationStore#find_installation()` call."""
+
+    enterprise_id: Optional[str]
+    team_id: Optional[str]
+    user_id: Optional[str] = None
+    is_enterprise_install: Optional[bool] = False
+
+
+class BatchInstallationStore:
+    """An optional capability of `InstallationStore`, which loads several installations at once.
+
+    When the installation store given to a Bolt app implements this class (e.g., as a mixin),
+    `InstallationStoreAuthorize` loads both the latest installation in a workspace and the request user's
+    installation with a single `find_installations()` call, instead of calling `find_installation()` twice.
+    This is beneficial for installation stores backed by a remote database.
+
+        class MyInstallationStore(SQLAlchemyInstallationStore, BatchInstallationStore):
+            def find_installations(self, *, queries):
+                ...  # run a single query
+    """
+
+    def find_installations(
+        self,
+        *,
+        queries: Sequence[InstallationQuery],
+    ) -> Sequence[Optional[Installation]]:
+        """Finds the installations for the given queries.
+
+        Args:
+            queries: The arguments of `find_installation()` calls
+
+        Returns:
+            The results in the same order as the queries. Each item must be the same as what
+            `find_installation()` returns for the query (None if not found).
+        """
+        raise NotImplementedError()
+
+
+def build_user_installation_query(
+    *,
+    user_token_resolution: str,
+    enterprise_id: Optional[str],
+    team_id: Optional[str],
+    user_id: Optional[str],
+    is_enterprise_install: Optional[bool],
+    actor_enterprise_id: Optional[str] = None,
+    actor_team_id: Optional[str] = None,
+    actor_user_id: Optional[str] = None,
+) -> Optional[InstallationQuery]:
+    # Returns the query to load the installation for the user associated with an incoming request
+    if user_token_resolution == "actor":
+        if actor_enterprise_id is None and actor_team_id is None:
+            return None
+        # Note that actor_team_id can be absent for app_mention events
+        return InstallationQuery(actor_enterprise_id, actor_team_id, actor_user_id, None)
+    return InstallationQuery(enterprise_id, team_id, user_id, is_enterprise_install)
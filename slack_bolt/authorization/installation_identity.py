@@ -0,0 +1,92 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Sequence, Union
+
+from slack_sdk.oauth.installation_store.models.bot import Bot
+from slack_sdk.oauth.installation_store.models.installation import Installation
+
+from slack_bolt.authorization.authorize_result import AuthorizeResult
+
+auth_test_modes = ["always", "fallback"]
+
+
+def build_authorize_result_from_installation(
+    *,
+    bot_identity_source: Optional[Union[Installation, Bot]],
+    user_identity_source: Optional[Installation],
+    bot_token: Optional[str],
+    user_token: Optional[str],
+    bot_scopes: Optional[Sequence[str]],
+    user_scopes: Optional[Sequence[str]],
+) -> Optional[AuthorizeResult]:
+    """Builds an `AuthorizeResult` from the data in the installation store without calling auth.test API.
+
+    Returns:
+        The result, or None if the stored data lacks any of the required identity fields.
+        Note that `url` and `user` (name) are not available in this way.
+    """
+    team_source: Optional[Union[Installation, Bot]] = None
+    bot_id: Optional[str] = None
+    bot_user_id: Optional[str] = None
+    user_id: Optional[str] = None
+    if bot_token is not None:
+        if bot_identity_source is None or bot_identity_source.bot_id is None or bot_identity_source.bot_user_id is None:
+            return None
+        team_source = bot_identity_source
+        bot_id = bot_identity_source.bot_id
+        bot_user_id = bot_identity_source.bot_user_id
+    if user_token is not None:
+        if user_identity_source is None or user_identity_source.user_id is None:
+            return None
+        team_source = team_source or user_identity_source
+        user_id = user_identity_source.user_id
+    if team_source is None or (team_source.team_id is None and team_source.enterprise_id is None):
+        return None
+
+    return AuthorizeResult(
+        enterprise_id=team_source.enterprise_id,
+        team_id=team_source.team_id,
+        team=team_source.team_name,
+        bot_id=bot_id,
+        bot_user_id=bot_user_id,
+        bot_token=bot_token,
+        bot_scopes=bot_scopes,
+        user_id=user_id,
+        user_token=user_token,
+        user_scopes=user_scopes,
+    )
+
+
+class AuthTestVerificationSchedule:
+    """Decides when a token should be verified by calling auth.test API
+    even though the `AuthorizeResult` can be built from the installation store data.
+
+    A token is verified when it is seen for the first time and then every `interval_seconds`,
+    so that revoked tokens are eventually detected. When `interval_seconds` is None, no verification is done.
+    """
+
+    interval_seconds: Optional[float]
+    max_size: int
+
+    def __init__(self, *, interval_seconds: Optional[float] = None, max_size: int = 10000):
+        self.interval_seconds = interval_seconds
+        self.max_size = max_size
+        self._verified_at: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = Lock()
+
+    def is_due(self, token: str) -> bool:
+        if self.interval_seconds is None:
+            return False
+        with self._lock:
+            verified_at = self._verified_at.get(token)
+        return verified_at is None or time.monotonic() - verified_at >= self.interval_seconds
+
+    def record(self, token: str) -> None:
+        if self.interval_seconds is None:
+            return
+        with self._lock:
+            self._verified_at[token] = time.monotonic()
+            self._verified_at.move_to_end(token)
+            while len(self._verified_at) > self.max_size:
+                self._verified_at.popitem(last=False)
@@ -0,0 +1,223 @@
+import time
+from logging import Logger
+from threading import Event, Lock, Thread
+from typing import Any, Dict, Optional, Tuple, Union
+from weakref import WeakValueDictionary
+
+from slack_sdk.errors import SlackTokenRotationError
+from slack_sdk.oauth import InstallationStore
+from slack_sdk.oauth.installation_store.models.bot import Bot
+from slack_sdk.oauth.installation_store.models.installation import Installation
+from slack_sdk.oauth.token_rotation.rotator import TokenRotator
+
+from slack_bolt.logger import get_bolt_logger
+
+# (kind, enterprise_id, team_id, user_id, is_enterprise_install)
+TokenRotationKey = Tuple[str, Optional[str], Optional[str], Optional[str], Optional[bool]]
+
+
+def _expires_at(data: Union[Installation, Bot]) -> Optional[int]:
+    # Returns the earliest expiration time of the tokens that can be refreshed
+    values = []
+    if data.bot_refresh_token is not None and data.bot_token_expires_at is not None:
+        values.append(data.bot_token_expires_at)
+    if isinstance(data, Installation):
+        if data.user_refresh_token is not None and data.user_token_expires_at is not None:
+            values.append(data.user_token_expires_at)
+    return min(values) if len(values) > 0 else None
+
+
+def _installation_key(installation: Installation, user_id: Optional[str]) -> TokenRotationKey:
+    return ("installation", installation.enterprise_id, installation.team_id, user_id, installation.is_enterprise_install)
+
+
+def _bot_key(bot: Bot) -> TokenRotationKey:
+    return ("bot", bot.enterprise_id, bot.team_id, None, bot.is_enterprise_install)
+
+
+class TokenRotationScheduler:
+    """Refreshes the tokens of the installations seen by `InstallationStoreAuthorize` in a background thread.
+
+    As `InstallationStore` does not provide a way to enumerate installations, this scheduler keeps track of
+    the installations with expiring tokens when the authorize middleware loads them. A daemon thread periodically
+    rotates the ones nearing `token_rotation_expiration_minutes` and saves the refreshed data,
+    so that incoming requests only read the fresh tokens. A request rotates tokens by itself only when they
+    are about to expire (e.g., the first request after the app has been idle).
+    Each installation is rotated while holding its own lock, and the latest data is loaded again inside the lock,
+    so that the same refresh token is never used twice.
+    Call `App#stop()` (or `shutdown()`) to stop the background thread.
+    """
+
+    installation_store: InstallationStore
+    token_rotator: TokenRotator
+    token_rotation_expiration_minutes: int
+    interval_seconds: float
+    inline_rotation_margin_seconds: float
+    logger: Logger
+
+    def __init__(
+        self,
+        *,
+        installation_store: InstallationStore,
+        token_rotator: TokenRotator,
+        token_rotation_expiration_minutes: int = 120,
+        interval_seconds: float = 60,
+        inline_rotation_margin_seconds: float = 30,
+        logger: Optional[Logger] = None,
+    ):
+        """
+        Args:
+            installation_store: The installation store to load and save installations
+            token_rotator: The token rotator
+            token_rotation_expiration_minutes: The tokens expiring within this period are rotated (Default: 120)
+            interval_seconds: The interval of the background scans (Default: 60)
+            inline_rotation_margin_seconds: A request rotates tokens by itself
+                only when they expire within this period (Default: 30)
+            logger: The logger
+        """
+        self.installation_store = installation_store
+        self.token_rotator = token_rotator
+        self.token_rotation_expiration_minutes = token_rotation_expiration_minutes
+        self.interval_seconds = interval_seconds
+        self.inline_rotation_margin_seconds = inline_rotation_margin_seconds
+        self.logger = logger or get_bolt_logger(TokenRotationScheduler)
+
+        self._expirations: Dict[TokenRotationKey, int] = {}
+        # A lock lives only while a thread is rotating the installation's tokens
+        self._locks: "WeakValueDictionary[TokenRotationKey, Lock]" = WeakValueDictionary()
+        self._lock = Lock()
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+
+    def rotate_if_necessary(self, installation: Installation, *, user_id: Optional[str] = None) -> Optional[Installation]:
+        """Called by the authorize middleware instead of rotating the tokens of an installation inline.
+
+        Args:
+            installation: The installation loaded by the authorize middleware
+            user_id: The user_id used for loading the installation (None for the latest installation in a workspace)
+
+        Returns:
+            The latest installation data if it had to be refreshed inline, otherwise None
+        """
+        key = _installation_key(installation, user_id)
+        expires_at = _expires_at(installation)
+        if expires_at is not None and expires_at - time.time() > self.inline_rotation_margin_seconds:
+            # The tokens are still valid; the background thread refreshes them before they expire
+            self._track(key, expires_at)
+            return None
+        return self._rotate(key)
+
+    def rotate_bot_if_necessary(self, bot: Bot) -> Optional[Bot]:
+        """The same as `rotate_if_necessary()` for the `InstallationStore#find_bot()` users."""
+        key = _bot_key(bot)
+        expires_at = _expires_at(bot)
+        if expires_at is not None and expires_at - time.time() > self.inline_rotation_margin_seconds:
+            self._track(key, expires_at)
+            return None
+        return self._rotate(key)
+
+    def rotate_expiring_tokens(self) -> int:
+        """Rotates the tokens nearing their expiration. The background thread calls this method periodically.
+
+        Returns:
+            The number of the installations that were checked
+        """
+        threshold = time.time() + self.token_rotation_expiration_minutes * 60
+        with self._lock:
+            keys = [key for key, expires_at in self._expirations.items() if expires_at <= threshold]
+        for key in keys:
+            try:
+                self._rotate(key)
+            except SlackTokenRotationError as e:
+                # Usually unrecoverable; the next request for the installation will try it again
+                self.logger.error(f"Failed to rotate tokens in the background due to {e}")
+                self._untrack(key)
+            except Exception as e:
+                self.logger.warning(f"Failed to rotate tokens in the background due to {e}")
+        return len(keys)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopped.clear()
+            self._thread = Thread(target=self._run, name="slack-bolt-token-rotation", daemon=True)
+            self._thread.start()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        self._stopped.set()
+        if thread is not None:
+            thread.join()
+
+    @property
+    def tracked_count(self) -> int:
+        return len(self._expirations)
+
+    # ------------------------------------------------
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval_seconds):
+            self.rotate_expiring_tokens()
+
+    def _track(self, key: TokenRotationKey, expires_at: int) -> None:
+        with self._lock:
+            self._expirations[key] = expires_at
+        if self._thread is None and not self._stopped.is_set():
+            self.start()
+
+    def _untrack(self, key: TokenRotationKey) -> None:
+        with self._lock:
+            self._expirations.pop(key, None)
+
+    def _lock_for(self, key: TokenRotationKey) -> Lock:
+        with self._lock:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = Lock()
+            return lock
+
+    def _rotate(self, key: TokenRotationKey) -> Any:
+        with self._lock_for(key):
+            # Load the latest data as another thread may have already rotated the tokens
+            kind, enterprise_id, team_id, user_id, is_enterprise_install = key
+            current: Optional[Union[Installation, Bot]]
+            if kind == "bot":
+                current = self.installation_store.find_bot(
+                    enterprise_id=enterprise_id,
+                    team_id=team_id,
+                    is_enterprise_install=is_enterprise_install,
+                )
+                if current is not None:
+                    refreshed_bot = self.token_rotator.perform_bot_token_rotation(
+                        bot=current,
+                        minutes_before_expiration=self.token_rotation_expiration_minutes,
+                    )
+                    if refreshed_bot is not None:
+                        self.installation_store.save_bot(refreshed_bot)
+                        current = refreshed_bot
+            else:
+                current = self.installation_store.find_installation(
+                    enterprise_id=enterprise_id,
+                    team_id=team_id,
+                    user_id=user_id,
+                    is_enterprise_install=is_enterprise_install,
+                )
+                if current is not None:
+                    refreshed = self.token_rotator.perform_token_rotation(
+                        installation=current,
+                        minutes_before_expiration=self.token_rotation_expiration_minutes,
+                    )
+                    if refreshed is not None:
+                        self.installation_store.save(refreshed)
+                        current = refreshed
+
+            expires_at = _expires_at(current) if current is not None else None
+            if expires_at is None:
+                self._untrack(key)
+            else:
+                with self._lock:
+                    self._expirations[key] = expires_at
+            return current
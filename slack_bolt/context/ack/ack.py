@@ -1,4 +1,5 @@
-from typing import Optional, Union, Dict, Sequence
+from threading import Event
+from typing import Any, Dict, Optional, Sequence, Union
 
 from slack_sdk.models.attachments import Attachment
 from slack_sdk.models.blocks import Block, Option, OptionGroup
@@ -9,10 +10,45 @@ from slack_bolt.response.response import BoltResponse
 
 
 class Ack:
-    response: Optional[BoltResponse]
+    _response: Optional[BoltResponse]
+    _acknowledged: Event
 
     def __init__(self):
-        self.response: Optional[BoltResponse] = None
+        self._response = None
+        self._acknowledged = Event()
+
+    @property
+    def response(self) -> Optional[BoltResponse]:
+        return self._response
+
+    @response.setter
+    def response(self, response: Optional[BoltResponse]) -> None:
+        self._response = response
+        if response is not None:
+            # wake up the listener runner waiting for the acknowledgement
+            self._acknowledged.set()
+
+    def wait_until_acknowledged(self, timeout: Optional[float] = None) -> bool:
+        """Blocks the current thread until a response is set or the timeout expires.
+
+        Args:
+            timeout: The max duration to wait in seconds
+
+        Returns:
+            True if this ack() has been called (= the response is available)
+        """
+        if self._response is None:
+            self._acknowledged.wait(timeout)
+        return self._response is not None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # threading.Event is not copyable
+        return {"_response": self._response}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._response = None
+        self._acknowledged = Event()
+        self.response = state["_response"]
 
     def __call__(
         self,
@@ -1,4 +1,5 @@
-from typing import Optional, Union, Dict, Sequence
+import asyncio
+from typing import Any, Dict, Optional, Sequence, Union
 
 from slack_sdk.models.attachments import Attachment
 from slack_sdk.models.blocks import Block, Option, OptionGroup
@@ -9,10 +10,50 @@ from slack_bolt.response.response import BoltResponse
 
 
 class AsyncAck:
-    response: Optional[BoltResponse]
+    _response: Optional[BoltResponse]
+    _acknowledged: Optional[asyncio.Event]
 
     def __init__(self):
-        self.response: Optional[BoltResponse] = None
+        self._response = None
+        # created in the event loop that waits for the acknowledgement
+        self._acknowledged = None
+
+    @property
+    def response(self) -> Optional[BoltResponse]:
+        return self._response
+
+    @response.setter
+    def response(self, response: Optional[BoltResponse]) -> None:
+        self._response = response
+        if response is not None and self._acknowledged is not None:
+            # wake up the listener runner waiting for the acknowledgement
+            self._acknowledged.set()
+
+    async def wait_until_acknowledged(self, timeout: Optional[float] = None) -> bool:
+        """Waits until a response is set or the timeout expires.
+
+        Args:
+            timeout: The max duration to wait in seconds
+
+        Returns:
+            True if this ack() has been called (= the response is available)
+        """
+        if self._response is None:
+            if self._acknowledged is None:
+                self._acknowledged = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._acknowledged.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._response is not None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # asyncio.Event is not copyable
+        return {"_response": self._response}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._response = state["_response"]
+        self._acknowledged = None
 
     async def __call__(
         self,
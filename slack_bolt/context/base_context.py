@@ -1,8 +1,11 @@
 from logging import Logger
-from typing import Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from slack_bolt.authorization import AuthorizeResult
 
+if TYPE_CHECKING:
+    from slack_bolt.request.payload_kind import PayloadKind
+
 
 class BaseContext(dict):
     """Context object associated with a request from Slack."""
@@ -20,6 +23,7 @@ class BaseContext(dict):
         "channel_id",
         "thread_ts",
         "response_url",
+        "payload_kind",
         "matches",
         "authorize_result",
         "function_bot_access_token",
@@ -121,6 +125,11 @@ class BaseContext(dict):
         """The `response_url` associated with this request."""
         return self.get("response_url")
 
+    @property
+    def payload_kind(self) -> Optional["PayloadKind"]:
+        """The classification of the request payload, which is extracted when the request is constructed."""
+        return self.get("payload_kind")
+
     @property
     def matches(self) -> Optional[Tuple]:
         """Returns all the matched parts in message listener's regexp"""
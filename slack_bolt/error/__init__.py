@@ -27,3 +27,15 @@ class BoltUnhandledRequestError(BoltError):
 
     def __str__(self) -> str:
         return "unhandled request error"
+
+
+class BoltListenerExecutorSaturatedError(BoltError):
+    """Raised when the listener executor rejects a new task as both the workers and the queue are full."""
+
+    listener_name: Optional[str]
+
+    def __init__(self, listener_name: Optional[str] = None):
+        self.listener_name = listener_name
+
+    def __str__(self) -> str:
+        return f"listener executor is saturated (listener: {self.listener_name})"
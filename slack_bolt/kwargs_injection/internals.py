@@ -0,0 +1,171 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from slack_bolt.request.payload_utils import (
+    to_options,
+    to_shortcut,
+    to_action,
+    to_view,
+    to_command,
+    to_event,
+    to_message,
+    to_step,
+)
+
+# The order matters; "payload" is the first non-empty one among them
+_payload_extractors: Dict[str, Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = {
+    "options": to_options,
+    "shortcut": to_shortcut,
+    "action": to_action,
+    "view": to_view,
+    "command": to_command,
+    "event": to_event,
+    "message": to_message,
+    "step": to_step,
+}
+
+
+def extract_payload(request: Any, name: str) -> Optional[Dict[str, Any]]:
+    """Returns a payload alias (e.g., "event", "action") or "payload" in the request body.
+    The extracted values are cached in the request, so that they are computed at most once per request.
+
+    Args:
+        request: The `BoltRequest` / `AsyncBoltRequest` instance
+        name: Either "payload" or any of the payload aliases
+
+    Returns:
+        The extracted payload data
+    """
+    body = request.body
+    cache: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = getattr(request, "_extracted_payloads", None)
+    if cache is None or cache[0] is not body:
+        # The body can be replaced by a middleware; in that case, the cached values must be discarded
+        cache = (body, {})
+        request._extracted_payloads = cache
+    values = cache[1]
+    if name not in values:
+        if name == "payload":
+            payload = None
+            for alias in _payload_extractors.keys():
+                payload = extract_payload(request, alias)
+                if payload:
+                    break
+            values[name] = payload or body
+        else:
+            values[name] = _payload_extractors[name](body)
+    return values[name]
+
+
+class ArgumentSource:
+    """The values required for resolving the arguments of a middleware/listener function invocation."""
+
+    __slots__ = ["logger", "request", "response", "next_func", "error"]
+
+    def __init__(self, logger: Any, request: Any, response: Any, next_func: Any, error: Optional[Exception]):
+        self.logger = logger
+        self.request = request
+        self.response = response
+        self.next_func = next_func
+        self.error = error
+
+
+ArgumentResolver = Callable[[ArgumentSource], Any]
+
+
+def _payload_resolver(name: str) -> ArgumentResolver:
+    def resolve(source: ArgumentSource) -> Any:
+        return extract_payload(source.request, name)
+
+    return resolve
+
+
+def _context_property_resolver(name: str) -> ArgumentResolver:
+    def resolve(source: ArgumentSource) -> Any:
+        return getattr(source.request.context, name)
+
+    return resolve
+
+
+# All the built-in arguments; the values are resolved only when a function requires them
+standard_argument_resolvers: Dict[str, ArgumentResolver] = {
+    "logger": lambda s: s.logger,
+    "client": _context_property_resolver("client"),
+    "req": lambda s: s.request,
+    "request": lambda s: s.request,
+    "resp": lambda s: s.response,
+    "response": lambda s: s.response,
+    "context": lambda s: s.request.context,
+    # payload
+    "body": lambda s: s.request.body,
+    "options": _payload_resolver("options"),
+    "shortcut": _payload_resolver("shortcut"),
+    "action": _payload_resolver("action"),
+    "view": _payload_resolver("view"),
+    "command": _payload_resolver("command"),
+    "event": _payload_resolver("event"),
+    "message": _payload_resolver("message"),
+    "step": _payload_resolver("step"),
+    # utilities
+    "ack": _context_property_resolver("ack"),
+    "say": _context_property_resolver("say"),
+    "respond": _context_property_resolver("respond"),
+    "complete": _context_property_resolver("complete"),
+    "fail": _context_property_resolver("fail"),
+    "set_status": _context_property_resolver("set_status"),
+    "set_title": _context_property_resolver("set_title"),
+    "set_suggested_prompts": _context_property_resolver("set_suggested_prompts"),
+    "save_thread_context": _context_property_resolver("save_thread_context"),
+    "say_stream": _context_property_resolver("say_stream"),
+    # middleware
+    "next": lambda s: s.next_func,
+    "next_": lambda s: s.next_func,  # for the middleware using Python's built-in `next()` function
+    # error handler
+    "error": lambda s: s.error,  # Exception
+    "payload": _payload_resolver("payload"),
+}
+
+next_argument_names = ("next", "next_")
+
+# (arg name, resolver) pairs; None as the resolver means the value is either in the context or unavailable
+InjectionPlan = Tuple[Tuple[str, Optional[ArgumentResolver]], ...]
+
+
+def build_injection_plan(
+    resolvers: Dict[str, ArgumentResolver],
+    required_arg_names: Tuple[str, ...],
+    next_keys_required: bool,
+) -> InjectionPlan:
+    """Determines how to resolve each argument of a function. The result can be reused for the same function."""
+    plan = []
+    for name in required_arg_names:
+        resolver = resolvers.get(name)
+        if not next_keys_required and name in next_argument_names:
+            resolver = None
+        plan.append((name, resolver))
+    return tuple(plan)
+
+
+def is_available_argument(
+    name: str,
+    resolvers: Dict[str, ArgumentResolver],
+    request: Any,
+    next_keys_required: bool,
+) -> bool:
+    if name in resolvers and (next_keys_required or name not in next_argument_names):
+        return True
+    return name in request.context
+
+
+def resolve_all_arguments(
+    resolvers: Dict[str, ArgumentResolver],
+    source: ArgumentSource,
+    next_keys_required: bool,
+) -> Dict[str, Any]:
+    """Resolves all the available arguments. This is used only for the `args` argument."""
+    all_available_args: Dict[str, Any] = {}
+    for name, resolver in resolvers.items():
+        if next_keys_required or name not in next_argument_names:
+            all_available_args[name] = resolver(source)
+    for k, v in source.request.context.items():
+        if k not in all_available_args:
+            all_available_args[k] = v
+    return all_available_args
@@ -1,22 +1,29 @@
 import inspect
 import logging
-from typing import Callable, Dict, MutableSequence, Optional, Any
+from functools import lru_cache
+from typing import Callable, Dict, MutableSequence, Optional, Any, Tuple
 
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
 from .args import Args
-from slack_bolt.request.payload_utils import (
-    to_options,
-    to_shortcut,
-    to_action,
-    to_view,
-    to_command,
-    to_event,
-    to_message,
-    to_step,
+from .internals import (
+    ArgumentResolver,
+    ArgumentSource,
+    InjectionPlan,
+    build_injection_plan,
+    is_available_argument,
+    resolve_all_arguments,
+    standard_argument_resolvers,
 )
 from ..logger.messages import warning_skip_uncommon_arg_name
 
+_argument_resolvers: Dict[str, ArgumentResolver] = standard_argument_resolvers
+
+
+@lru_cache(maxsize=1024)
+def _build_injection_plan(required_arg_names: Tuple[str, ...], next_keys_required: bool) -> InjectionPlan:
+    return build_injection_plan(_argument_resolvers, required_arg_names, next_keys_required)
+
 
 def build_required_kwargs(
     *,
@@ -29,67 +36,16 @@ def build_required_kwargs(
     error: Optional[Exception] = None,  # for error handlers
     next_keys_required: bool = True,  # False for listeners / middleware / error handlers
 ) -> Dict[str, Any]:
-    all_available_args: Dict[str, Any] = {
-        "logger": logger,
-        "client": request.context.client,
-        "req": request,
-        "request": request,
-        "resp": response,
-        "response": response,
-        "context": request.context,
-        # payload
-        "body": request.body,
-        "options": to_options(request.body),
-        "shortcut": to_shortcut(request.body),
-        "action": to_action(request.body),
-        "view": to_view(request.body),
-        "command": to_command(request.body),
-        "event": to_event(request.body),
-        "message": to_message(request.body),
-        "step": to_step(request.body),
-        # utilities
-        "ack": request.context.ack,
-        "say": request.context.say,
-        "respond": request.context.respond,
-        "complete": request.context.complete,
-        "fail": request.context.fail,
-        "set_status": request.context.set_status,
-        "set_title": request.context.set_title,
-        "set_suggested_prompts": request.context.set_suggested_prompts,
-        "save_thread_context": request.context.save_thread_context,
-        "say_stream": request.context.say_stream,
-        # middleware
-        "next": next_func,
-        "next_": next_func,  # for the middleware using Python's built-in `next()` function
-        # error handler
-        "error": error,  # Exception
-    }
-    if not next_keys_required:
-        all_available_args.pop("next")
-        all_available_args.pop("next_")
-
-    all_available_args["payload"] = (
-        all_available_args["options"]
-        or all_available_args["shortcut"]
-        or all_available_args["action"]
-        or all_available_args["view"]
-        or all_available_args["command"]
-        or all_available_args["event"]
-        or all_available_args["message"]
-        or all_available_args["step"]
-        or request.body
-    )
-    for k, v in request.context.items():
-        if k not in all_available_args:
-            all_available_args[k] = v
-
     if len(required_arg_names) > 0:
         # To support instance/class methods in a class for listeners/middleware,
         # check if the first argument is either self or cls
         first_arg_name = required_arg_names[0]
         if first_arg_name in {"self", "cls"}:
             required_arg_names.pop(0)
-        elif first_arg_name not in all_available_args.keys() and first_arg_name != "args":
+        elif (
+            not is_available_argument(first_arg_name, _argument_resolvers, request, next_keys_required)
+            and first_arg_name != "args"
+        ):
             if this_func is None:
                 logger.warning(warning_skip_uncommon_arg_name(first_arg_name))
                 required_arg_names.pop(0)
@@ -97,16 +53,22 @@ def build_required_kwargs(
                 # We are sure that we should skip manipulating this arg
                 required_arg_names.pop(0)
 
-    kwargs: Dict[str, Any] = {k: v for k, v in all_available_args.items() if k in required_arg_names}
-    found_arg_names = kwargs.keys()
-    for name in required_arg_names:
+    # Only the required arguments are resolved here
+    source = ArgumentSource(logger, request, response, next_func, error)
+    kwargs: Dict[str, Any] = {}
+    for name, resolver in _build_injection_plan(tuple(required_arg_names), next_keys_required):
         if name == "args":
             if isinstance(request, BoltRequest):
-                kwargs[name] = Args(**all_available_args)
+                kwargs[name] = Args(**resolve_all_arguments(_argument_resolvers, source, next_keys_required))
             else:
                 logger.warning(f"Unknown Request object type detected ({type(request)})")
-
-        elif name not in found_arg_names:
+                if name in request.context:
+                    kwargs[name] = request.context[name]
+        elif resolver is not None:
+            kwargs[name] = resolver(source)
+        elif name in request.context:
+            kwargs[name] = request.context[name]
+        else:
             logger.warning(f"{name} is not a valid argument")
             kwargs[name] = None
     return kwargs
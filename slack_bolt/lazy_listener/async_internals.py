@@ -1,21 +1,25 @@
+import time
 from functools import wraps
 from logging import Logger
-from typing import Callable, Awaitable
+from typing import Callable, Awaitable, Optional
 
 from slack_bolt.kwargs_injection.async_utils import build_async_required_kwargs
 from slack_bolt.request.async_request import AsyncBoltRequest
-from slack_bolt.util.utils import get_arg_names_of_callable
+from slack_bolt.util.phase_observer import PhaseObserver
+from slack_bolt.util.utils import get_arg_names_of_callable, get_name_for_callable
 
 
 async def to_runnable_function(
     internal_func: Callable[..., Awaitable[None]],
     logger: Logger,
     request: AsyncBoltRequest,
+    phase_observer: Optional[PhaseObserver] = None,
 ):
     arg_names = get_arg_names_of_callable(internal_func)
 
     @wraps(internal_func)
     async def request_wired_wrapper() -> None:
+        started_at = time.perf_counter() if phase_observer is not None else 0.0
         try:
             await internal_func(
                 **build_async_required_kwargs(
@@ -28,5 +32,9 @@ async def to_runnable_function(
             )
         except Exception as e:
             logger.error(f"Failed to run an internal function ({e})")
+        finally:
+            if phase_observer is not None:
+                phase = f"lazy_function:{get_name_for_callable(internal_func)}"
+                phase_observer.on_phase(request, phase, time.perf_counter() - started_at)
 
     return await request_wired_wrapper()
@@ -1,10 +1,11 @@
 import asyncio
 from logging import Logger
-from typing import Callable, Awaitable
+from typing import Callable, Awaitable, Optional
 
 from slack_bolt.lazy_listener.async_internals import to_runnable_function
 from slack_bolt.lazy_listener.async_runner import AsyncLazyListenerRunner
 from slack_bolt.request.async_request import AsyncBoltRequest
+from slack_bolt.util.phase_observer import PhaseObserver
 
 
 class AsyncioLazyListenerRunner(AsyncLazyListenerRunner):
@@ -13,8 +14,10 @@ class AsyncioLazyListenerRunner(AsyncLazyListenerRunner):
     def __init__(
         self,
         logger: Logger,
+        phase_observer: Optional[PhaseObserver] = None,
     ):
         self.logger = logger
+        self.phase_observer = phase_observer
 
     def start(self, function: Callable[..., Awaitable[None]], request: AsyncBoltRequest) -> None:
         asyncio.ensure_future(
@@ -22,5 +25,6 @@ class AsyncioLazyListenerRunner(AsyncLazyListenerRunner):
                 internal_func=function,
                 logger=self.logger,
                 request=request,
+                phase_observer=self.phase_observer,
             )
         )
@@ -1,21 +1,25 @@
+import time
 from functools import wraps
 from logging import Logger
-from typing import Callable
+from typing import Callable, Optional
 
 from slack_bolt.kwargs_injection import build_required_kwargs
 from slack_bolt.request import BoltRequest
-from slack_bolt.util.utils import get_arg_names_of_callable
+from slack_bolt.util.phase_observer import PhaseObserver
+from slack_bolt.util.utils import get_arg_names_of_callable, get_name_for_callable
 
 
 def build_runnable_function(
     func: Callable[..., None],
     logger: Logger,
     request: BoltRequest,
+    phase_observer: Optional[PhaseObserver] = None,
 ) -> Callable[[], None]:
     arg_names = get_arg_names_of_callable(func)
 
     @wraps(func)
     def request_wired_func_wrapper() -> None:
+        started_at = time.perf_counter() if phase_observer is not None else 0.0
         try:
             func(
                 **build_required_kwargs(
@@ -28,5 +32,9 @@ def build_runnable_function(
             )
         except Exception as e:
             logger.error(f"Failed to run an internal function ({e})")
+        finally:
+            if phase_observer is not None:
+                phase = f"lazy_function:{get_name_for_callable(func)}"
+                phase_observer.on_phase(request, phase, time.perf_counter() - started_at)
 
     return request_wired_func_wrapper
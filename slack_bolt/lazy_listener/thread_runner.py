@@ -1,10 +1,15 @@
 from concurrent.futures import Executor
 from logging import Logger
-from typing import Callable
+from typing import Callable, Optional
 
+from slack_bolt.error import BoltListenerExecutorSaturatedError
 from slack_bolt.lazy_listener.internals import build_runnable_function
 from slack_bolt.lazy_listener.runner import LazyListenerRunner
+from slack_bolt.listener.listener_executor import ListenerExecutor
+from slack_bolt.logger.messages import error_lazy_listener_rejected
 from slack_bolt.request import BoltRequest
+from slack_bolt.util.phase_observer import PhaseObserver
+from slack_bolt.util.utils import get_name_for_callable
 
 
 class ThreadLazyListenerRunner(LazyListenerRunner):
@@ -14,15 +19,29 @@ class ThreadLazyListenerRunner(LazyListenerRunner):
         self,
         logger: Logger,
         executor: Executor,
+        phase_observer: Optional[PhaseObserver] = None,
     ):
         self.logger = logger
         self.executor = executor
+        self.phase_observer = phase_observer
 
     def start(self, function: Callable[..., None], request: BoltRequest) -> None:
-        self.executor.submit(
+        self._submit(
+            function,
             build_runnable_function(
                 func=function,
                 logger=self.logger,
                 request=request,
-            )
+                phase_observer=self.phase_observer,
+            ),
         )
+
+    def _submit(self, function: Callable[..., None], runnable: Callable[[], None]) -> None:
+        try:
+            if isinstance(self.executor, ListenerExecutor):
+                self.executor.submit_listener(get_name_for_callable(function), runnable)
+            else:
+                self.executor.submit(runnable)
+        except BoltListenerExecutorSaturatedError:
+            # The acknowledgement has been already done, so the lazy function cannot be retried
+            self.logger.error(error_lazy_listener_rejected(get_name_for_callable(function)))
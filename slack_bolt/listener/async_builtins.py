@@ -1,3 +1,6 @@
+from typing import Optional
+
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
 from slack_bolt.context.async_context import AsyncBoltContext
 from slack_sdk.oauth.installation_store.async_installation_store import (
     AsyncInstallationStore,
@@ -8,9 +11,15 @@ class AsyncTokenRevocationListeners:
     """Listener functions to handle token revocation / uninstallation events"""
 
     installation_store: AsyncInstallationStore
+    authorize_result_cache: Optional[AuthorizeResultCache]
 
-    def __init__(self, installation_store: AsyncInstallationStore):
+    def __init__(
+        self,
+        installation_store: AsyncInstallationStore,
+        authorize_result_cache: Optional[AuthorizeResultCache] = None,
+    ):
         self.installation_store = installation_store
+        self.authorize_result_cache = authorize_result_cache
 
     async def handle_tokens_revoked_events(self, event: dict, context: AsyncBoltContext) -> None:
         user_ids = event.get("tokens", {}).get("oauth", [])
@@ -27,9 +36,19 @@ class AsyncTokenRevocationListeners:
                 enterprise_id=context.enterprise_id,
                 team_id=context.team_id,
             )
+        self._invalidate_authorize_result_cache(context)
 
     async def handle_app_uninstalled_events(self, context: AsyncBoltContext) -> None:
         await self.installation_store.async_delete_all(
             enterprise_id=context.enterprise_id,
             team_id=context.team_id,
         )
+        self._invalidate_authorize_result_cache(context)
+
+    def _invalidate_authorize_result_cache(self, context: AsyncBoltContext) -> None:
+        if self.authorize_result_cache is not None:
+            self.authorize_result_cache.invalidate(
+                enterprise_id=context.enterprise_id,
+                team_id=context.team_id,
+                is_enterprise_install=context.is_enterprise_install,
+            )
@@ -3,6 +3,7 @@ from typing import Callable, Awaitable, MutableSequence, Tuple, Optional, Sequen
 
 from slack_bolt.listener_matcher.async_listener_matcher import AsyncListenerMatcher
 from slack_bolt.middleware.async_middleware import AsyncMiddleware
+from slack_bolt.middleware.async_middleware_chain import AsyncMiddlewareChain
 from slack_bolt.request.async_request import AsyncBoltRequest
 from slack_bolt.response import BoltResponse
 from ..kwargs_injection.async_utils import build_async_required_kwargs
@@ -16,6 +17,8 @@ class AsyncListener(metaclass=ABCMeta):
     lazy_functions: Sequence[Callable[..., Awaitable[None]]]
     auto_acknowledgement: bool
     ack_timeout: int
+    _middleware_chain: Optional[AsyncMiddlewareChain] = None
+    _compiled_middleware: Optional[Tuple[AsyncMiddleware, ...]] = None
 
     async def async_matches(
         self,
@@ -45,17 +48,16 @@ class AsyncListener(metaclass=ABCMeta):
         Returns:
             A tuple of the processed response and a flag indicating termination
         """
-        for m in self.middleware:
-            middleware_state = {"next_called": False}
-
-            async def _next():
-                middleware_state["next_called"] = True
-
-            resp = await m.async_process(req=req, resp=resp, next=_next)  # type: ignore[assignment]
-            if not middleware_state["next_called"]:
-                # next() was not called in this middleware
-                return (resp, True)
-        return (resp, False)
+        chain = self._middleware_chain
+        # Compare with the snapshot so that replacing or mutating the list in place is detected
+        middleware = tuple(self.middleware)
+        if chain is None or self._compiled_middleware != middleware:
+            # Compile the middleware only once unless they are changed
+            chain = self._middleware_chain = AsyncMiddlewareChain(middleware)
+            self._compiled_middleware = middleware
+        processed_resp, stopped_at = await chain.run(req=req, resp=resp)
+        # stopped_at is not None if next() was not called in a middleware
+        return (processed_resp, stopped_at is not None)
 
     @abstractmethod
     async def run_ack_function(self, *, request: AsyncBoltRequest, response: BoltResponse) -> Optional[BoltResponse]:
@@ -21,7 +21,8 @@ from slack_bolt.logger.messages import (
 )
 from slack_bolt.request.async_request import AsyncBoltRequest
 from slack_bolt.response import BoltResponse
-from slack_bolt.util.utils import create_copy, get_name_for_callable
+from slack_bolt.util.phase_observer import PhaseObserver
+from slack_bolt.util.utils import get_name_for_callable
 
 
 class AsyncioListenerRunner:
@@ -31,6 +32,7 @@ class AsyncioListenerRunner:
     listener_start_handler: AsyncListenerStartHandler
     listener_completion_handler: AsyncListenerCompletionHandler
     lazy_listener_runner: AsyncLazyListenerRunner
+    phase_observer: Optional[PhaseObserver]
 
     def __init__(
         self,
@@ -40,6 +42,7 @@ class AsyncioListenerRunner:
         listener_start_handler: AsyncListenerStartHandler,
         listener_completion_handler: AsyncListenerCompletionHandler,
         lazy_listener_runner: AsyncLazyListenerRunner,
+        phase_observer: Optional[PhaseObserver] = None,
     ):
         self.logger = logger
         self.process_before_response = process_before_response
@@ -47,6 +50,7 @@ class AsyncioListenerRunner:
         self.listener_start_handler = listener_start_handler
         self.listener_completion_handler = listener_completion_handler
         self.lazy_listener_runner = lazy_listener_runner
+        self.phase_observer = phase_observer
 
     async def run(
         self,
@@ -62,7 +66,7 @@ class AsyncioListenerRunner:
             if not request.lazy_only:
                 try:
                     await self.listener_start_handler.handle(request=request, response=response)
-                    returned_value = await listener.run_ack_function(request=request, response=response)
+                    returned_value = await self._run_ack_function(listener_name, listener, request, response)
                     if isinstance(returned_value, BoltResponse):
                         response = returned_value
                     if ack.response is None and listener.auto_acknowledgement:
@@ -86,7 +90,7 @@ class AsyncioListenerRunner:
                 if request.lazy_function_name:
                     func_name = get_name_for_callable(lazy_func)
                     if func_name == request.lazy_function_name:
-                        await self.lazy_listener_runner.run(function=lazy_func, request=request)
+                        await self._run_lazy_function(func_name, lazy_func, request)
                         # This HTTP response won't be sent to Slack API servers.
                         return BoltResponse(status=200)
                     else:
@@ -115,7 +119,7 @@ class AsyncioListenerRunner:
                 ):
                     try:
                         await self.listener_start_handler.handle(request=request, response=response)
-                        await listener.run_ack_function(request=request, response=response)
+                        await self._run_ack_function(listener_name, listener, request, response)
                     except Exception as e:
                         # The default response status code is 500 in this case.
                         # You can customize this by passing your own error handler.
@@ -140,7 +144,7 @@ class AsyncioListenerRunner:
                 if request.lazy_function_name:
                     func_name = get_name_for_callable(lazy_func)
                     if func_name == request.lazy_function_name:
-                        await self.lazy_listener_runner.run(function=lazy_func, request=request)
+                        await self._run_lazy_function(func_name, lazy_func, request)
                         # This HTTP response won't be sent to Slack API servers.
                         return BoltResponse(status=200)
                     else:
@@ -149,8 +153,7 @@ class AsyncioListenerRunner:
                     self._start_lazy_function(lazy_func, request)
 
             # await for the completion of ack() in the async listener execution
-            while ack.response is None and time.time() - starting_time <= listener.ack_timeout:
-                await asyncio.sleep(0.01)
+            await ack.wait_until_acknowledged(timeout=max(0.0, listener.ack_timeout - (time.time() - starting_time)))
 
             if response is None and ack.response is None:
                 self.logger.warning(warning_did_not_call_ack(listener_name))
@@ -167,6 +170,36 @@ class AsyncioListenerRunner:
         # None for both means no ack() in the listener
         return None
 
+    async def _run_ack_function(
+        self,
+        listener_name: str,
+        listener: AsyncListener,
+        request: AsyncBoltRequest,
+        response: Optional[BoltResponse],
+    ) -> Optional[BoltResponse]:
+        if self.phase_observer is None:
+            return await listener.run_ack_function(request=request, response=response)  # type: ignore[arg-type]
+        started_at = time.perf_counter()
+        try:
+            return await listener.run_ack_function(request=request, response=response)  # type: ignore[arg-type]
+        finally:
+            self.phase_observer.on_phase(request, f"ack_function:{listener_name}", time.perf_counter() - started_at)
+
+    async def _run_lazy_function(
+        self,
+        func_name: str,
+        lazy_func: Callable[..., Awaitable[None]],
+        request: AsyncBoltRequest,
+    ) -> None:
+        if self.phase_observer is None:
+            await self.lazy_listener_runner.run(function=lazy_func, request=request)
+            return
+        started_at = time.perf_counter()
+        try:
+            await self.lazy_listener_runner.run(function=lazy_func, request=request)
+        finally:
+            self.phase_observer.on_phase(request, f"lazy_function:{func_name}", time.perf_counter() - started_at)
+
     def _start_lazy_function(self, lazy_func: Callable[..., Awaitable[None]], request: AsyncBoltRequest) -> None:
         # Start a lazy function asynchronously
         func_name: str = get_name_for_callable(lazy_func)
@@ -175,9 +208,8 @@ class AsyncioListenerRunner:
         self.lazy_listener_runner.start(function=lazy_func, request=copied_request)
 
     def _build_lazy_request(self, request: AsyncBoltRequest, lazy_func_name: str) -> AsyncBoltRequest:
-        copied_request: AsyncBoltRequest = create_copy(request.to_copyable())
-        copied_request.lazy_only = True
-        copied_request.lazy_function_name = lazy_func_name
+        # The body is shared with the original request, and the context is a shallow copy
+        copied_request: AsyncBoltRequest = request.to_lazy_request(lazy_func_name)
         copied_request.context["listener_runner"] = self
         if request.context.get_thread_context is not None:
             copied_request.context["get_thread_context"] = request.context.get_thread_context
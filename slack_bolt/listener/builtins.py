@@ -1,3 +1,6 @@
+from typing import Optional
+
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
 from slack_bolt.context.context import BoltContext
 from slack_sdk.oauth.installation_store.installation_store import InstallationStore
 
@@ -6,9 +9,15 @@ class TokenRevocationListeners:
     """Listener functions to handle token revocation / uninstallation events"""
 
     installation_store: InstallationStore
+    authorize_result_cache: Optional[AuthorizeResultCache]
 
-    def __init__(self, installation_store: InstallationStore):
+    def __init__(
+        self,
+        installation_store: InstallationStore,
+        authorize_result_cache: Optional[AuthorizeResultCache] = None,
+    ):
         self.installation_store = installation_store
+        self.authorize_result_cache = authorize_result_cache
 
     def handle_tokens_revoked_events(self, event: dict, context: BoltContext) -> None:
         user_ids = event.get("tokens", {}).get("oauth", [])
@@ -25,9 +34,19 @@ class TokenRevocationListeners:
                 enterprise_id=context.enterprise_id,
                 team_id=context.team_id,
             )
+        self._invalidate_authorize_result_cache(context)
 
     def handle_app_uninstalled_events(self, context: BoltContext) -> None:
         self.installation_store.delete_all(
             enterprise_id=context.enterprise_id,
             team_id=context.team_id,
         )
+        self._invalidate_authorize_result_cache(context)
+
+    def _invalidate_authorize_result_cache(self, context: BoltContext) -> None:
+        if self.authorize_result_cache is not None:
+            self.authorize_result_cache.invalidate(
+                enterprise_id=context.enterprise_id,
+                team_id=context.team_id,
+                is_enterprise_install=context.is_enterprise_install,
+            )
@@ -3,6 +3,7 @@ from typing import Callable, Tuple, Sequence, Optional
 
 from slack_bolt.listener_matcher import ListenerMatcher
 from slack_bolt.middleware import Middleware
+from slack_bolt.middleware.middleware_chain import MiddlewareChain
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
 
@@ -14,6 +15,8 @@ class Listener(metaclass=ABCMeta):
     lazy_functions: Sequence[Callable[..., None]]
     auto_acknowledgement: bool
     ack_timeout: int = 3
+    _middleware_chain: Optional[MiddlewareChain] = None
+    _compiled_middleware: Optional[Tuple[Middleware, ...]] = None
 
     def matches(
         self,
@@ -43,17 +46,16 @@ class Listener(metaclass=ABCMeta):
         Returns:
             A tuple of the processed response and a flag indicating termination
         """
-        for m in self.middleware:
-            middleware_state = {"next_called": False}
-
-            def next_():
-                middleware_state["next_called"] = True
-
-            resp = m.process(req=req, resp=resp, next=next_)  # type: ignore[assignment]
-            if not middleware_state["next_called"]:
-                # next() was not called in this middleware
-                return (resp, True)
-        return (resp, False)
+        chain = self._middleware_chain
+        # Compare with the snapshot so that replacing or mutating the list in place is detected
+        middleware = tuple(self.middleware)
+        if chain is None or self._compiled_middleware != middleware:
+            # Compile the middleware only once unless they are changed
+            chain = self._middleware_chain = MiddlewareChain(middleware)
+            self._compiled_middleware = middleware
+        processed_resp, stopped_at = chain.run(req=req, resp=resp)
+        # stopped_at is not None if next() was not called in a middleware
+        return (processed_resp, stopped_at is not None)
 
     @abstractmethod
     def run_ack_function(self, *, request: BoltRequest, response: BoltResponse) -> Optional[BoltResponse]:
@@ -0,0 +1,250 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from threading import Condition
+from typing import Any, Callable, Deque, Dict, Optional
+
+from slack_bolt.error import BoltListenerExecutorSaturatedError
+
+
+class ListenerExecutorMetrics:
+    """The hooks to observe `ListenerExecutor`. All the methods do nothing by default,
+    so that you can override only the ones you need. The methods are called in the worker threads,
+    so the implementation must be thread-safe and must not block.
+    """
+
+    def record_queue_wait(self, *, name: Optional[str], seconds: float) -> None:
+        """Records the duration between the task submission and the beginning of its execution.
+
+        Args:
+            name: The listener name (None if the task is not associated with a listener)
+            seconds: The queue wait time in seconds
+        """
+        pass
+
+    def record_run_time(self, *, name: Optional[str], seconds: float, error: Optional[BaseException]) -> None:
+        """Records the execution time of a task.
+
+        Args:
+            name: The listener name (None if the task is not associated with a listener)
+            seconds: The run time in seconds
+            error: The exception raised by the task if any
+        """
+        pass
+
+    def record_active_workers(self, *, active_workers: int, pending_tasks: int) -> None:
+        """Records the number of busy worker threads whenever it changes.
+
+        Args:
+            active_workers: The number of the worker threads running a task
+            pending_tasks: The number of the submitted tasks that are not yet completed (including running ones)
+        """
+        pass
+
+    def record_rejection(self, *, name: Optional[str]) -> None:
+        """Records a task rejected due to the saturated queue.
+
+        Args:
+            name: The listener name (None if the task is not associated with a listener)
+        """
+        pass
+
+
+class _Task:
+    __slots__ = ["name", "fn", "args", "kwargs", "future", "submitted_at"]
+
+    def __init__(self, name: Optional[str], fn: Callable[..., Any], args: tuple, kwargs: dict):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        self.submitted_at = time.perf_counter()
+
+
+class ListenerExecutor(Executor):
+    max_workers: int
+    max_queue_size: Optional[int]
+    max_concurrency_per_listener: Optional[int]
+    listener_max_concurrency: Dict[str, int]
+    metrics: ListenerExecutorMetrics
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = 5,
+        max_queue_size: Optional[int] = None,
+        max_concurrency_per_listener: Optional[int] = None,
+        listener_max_concurrency: Optional[Dict[str, int]] = None,
+        metrics: Optional[ListenerExecutorMetrics] = None,
+        thread_name_prefix: str = "slack_bolt_listener",
+    ):
+        """The default executor that runs listeners and lazy listeners in `App`.
+
+            from slack_bolt import App
+            from slack_bolt.listener.listener_executor import ListenerExecutor
+
+            app = App(
+                listener_executor=ListenerExecutor(
+                    max_workers=20,
+                    max_queue_size=100,
+                    listener_max_concurrency={"handle_heavy_command": 2},
+                )
+            )
+
+        When both the workers and the queue are full, the executor rejects new tasks
+        by raising `BoltListenerExecutorSaturatedError`; the app responds with 503 status in the case.
+        The tasks exceeding a per-listener concurrency limit wait without occupying worker threads.
+
+        Args:
+            max_workers: The max number of worker threads (Default: 5, the same as the thread pool `App` used to have);
+                None sizes the pool in the same way as `ThreadPoolExecutor` (`min(32, os.cpu_count() + 4)`)
+            max_queue_size: The max number of tasks waiting for a worker; None means unbounded (Default: None)
+            max_concurrency_per_listener: The max number of concurrent executions for each listener
+                (Default: None, which means no limit)
+            listener_max_concurrency: The max concurrency for specific listeners; the keys are the function names.
+                This is prioritized over max_concurrency_per_listener.
+            metrics: The hooks to observe this executor
+            thread_name_prefix: The name prefix of the worker threads
+        """
+        self.max_workers = max_workers if max_workers is not None else min(32, (os.cpu_count() or 1) + 4)
+        self.max_queue_size = max_queue_size
+        self.max_concurrency_per_listener = max_concurrency_per_listener
+        self.listener_max_concurrency = listener_max_concurrency or {}
+        self.metrics = metrics or ListenerExecutorMetrics()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=thread_name_prefix)
+        self._condition = Condition()
+        self._pending = 0
+        self._active = 0
+        self._shutdown = False
+        self._cancel_pending = False
+        self._running_per_listener: Dict[str, int] = {}
+        self._waiting_per_listener: Dict[str, Deque[_Task]] = {}
+
+    @property
+    def pending_tasks(self) -> int:
+        """The number of the submitted tasks that are not yet completed (including running ones)."""
+        return self._pending
+
+    @property
+    def active_workers(self) -> int:
+        """The number of the worker threads running a task."""
+        return self._active
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:  # type: ignore[override]
+        return self.submit_listener(None, fn, *args, **kwargs)
+
+    def submit_listener(self, name: Optional[str], fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """Schedules a task associated with a listener.
+
+        Args:
+            name: The listener name, which is used for the per-listener concurrency limits and the metrics
+            fn: The function to run
+
+        Returns:
+            The future representing the execution
+        """
+        task = _Task(name, fn, args, kwargs)
+        limit = self._concurrency_limit(name)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+            if self.max_queue_size is not None and self._pending >= self.max_workers + self.max_queue_size:
+                rejected = True
+            else:
+                rejected = False
+                self._pending += 1
+                if name is not None and limit is not None:
+                    if self._running_per_listener.get(name, 0) >= limit:
+                        self._waiting_per_listener.setdefault(name, deque()).append(task)
+                        return task.future
+                    self._running_per_listener[name] = self._running_per_listener.get(name, 0) + 1
+        if rejected:
+            self.metrics.record_rejection(name=name)
+            raise BoltListenerExecutorSaturatedError(name)
+        self._dispatch(task)
+        return task.future
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until all the submitted tasks are completed.
+
+        Args:
+            timeout: The max duration to wait in seconds
+
+        Returns:
+            True if there is no pending task
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stops accepting new tasks.
+
+        Args:
+            wait: Blocks until all the pending tasks are completed if True
+            cancel_futures: Cancels the tasks that have not started yet if True
+        """
+        with self._condition:
+            self._shutdown = True
+            self._cancel_pending = cancel_futures
+        if wait:
+            self.drain()
+        self._executor.shutdown(wait=wait)
+
+    def _concurrency_limit(self, name: Optional[str]) -> Optional[int]:
+        if name is None:
+            return None
+        return self.listener_max_concurrency.get(name, self.max_concurrency_per_listener)
+
+    def _dispatch(self, task: _Task) -> None:
+        try:
+            self._executor.submit(self._run, task)
+        except RuntimeError:
+            # the underlying executor has been shut down without waiting for the pending tasks
+            task.future.cancel()
+            self._complete(task)
+
+    def _run(self, task: _Task) -> None:
+        if self._cancel_pending:
+            task.future.cancel()
+        if not task.future.set_running_or_notify_cancel():
+            self._complete(task)
+            return
+
+        started_at = time.perf_counter()
+        with self._condition:
+            self._active += 1
+            active, pending = self._active, self._pending
+        self.metrics.record_queue_wait(name=task.name, seconds=started_at - task.submitted_at)
+        self.metrics.record_active_workers(active_workers=active, pending_tasks=pending)
+        error: Optional[BaseException] = None
+        try:
+            task.future.set_result(task.fn(*task.args, **task.kwargs))
+        except BaseException as e:
+            error = e
+            task.future.set_exception(e)
+        finally:
+            self.metrics.record_run_time(name=task.name, seconds=time.perf_counter() - started_at, error=error)
+            with self._condition:
+                self._active -= 1
+            self._complete(task)
+
+    def _complete(self, task: _Task) -> None:
+        next_task: Optional[_Task] = None
+        with self._condition:
+            self._pending -= 1
+            name = task.name
+            if name is not None and self._concurrency_limit(name) is not None:
+                waiting = self._waiting_per_listener.get(name)
+                if waiting:
+                    # hand over the slot to the next task for the same listener
+                    next_task = waiting.popleft()
+                else:
+                    self._running_per_listener[name] -= 1
+            active, pending = self._active, self._pending
+            if pending == 0:
+                self._condition.notify_all()
+        self.metrics.record_active_workers(active_workers=active, pending_tasks=pending)
+        if next_task is not None:
+            self._dispatch(next_task)
@@ -0,0 +1,125 @@
+import heapq
+from operator import itemgetter
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from slack_bolt.request.payload_kind import PayloadKind
+
+# A routing key is a pair of the payload type and the identifier that a listener exactly matches with.
+# e.g., ("event", "app_mention"), ("command", "/hello"), ("block_actions", "button-action-id")
+RoutingKey = Tuple[str, str]
+
+L = TypeVar("L")
+
+# The payload types that can be routed by their top-level callback_id
+_CALLBACK_ID_PAYLOAD_TYPES = {
+    "shortcut",
+    "message_action",
+    "interactive_message",
+    "dialog_submission",
+    "dialog_cancellation",
+    "dialog_suggestion",
+    "workflow_step_edit",
+}
+
+
+def build_routing_keys(payload_types: Sequence[str], value: Any) -> Optional[List[RoutingKey]]:
+    """Builds the routing keys for a built-in listener matcher.
+
+    Args:
+        payload_types: The payload types that the matcher can accept
+        value: The constraint value; only str values can be indexed (e.g., regular expressions cannot)
+
+    Returns:
+        The routing keys if the matcher can be indexed, otherwise None
+    """
+    if not isinstance(value, str):
+        return None
+    return [(payload_type, value) for payload_type in payload_types]
+
+
+def extract_routing_keys(body: Dict[str, Any]) -> List[RoutingKey]:
+    """Extracts all the routing keys that an incoming request payload can match with.
+
+    Args:
+        body: The parsed request body
+
+    Returns:
+        The list of routing keys
+    """
+    return extract_payload_kind_routing_keys(PayloadKind(body))
+
+
+def extract_payload_kind_routing_keys(payload_kind: PayloadKind) -> List[RoutingKey]:
+    """Extracts all the routing keys from the payload kind of an incoming request.
+
+    Args:
+        payload_kind: The payload kind extracted at the request construction
+
+    Returns:
+        The list of routing keys
+    """
+    keys: List[Tuple[str, Any]] = []
+    if payload_kind.event_type is not None:
+        keys.append(("event", payload_kind.event_type))
+    if payload_kind.command is not None:
+        keys.append(("command", payload_kind.command))
+    payload_type = payload_kind.type
+    if payload_type in ("block_actions", "block_suggestion"):
+        keys.append((payload_type, payload_kind.action_id))
+    elif payload_type in ("view_submission", "view_closed") or payload_type in _CALLBACK_ID_PAYLOAD_TYPES:
+        keys.append((payload_type, payload_kind.callback_id))
+    return [k for k in keys if isinstance(k[1], str)]
+
+
+class ListenerRoutingIndex(Generic[L]):
+    """Listener lookup table that narrows down the listeners to check for an incoming request.
+
+    The listeners with str-based primary matchers (e.g., `app.event("app_mention")`, `app.command("/hello")`)
+    are stored in the buckets keyed by the payload type and the identifier. The rest of the listeners
+    (e.g., regular expressions, custom primary matchers) go to the residual bucket, which is always checked.
+    The candidates are returned in registration order, so that the listener ordering semantics never change.
+    """
+
+    def __init__(self):
+        self._sequence = 0
+        self._keyed: Dict[RoutingKey, List[Tuple[int, L]]] = {}
+        self._residual: List[Tuple[int, L]] = []
+
+    def add(self, listener: L, routing_keys: Optional[Sequence[RoutingKey]] = None) -> None:
+        """Adds a listener to this index.
+
+        Args:
+            listener: The listener to add
+            routing_keys: The keys that the listener's primary matcher requires; None if it cannot be indexed
+        """
+        entry = (self._sequence, listener)
+        self._sequence += 1
+        if routing_keys:
+            for key in set(routing_keys):
+                self._keyed.setdefault(key, []).append(entry)
+        else:
+            self._residual.append(entry)
+
+    def candidates(self, payload: Union[PayloadKind, Dict[str, Any]]) -> Iterator[L]:
+        """Returns the listeners that can possibly match the given request payload in registration order.
+
+        Args:
+            payload: The payload kind of the request (or the parsed request body)
+
+        Returns:
+            The candidate listeners
+        """
+        payload_kind = payload if isinstance(payload, PayloadKind) else PayloadKind(payload)
+        keys = extract_payload_kind_routing_keys(payload_kind)
+        buckets = [self._keyed[key] for key in keys if key in self._keyed]
+        if len(buckets) == 0:
+            return (listener for _, listener in self._residual)
+        return self._merge(buckets)
+
+    def _merge(self, buckets: List[List[Tuple[int, L]]]) -> Iterator[L]:
+        last_sequence = -1
+        for sequence, listener in heapq.merge(self._residual, *buckets, key=itemgetter(0)):
+            # A listener can be stored in multiple buckets
+            if sequence != last_sequence:
+                last_sequence = sequence
+                yield listener
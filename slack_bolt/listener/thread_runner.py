@@ -3,19 +3,23 @@ from concurrent.futures import Executor
 from logging import Logger
 from typing import Optional, Callable
 
+from slack_bolt.error import BoltListenerExecutorSaturatedError
 from slack_bolt.lazy_listener import LazyListenerRunner
 from slack_bolt.listener import Listener
 from slack_bolt.listener.listener_start_handler import ListenerStartHandler
 from slack_bolt.listener.listener_completion_handler import ListenerCompletionHandler
 from slack_bolt.listener.listener_error_handler import ListenerErrorHandler
+from slack_bolt.listener.listener_executor import ListenerExecutor
 from slack_bolt.logger.messages import (
     debug_responding,
     debug_running_lazy_listener,
     warning_did_not_call_ack,
+    warning_listener_executor_saturated,
 )
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
-from slack_bolt.util.utils import create_copy, get_name_for_callable
+from slack_bolt.util.phase_observer import PhaseObserver
+from slack_bolt.util.utils import get_name_for_callable
 
 
 class ThreadListenerRunner:
@@ -26,6 +30,7 @@ class ThreadListenerRunner:
     listener_completion_handler: ListenerCompletionHandler
     listener_executor: Executor
     lazy_listener_runner: LazyListenerRunner
+    phase_observer: Optional[PhaseObserver]
 
     def __init__(
         self,
@@ -36,6 +41,7 @@ class ThreadListenerRunner:
         listener_completion_handler: ListenerCompletionHandler,
         listener_executor: Executor,
         lazy_listener_runner: LazyListenerRunner,
+        phase_observer: Optional[PhaseObserver] = None,
     ):
         self.logger = logger
         self.process_before_response = process_before_response
@@ -44,6 +50,7 @@ class ThreadListenerRunner:
         self.listener_completion_handler = listener_completion_handler
         self.listener_executor = listener_executor
         self.lazy_listener_runner = lazy_listener_runner
+        self.phase_observer = phase_observer
 
     def run(
         self,
@@ -62,7 +69,7 @@ class ThreadListenerRunner:
                         request=request,
                         response=response,
                     )
-                    returned_value = listener.run_ack_function(request=request, response=response)
+                    returned_value = self._run_ack_function(listener_name, listener, request, response)
                     if isinstance(returned_value, BoltResponse):
                         response = returned_value
                     if ack.response is None and listener.auto_acknowledgement:
@@ -89,7 +96,7 @@ class ThreadListenerRunner:
                 if request.lazy_function_name:
                     func_name = get_name_for_callable(lazy_func)
                     if func_name == request.lazy_function_name:
-                        self.lazy_listener_runner.run(function=lazy_func, request=request)
+                        self._run_lazy_function(func_name, lazy_func, request)
                         # This HTTP response won't be sent to Slack API servers.
                         return BoltResponse(status=200)
                     else:
@@ -117,7 +124,7 @@ class ThreadListenerRunner:
                             request=request,
                             response=response,
                         )
-                        listener.run_ack_function(request=request, response=response)
+                        self._run_ack_function(listener_name, listener, request, response)
                     except Exception as e:
                         # The default response status code is 500 in this case.
                         # You can customize this by passing your own error handler.
@@ -145,13 +152,21 @@ class ThreadListenerRunner:
                             response=response,
                         )
 
-                self.listener_executor.submit(run_ack_function_asynchronously)
+                try:
+                    if isinstance(self.listener_executor, ListenerExecutor):
+                        self.listener_executor.submit_listener(listener_name, run_ack_function_asynchronously)
+                    else:
+                        self.listener_executor.submit(run_ack_function_asynchronously)
+                except BoltListenerExecutorSaturatedError:
+                    # Shed the load; Slack may retry the request later
+                    self.logger.warning(warning_listener_executor_saturated(listener_name))
+                    return BoltResponse(status=503, body="")
 
             for lazy_func in listener.lazy_functions:
                 if request.lazy_function_name:
                     func_name = get_name_for_callable(lazy_func)
                     if func_name == request.lazy_function_name:
-                        self.lazy_listener_runner.run(function=lazy_func, request=request)
+                        self._run_lazy_function(func_name, lazy_func, request)
                         # This HTTP response won't be sent to Slack API servers.
                         return BoltResponse(status=200)
                     else:
@@ -160,8 +175,7 @@ class ThreadListenerRunner:
                     self._start_lazy_function(lazy_func, request)
 
             # await for the completion of ack() in the async listener execution
-            while ack.response is None and time.time() - starting_time <= listener.ack_timeout:
-                time.sleep(0.01)
+            ack.wait_until_acknowledged(timeout=max(0.0, listener.ack_timeout - (time.time() - starting_time)))
 
             if response is None and ack.response is None:
                 self.logger.warning(warning_did_not_call_ack(listener_name))
@@ -178,6 +192,31 @@ class ThreadListenerRunner:
         # None for both means no ack() in the listener
         return None
 
+    def _run_ack_function(
+        self,
+        listener_name: str,
+        listener: Listener,
+        request: BoltRequest,
+        response: Optional[BoltResponse],
+    ) -> Optional[BoltResponse]:
+        if self.phase_observer is None:
+            return listener.run_ack_function(request=request, response=response)  # type: ignore[arg-type]
+        started_at = time.perf_counter()
+        try:
+            return listener.run_ack_function(request=request, response=response)  # type: ignore[arg-type]
+        finally:
+            self.phase_observer.on_phase(request, f"ack_function:{listener_name}", time.perf_counter() - started_at)
+
+    def _run_lazy_function(self, func_name: str, lazy_func: Callable[..., None], request: BoltRequest) -> None:
+        if self.phase_observer is None:
+            self.lazy_listener_runner.run(function=lazy_func, request=request)
+            return
+        started_at = time.perf_counter()
+        try:
+            self.lazy_listener_runner.run(function=lazy_func, request=request)
+        finally:
+            self.phase_observer.on_phase(request, f"lazy_function:{func_name}", time.perf_counter() - started_at)
+
     def _start_lazy_function(self, lazy_func: Callable[..., None], request: BoltRequest) -> None:
         # Start a lazy function asynchronously
         func_name: str = get_name_for_callable(lazy_func)
@@ -186,9 +225,8 @@ class ThreadListenerRunner:
         self.lazy_listener_runner.start(function=lazy_func, request=copied_request)
 
     def _build_lazy_request(self, request: BoltRequest, lazy_func_name: str) -> BoltRequest:
-        copied_request: BoltRequest = create_copy(request.to_copyable())
-        copied_request.lazy_only = True
-        copied_request.lazy_function_name = lazy_func_name
+        # The body is shared with the original request, and the context is a shallow copy
+        copied_request: BoltRequest = request.to_lazy_request(lazy_func_name)
         # These are not copyable objects, so manually set for a different thread
         copied_request.context["listener_runner"] = self
         if request.context.get_thread_context is not None:
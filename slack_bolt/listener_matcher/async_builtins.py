@@ -7,6 +7,10 @@ from ..kwargs_injection.async_utils import build_async_required_kwargs
 
 class AsyncBuiltinListenerMatcher(BuiltinListenerMatcher, AsyncListenerMatcher):
     async def async_matches(self, req: AsyncBoltRequest, resp: BoltResponse) -> bool:
+        if self.payload_kind_only:
+            return await self.func(req.payload_kind)  # type: ignore[misc]
+        if self.body_only:
+            return await self.func(req.body)  # type: ignore[misc]
         return await self.func(  # type: ignore[misc]
             **build_async_required_kwargs(
                 logger=self.logger,
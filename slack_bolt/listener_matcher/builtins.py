@@ -2,32 +2,15 @@ import re
 from logging import Logger
 
 from slack_bolt.error import BoltError
-from slack_bolt.request.payload_utils import (
-    is_block_actions,
-    is_function,
-    is_global_shortcut,
-    is_message_shortcut,
-    is_attachment_action,
-    is_dialog_submission,
-    is_dialog_cancellation,
-    is_workflow_step_edit,
-    is_slash_command,
-    is_event,
-    is_view_submission,
-    is_view_closed,
-    is_block_suggestion,
-    is_dialog_suggestion,
-    is_shortcut,
-    to_action,
-    is_workflow_step_save,
-)
+from slack_bolt.request.payload_kind import PayloadKind
 from ..logger.messages import error_message_event_type
 from ..util.utils import get_arg_names_of_callable
 
 from re import Pattern
-from typing import Callable, Awaitable, Any, Sequence, Optional, Union, Dict
+from typing import Callable, Awaitable, Any, Sequence, Optional, Union, Dict, List
 
 from slack_bolt.kwargs_injection import build_required_kwargs
+from slack_bolt.listener.routing_index import RoutingKey, build_routing_keys
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
 from .listener_matcher import ListenerMatcher
@@ -41,12 +24,23 @@ class BuiltinListenerMatcher(ListenerMatcher):
         *,
         func: Callable[..., Union[bool, Awaitable[bool]]],
         base_logger: Optional[Logger] = None,
+        routing_keys: Optional[List[RoutingKey]] = None,
     ):
         self.func = func
         self.arg_names = get_arg_names_of_callable(func)
+        # Most built-in matchers require only the payload kind extracted at the request construction,
+        # so that they can skip building all the available kwargs per request
+        self.payload_kind_only = self.arg_names == ["payload_kind"]
+        self.body_only = self.arg_names == ["body"]
         self.logger = get_bolt_logger(self.func, base_logger)
+        # The keys used for narrowing down the listeners to check in App#dispatch
+        self.routing_keys = routing_keys
 
     def matches(self, req: BoltRequest, resp: BoltResponse) -> bool:
+        if self.payload_kind_only:
+            return self.func(req.payload_kind)  # type: ignore[return-value]
+        if self.body_only:
+            return self.func(req.body)  # type: ignore[return-value]
         return self.func(  # type: ignore[return-value]
             **build_required_kwargs(
                 logger=self.logger,
@@ -62,16 +56,28 @@ def build_listener_matcher(
     func: Callable[..., bool],
     asyncio: bool,
     base_logger: Optional[Logger] = None,
+    routing_keys: Optional[List[RoutingKey]] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
     if asyncio:
         from .async_builtins import AsyncBuiltinListenerMatcher
 
+        if get_arg_names_of_callable(func) == ["payload_kind"]:
+
+            async def async_payload_kind_fun(payload_kind: PayloadKind) -> bool:
+                return func(payload_kind)
+
+            return AsyncBuiltinListenerMatcher(
+                func=async_payload_kind_fun,
+                base_logger=base_logger,
+                routing_keys=routing_keys,
+            )
+
         async def async_fun(body: Dict[str, Any]) -> bool:
             return func(body)
 
-        return AsyncBuiltinListenerMatcher(func=async_fun, base_logger=base_logger)
+        return AsyncBuiltinListenerMatcher(func=async_fun, base_logger=base_logger, routing_keys=routing_keys)
     else:
-        return BuiltinListenerMatcher(func=func, base_logger=base_logger)
+        return BuiltinListenerMatcher(func=func, base_logger=base_logger, routing_keys=routing_keys)
 
 
 # -------------
@@ -90,24 +96,21 @@ def event(
     if isinstance(constraints, (str, Pattern)):
         event_type: Union[str, Pattern] = constraints
         _verify_message_event_type(event_type)
+        event_type_matches = _compile(event_type)
 
-        def func(body: Dict[str, Any]) -> bool:
-            return is_event(body) and _matches(event_type, body["event"]["type"])
+        def func(payload_kind: PayloadKind) -> bool:
+            return payload_kind.event_type is not None and event_type_matches(payload_kind.event_type)
 
-        return build_listener_matcher(func, asyncio, base_logger)
+        return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["event"], event_type))
 
     elif "type" in constraints:
         _verify_message_event_type(constraints["type"])  # type: ignore[arg-type]
+        event_payload_matches = _compile_event_subtype_constraints(constraints)
 
-        def func(body: Dict[str, Any]) -> bool:
-            if is_event(body):
-                return _check_event_subtype(
-                    event_payload=body["event"],
-                    constraints=constraints,
-                )
-            return False
+        def func(payload_kind: PayloadKind) -> bool:
+            return payload_kind.event_type is not None and event_payload_matches(payload_kind.body["event"])
 
-        return build_listener_matcher(func, asyncio, base_logger)
+        return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["event"], constraints["type"]))
 
     raise BoltError(f"event ({constraints}: {type(constraints)}) must be any of str, Pattern, and dict")
 
@@ -120,49 +123,69 @@ def message_event(
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
     if "type" in constraints and keyword is not None:
         _verify_message_event_type(constraints["type"])  # type: ignore[arg-type]
+        event_payload_matches = _compile_event_subtype_constraints(constraints)
+        keyword_pattern: Pattern = re.compile(keyword)
 
-        def func(body: Dict[str, Any]) -> bool:
-            if is_event(body):
-                is_valid_subtype = _check_event_subtype(
-                    event_payload=body["event"],
-                    constraints=constraints,
-                )
-                if is_valid_subtype is True:
+        def func(payload_kind: PayloadKind) -> bool:
+            if payload_kind.event_type is not None:
+                event_payload = payload_kind.body["event"]
+                if event_payload_matches(event_payload):
                     # Check keyword matching
-                    text = body.get("event", {}).get("text", "")
-                    match_result = re.findall(keyword, text)
-                    if match_result is not None and match_result != []:
+                    text = event_payload.get("text", "")
+                    if keyword_pattern.search(text) is not None:
                         return True
             return False
 
-        return build_listener_matcher(func, asyncio, base_logger)
+        return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["event"], constraints["type"]))
 
     raise BoltError(f"event ({constraints}: {type(constraints)}) must be dict")
 
 
-def _check_event_subtype(event_payload: dict, constraints: dict) -> bool:
-    if not _matches(constraints["type"], event_payload["type"]):
-        return False
-    if "subtype" in constraints:
-        expected_subtype: Optional[Union[str, Sequence[Optional[Union[str, Pattern]]]]] = constraints["subtype"]
-        if expected_subtype is None:
-            # "subtype" in constraints is intentionally None for this pattern
-            return "subtype" not in event_payload
-        elif isinstance(expected_subtype, (str, Pattern)):
-            return "subtype" in event_payload and _matches(expected_subtype, event_payload["subtype"])
-        elif isinstance(expected_subtype, Sequence):
-            subtypes: Sequence[Optional[Union[str, Pattern]]] = expected_subtype
-            for expected in subtypes:
-                actual: Optional[str] = event_payload.get("subtype")
-                if expected is None:
-                    if actual is None:
-                        return True
-                elif actual is not None and _matches(expected, actual):
+def _compile_event_subtype_constraints(constraints: dict) -> Callable[[dict], bool]:
+    type_matches = _compile(constraints["type"])
+    if "subtype" not in constraints:
+
+        def type_only_matches(event_payload: dict) -> bool:
+            return type_matches(event_payload["type"])
+
+        return type_only_matches
+
+    expected_subtype: Optional[Union[str, Sequence[Optional[Union[str, Pattern]]]]] = constraints["subtype"]
+    if expected_subtype is None:
+        # "subtype" in constraints is intentionally None for this pattern
+        def no_subtype_matches(event_payload: dict) -> bool:
+            return type_matches(event_payload["type"]) and "subtype" not in event_payload
+
+        return no_subtype_matches
+
+    if isinstance(expected_subtype, Sequence) and not isinstance(expected_subtype, str):
+        subtypes: Sequence[Optional[Union[str, Pattern]]] = expected_subtype
+        none_allowed = None in subtypes
+        subtype_matchers = [_compile(expected) for expected in subtypes if expected is not None]
+
+        def any_subtype_matches(event_payload: dict) -> bool:
+            if not type_matches(event_payload["type"]):
+                return False
+            actual: Optional[str] = event_payload.get("subtype")
+            if actual is None:
+                return none_allowed
+            for subtype_matches in subtype_matchers:
+                if subtype_matches(actual):
                     return True
             return False
-        else:
-            return "subtype" in event_payload and _matches(expected_subtype, event_payload["subtype"])
-    return True
+
+        return any_subtype_matches
+
+    single_subtype_matches = _compile(expected_subtype)
+
+    def subtype_matches(event_payload: dict) -> bool:
+        return (
+            type_matches(event_payload["type"])
+            and "subtype" in event_payload
+            and single_subtype_matches(event_payload["subtype"])
+        )
+
+    return subtype_matches
 
 
 def _verify_message_event_type(event_type: Union[str, Pattern]) -> None:
@@ -177,10 +200,18 @@ def function_executed(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return is_function(body) and _matches(callback_id, body.get("event", {}).get("function", {}).get("callback_id", ""))
+    callback_id_matches = _compile(callback_id)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    def func(payload_kind: PayloadKind) -> bool:
+        if payload_kind.event_type != "function_executed":
+            return False
+        event_payload = payload_kind.body["event"]
+        if "function_execution_id" not in event_payload:
+            return False
+        function = event_payload.get("function")
+        return callback_id_matches(function.get("callback_id", "") if function is not None else "")
+
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["event"], "function_executed"))
 
 
 def workflow_step_execute(
@@ -188,15 +219,16 @@ def workflow_step_execute(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
+    callback_id_matches = _compile(callback_id)
+
+    def func(payload_kind: PayloadKind) -> bool:
         return (
-            is_event(body)
-            and _matches("workflow_step_execute", body["event"]["type"])
-            and "workflow_step" in body["event"]
-            and _matches(callback_id, body["event"]["callback_id"])
+            payload_kind.event_type == "workflow_step_execute"
+            and "workflow_step" in payload_kind.body["event"]
+            and callback_id_matches(payload_kind.body["event"]["callback_id"])
         )
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["event"], "workflow_step_execute"))
 
 
 # -------------
@@ -208,10 +240,12 @@ def command(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return is_slash_command(body) and _matches(command, body["command"])
+    command_matches = _compile(command)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    def func(payload_kind: PayloadKind) -> bool:
+        return payload_kind.command is not None and command_matches(payload_kind.command)
+
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["command"], command))
 
 
 # -------------
@@ -225,11 +259,13 @@ def shortcut(
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
     if isinstance(constraints, (str, Pattern)):
         callback_id: Union[str, Pattern] = constraints
+        callback_id_matches = _compile(callback_id)
 
-        def func(body: Dict[str, Any]) -> bool:
-            return is_shortcut(body) and _matches(callback_id, body["callback_id"])
+        def func(payload_kind: PayloadKind) -> bool:
+            return payload_kind.type in ("shortcut", "message_action") and callback_id_matches(payload_kind.callback_id)
 
-        return build_listener_matcher(func, asyncio, base_logger)
+        routing_keys = build_routing_keys(["shortcut", "message_action"], callback_id)
+        return build_listener_matcher(func, asyncio, base_logger, routing_keys)
 
     elif "type" in constraints and "callback_id" in constraints:
         if constraints["type"] == "shortcut":
@@ -245,10 +281,12 @@ def global_shortcut(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return is_global_shortcut(body) and _matches(callback_id, body["callback_id"])
+    callback_id_matches = _compile(callback_id)
+
+    def func(payload_kind: PayloadKind) -> bool:
+        return payload_kind.type == "shortcut" and callback_id_matches(payload_kind.callback_id)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["shortcut"], callback_id))
 
 
 def message_shortcut(
@@ -256,10 +294,12 @@ def message_shortcut(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return is_message_shortcut(body) and _matches(callback_id, body["callback_id"])
+    callback_id_matches = _compile(callback_id)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    def func(payload_kind: PayloadKind) -> bool:
+        return payload_kind.type == "message_action" and callback_id_matches(payload_kind.callback_id)
+
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["message_action"], callback_id))
 
 
 # -------------
@@ -272,17 +312,29 @@ def action(
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
     if isinstance(constraints, (str, Pattern)):
+        block_action_matches = _compile_block_action(constraints)
+        callback_id_matches = _compile(constraints)
 
-        def func(body: Dict[str, Any]) -> bool:
+        def func(payload_kind: PayloadKind) -> bool:
             return (
-                _block_action(constraints, body)
-                or _attachment_action(constraints, body)
-                or _dialog_submission(constraints, body)
-                or _dialog_cancellation(constraints, body)
-                or _workflow_step_edit(constraints, body)
+                block_action_matches(payload_kind)
+                or _attachment_action(callback_id_matches, payload_kind)
+                or _dialog_submission(callback_id_matches, payload_kind)
+                or _dialog_cancellation(callback_id_matches, payload_kind)
+                or _workflow_step_edit(callback_id_matches, payload_kind)
             )
 
-        return build_listener_matcher(func, asyncio, base_logger)
+        routing_keys = build_routing_keys(
+            [
+                "block_actions",
+                "interactive_message",
+                "dialog_submission",
+                "dialog_cancellation",
+                "workflow_step_edit",
+            ],
+            constraints,
+        )
+        return build_listener_matcher(func, asyncio, base_logger, routing_keys)
 
     elif "type" in constraints:
         action_type = constraints["type"]
@@ -306,26 +358,37 @@ def action(
     raise BoltError(f"action ({constraints}: {type(constraints)}) must be any of str, Pattern, and dict")
 
 
-def _block_action(
+def _compile_block_action(
     constraints: Union[str, Pattern, Dict[str, Union[str, Pattern]]],
-    body: Dict[str, Any],
-) -> bool:
-    if is_block_actions(body) is False:
-        return False
-
-    action = to_action(body)
+) -> Callable[[PayloadKind], bool]:
     if isinstance(constraints, (str, Pattern)):
-        action_id = constraints
-        return _matches(action_id, action["action_id"])  # type: ignore[index]
+        action_id_matches = _compile(constraints)
+
+        def action_id_only_matches(payload_kind: PayloadKind) -> bool:
+            return payload_kind.type == "block_actions" and action_id_matches(payload_kind.action_id)
+
+        return action_id_only_matches
+
     elif isinstance(constraints, dict):
         # block_id matching is optional
         block_id: Optional[Union[str, Pattern]] = constraints.get("block_id")
-        action_id = constraints.get("action_id")  # type: ignore[assignment]
+        action_id: Optional[Union[str, Pattern]] = constraints.get("action_id")
         if block_id is None and action_id is None:
-            return False
-        block_id_matched = block_id is None or _matches(block_id, action.get("block_id"))  # type: ignore[union-attr]
-        action_id_matched = action_id is None or _matches(action_id, action.get("action_id"))  # type: ignore[union-attr]
-        return block_id_matched and action_id_matched
+            return _never_matches
+        block_id_matches = _compile(block_id) if block_id is not None else None
+        action_id_matches = _compile(action_id) if action_id is not None else None  # type: ignore[assignment]
+
+        def block_id_and_action_id_matches(payload_kind: PayloadKind) -> bool:
+            if payload_kind.type != "block_actions" or len(payload_kind.action_ids) == 0:
+                return False
+            action = payload_kind.body["actions"][0]
+            if block_id_matches is not None and not block_id_matches(action.get("block_id")):
+                return False
+            return action_id_matches is None or action_id_matches(action.get("action_id"))
+
+        return block_id_and_action_id_matches
+
+    return _never_matches
 
 
 def block_action(
@@ -333,17 +396,16 @@ def block_action(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return _block_action(constraints, body)
-
-    return build_listener_matcher(func, asyncio, base_logger)
+    func = _compile_block_action(constraints)
+    action_id = constraints.get("action_id") if isinstance(constraints, dict) else constraints
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["block_actions"], action_id))
 
 
 def _attachment_action(
-    callback_id: Union[str, Pattern],
-    body: Dict[str, Any],
+    callback_id_matches: Callable[[Optional[str]], bool],
+    payload_kind: PayloadKind,
 ) -> bool:
-    return is_attachment_action(body) and _matches(callback_id, body["callback_id"])
+    return payload_kind.type == "interactive_message" and callback_id_matches(payload_kind.callback_id)
 
 
 def attachment_action(
@@ -351,17 +413,19 @@ def attachment_action(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return _attachment_action(callback_id, body)
+    callback_id_matches = _compile(callback_id)
+
+    def func(payload_kind: PayloadKind) -> bool:
+        return _attachment_action(callback_id_matches, payload_kind)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["interactive_message"], callback_id))
 
 
 def _dialog_submission(
-    callback_id: Union[str, Pattern],
-    body: Dict[str, Any],
+    callback_id_matches: Callable[[Optional[str]], bool],
+    payload_kind: PayloadKind,
 ) -> bool:
-    return is_dialog_submission(body) and _matches(callback_id, body["callback_id"])
+    return payload_kind.type == "dialog_submission" and callback_id_matches(payload_kind.callback_id)
 
 
 def dialog_submission(
@@ -369,17 +433,19 @@ def dialog_submission(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return _dialog_submission(callback_id, body)
+    callback_id_matches = _compile(callback_id)
+
+    def func(payload_kind: PayloadKind) -> bool:
+        return _dialog_submission(callback_id_matches, payload_kind)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["dialog_submission"], callback_id))
 
 
 def _dialog_cancellation(
-    callback_id: Union[str, Pattern],
-    body: Dict[str, Any],
+    callback_id_matches: Callable[[Optional[str]], bool],
+    payload_kind: PayloadKind,
 ) -> bool:
-    return is_dialog_cancellation(body) and _matches(callback_id, body["callback_id"])
+    return payload_kind.type == "dialog_cancellation" and callback_id_matches(payload_kind.callback_id)
 
 
 def dialog_cancellation(
@@ -387,17 +453,19 @@ def dialog_cancellation(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return _dialog_cancellation(callback_id, body)
+    callback_id_matches = _compile(callback_id)
+
+    def func(payload_kind: PayloadKind) -> bool:
+        return _dialog_cancellation(callback_id_matches, payload_kind)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["dialog_cancellation"], callback_id))
 
 
 def _workflow_step_edit(
-    callback_id: Union[str, Pattern],
-    body: Dict[str, Any],
+    callback_id_matches: Callable[[Optional[str]], bool],
+    payload_kind: PayloadKind,
 ) -> bool:
-    return is_workflow_step_edit(body) and _matches(callback_id, body["callback_id"])
+    return payload_kind.type == "workflow_step_edit" and callback_id_matches(payload_kind.callback_id)
 
 
 def workflow_step_edit(
@@ -405,10 +473,12 @@ def workflow_step_edit(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return _workflow_step_edit(callback_id, body)
+    callback_id_matches = _compile(callback_id)
+
+    def func(payload_kind: PayloadKind) -> bool:
+        return _workflow_step_edit(callback_id_matches, payload_kind)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["workflow_step_edit"], callback_id))
 
 
 # -------------------------
@@ -436,10 +506,12 @@ def view_submission(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return is_view_submission(body) and _matches(callback_id, body["view"]["callback_id"])
+    callback_id_matches = _compile(callback_id)
+
+    def func(payload_kind: PayloadKind) -> bool:
+        return payload_kind.type == "view_submission" and callback_id_matches(payload_kind.callback_id)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["view_submission"], callback_id))
 
 
 def view_closed(
@@ -447,10 +519,12 @@ def view_closed(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return is_view_closed(body) and _matches(callback_id, body["view"]["callback_id"])
+    callback_id_matches = _compile(callback_id)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    def func(payload_kind: PayloadKind) -> bool:
+        return payload_kind.type == "view_closed" and callback_id_matches(payload_kind.callback_id)
+
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["view_closed"], callback_id))
 
 
 def workflow_step_save(
@@ -458,10 +532,16 @@ def workflow_step_save(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return is_workflow_step_save(body) and _matches(callback_id, body["view"]["callback_id"])
+    callback_id_matches = _compile(callback_id)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    def func(payload_kind: PayloadKind) -> bool:
+        return (
+            payload_kind.type == "view_submission"
+            and payload_kind.view_type == "workflow_step"
+            and callback_id_matches(payload_kind.callback_id)
+        )
+
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["view_submission"], callback_id))
 
 
 # -------------
@@ -475,10 +555,15 @@ def options(
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
     if isinstance(constraints, (str, Pattern)):
 
-        def func(body: Dict[str, Any]) -> bool:
-            return _block_suggestion(constraints, body) or _dialog_suggestion(constraints, body)
+        constraints_matches = _compile(constraints)
+
+        def func(payload_kind: PayloadKind) -> bool:
+            return _block_suggestion(constraints_matches, payload_kind) or _dialog_suggestion(
+                constraints_matches, payload_kind
+            )
 
-        return build_listener_matcher(func, asyncio, base_logger)
+        routing_keys = build_routing_keys(["block_suggestion", "dialog_suggestion"], constraints)
+        return build_listener_matcher(func, asyncio, base_logger, routing_keys)
 
     if "action_id" in constraints:
         return block_suggestion(constraints["action_id"], asyncio)
@@ -489,10 +574,10 @@ def options(
 
 
 def _block_suggestion(
-    action_id: Union[str, Pattern],
-    body: Dict[str, Any],
+    action_id_matches: Callable[[Optional[str]], bool],
+    payload_kind: PayloadKind,
 ) -> bool:
-    return is_block_suggestion(body) and _matches(action_id, body["action_id"])
+    return payload_kind.type == "block_suggestion" and action_id_matches(payload_kind.action_id)
 
 
 def block_suggestion(
@@ -500,17 +585,19 @@ def block_suggestion(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return _block_suggestion(action_id, body)
+    action_id_matches = _compile(action_id)
+
+    def func(payload_kind: PayloadKind) -> bool:
+        return _block_suggestion(action_id_matches, payload_kind)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["block_suggestion"], action_id))
 
 
 def _dialog_suggestion(
-    callback_id: Union[str, Pattern],
-    body: Dict[str, Any],
+    callback_id_matches: Callable[[Optional[str]], bool],
+    payload_kind: PayloadKind,
 ) -> bool:
-    return is_dialog_suggestion(body) and _matches(callback_id, body["callback_id"])
+    return payload_kind.type == "dialog_suggestion" and callback_id_matches(payload_kind.callback_id)
 
 
 def dialog_suggestion(
@@ -518,15 +605,45 @@ def dialog_suggestion(
     asyncio: bool = False,
     base_logger: Optional[Logger] = None,
 ) -> Union[ListenerMatcher, "AsyncListenerMatcher"]:  # type: ignore[name-defined]
-    def func(body: Dict[str, Any]) -> bool:
-        return _dialog_suggestion(callback_id, body)
+    callback_id_matches = _compile(callback_id)
 
-    return build_listener_matcher(func, asyncio, base_logger)
+    def func(payload_kind: PayloadKind) -> bool:
+        return _dialog_suggestion(callback_id_matches, payload_kind)
+
+    return build_listener_matcher(func, asyncio, base_logger, build_routing_keys(["dialog_suggestion"], callback_id))
 
 
 # -------------------------
 
 
+def _never_matches(payload_kind: PayloadKind) -> bool:
+    return False
+
+
+def _compile(str_or_pattern: Union[str, Pattern]) -> Callable[[Optional[str]], bool]:
+    """Precompiles a str/Pattern constraint into a predicate, which avoids type checks per request."""
+    if isinstance(str_or_pattern, str):
+        exact_match_str: str = str_or_pattern
+
+        def equals(input: Optional[str]) -> bool:
+            return input is not None and input == exact_match_str
+
+        return equals
+    elif isinstance(str_or_pattern, Pattern):
+        search = str_or_pattern.search
+
+        def searches(input: Optional[str]) -> bool:
+            return input is not None and search(input) is not None
+
+        return searches
+    else:
+        # None never matches; other types result in the error in _matches() at runtime
+        def fallback(input: Optional[str]) -> bool:
+            return _matches(str_or_pattern, input)
+
+        return fallback
+
+
 def _matches(str_or_pattern: Union[str, Pattern], input: Optional[str]) -> bool:
     if str_or_pattern is None or input is None:
         return False
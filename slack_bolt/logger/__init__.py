@@ -2,27 +2,52 @@
 
 import logging
 from logging import Logger
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
+
+# (logger name, base logger) -> the logger configured with the base logger (or the root logger if None)
+_configured_loggers: Dict[Tuple[str, Optional[Logger]], Logger] = {}
 
 
 def get_bolt_logger(cls: Any, base_logger: Optional[Logger] = None) -> Logger:
-    logger = logging.getLogger(f"slack_bolt.{cls.__name__}")
-    if base_logger is not None:
-        _configure_from_base_logger(logger, base_logger)
-    else:
-        _configure_from_root(logger)
-    return logger
+    return _get_configured_logger(f"slack_bolt.{cls.__name__}", base_logger)
 
 
 def get_bolt_app_logger(app_name: str, cls: object = None, base_logger: Optional[Logger] = None) -> Logger:
-    logger: Logger = (
-        logging.getLogger(f"{app_name}:{cls.__name__}") if cls and hasattr(cls, "__name__") else logging.getLogger(app_name)
-    )
+    name = f"{app_name}:{cls.__name__}" if cls and hasattr(cls, "__name__") else app_name
+    return _get_configured_logger(name, base_logger)
+
+
+def clear_logger_cache() -> None:
+    """Discards the resolved logger configurations.
+
+    The loggers returned by `get_bolt_logger()` and `get_bolt_app_logger()` copy the handlers and filters
+    of the base logger only when they are requested for the first time, while the level and the disabled flag
+    of the base logger (or the root logger) are synchronized every time.
+    Call this function after changing the handlers or filters of the base logger so that the loggers requested
+    afterwards reflect the change. Note that the loggers which components such as `App` already hold are not reconfigured.
+    """
+    _configured_loggers.clear()
+
 
-    if base_logger is not None:
-        _configure_from_base_logger(logger, base_logger)
+def _get_configured_logger(name: str, base_logger: Optional[Logger]) -> Logger:
+    key = (name, base_logger)
+    logger = _configured_loggers.get(key)
+    if logger is None:
+        # logging.getLogger() acquires the module-level lock, so this is done only once per logger
+        logger = logging.getLogger(name)
+        if base_logger is not None:
+            _configure_from_base_logger(logger, base_logger)
+        else:
+            _configure_from_root(logger)
+        _configured_loggers[key] = logger
     else:
-        _configure_from_root(logger)
+        # e.g., logging.basicConfig(level=logging.DEBUG) can be called after the logger is configured
+        source = base_logger if base_logger is not None else logging.root
+        if logger.level != source.level:
+            # setLevel() clears the cached results of isEnabledFor()
+            logger.setLevel(source.level)
+        if logger.disabled != source.disabled:
+            logger.disabled = source.disabled
     return logger
 
 
@@ -45,4 +70,5 @@ def _configure_from_root(new_logger: Logger):
 __all__ = [
     "get_bolt_logger",
     "get_bolt_app_logger",
+    "clear_logger_cache",
 ]
@@ -79,6 +79,28 @@ def error_oauth_flow_or_authorize_required() -> str:
     return "`oauth_flow` or `authorize` must be configured to make a Bolt app"
 
 
+def error_background_token_rotation_unavailable() -> str:
+    return (
+        "`background_token_rotation_enabled` requires the installation store based `authorize` "
+        "with client_id/client_secret (e.g., `oauth_settings`) for token rotation"
+    )
+
+
+def error_middleware_metrics_conflicts() -> str:
+    return (
+        "`middleware_metrics` and `phase_observer` cannot be used together; "
+        "as `PhaseObserver` is a `MiddlewareMetrics`, override its `record_middleware_time()` instead"
+    )
+
+
+def error_authorize_options_conflicts() -> str:
+    return (
+        "`authorize_result_cache`, `single_flight_enabled`, `auth_test_mode`, and "
+        "`auth_test_verification_interval_seconds` in the top-level arguments are not allowed "
+        "when the `authorize` is built from either `oauth_settings` or `oauth_flow`; set them in the OAuth settings instead"
+    )
+
+
 # -------------------------------
 # Warning
 # -------------------------------
@@ -318,6 +340,35 @@ def warning_did_not_call_ack(listener_name: str) -> str:
     return f"{listener_name} didn't call ack()"
 
 
+def warning_listener_executor_saturated(listener_name: str) -> str:
+    return f"Responded with 503 status as the listener executor was too busy to run {listener_name}"
+
+
+def error_lazy_listener_rejected(func_name: str) -> str:
+    return f"Skipped running a lazy listener function ({func_name}) as the listener executor was too busy"
+
+
+def warning_installation_pipeline_full(team_id: Optional[str], enterprise_id: Optional[str]) -> str:
+    return (
+        f"Storing an installation (team_id: {team_id}, enterprise_id: {enterprise_id}) on the request thread "
+        "as the installation pipeline's queue is full"
+    )
+
+
+def error_dispatch_scheduler_concurrency(concurrency: int) -> str:
+    return (
+        f"concurrency must be 1 when dispatch_scheduler is given (actual: {concurrency}); "
+        "the scheduler's lanes run the envelopes concurrently instead"
+    )
+
+
+def warning_dispatch_scheduler_without_process_before_response() -> str:
+    return (
+        "dispatch_scheduler keeps the order of only ack() calls as process_before_response is False; "
+        "set process_before_response=True to run the whole listeners in order"
+    )
+
+
 def warning_bot_only_conflicts() -> str:
     return (
         "installation_store_bot_only exists in both App and OAuthFlow.settings. "
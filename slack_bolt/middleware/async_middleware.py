@@ -2,6 +2,7 @@ from abc import ABCMeta, abstractmethod
 from typing import Callable, Awaitable, Optional
 
 from slack_bolt.request.async_request import AsyncBoltRequest
+from slack_bolt.request.payload_kind import PayloadKind
 from slack_bolt.response import BoltResponse
 
 
@@ -45,6 +46,19 @@ class AsyncMiddleware(metaclass=ABCMeta):
         """
         raise NotImplementedError()
 
+    def is_applicable_to(self, payload_kind: PayloadKind) -> bool:
+        """Returns False if this middleware never does anything but calling `next()` for the kind of payload.
+        The app skips such middleware without invoking `async_process()`. Override this method only when
+        the `async_process()` method returns `await next()` for all the payloads that this method returns False for.
+
+        Args:
+            payload_kind: The kind of the incoming request payload
+
+        Returns:
+            True if the `async_process()` method needs to run for the payload (Default: True)
+        """
+        return True
+
     @property
     def name(self) -> str:
         """The name of this middleware"""
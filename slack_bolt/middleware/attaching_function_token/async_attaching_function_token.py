@@ -3,6 +3,7 @@ from typing import Callable, Awaitable
 from slack_bolt.request.async_request import AsyncBoltRequest
 from slack_bolt.response import BoltResponse
 from slack_bolt.middleware.async_middleware import AsyncMiddleware
+from slack_bolt.util.async_web_client_pool import assign_token_to_context_client
 
 
 class AsyncAttachingFunctionToken(AsyncMiddleware):
@@ -15,6 +16,6 @@ class AsyncAttachingFunctionToken(AsyncMiddleware):
         next: Callable[[], Awaitable[BoltResponse]],
     ) -> BoltResponse:
         if req.context.function_bot_access_token is not None:
-            req.context.client.token = req.context.function_bot_access_token
+            assign_token_to_context_client(req.context, req.context.function_bot_access_token)
 
         return await next()
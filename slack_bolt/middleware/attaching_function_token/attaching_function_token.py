@@ -3,6 +3,7 @@ from typing import Callable
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
 from slack_bolt.middleware.middleware import Middleware
+from slack_bolt.util.web_client_pool import assign_token_to_context_client
 
 
 class AttachingFunctionToken(Middleware):
@@ -15,6 +16,6 @@ class AttachingFunctionToken(Middleware):
         next: Callable[[], BoltResponse],
     ) -> BoltResponse:
         if req.context.function_bot_access_token is not None:
-            req.context.client.token = req.context.function_bot_access_token
+            assign_token_to_context_client(req.context, req.context.function_bot_access_token)
 
         return next()
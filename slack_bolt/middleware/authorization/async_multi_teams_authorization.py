@@ -7,9 +7,14 @@ from slack_bolt.request.async_request import AsyncBoltRequest
 from slack_bolt.response import BoltResponse
 from .async_authorization import AsyncAuthorization
 from .async_internals import _build_user_facing_error_response, _is_no_auth_required
-from .internals import _is_no_auth_test_call_required, _build_user_facing_authorize_error_message
+from .internals import (
+    _is_no_auth_test_call_required,
+    _build_user_facing_authorize_error_message,
+    auth_test_result_invalidating_events,
+)
 from ...authorization import AuthorizeResult
-from ...authorization.async_authorize import AsyncAuthorize
+from ...authorization.async_authorize import AsyncAuthorize, AsyncInstallationStoreAuthorize
+from ...util.async_web_client_pool import assign_token_to_context_client
 
 
 class AsyncMultiTeamsAuthorization(AsyncAuthorization):
@@ -52,6 +57,8 @@ class AsyncMultiTeamsAuthorization(AsyncAuthorization):
             return await next()
 
         if _is_no_auth_test_call_required(req):
+            if req.payload_kind.event_type in auth_test_result_invalidating_events:
+                self._invalidate_authorize_result_cache(req)
             req.context.set_authorize_result(
                 AuthorizeResult(
                     enterprise_id=req.context.enterprise_id,
@@ -84,9 +91,9 @@ class AsyncMultiTeamsAuthorization(AsyncAuthorization):
                 req.context.set_authorize_result(auth_result)
                 token = auth_result.bot_token or auth_result.user_token
                 req.context["token"] = token
-                # As AsyncApp#_init_context() generates a new AsyncWebClient for this request,
-                # it's safe to modify this instance.
-                req.context.client.token = token
+                # As AsyncApp#_init_context() generates a new AsyncWebClient for this request (or a pooled one,
+                # which is replaced instead of being modified), it's safe to modify this instance.
+                assign_token_to_context_client(req.context, token)
                 return await next()
             else:
                 # This situation can arise if:
@@ -104,3 +111,12 @@ class AsyncMultiTeamsAuthorization(AsyncAuthorization):
         except SlackApiError as e:
             self.logger.error(f"Failed to authorize with the given token ({e})")
             return _build_user_facing_error_response(self.user_facing_authorize_error_message)
+
+    def _invalidate_authorize_result_cache(self, req: AsyncBoltRequest) -> None:
+        # The installation is about to be deleted, so the cached result must not be used any longer
+        if isinstance(self.authorize, AsyncInstallationStoreAuthorize) and self.authorize.authorize_result_cache is not None:
+            self.authorize.authorize_result_cache.invalidate(
+                enterprise_id=req.context.enterprise_id,
+                team_id=req.context.team_id,
+                is_enterprise_install=req.context.is_enterprise_install,
+            )
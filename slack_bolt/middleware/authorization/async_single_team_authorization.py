@@ -1,3 +1,4 @@
+import time
 from logging import Logger
 from typing import Callable, Awaitable, Optional
 
@@ -8,7 +9,13 @@ from slack_bolt.response import BoltResponse
 from slack_sdk.web.async_slack_response import AsyncSlackResponse
 from slack_sdk.errors import SlackApiError
 from .async_internals import _build_user_facing_error_response, _is_no_auth_required
-from .internals import _to_authorize_result, _is_no_auth_test_call_required, _build_user_facing_authorize_error_message
+from .internals import (
+    _to_authorize_result,
+    _is_no_auth_test_call_required,
+    _build_user_facing_authorize_error_message,
+    _overlay_request_user_id,
+    auth_test_result_invalidating_events,
+)
 from ...authorization import AuthorizeResult
 
 
@@ -17,9 +24,20 @@ class AsyncSingleTeamAuthorization(AsyncAuthorization):
         self,
         base_logger: Optional[Logger] = None,
         user_facing_authorize_error_message: Optional[str] = None,
+        auth_test_refresh_interval_seconds: Optional[float] = None,
     ):
-        """Single-workspace authorization."""
+        """Single-workspace authorization. Refer to `SingleTeamAuthorization` for details.
+
+        Args:
+            base_logger: The base logger
+            user_facing_authorize_error_message: The message to display when authorization fails
+            auth_test_refresh_interval_seconds: The interval to call `auth.test` API again (Default: never)
+        """
         self.auth_test_result: Optional[AsyncSlackResponse] = None
+        self.auth_test_refresh_interval_seconds = auth_test_refresh_interval_seconds
+        self._auth_test_result_updated_at = time.monotonic()
+        self._authorize_result: Optional[AuthorizeResult] = None
+        self._authorize_result_token: Optional[str] = None
         self.logger = get_bolt_logger(AsyncSingleTeamAuthorization, base_logger=base_logger)
         self.user_facing_authorize_error_message = (
             user_facing_authorize_error_message or _build_user_facing_authorize_error_message()
@@ -39,6 +57,8 @@ class AsyncSingleTeamAuthorization(AsyncAuthorization):
             return await next()
 
         if _is_no_auth_test_call_required(req):
+            if req.payload_kind.event_type in auth_test_result_invalidating_events:
+                self.invalidate()
             req.context.set_authorize_result(
                 AuthorizeResult(
                     enterprise_id=req.context.enterprise_id,
@@ -49,17 +69,27 @@ class AsyncSingleTeamAuthorization(AsyncAuthorization):
             return await next()
 
         try:
-            if self.auth_test_result is None:
-                self.auth_test_result = await req.context.client.auth_test()
+            # invalidate() can run concurrently, so the shared result is read only once
+            auth_test_result = self.auth_test_result
+            if auth_test_result is None or self._is_refresh_due():
+                auth_test_result = await req.context.client.auth_test()
+                self.auth_test_result = auth_test_result
+                self._auth_test_result_updated_at = time.monotonic()
+                self._authorize_result = None
 
-            if self.auth_test_result:
-                req.context.set_authorize_result(
-                    _to_authorize_result(
-                        auth_test_result=self.auth_test_result,
-                        token=req.context.client.token,
-                        request_user_id=req.context.user_id,
+            if auth_test_result:
+                token = req.context.client.token
+                authorize_result = self._authorize_result
+                if authorize_result is None or self._authorize_result_token != token:
+                    authorize_result = _to_authorize_result(
+                        auth_test_result=auth_test_result,
+                        token=token,
+                        request_user_id=None,
                     )
-                )
+                    if self.auth_test_result is auth_test_result:
+                        self._authorize_result = authorize_result
+                        self._authorize_result_token = token
+                req.context.set_authorize_result(_overlay_request_user_id(authorize_result, req.context.user_id))
                 return await next()
             else:
                 # Just in case
@@ -71,3 +101,12 @@ class AsyncSingleTeamAuthorization(AsyncAuthorization):
         except SlackApiError as e:
             self.logger.error(f"Failed to authorize with the given token ({e})")
             return _build_user_facing_error_response(self.user_facing_authorize_error_message)
+
+    def invalidate(self) -> None:
+        """Discards the auth.test API result so that the next request calls the API again."""
+        self.auth_test_result = None
+        self._authorize_result = None
+
+    def _is_refresh_due(self) -> bool:
+        interval = self.auth_test_refresh_interval_seconds
+        return interval is not None and time.monotonic() - self._auth_test_result_updated_at >= interval
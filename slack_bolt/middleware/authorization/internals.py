@@ -1,3 +1,4 @@
+import copy
 from typing import Optional, Union
 
 from slack_sdk.web import SlackResponse
@@ -16,23 +17,18 @@ from slack_bolt.response import BoltResponse
 
 
 def _is_url_verification(req: Union[BoltRequest, "AsyncBoltRequest"]) -> bool:  # type: ignore[name-defined]
-    return req is not None and req.body is not None and req.body.get("type") == "url_verification"
+    return req is not None and req.payload_kind.type == "url_verification"
 
 
 def _is_ssl_check(req: Union[BoltRequest, "AsyncBoltRequest"]) -> bool:  # type: ignore[name-defined]
-    return req is not None and req.body is not None and req.body.get("type") == "ssl_check"
+    return req is not None and req.payload_kind.type == "ssl_check"
 
 
 no_auth_test_events = ["app_uninstalled", "tokens_revoked", "team_access_revoked"]
 
 
 def _is_no_auth_test_events(req: Union[BoltRequest, "AsyncBoltRequest"]) -> bool:  # type: ignore[name-defined]
-    return (
-        req is not None
-        and req.body is not None
-        and req.body.get("type") == "event_callback"
-        and req.body.get("event", {}).get("type") in no_auth_test_events
-    )
+    return req is not None and req.payload_kind.event_type in no_auth_test_events
 
 
 def _is_no_auth_required(req: Union[BoltRequest, "AsyncBoltRequest"]) -> bool:  # type: ignore[name-defined]
@@ -80,3 +76,16 @@ def _to_authorize_result(
         bot_scopes=oauth_scopes if _is_bot_token(token) else None,
         user_scopes=None if _is_bot_token(token) else oauth_scopes,
     )
+
+
+def _overlay_request_user_id(authorize_result: AuthorizeResult, request_user_id: Optional[str]) -> AuthorizeResult:
+    # Returns the team-level result as-is, or its shallow copy that has the request user's ID
+    if not request_user_id or request_user_id == authorize_result.user_id:
+        return authorize_result
+    result = copy.copy(authorize_result)
+    result["user_id"] = result.user_id = request_user_id
+    return result
+
+
+# The events that may make the auth.test API result of a single-workspace app outdated
+auth_test_result_invalidating_events = ["tokens_revoked", "app_uninstalled"]
@@ -12,9 +12,11 @@ from .internals import (
     _is_no_auth_required,
     _is_no_auth_test_call_required,
     _build_user_facing_authorize_error_message,
+    auth_test_result_invalidating_events,
 )
 from ...authorization import AuthorizeResult
-from ...authorization.authorize import Authorize
+from ...authorization.authorize import Authorize, InstallationStoreAuthorize
+from ...util.web_client_pool import assign_token_to_context_client
 
 
 class MultiTeamsAuthorization(Authorization):
@@ -55,6 +57,8 @@ class MultiTeamsAuthorization(Authorization):
             return next()
 
         if _is_no_auth_test_call_required(req):
+            if req.payload_kind.event_type in auth_test_result_invalidating_events:
+                self._invalidate_authorize_result_cache(req)
             req.context.set_authorize_result(
                 AuthorizeResult(
                     enterprise_id=req.context.enterprise_id,
@@ -87,9 +91,9 @@ class MultiTeamsAuthorization(Authorization):
                 req.context.set_authorize_result(auth_result)
                 token = auth_result.bot_token or auth_result.user_token
                 req.context["token"] = token
-                # As App#_init_context() generates a new WebClient for this request,
-                # it's safe to modify this instance.
-                req.context.client.token = token
+                # As App#_init_context() generates a new WebClient for this request (or a pooled one,
+                # which is replaced instead of being modified), it's safe to modify this instance.
+                assign_token_to_context_client(req.context, token)
                 return next()
             else:
                 # This situation can arise if:
@@ -107,3 +111,12 @@ class MultiTeamsAuthorization(Authorization):
         except SlackApiError as e:
             self.logger.error(f"Failed to authorize with the given token ({e})")
             return _build_user_facing_error_response(self.user_facing_authorize_error_message)
+
+    def _invalidate_authorize_result_cache(self, req: BoltRequest) -> None:
+        # The installation is about to be deleted, so the cached result must not be used any longer
+        if isinstance(self.authorize, InstallationStoreAuthorize) and self.authorize.authorize_result_cache is not None:
+            self.authorize.authorize_result_cache.invalidate(
+                enterprise_id=req.context.enterprise_id,
+                team_id=req.context.team_id,
+                is_enterprise_install=req.context.is_enterprise_install,
+            )
@@ -1,3 +1,4 @@
+import time
 from logging import Logger
 from typing import Callable, Optional
 
@@ -13,6 +14,8 @@ from .internals import (
     _to_authorize_result,
     _is_no_auth_test_call_required,
     _build_user_facing_authorize_error_message,
+    _overlay_request_user_id,
+    auth_test_result_invalidating_events,
 )
 from ...authorization import AuthorizeResult
 
@@ -24,14 +27,25 @@ class SingleTeamAuthorization(Authorization):
         auth_test_result: Optional[SlackResponse] = None,
         base_logger: Optional[Logger] = None,
         user_facing_authorize_error_message: Optional[str] = None,
+        auth_test_refresh_interval_seconds: Optional[float] = None,
     ):
         """Single-workspace authorization.
 
+        The team-level `AuthorizeResult` is built only once; each request gets it with its own user_id.
+        The result is refreshed when `tokens_revoked` / `app_uninstalled` events arrive,
+        or every `auth_test_refresh_interval_seconds` if the interval is given.
+
         Args:
             auth_test_result: The initial `auth.test` API call result.
             base_logger: The base logger
+            user_facing_authorize_error_message: The message to display when authorization fails
+            auth_test_refresh_interval_seconds: The interval to call `auth.test` API again (Default: never)
         """
         self.auth_test_result = auth_test_result
+        self.auth_test_refresh_interval_seconds = auth_test_refresh_interval_seconds
+        self._auth_test_result_updated_at = time.monotonic()
+        self._authorize_result: Optional[AuthorizeResult] = None
+        self._authorize_result_token: Optional[str] = None
         self.logger = get_bolt_logger(SingleTeamAuthorization, base_logger=base_logger)
         self.user_facing_authorize_error_message = (
             user_facing_authorize_error_message or _build_user_facing_authorize_error_message()
@@ -52,6 +66,8 @@ class SingleTeamAuthorization(Authorization):
             return next()
 
         if _is_no_auth_test_call_required(req):
+            if req.payload_kind.event_type in auth_test_result_invalidating_events:
+                self.invalidate()
             req.context.set_authorize_result(
                 AuthorizeResult(
                     enterprise_id=req.context.enterprise_id,
@@ -62,17 +78,27 @@ class SingleTeamAuthorization(Authorization):
             return next()
 
         try:
-            if not self.auth_test_result:
-                self.auth_test_result = req.context.client.auth_test()
+            # invalidate() can run concurrently, so the shared result is read only once
+            auth_test_result = self.auth_test_result
+            if not auth_test_result or self._is_refresh_due():
+                auth_test_result = req.context.client.auth_test()
+                self.auth_test_result = auth_test_result
+                self._auth_test_result_updated_at = time.monotonic()
+                self._authorize_result = None
 
-            if self.auth_test_result:
-                req.context.set_authorize_result(
-                    _to_authorize_result(
-                        auth_test_result=self.auth_test_result,
-                        token=req.context.client.token,
-                        request_user_id=req.context.user_id,
+            if auth_test_result:
+                token = req.context.client.token
+                authorize_result = self._authorize_result
+                if authorize_result is None or self._authorize_result_token != token:
+                    authorize_result = _to_authorize_result(
+                        auth_test_result=auth_test_result,
+                        token=token,
+                        request_user_id=None,
                     )
-                )
+                    if self.auth_test_result is auth_test_result:
+                        self._authorize_result = authorize_result
+                        self._authorize_result_token = token
+                req.context.set_authorize_result(_overlay_request_user_id(authorize_result, req.context.user_id))
                 return next()
             else:
                 # Just in case
@@ -84,3 +110,12 @@ class SingleTeamAuthorization(Authorization):
         except SlackApiError as e:
             self.logger.error(f"Failed to authorize with the given token ({e})")
             return _build_user_facing_error_response(self.user_facing_authorize_error_message)
+
+    def invalidate(self) -> None:
+        """Discards the auth.test API result so that the next request calls the API again."""
+        self.auth_test_result = None
+        self._authorize_result = None
+
+    def _is_refresh_due(self) -> bool:
+        interval = self.auth_test_refresh_interval_seconds
+        return interval is not None and time.monotonic() - self._auth_test_result_updated_at >= interval
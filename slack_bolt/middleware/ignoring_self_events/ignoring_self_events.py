@@ -4,6 +4,7 @@ from typing import Callable, Dict, Any, Optional
 from slack_bolt.authorization import AuthorizeResult
 from slack_bolt.logger import get_bolt_logger
 from slack_bolt.request import BoltRequest
+from slack_bolt.request.payload_kind import PayloadKind
 from slack_bolt.request.payload_utils import is_bot_message_event_in_assistant_thread
 from slack_bolt.response import BoltResponse
 from slack_bolt.middleware.middleware import Middleware
@@ -19,6 +20,9 @@ class IgnoringSelfEvents(Middleware):
         self.logger = get_bolt_logger(IgnoringSelfEvents, base_logger=base_logger)
         self.ignoring_self_assistant_message_events_enabled = ignoring_self_assistant_message_events_enabled
 
+    def is_applicable_to(self, payload_kind: PayloadKind) -> bool:
+        return payload_kind.body.get("event") is not None
+
     def process(
         self,
         *,
@@ -0,0 +1,108 @@
+import logging
+import time
+from logging import Logger
+from typing import Callable, Optional, Sequence, Tuple
+
+from slack_bolt.logger.messages import debug_applying_middleware
+from slack_bolt.request import BoltRequest
+from slack_bolt.request.payload_kind import PayloadKind
+from slack_bolt.response import BoltResponse
+from slack_bolt.util.phase_observer import MiddlewareMetrics
+from .middleware import Middleware
+
+
+class NextCall:
+    """The `next()` function passed to middleware. A single instance is reused for all the middleware
+    in a chain execution, so that running a chain does not create any closures."""
+
+    __slots__ = ["called"]
+
+    def __init__(self):
+        self.called = False
+
+    def __call__(self) -> None:
+        self.called = True
+
+
+def _applicability_predicate(middleware: object) -> Optional[Callable[[PayloadKind], bool]]:
+    is_applicable_to = getattr(type(middleware), "is_applicable_to", None)
+    if is_applicable_to is None or is_applicable_to is Middleware.is_applicable_to:
+        # This middleware can process any requests
+        return None
+    return middleware.is_applicable_to  # type: ignore[attr-defined]
+
+
+class MiddlewareChain:
+    middleware: Tuple[Middleware, ...]
+    names: Tuple[str, ...]
+    logger: Optional[Logger]
+    metrics: Optional[MiddlewareMetrics]
+
+    def __init__(
+        self,
+        middleware: Sequence[Middleware],
+        *,
+        logger: Optional[Logger] = None,
+        metrics: Optional[MiddlewareMetrics] = None,
+    ):
+        """A middleware stack compiled into a flat sequence.
+
+        The names and the applicability of the middleware are resolved only once here,
+        so that running the chain neither creates closures nor builds strings per request.
+        The built-in middleware that never do anything for the kind of an incoming request
+        (e.g., `UrlVerification` for block_actions requests) are skipped.
+        Compile a new chain when the middleware stack is changed.
+
+        Args:
+            middleware: The middleware to run in order
+            logger: The logger to print debug logs for each middleware execution
+            metrics: The hooks to measure the time spent in each middleware
+        """
+        self.middleware = tuple(middleware)
+        self.names = tuple(m.name for m in self.middleware)
+        self.logger = logger
+        self.metrics = metrics
+        self._entries = tuple(zip(self.middleware, self.names, [_applicability_predicate(m) for m in self.middleware]))
+
+    def __len__(self) -> int:
+        return len(self.middleware)
+
+    def run(
+        self,
+        *,
+        req: BoltRequest,
+        resp: Optional[BoltResponse],
+    ) -> Tuple[Optional[BoltResponse], Optional[int]]:
+        """Runs the middleware in order until one of them does not call `next()`.
+
+        Args:
+            req: The incoming request
+            resp: The current response
+
+        Returns:
+            A tuple of the processed response and the index of the middleware that did not call `next()`
+            (None if all the middleware called `next()`)
+        """
+        next_ = NextCall()
+        debug_enabled = self.logger is not None and self.logger.level <= logging.DEBUG
+        metrics = self.metrics
+        for index, (middleware, name, is_applicable_to) in enumerate(self._entries):
+            if is_applicable_to is not None and not is_applicable_to(req.payload_kind):
+                # The same as the middleware simply calling `return next()`
+                resp = None
+                continue
+            if debug_enabled:
+                self.logger.debug(debug_applying_middleware(name))  # type: ignore[union-attr]
+            next_.called = False
+            if metrics is None:
+                resp = middleware.process(req=req, resp=resp, next=next_)  # type: ignore[arg-type]
+            else:
+                started_at = time.perf_counter()
+                try:
+                    resp = middleware.process(req=req, resp=resp, next=next_)  # type: ignore[arg-type]
+                finally:
+                    seconds = time.perf_counter() - started_at
+                    metrics.record_middleware_time(request=req, name=name, seconds=seconds, next_called=next_.called)
+            if not next_.called:
+                return resp, index
+        return resp, None
@@ -26,11 +26,12 @@ class AsyncRequestVerification(RequestVerification, AsyncMiddleware):
         if self._can_skip(req.mode, req.body):
             return await next()
 
-        body = req.raw_body
+        # The bytes given by the adapter are verified as-is without encoding the decoded body again
+        body = req.raw_body_bytes if req.raw_body_bytes is not None else req.raw_body
         timestamp = req.headers.get("x-slack-request-timestamp", ["0"])[0]
         signature = req.headers.get("x-slack-signature", [""])[0]
         if self.verifier.is_valid(body, timestamp, signature):
             return await next()
         else:
-            self._debug_log_error(signature, timestamp, body)
+            self._debug_log_error(signature, timestamp, req.raw_body)
             return self._build_error_response()
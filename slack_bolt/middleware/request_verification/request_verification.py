@@ -7,6 +7,7 @@ from slack_bolt.logger import get_bolt_logger
 from slack_bolt.middleware.middleware import Middleware
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
+from .signature_verifier import PreparedSignatureVerifier
 
 
 class RequestVerification(Middleware):
@@ -28,7 +29,7 @@ class RequestVerification(Middleware):
     def verifier(self) -> SignatureVerifier:
         # Defer initialization to avoid errors during start up
         if self._verifier is None:
-            self._verifier = SignatureVerifier(signing_secret=self._signing_secret)
+            self._verifier = PreparedSignatureVerifier(signing_secret=self._signing_secret)
         return self._verifier
 
     def process(
@@ -44,13 +45,14 @@ class RequestVerification(Middleware):
         if self._can_skip(req.mode, req.body):
             return next()
 
-        body = req.raw_body
+        # The bytes given by the adapter are verified as-is without encoding the decoded body again
+        body = req.raw_body_bytes if req.raw_body_bytes is not None else req.raw_body
         timestamp = req.headers.get("x-slack-request-timestamp", ["0"])[0]
         signature = req.headers.get("x-slack-signature", [""])[0]
         if self.verifier.is_valid(body, timestamp, signature):
             return next()
         else:
-            self._debug_log_error(signature, timestamp, body)
+            self._debug_log_error(signature, timestamp, req.raw_body)
             return self._build_error_response()
 
     # -----------------------------------------
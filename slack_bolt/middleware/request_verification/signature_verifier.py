@@ -0,0 +1,42 @@
+import hashlib
+import hmac
+from typing import Optional, Union
+
+from slack_sdk.signature import Clock, SignatureVerifier
+
+
+class PreparedSignatureVerifier(SignatureVerifier):
+    """A `SignatureVerifier` optimized for verifying many requests with the same signing secret.
+
+    The HMAC object keyed with the signing secret is built only once, and each verification works on its copy.
+    The body is hashed as-is when it is given as bytes (e.g., the raw data received by an adapter),
+    and a request with a stale timestamp or a malformed signature is rejected before hashing the body.
+    """
+
+    # The allowed difference in seconds between the request timestamp and the current time
+    max_timestamp_age_seconds: int = 60 * 5
+
+    def __init__(self, signing_secret: str, clock: Clock = Clock()):
+        super().__init__(signing_secret=signing_secret, clock=clock)
+        self._hmac = hmac.new(signing_secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def is_valid(
+        self,
+        body: Union[str, bytes, memoryview],
+        timestamp: Optional[str],
+        signature: Optional[str],
+    ) -> bool:
+        if timestamp is None or signature is None:
+            return False
+        try:
+            if abs(self.clock.now() - int(timestamp)) > self.max_timestamp_age_seconds:
+                return False
+        except ValueError:
+            return False
+        if not signature.startswith("v0="):
+            return False
+
+        h = self._hmac.copy()
+        h.update(b"v0:" + timestamp.encode("utf-8") + b":")
+        h.update(body.encode("utf-8") if isinstance(body, str) else body)
+        return hmac.compare_digest("v0=" + h.hexdigest(), signature)
@@ -4,6 +4,7 @@ from typing import Callable, Optional
 from slack_bolt.logger import get_bolt_logger
 from slack_bolt.middleware.middleware import Middleware
 from slack_bolt.request import BoltRequest
+from slack_bolt.request.payload_kind import PayloadKind
 from slack_bolt.response import BoltResponse
 
 
@@ -27,6 +28,9 @@ class SslCheck(Middleware):
         self.verification_token = verification_token
         self.logger = get_bolt_logger(SslCheck, base_logger=base_logger)
 
+    def is_applicable_to(self, payload_kind: PayloadKind) -> bool:
+        return "ssl_check" in payload_kind.body
+
     def process(
         self,
         *,
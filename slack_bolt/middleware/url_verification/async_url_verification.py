@@ -19,7 +19,7 @@ class AsyncUrlVerification(UrlVerification, AsyncMiddleware):
         resp: BoltResponse,
         next: Callable[[], Awaitable[BoltResponse]],
     ) -> BoltResponse:
-        if self._is_url_verification_request(req.body):
+        if req.payload_kind.type == "url_verification":
             return self._build_success_response(req.body)
         else:
             return await next()
@@ -4,6 +4,7 @@ from typing import Callable, Optional
 from slack_bolt.logger import get_bolt_logger
 from slack_bolt.middleware.middleware import Middleware
 from slack_bolt.request import BoltRequest
+from slack_bolt.request.payload_kind import PayloadKind
 from slack_bolt.response import BoltResponse
 
 
@@ -18,6 +19,9 @@ class UrlVerification(Middleware):
         """
         self.logger = get_bolt_logger(UrlVerification, base_logger=base_logger)
 
+    def is_applicable_to(self, payload_kind: PayloadKind) -> bool:
+        return payload_kind.type == "url_verification"
+
     def process(
         self,
         *,
@@ -28,7 +32,7 @@ class UrlVerification(Middleware):
         # only the internals of this method
         next: Callable[[], BoltResponse],
     ) -> BoltResponse:
-        if self._is_url_verification_request(req.body):
+        if req.payload_kind.type == "url_verification":
             return self._build_success_response(req.body)
         else:
             return next()
@@ -0,0 +1,152 @@
+import asyncio
+from logging import Logger
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from slack_sdk.oauth.installation_store import Installation
+
+from slack_bolt.logger import get_bolt_logger
+
+
+class AsyncInstallationPipeline:
+    """Completes OAuth installations in background tasks. Refer to `InstallationPipeline` for details.
+
+    The worker tasks start on the running event loop when the first installation is submitted.
+    When an installation is submitted on another event loop (e.g., the previous one has been closed),
+    the workers start again on the new loop and take over the installations waiting in the queue.
+    """
+
+    worker_count: int
+    max_queue_size: int
+    max_attempts: int
+    retry_interval_seconds: float
+    error_handler: Optional[Callable[[Installation, Exception], Awaitable[None]]]
+    logger: Logger
+
+    completed_count: int
+    failed_count: int
+
+    def __init__(
+        self,
+        *,
+        worker_count: int = 2,
+        max_queue_size: int = 1000,
+        max_attempts: int = 3,
+        retry_interval_seconds: float = 0.5,
+        error_handler: Optional[Callable[[Installation, Exception], Awaitable[None]]] = None,
+        logger: Optional[Logger] = None,
+    ):
+        """
+        Args:
+            worker_count: The number of the worker tasks (Default: 2)
+            max_queue_size: The maximum number of the installations waiting for the workers (Default: 1000)
+            max_attempts: The maximum number of attempts for an installation (Default: 3)
+            retry_interval_seconds: The interval before the first retry, which doubles every retry (Default: 0.5)
+            error_handler: The function called with the installation and the last error when all the attempts failed
+            logger: The logger
+        """
+        self.worker_count = worker_count
+        self.max_queue_size = max_queue_size
+        self.max_attempts = max_attempts
+        self.retry_interval_seconds = retry_interval_seconds
+        self.error_handler = error_handler
+        self.logger = logger or get_bolt_logger(AsyncInstallationPipeline)
+        self.completed_count = 0
+        self.failed_count = 0
+
+        # Created on the running event loop
+        self._queue: Optional["asyncio.Queue[Tuple[Installation, Callable[[], Awaitable[None]]]]"] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def submit(self, installation: Installation, task: Callable[[], Awaitable[None]]) -> bool:
+        """Adds a task that persists the installation. This method must be called on the running event loop.
+
+        Args:
+            installation: The installation to persist
+            task: The function to run in a worker task
+
+        Returns:
+            False if the queue is full and the task was not accepted
+        """
+        queue = self._start_workers()
+        try:
+            queue.put_nowait((installation, task))
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def join(self) -> None:
+        """Waits until all the accepted tasks are done."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def shutdown(self) -> None:
+        """Stops the worker tasks after the accepted tasks are done."""
+        await self.join()
+        workers = self._workers
+        self._workers = []
+        for worker in workers:
+            worker.cancel()
+        for worker in workers:
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+        self._queue = None
+        self._loop = None
+
+    # ------------------------------------------------
+
+    def _start_workers(self) -> "asyncio.Queue[Tuple[Installation, Callable[[], Awaitable[None]]]]":
+        loop = asyncio.get_running_loop()
+        if self._queue is not None and self._loop is not loop:
+            # The workers on the previous loop never run again once it is closed;
+            # the queue is bound to the loop as well, so the waiting installations move to a new one
+            previous_queue = self._queue
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            while not previous_queue.empty():
+                self._queue.put_nowait(previous_queue.get_nowait())
+            self._workers = []
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        if len(self._workers) == 0:
+            self._loop = loop
+            self._workers = [loop.create_task(self._run(self._queue)) for _ in range(self.worker_count)]
+        return self._queue
+
+    async def _run(self, queue: "asyncio.Queue[Tuple[Installation, Callable[[], Awaitable[None]]]]") -> None:
+        while True:
+            installation, task = await queue.get()
+            try:
+                await self._process(installation, task)
+            finally:
+                queue.task_done()
+
+    async def _process(self, installation: Installation, task: Callable[[], Awaitable[None]]) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await task()
+                self.completed_count += 1
+                return
+            except Exception as e:
+                if attempt < self.max_attempts:
+                    self.logger.warning(
+                        f"Failed to store an installation (team_id: {installation.team_id}, "
+                        f"enterprise_id: {installation.enterprise_id}, attempt: {attempt}) due to {e}"
+                    )
+                    await asyncio.sleep(self.retry_interval_seconds * (2 ** (attempt - 1)))
+                    continue
+                self.failed_count += 1
+                self.logger.error(
+                    f"Gave up storing an installation (team_id: {installation.team_id}, "
+                    f"enterprise_id: {installation.enterprise_id}) due to {e}"
+                )
+                if self.error_handler is not None:
+                    try:
+                        await self.error_handler(installation, e)
+                    except Exception as handler_error:
+                        self.logger.exception(f"Failed to run the error handler: {handler_error}")
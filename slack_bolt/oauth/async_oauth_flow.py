@@ -3,8 +3,10 @@ import os
 from logging import Logger
 from typing import Optional, Dict, Callable, Awaitable, Sequence
 
+from slack_bolt.authorization.async_authorize import AsyncInstallationStoreAuthorize
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
 from slack_bolt.error import BoltError
-from slack_bolt.logger.messages import error_oauth_settings_invalid_type_async
+from slack_bolt.logger.messages import error_oauth_settings_invalid_type_async, warning_installation_pipeline_full
 from slack_bolt.oauth.async_callback_options import (
     AsyncCallbackOptions,
     DefaultAsyncCallbackOptions,
@@ -32,6 +34,7 @@ class AsyncOAuthFlow:
     redirect_uri: Optional[str]
     install_path: str
     redirect_uri_path: str
+    authorize_result_cache: Optional[AuthorizeResultCache]
 
     success_handler: Callable[[AsyncSuccessArgs], Awaitable[BoltResponse]]
     failure_handler: Callable[[AsyncFailureArgs], Awaitable[BoltResponse]]
@@ -64,6 +67,12 @@ class AsyncOAuthFlow:
         self.redirect_uri = self.settings.redirect_uri
         self.install_path = self.settings.install_path
         self.redirect_uri_path = self.settings.redirect_uri_path
+        # The cached authorize results are dropped when a new installation is saved
+        self.authorize_result_cache = (
+            self.settings.authorize.authorize_result_cache
+            if isinstance(self.settings.authorize, AsyncInstallationStoreAuthorize)
+            else None
+        )
 
         self.default_callback_options = DefaultAsyncCallbackOptions(
             logger=logger,  # type: ignore[arg-type]
@@ -284,7 +293,8 @@ class AsyncOAuthFlow:
 
         # persist the installation
         try:
-            await self.store_installation(request, installation)
+            if not self.submit_installation(request, installation):
+                await self.store_installation(request, installation)
         except BoltError as err:
             return await self.failure_handler(
                 AsyncFailureArgs(
@@ -365,6 +375,23 @@ class AsyncOAuthFlow:
             self.logger.warning(message)
             return None
 
+    def submit_installation(self, request: AsyncBoltRequest, installation: Installation) -> bool:
+        # Returns True if the installation pipeline takes over storing the installation
+        pipeline = self.settings.installation_pipeline
+        if pipeline is None:
+            return False
+        if pipeline.submit(installation, lambda: self.store_installation(request, installation)):
+            return True
+        self.logger.warning(warning_installation_pipeline_full(installation.team_id, installation.enterprise_id))
+        return False
+
     async def store_installation(self, request: AsyncBoltRequest, installation: Installation):
         # may raise BoltError
         await self.settings.installation_store.async_save(installation)
+        if self.authorize_result_cache is not None:
+            # The existing entries may hold the old tokens or tell that the workspace has not installed this app
+            self.authorize_result_cache.invalidate(
+                enterprise_id=installation.enterprise_id,
+                team_id=installation.team_id,
+                is_enterprise_install=installation.is_enterprise_install,
+            )
@@ -0,0 +1,152 @@
+import time
+from logging import Logger
+from queue import Full, Queue
+from threading import Lock, Thread
+from typing import Callable, List, Optional, Tuple
+
+from slack_sdk.oauth.installation_store import Installation
+
+from slack_bolt.logger import get_bolt_logger
+
+
+class InstallationPipeline:
+    """Completes OAuth installations in background worker threads.
+
+    When `OAuthSettings(installation_pipeline=InstallationPipeline())` is set, `OAuthFlow#handle_callback()`
+    validates the state parameter and exchanges the code for tokens on the request thread as usual,
+    and then hands the persistence (`OAuthFlow#store_installation()`, including any post-install hooks
+    in its overridden method) over to this pipeline. The success page is rendered right after the token exchange,
+    so that installation spikes do not occupy the web server's workers.
+
+    The queue is bounded; when it is full, the installation is saved on the request thread instead.
+    A failed task is retried with exponential backoff up to `max_attempts` times.
+    Note that the events for a new installation can arrive before it is saved, although they are usually
+    delivered after the installer has seen the completion page.
+    """
+
+    worker_count: int
+    max_queue_size: int
+    max_attempts: int
+    retry_interval_seconds: float
+    error_handler: Optional[Callable[[Installation, Exception], None]]
+    logger: Logger
+
+    completed_count: int
+    failed_count: int
+
+    def __init__(
+        self,
+        *,
+        worker_count: int = 2,
+        max_queue_size: int = 1000,
+        max_attempts: int = 3,
+        retry_interval_seconds: float = 0.5,
+        error_handler: Optional[Callable[[Installation, Exception], None]] = None,
+        logger: Optional[Logger] = None,
+    ):
+        """
+        Args:
+            worker_count: The number of the worker threads (Default: 2)
+            max_queue_size: The maximum number of the installations waiting for the workers (Default: 1000)
+            max_attempts: The maximum number of attempts for an installation (Default: 3)
+            retry_interval_seconds: The interval before the first retry, which doubles every retry (Default: 0.5)
+            error_handler: The function called with the installation and the last error when all the attempts failed
+            logger: The logger
+        """
+        self.worker_count = worker_count
+        self.max_queue_size = max_queue_size
+        self.max_attempts = max_attempts
+        self.retry_interval_seconds = retry_interval_seconds
+        self.error_handler = error_handler
+        self.logger = logger or get_bolt_logger(InstallationPipeline)
+        self.completed_count = 0
+        self.failed_count = 0
+
+        self._queue: "Queue[Optional[Tuple[Installation, Callable[[], None]]]]" = Queue(maxsize=max_queue_size)
+        self._workers: List[Thread] = []
+        self._lock = Lock()
+
+    def submit(self, installation: Installation, task: Callable[[], None]) -> bool:
+        """Adds a task that persists the installation.
+
+        Args:
+            installation: The installation to persist
+            task: The function to run in a worker thread
+
+        Returns:
+            False if the queue is full and the task was not accepted
+        """
+        self._start_workers()
+        try:
+            self._queue.put_nowait((installation, task))
+            return True
+        except Full:
+            return False
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+    def join(self) -> None:
+        """Blocks until all the accepted tasks are done."""
+        self._queue.join()
+
+    def shutdown(self) -> None:
+        """Stops the worker threads after the accepted tasks are done."""
+        with self._lock:
+            workers = self._workers
+            self._workers = []
+        for _ in workers:
+            self._queue.put(None)
+        for worker in workers:
+            worker.join()
+
+    # ------------------------------------------------
+
+    def _start_workers(self) -> None:
+        if len(self._workers) > 0:
+            return
+        with self._lock:
+            if len(self._workers) > 0:
+                return
+            for i in range(self.worker_count):
+                worker = Thread(target=self._run, name=f"slack-bolt-installation-pipeline-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._process(*item)
+            finally:
+                self._queue.task_done()
+
+    def _process(self, installation: Installation, task: Callable[[], None]) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                task()
+                with self._lock:
+                    self.completed_count += 1
+                return
+            except Exception as e:
+                if attempt < self.max_attempts:
+                    self.logger.warning(
+                        f"Failed to store an installation (team_id: {installation.team_id}, "
+                        f"enterprise_id: {installation.enterprise_id}, attempt: {attempt}) due to {e}"
+                    )
+                    time.sleep(self.retry_interval_seconds * (2 ** (attempt - 1)))
+                    continue
+                with self._lock:
+                    self.failed_count += 1
+                self.logger.error(
+                    f"Gave up storing an installation (team_id: {installation.team_id}, "
+                    f"enterprise_id: {installation.enterprise_id}) due to {e}"
+                )
+                if self.error_handler is not None:
+                    try:
+                        self.error_handler(installation, e)
+                    except Exception as handler_error:
+                        self.logger.exception(f"Failed to run the error handler: {handler_error}")
@@ -3,7 +3,10 @@ import os
 from logging import Logger
 from typing import Optional, Dict, Callable, Sequence
 
+from slack_bolt.authorization.authorize import InstallationStoreAuthorize
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
 from slack_bolt.error import BoltError
+from slack_bolt.logger.messages import warning_installation_pipeline_full
 from slack_bolt.oauth.callback_options import (
     FailureArgs,
     SuccessArgs,
@@ -31,6 +34,7 @@ class OAuthFlow:
     redirect_uri: Optional[str]
     install_path: str
     redirect_uri_path: str
+    authorize_result_cache: Optional[AuthorizeResultCache]
 
     success_handler: Callable[[SuccessArgs], BoltResponse]
     failure_handler: Callable[[FailureArgs], BoltResponse]
@@ -59,6 +63,12 @@ class OAuthFlow:
         self.redirect_uri = self.settings.redirect_uri
         self.install_path = self.settings.install_path
         self.redirect_uri_path = self.settings.redirect_uri_path
+        # The cached authorize results are dropped when a new installation is saved
+        self.authorize_result_cache = (
+            self.settings.authorize.authorize_result_cache
+            if isinstance(self.settings.authorize, InstallationStoreAuthorize)
+            else None
+        )
 
         self.default_callback_options = DefaultCallbackOptions(
             logger=logger,  # type: ignore[arg-type]
@@ -282,7 +292,8 @@ class OAuthFlow:
 
         # persist the installation
         try:
-            self.store_installation(request, installation)
+            if not self.submit_installation(request, installation):
+                self.store_installation(request, installation)
         except BoltError as err:
             return self.failure_handler(
                 FailureArgs(
@@ -363,6 +374,23 @@ class OAuthFlow:
             self.logger.warning(message)
             return None
 
+    def submit_installation(self, request: BoltRequest, installation: Installation) -> bool:
+        # Returns True if the installation pipeline takes over storing the installation
+        pipeline = self.settings.installation_pipeline
+        if pipeline is None:
+            return False
+        if pipeline.submit(installation, lambda: self.store_installation(request, installation)):
+            return True
+        self.logger.warning(warning_installation_pipeline_full(installation.team_id, installation.enterprise_id))
+        return False
+
     def store_installation(self, request: BoltRequest, installation: Installation):
         # may raise BoltError
         self.settings.installation_store.save(installation)
+        if self.authorize_result_cache is not None:
+            # The existing entries may hold the old tokens or tell that the workspace has not installed this app
+            self.authorize_result_cache.invalidate(
+                enterprise_id=installation.enterprise_id,
+                team_id=installation.team_id,
+                is_enterprise_install=installation.is_enterprise_install,
+            )
@@ -13,9 +13,12 @@ from slack_sdk.oauth import (
 from slack_sdk.oauth.state_store import FileOAuthStateStore
 
 from slack_bolt.authorization.authorize import Authorize, InstallationStoreAuthorize
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
 from slack_bolt.error import BoltError
+from slack_bolt.oauth.installation_pipeline import InstallationPipeline
 from slack_bolt.oauth.internals import get_or_create_default_installation_store
 from slack_bolt.oauth.callback_options import CallbackOptions
+from slack_bolt.oauth.signed_state_store import SignedOAuthStateStore
 
 
 class OAuthSettings:
@@ -37,11 +40,17 @@ class OAuthSettings:
     installation_store: InstallationStore
     installation_store_bot_only: bool
     token_rotation_expiration_minutes: int
+    authorize_result_cache: Optional[AuthorizeResultCache]
+    single_flight_enabled: bool
+    auth_test_mode: str
+    auth_test_verification_interval_seconds: Optional[float]
+    installation_pipeline: Optional[InstallationPipeline]
     authorize: Authorize
     user_token_resolution: str  # default: "authed_user"
     # state parameter related configurations
     state_validation_enabled: bool
     state_store: OAuthStateStore
+    state_signing_enabled: bool
     state_cookie_name: str
     state_expiration_seconds: int
     # Customizable utilities
@@ -73,9 +82,15 @@ class OAuthSettings:
         installation_store_bot_only: bool = False,
         token_rotation_expiration_minutes: int = 120,
         user_token_resolution: str = "authed_user",
+        authorize_result_cache: Optional[AuthorizeResultCache] = None,
+        single_flight_enabled: bool = True,
+        auth_test_mode: str = "always",
+        auth_test_verification_interval_seconds: Optional[float] = None,
+        installation_pipeline: Optional[InstallationPipeline] = None,
         # state parameter related configurations
         state_validation_enabled: bool = True,
         state_store: Optional[OAuthStateStore] = None,
+        state_signing_enabled: bool = False,
         state_cookie_name: str = OAuthStateUtils.default_cookie_name,
         state_expiration_seconds: int = OAuthStateUtils.default_expiration_seconds,
         # Others
@@ -104,8 +119,20 @@ class OAuthSettings:
                 using the event's actor IDs, you can set "actor" instead. With this option, bolt-python tries to resolve
                 a user token for context.actor_enterprise/team/user_id. This can be useful for events in Slack Connect
                 channels. Note that actor IDs can be absent in some scenarios.
+            installation_pipeline: Set `InstallationPipeline` if you would like to run `OAuthFlow#store_installation()`
+                in the background and display the completion page right after the token exchange (Default: None)
+            authorize_result_cache: Set `AuthorizeResultCache` if you would like to cache the authorize results
+                in memory and to customize the cache size and TTLs (Default: None, which disables the cache)
+            single_flight_enabled: Set False if you would like concurrent requests for the same user/workspace
+                to load the installation on their own (Default: True)
+            auth_test_mode: "always" calls `auth.test` API for every authorize result built from the installation store,
+                while "fallback" calls it only when the stored data lacks fields such as bot_user_id (Default: "always")
+            auth_test_verification_interval_seconds: The interval in seconds to verify the tokens with `auth.test` API
+                even when auth_test_mode is "fallback" (Default: None, which never verifies them)
             state_validation_enabled: Set False if your OAuth flow omits the state parameter validation (Default: True)
             state_store: Specify the instance of `InstallationStore` (Default: `FileOAuthStateStore`)
+            state_signing_enabled: Set True if you would like to use `SignedOAuthStateStore` as the state store,
+                which issues state values signed with client_secret and needs no storage (Default: False)
             state_cookie_name: The cookie name that is set for installers' browser. (Default: "slack-app-oauth-state")
             state_expiration_seconds: The seconds that the state value is alive (Default: 600 seconds)
             logger: The logger that will be used internally
@@ -137,6 +164,11 @@ class OAuthSettings:
         self.user_token_resolution = user_token_resolution or "authed_user"
         self.installation_store_bot_only = installation_store_bot_only
         self.token_rotation_expiration_minutes = token_rotation_expiration_minutes
+        self.authorize_result_cache = authorize_result_cache
+        self.single_flight_enabled = single_flight_enabled
+        self.auth_test_mode = auth_test_mode
+        self.auth_test_verification_interval_seconds = auth_test_verification_interval_seconds
+        self.installation_pipeline = installation_pipeline
         self.authorize = InstallationStoreAuthorize(
             logger=logger,
             client_id=self.client_id,
@@ -145,9 +177,22 @@ class OAuthSettings:
             installation_store=self.installation_store,
             bot_only=self.installation_store_bot_only,
             user_token_resolution=user_token_resolution,
+            authorize_result_cache=self.authorize_result_cache,
+            single_flight_enabled=self.single_flight_enabled,
+            auth_test_mode=self.auth_test_mode,
+            auth_test_verification_interval_seconds=self.auth_test_verification_interval_seconds,
         )
         # state parameter related configurations
         self.state_validation_enabled = state_validation_enabled
+        self.state_signing_enabled = state_signing_enabled
+        if state_signing_enabled:
+            if state_store is not None:
+                raise BoltError("state_store and state_signing_enabled cannot be used together")
+            state_store = SignedOAuthStateStore(
+                signing_secret=client_secret,
+                expiration_seconds=state_expiration_seconds,
+                logger=logger,
+            )
         self.state_store = state_store or FileOAuthStateStore(
             expiration_seconds=state_expiration_seconds,
             client_id=client_id,
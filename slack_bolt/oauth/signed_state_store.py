@@ -0,0 +1,110 @@
+import base64
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
+from logging import Logger
+from threading import Lock
+from typing import Optional
+
+from slack_sdk.oauth import OAuthStateUtils
+from slack_sdk.oauth.state_store import OAuthStateStore
+from slack_sdk.oauth.state_store.async_state_store import AsyncOAuthStateStore
+
+from slack_bolt.logger import get_bolt_logger
+
+
+class SignedOAuthStateStore(OAuthStateStore, AsyncOAuthStateStore):
+    """An OAuth state store that needs no storage.
+
+    A state value is `{expiration time}.{random nonce}.{HMAC-SHA256 signature}`, so that `consume()` can
+    verify it by itself; neither issuing nor consuming a state does any I/O. As a signed value alone can be
+    used many times until it expires, the nonces of the consumed states are kept in a bounded in-memory set
+    until they expire, and a replayed state is rejected.
+
+    Note that the replay protection works per process. When running multiple instances behind a load balancer,
+    a state can be consumed once per instance within its lifetime, so keep `expiration_seconds` short.
+    Slack authorization codes are single-use anyway, and the state cookie validation is done as usual.
+    """
+
+    expiration_seconds: int
+    max_consumed_states: int
+
+    def __init__(
+        self,
+        *,
+        signing_secret: str,
+        expiration_seconds: int = OAuthStateUtils.default_expiration_seconds,
+        max_consumed_states: int = 10000,
+        logger: Optional[Logger] = None,
+    ):
+        """
+        Args:
+            signing_secret: The secret to sign state values;
+                all the instances that can receive the same OAuth callback must share the same value
+            expiration_seconds: The seconds that a state value is alive (Default: 600 seconds)
+            max_consumed_states: The maximum number of the consumed states remembered for replay protection;
+                the oldest one is forgotten when exceeded (Default: 10000)
+            logger: The logger
+        """
+        self.expiration_seconds = expiration_seconds
+        self.max_consumed_states = max_consumed_states
+        self._key = signing_secret.encode("utf-8")
+        self._logger = logger or get_bolt_logger(SignedOAuthStateStore)
+        # nonce -> expiration time, in the order of consumption
+        self._consumed: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def logger(self) -> Logger:
+        return self._logger
+
+    def issue(self, *args, **kwargs) -> str:
+        payload = f"{int(time.time()) + self.expiration_seconds}.{secrets.token_urlsafe(16)}"
+        return f"{payload}.{self._sign(payload)}"
+
+    def consume(self, state: str) -> bool:
+        parts = state.split(".") if state else []
+        if len(parts) != 3:
+            self.logger.warning(f"Invalid state format: {state}")
+            return False
+        expires_at_str, nonce, signature = parts
+        try:
+            expires_at = int(expires_at_str)
+        except ValueError:
+            self.logger.warning(f"Invalid state format: {state}")
+            return False
+        now = time.time()
+        if expires_at < now:
+            # Rejected before computing the signature
+            self.logger.warning(f"The state has already expired: {state}")
+            return False
+        # Compared as bytes, as compare_digest() raises TypeError for non-ASCII str values
+        if not hmac.compare_digest(signature.encode("utf-8"), self._sign(f"{expires_at_str}.{nonce}").encode("utf-8")):
+            self.logger.warning(f"Invalid state signature: {state}")
+            return False
+
+        with self._lock:
+            while len(self._consumed) > 0:
+                oldest_nonce, oldest_expires_at = next(iter(self._consumed.items()))
+                if oldest_expires_at >= now:
+                    break
+                del self._consumed[oldest_nonce]
+            if nonce in self._consumed:
+                self.logger.warning(f"The state has already been consumed: {state}")
+                return False
+            self._consumed[nonce] = expires_at
+            while len(self._consumed) > self.max_consumed_states:
+                self._consumed.popitem(last=False)
+        return True
+
+    async def async_issue(self, *args, **kwargs) -> str:
+        return self.issue(*args, **kwargs)
+
+    async def async_consume(self, state: str) -> bool:
+        return self.consume(state)
+
+    def _sign(self, payload: str) -> str:
+        digest = hmac.new(self._key, payload.encode("utf-8"), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("utf-8")
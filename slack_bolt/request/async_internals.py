@@ -16,12 +16,14 @@ from slack_bolt.request.internals import (
     extract_actor_user_id,
     extract_thread_ts,
 )
+from slack_bolt.request.payload_kind import PayloadKind
 
 
 def build_async_context(
     context: AsyncBoltContext,
     body: Dict[str, Any],
 ) -> AsyncBoltContext:
+    context["payload_kind"] = PayloadKind(body)
     context["is_enterprise_install"] = extract_is_enterprise_install(body)
     enterprise_id = extract_enterprise_id(body)
     if enterprise_id:
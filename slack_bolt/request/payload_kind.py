@@ -0,0 +1,95 @@
+from typing import Any, Dict, Optional, Tuple
+
+from slack_bolt.request.payload_utils import is_event
+
+
+class PayloadKind:
+    """The classification of an incoming request payload.
+
+    The values are extracted only once when a request is constructed, so that the built-in middleware
+    and listener matchers can check the payload type without inspecting the request body every time.
+    """
+
+    __slots__ = [
+        "body",
+        "type",
+        "event_type",
+        "event_subtype",
+        "action_ids",
+        "callback_id",
+        "command",
+        "view_type",
+    ]
+
+    body: Dict[str, Any]
+    # $.type (e.g., "event_callback", "block_actions", "view_submission")
+    type: Optional[str]
+    # $.event.type and $.event.subtype for Events API payloads
+    event_type: Optional[str]
+    event_subtype: Optional[str]
+    # $.actions[*].action_id for block_actions, $.action_id for block_suggestion
+    action_ids: Tuple[str, ...]
+    # $.view.callback_id for view_submission/view_closed, otherwise $.callback_id
+    callback_id: Optional[str]
+    # $.command for slash commands
+    command: Optional[str]
+    # $.view.type for view_submission/view_closed
+    view_type: Optional[str]
+
+    def __init__(self, body: Dict[str, Any]):
+        self.body = body
+        self.type = None
+        self.event_type = None
+        self.event_subtype = None
+        self.action_ids = ()
+        self.callback_id = None
+        self.command = None
+        self.view_type = None
+        if not body:
+            return
+
+        payload_type = body.get("type")
+        self.type = payload_type if isinstance(payload_type, str) else None
+        if is_event(body):
+            event = body["event"]
+            self.event_type = event["type"]
+            self.event_subtype = event.get("subtype")
+        if "command" in body:
+            self.command = body["command"]
+
+        if payload_type == "block_actions":
+            actions = body.get("actions")
+            if actions:
+                self.action_ids = tuple(action.get("action_id") for action in actions)
+        elif payload_type == "block_suggestion":
+            if "action_id" in body:
+                self.action_ids = (body["action_id"],)
+        elif payload_type in ("view_submission", "view_closed"):
+            view = body.get("view")
+            if isinstance(view, dict):
+                self.callback_id = view.get("callback_id")
+                self.view_type = view.get("type")
+        else:
+            self.callback_id = body.get("callback_id")
+
+    @property
+    def is_event(self) -> bool:
+        """True if the payload is an Events API one."""
+        return self.event_type is not None
+
+    @property
+    def is_slash_command(self) -> bool:
+        """True if the payload is a slash command invocation."""
+        return self.command is not None
+
+    @property
+    def action_id(self) -> Optional[str]:
+        """The first action_id of block_actions/block_suggestion payloads."""
+        return self.action_ids[0] if len(self.action_ids) > 0 else None
+
+    def __repr__(self) -> str:
+        return (
+            f"<slack_bolt.request.payload_kind.PayloadKind: type={self.type}, event_type={self.event_type}, "
+            f"event_subtype={self.event_subtype}, action_ids={self.action_ids}, callback_id={self.callback_id}, "
+            f"command={self.command}, view_type={self.view_type}>"
+        )
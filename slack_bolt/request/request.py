@@ -1,3 +1,4 @@
+import copy
 from typing import Dict, Optional, Union, Any, Sequence
 
 from slack_bolt.context.context import BoltContext
@@ -10,10 +11,10 @@ from slack_bolt.request.internals import (
     extract_content_type,
     error_message_raw_body_required_in_http_mode,
 )
+from slack_bolt.request.payload_kind import PayloadKind
 
 
 class BoltRequest:
-    raw_body: str
     query: Dict[str, Sequence[str]]
     headers: Dict[str, Sequence[str]]
     content_type: Optional[str]
@@ -26,7 +27,7 @@ class BoltRequest:
     def __init__(
         self,
         *,
-        body: Union[str, dict],
+        body: Union[str, bytes, bytearray, memoryview, dict],
         query: Optional[Union[str, Dict[str, str], Dict[str, Sequence[str]]]] = None,
         headers: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
         context: Optional[Dict[str, Any]] = None,
@@ -35,44 +36,110 @@ class BoltRequest:
         """Request to a Bolt app.
 
         Args:
-            body: The raw request body (only plain text is supported for "http" mode)
+            body: The raw request body (either str or bytes is supported for "http" mode)
             query: The query string data in any data format.
             headers: The request headers.
             context: The context in this request.
             mode: The mode used for this request. (either "http" or "socket_mode")
         """
+        self._raw_body: Optional[str] = None
+        self._raw_body_bytes: Optional[bytes] = None
         if mode == "http":
             # HTTP Mode
-            if body is not None and not isinstance(body, str):
+            if body is None:
+                self._raw_body = ""
+            elif isinstance(body, str):
+                self._raw_body = body
+            elif isinstance(body, (bytes, bytearray, memoryview)):
+                # The bytes are kept as-is for signature verification and decoded only when raw_body is accessed
+                self._raw_body_bytes = body if isinstance(body, bytes) else bytes(body)
+            else:
                 raise BoltError(error_message_raw_body_required_in_http_mode())
-            self.raw_body = body if body is not None else ""
         else:
             # Socket Mode
             if body is not None and isinstance(body, str):
-                self.raw_body = body
+                self._raw_body = body
             else:
                 # We don't convert the dict value to str
                 # as doing so does not guarantee to keep the original structure/format.
-                self.raw_body = ""
+                self._raw_body = ""
 
         self.query = parse_query(query)
         self.headers = build_normalized_headers(headers)
         self.content_type = extract_content_type(self.headers)
 
-        if isinstance(body, str):
-            self.body = parse_body(self.raw_body, self.content_type)
+        if self._raw_body_bytes is not None:
+            self.body = parse_body(self._raw_body_bytes, self.content_type)
+        elif isinstance(body, str):
+            self.body = parse_body(body, self.content_type)
         elif isinstance(body, dict):
             self.body = body
         else:
             self.body = {}
 
         self.context = build_context(BoltContext(context if context else {}), self.body)
+        self._payload_kind: PayloadKind = self.context["payload_kind"]
         self.lazy_only = bool(self.headers.get("x-slack-bolt-lazy-only", [False])[0])
         self.lazy_function_name = self.headers.get("x-slack-bolt-lazy-function-name", [None])[0]
         self.mode = mode
 
+    @property
+    def raw_body(self) -> str:
+        """The raw request body. When the body was given as bytes, it is decoded on the first access."""
+        if self._raw_body is None:
+            self._raw_body = self._raw_body_bytes.decode("utf-8") if self._raw_body_bytes is not None else ""
+        return self._raw_body
+
+    @raw_body.setter
+    def raw_body(self, value: str) -> None:
+        self._raw_body = value
+        self._raw_body_bytes = None
+
+    @property
+    def raw_body_bytes(self) -> Optional[bytes]:
+        """The raw request body bytes given by the adapter. None if the body was given as str."""
+        return self._raw_body_bytes
+
+    @property
+    def payload_kind(self) -> PayloadKind:
+        """The classification of the request payload (e.g., type, event type, action_ids, callback_id, command).
+
+        The value is extracted once when this request is constructed and is reused by the built-in middleware
+        and listener matchers. It is extracted again only if the body has been replaced with another dict.
+        """
+        kind = self._payload_kind
+        if kind.body is not self.body:
+            kind = PayloadKind(self.body)
+            self._payload_kind = kind
+            self.context["payload_kind"] = kind
+        return kind
+
+    def to_lazy_request(self, lazy_function_name: Optional[str]) -> "BoltRequest":
+        """Returns a lightweight snapshot of this request for a lazy listener execution.
+
+        Unlike `to_copyable()`, this method neither parses the raw body again nor makes a deep copy of the request.
+        The parsed body, query, and headers are shared with this request, so lazy listeners must treat them
+        as read-only data. The context is a new dict holding the same standard property values
+        except "ack", while custom values are copied in the same way as `to_copyable()`.
+
+        Args:
+            lazy_function_name: The name of the lazy listener function to run
+
+        Returns:
+            The request for the lazy listener execution
+        """
+        lazy_request = copy.copy(self)
+        lazy_request.context = self.context.to_copyable()
+        # The acknowledgement state must not be shared with the lazy listener execution
+        lazy_request.context.pop("ack", None)
+        lazy_request.lazy_only = True
+        lazy_request.lazy_function_name = lazy_function_name
+        return lazy_request
+
     def to_copyable(self) -> "BoltRequest":
-        body: Union[str, dict] = self.raw_body if self.mode == "http" else self.body
+        body: Union[str, bytes, dict] = self.body
+        if self.mode == "http":
+            body = self._raw_body_bytes if self._raw_body_bytes is not None else self.raw_body
         return BoltRequest(
             body=body,
             query=self.query,
@@ -1,7 +1,8 @@
-import json
 from http.cookies import SimpleCookie
 from typing import Union, Dict, Optional, Sequence
 
+from slack_bolt.util.json_codec import json_dumps
+
 
 class BoltResponse:
     status: int
@@ -23,7 +24,7 @@ class BoltResponse:
             headers: The response headers.
         """
         self.status: int = status
-        self.body: str = json.dumps(body) if isinstance(body, dict) else body
+        self.body: str = json_dumps(body) if isinstance(body, dict) else body
         self.headers: Dict[str, Sequence[str]] = {}
         if headers is not None:
             for name, value in headers.items():
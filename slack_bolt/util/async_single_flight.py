@@ -0,0 +1,67 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _CallCancelledError(Exception):
+    """Tells the waiting tasks that the task running the call was cancelled, so that they can retry the call."""
+
+    pass
+
+
+class AsyncSingleFlight:
+    """Deduplicates concurrent calls for the same key.
+
+    While a call for a key is running, the other tasks calling `run()` with the same key await
+    the shared `asyncio.Future` and receive its result (or its exception) instead of running the same coroutine again.
+    When the task running the call is cancelled, one of the waiting tasks runs the coroutine function again
+    instead of being cancelled together. Nothing is cached once the call completes.
+    """
+
+    shared_count: int
+
+    def __init__(self):
+        self.shared_count = 0
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Runs the coroutine function unless another task is running it for the same key.
+
+        Args:
+            key: The key to identify the call
+            func: The coroutine function to run
+
+        Returns:
+            The returned value of either this call or the one in flight
+        """
+        loop = asyncio.get_running_loop()
+        future = self._futures.get(key)
+        while future is not None and future.get_loop() is loop:
+            self.shared_count += 1
+            try:
+                # shield() prevents the cancellation of a waiting task from cancelling the shared call
+                return await asyncio.shield(future)
+            except _CallCancelledError:
+                # The key has been released; this task either runs the call or waits for another retrying task
+                future = self._futures.get(key)
+
+        future = loop.create_future()
+        self._futures[key] = future
+        try:
+            result = await func()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # Cancelling the future would cancel the waiting tasks as well
+            future.set_exception(_CallCancelledError())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, as no task may be waiting for it
+            future.exception()
+            raise
+        finally:
+            if self._futures.get(key) is future:
+                del self._futures[key]
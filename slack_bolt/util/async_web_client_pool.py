@@ -0,0 +1,141 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Optional
+
+from aiohttp import ClientSession, ClientTimeout
+from slack_sdk.web.async_client import AsyncWebClient
+
+from slack_bolt.error import BoltError
+from slack_bolt.util.web_client_pool import WebClientPoolKey
+
+
+class AsyncPooledWebClient(AsyncWebClient):
+    """An `AsyncWebClient` instance that is shared among requests by `AsyncWebClientPool`.
+
+    As multiple requests can use the same instance at the same time, the token of this client cannot be modified.
+    To switch the token for a request, use `assign_token_to_context_client()`, which replaces `context.client`
+    with another pooled instance for the token (copy-on-write).
+    """
+
+    pool: "AsyncWebClientPool"
+
+    def __setattr__(self, name: str, value: Any):
+        if name == "token" and getattr(self, "pool", None) is not None:
+            raise BoltError(
+                "The token of a pooled AsyncWebClient cannot be modified as the instance is shared among requests. "
+                "Replace context.client with a new AsyncWebClient instance instead."
+            )
+        super().__setattr__(name, value)
+
+
+class AsyncWebClientPool:
+    def __init__(self, *, template: AsyncWebClient, max_size: int = 100):
+        """A bounded LRU cache of `AsyncWebClient` instances keyed by (token, team_id).
+        All the pooled instances share a single aiohttp `ClientSession`.
+        If the template client does not have its own session, this pool creates one on the first use.
+        As the session is bound to the event loop, it is recreated when the pool is used on another loop
+        (e.g., after `asyncio.run()` is called again).
+        Call `close()` to release the session when the app shuts down.
+
+        Args:
+            template: The `AsyncWebClient` that holds the settings (e.g., base_url, timeout, proxy) for pooled instances
+            max_size: The maximum number of instances to keep (Default: 100)
+        """
+        if max_size < 1:
+            raise BoltError(f"max_size must be a positive integer (given: {max_size})")
+        self.template = template
+        self.max_size = max_size
+        self._clients: "OrderedDict[WebClientPoolKey, AsyncPooledWebClient]" = OrderedDict()
+        self._session: Optional[ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def session(self) -> ClientSession:
+        """The aiohttp session shared by all the pooled instances. This must be accessed in a running event loop."""
+        if self.template.session is not None:
+            return self.template.session
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # The session on the previous loop cannot be closed here as the loop may no longer run
+            self._session = ClientSession(
+                timeout=ClientTimeout(total=self.template.timeout),
+                trust_env=self.template.trust_env_in_session,
+            )
+            self._loop = loop
+            # The existing clients hold the closed session or the one bound to the previous loop
+            self._clients.clear()
+        return self._session
+
+    def get(self, *, token: Optional[str], team_id: Optional[str]) -> AsyncPooledWebClient:
+        """Returns the pooled instance for the given token and team_id. If absent, a new one is created.
+
+        Args:
+            token: The token that the client uses (this can be None)
+            team_id: The team_id that the client uses (this can be None)
+
+        Returns:
+            The shared `AsyncPooledWebClient` instance
+        """
+        session = self.session
+        key = (token, team_id)
+        client = self._clients.get(key)
+        if client is not None:
+            self._clients.move_to_end(key)
+            return client
+        client = self._create_client(token, team_id, session)
+        self._clients[key] = client
+        if len(self._clients) > self.max_size:
+            self._clients.popitem(last=False)
+        return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def clear(self) -> None:
+        self._clients.clear()
+
+    async def close(self) -> None:
+        """Clears the pooled instances and closes the aiohttp session if this pool created it."""
+        self._clients.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def _create_client(
+        self,
+        token: Optional[str],
+        team_id: Optional[str],
+        session: ClientSession,
+    ) -> AsyncPooledWebClient:
+        template = self.template
+        client = AsyncPooledWebClient(
+            token=token,
+            base_url=template.base_url,
+            timeout=template.timeout,
+            ssl=template.ssl,
+            proxy=template.proxy,
+            session=session,
+            trust_env_in_session=template.trust_env_in_session,
+            headers=template.headers,
+            team_id=team_id,
+            logger=template.logger,
+            retry_handlers=template.retry_handlers.copy() if template.retry_handlers is not None else None,
+        )
+        client.pool = self
+        return client
+
+
+def assign_token_to_context_client(context: Any, token: Optional[str]) -> None:
+    """Sets the token to `context.client`. When the client is shared by `AsyncWebClientPool`,
+    `context.client` is replaced with the pooled instance for the token instead of modifying the shared one.
+
+    Args:
+        context: The `AsyncBoltContext` of a request
+        token: The token to set
+    """
+    client = context.client
+    if isinstance(client, AsyncPooledWebClient):
+        context["client"] = client.pool.get(token=token, team_id=context.team_id)
+    else:
+        client.token = token
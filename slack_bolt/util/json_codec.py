@@ -0,0 +1,127 @@
+"""JSON encoder/decoder used for parsing incoming request bodies and serializing `BoltResponse` bodies.
+
+The standard `json` module is used by default. When either orjson or ujson is installed,
+you can switch to it at the start of your app:
+
+    from slack_bolt.util.json_codec import set_json_codec
+
+    set_json_codec("orjson")  # or "ujson", or "auto" to pick the fastest installed one
+
+Note that the alternative backends produce compact JSON data without any whitespace between the elements,
+while the standard one outputs `{"key": "value"}` style data.
+"""
+
+import importlib
+import json
+from typing import Any, Union
+
+from slack_bolt.error import BoltError
+
+
+class JSONCodec:
+    """The JSON codec backed by the standard `json` module. Subclass this to plug in another implementation."""
+
+    name: str = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """The JSON codec backed by orjson (https://github.com/ijl/orjson)."""
+
+    name: str = "orjson"
+
+    def __init__(self):
+        orjson = importlib.import_module("orjson")
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+        self._encode_error = orjson.JSONEncodeError
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return self._dumps(obj).decode("utf-8")
+        except self._encode_error:
+            # orjson is stricter than the standard module (e.g., non-str dict keys, integers larger than 64-bit)
+            return json.dumps(obj)
+
+
+class UjsonCodec(JSONCodec):
+    """The JSON codec backed by ujson (https://github.com/ultrajson/ultrajson)."""
+
+    name: str = "ujson"
+
+    def __init__(self):
+        ujson = importlib.import_module("ujson")
+        self._loads = ujson.loads
+        self._dumps = ujson.dumps
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj, ensure_ascii=True, escape_forward_slashes=False)
+
+
+_codec_classes = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+}
+
+
+def build_json_codec(name: str = "auto") -> JSONCodec:
+    """Builds a JSON codec.
+
+    Args:
+        name: Either "json", "orjson", "ujson", or "auto", which picks the fastest installed one (Default: "auto")
+
+    Returns:
+        The JSON codec
+    """
+    if name == "auto":
+        for candidate in [OrjsonCodec, UjsonCodec]:
+            try:
+                return candidate()
+            except ImportError:
+                continue
+        return JSONCodec()
+    codec_class = _codec_classes.get(name)
+    if codec_class is None:
+        raise BoltError(f"Unknown JSON codec: {name} (available: {', '.join(_codec_classes.keys())}, auto)")
+    try:
+        return codec_class()
+    except ImportError as e:
+        raise BoltError(f"The JSON codec {name} is not available as the library is not installed ({e})")
+
+
+_json_codec: JSONCodec = JSONCodec()
+
+
+def get_json_codec() -> JSONCodec:
+    """Returns the JSON codec currently in use."""
+    return _json_codec
+
+
+def set_json_codec(codec: Union[JSONCodec, str]) -> None:
+    """Replaces the JSON codec used for parsing request bodies and serializing response bodies.
+
+    Args:
+        codec: A `JSONCodec` instance or the name of a built-in codec (see `build_json_codec()`)
+    """
+    global _json_codec
+    _json_codec = build_json_codec(codec) if isinstance(codec, str) else codec
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    return _json_codec.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    return _json_codec.dumps(obj)
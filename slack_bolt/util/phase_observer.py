@@ -0,0 +1,81 @@
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from slack_bolt.request import BoltRequest
+    from slack_bolt.request.async_request import AsyncBoltRequest
+
+
+class MiddlewareMetrics:
+    """The hooks to observe middleware executions. All the methods do nothing by default,
+    so that you can override only the ones you need. The methods must be thread-safe and must not block.
+    """
+
+    def record_middleware_time(
+        self,
+        *,
+        request: Union["BoltRequest", "AsyncBoltRequest"],
+        name: str,
+        seconds: float,
+        next_called: bool,
+    ) -> None:
+        """Records the execution time of a middleware.
+
+        Args:
+            request: The request being handled
+            name: The middleware name
+            seconds: The time spent in the middleware in seconds
+            next_called: True if the middleware called `next()` to continue the chain
+        """
+        pass
+
+
+class PhaseObserver(MiddlewareMetrics):
+    """The hooks to observe where the time goes while an app handles a request.
+
+    Pass an instance to `App(phase_observer=...)` or `AsyncApp(phase_observer=...)`.
+    When no observer is given, the app does not even measure the time.
+    The method must be thread-safe and must not block, as it is called on the request-handling path
+    (in the event loop for `AsyncApp`).
+
+    The phases are:
+
+    * "middleware:{middleware name}": a global middleware; the name of a built-in one is its fully qualified class name,
+      e.g., "middleware:slack_bolt.middleware.request_verification.request_verification.RequestVerification"
+      is the signature verification, and the one ending with "SingleTeamAuthorization" or "MultiTeamsAuthorization"
+      is the authorization
+    * "listener_matching": finding the listener to run among the candidates
+    * "listener_middleware:{listener name}": the middleware attached to the listener
+    * "ack_function:{listener name}": the listener function, including building the response passed to `ack()`
+    * "lazy_function:{function name}": a lazy listener function run by the built-in runner
+    * "dispatch": the whole `App#dispatch()` execution
+
+    The global middleware phases are reported via `MiddlewareMetrics#record_middleware_time()`,
+    which this class implements by calling `on_phase()`.
+
+    The request body has been already parsed by the adapter before the app receives the request.
+    No phase is reported for the response serialization: `ack()` serializes a dict body to JSON when it builds
+    the `BoltResponse`, so the time is included in "ack_function", and the adapter's conversion
+    of the `BoltResponse` into the web framework's response is not measured.
+    When `process_before_response` is False, "ack_function" is reported from the thread (or the task)
+    running the listener, which can be after the app returned the response.
+    """
+
+    def on_phase(self, request: Union["BoltRequest", "AsyncBoltRequest"], phase: str, duration: float) -> None:
+        """Called when a phase is completed. This method does nothing by default.
+
+        Args:
+            request: The request being handled (for lazy functions, the copy passed to the function)
+            phase: The phase name
+            duration: The time spent in the phase in seconds
+        """
+        pass
+
+    def record_middleware_time(
+        self,
+        *,
+        request: Union["BoltRequest", "AsyncBoltRequest"],
+        name: str,
+        seconds: float,
+        next_called: bool,
+    ) -> None:
+        self.on_phase(request, f"middleware:{name}", seconds)
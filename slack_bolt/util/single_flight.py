@@ -0,0 +1,65 @@
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ["done", "result", "error"]
+
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls for the same key.
+
+    While a call for a key is running, the other threads calling `run()` with the same key wait for it
+    and receive its result (or its exception) instead of running the same function again.
+    Nothing is cached once the call completes.
+    """
+
+    shared_count: int
+
+    def __init__(self):
+        self.shared_count = 0
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = Lock()
+
+    def run(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Runs the function unless another thread is running it for the same key.
+
+        Args:
+            key: The key to identify the call
+            func: The function to run
+
+        Returns:
+            The returned value of either this call or the one in flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            in_flight = call is not None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.shared_count += 1
+
+        if in_flight:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
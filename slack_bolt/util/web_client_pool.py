@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional, Tuple
+
+from slack_sdk import WebClient
+
+from slack_bolt.error import BoltError
+
+# (token, team_id)
+WebClientPoolKey = Tuple[Optional[str], Optional[str]]
+
+
+class PooledWebClient(WebClient):
+    """A `WebClient` instance that is shared among requests by `WebClientPool`.
+
+    As multiple threads can use the same instance at the same time, the token of this client cannot be modified.
+    To switch the token for a request, use `assign_token_to_context_client()`, which replaces `context.client`
+    with another pooled instance for the token (copy-on-write).
+    """
+
+    pool: "WebClientPool"
+
+    def __setattr__(self, name: str, value: Any):
+        if name == "token" and getattr(self, "pool", None) is not None:
+            raise BoltError(
+                "The token of a pooled WebClient cannot be modified as the instance is shared among requests. "
+                "Replace context.client with a new WebClient instance instead."
+            )
+        super().__setattr__(name, value)
+
+
+class WebClientPool:
+    def __init__(self, *, template: WebClient, max_size: int = 100):
+        """A bounded LRU cache of `WebClient` instances keyed by (token, team_id).
+
+        Args:
+            template: The `WebClient` that holds the settings (e.g., base_url, timeout, proxy) for pooled instances
+            max_size: The maximum number of instances to keep (Default: 100)
+        """
+        if max_size < 1:
+            raise BoltError(f"max_size must be a positive integer (given: {max_size})")
+        self.template = template
+        self.max_size = max_size
+        self._clients: "OrderedDict[WebClientPoolKey, PooledWebClient]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, *, token: Optional[str], team_id: Optional[str]) -> PooledWebClient:
+        """Returns the pooled instance for the given token and team_id. If absent, a new one is created.
+
+        Args:
+            token: The token that the client uses (this can be None)
+            team_id: The team_id that the client uses (this can be None)
+
+        Returns:
+            The shared `PooledWebClient` instance
+        """
+        key = (token, team_id)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+            client = self._create_client(token, team_id)
+            self._clients[key] = client
+            if len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+    def _create_client(self, token: Optional[str], team_id: Optional[str]) -> PooledWebClient:
+        template = self.template
+        client = PooledWebClient(
+            token=token,
+            base_url=template.base_url,
+            timeout=template.timeout,
+            ssl=template.ssl,
+            proxy=template.proxy,
+            headers=template.headers,
+            team_id=team_id,
+            logger=template.logger,
+            retry_handlers=template.retry_handlers.copy() if template.retry_handlers is not None else None,
+        )
+        client.pool = self
+        return client
+
+
+def assign_token_to_context_client(context: Any, token: Optional[str]) -> None:
+    """Sets the token to `context.client`. When the client is shared by `WebClientPool`,
+    `context.client` is replaced with the pooled instance for the token instead of modifying the shared one.
+
+    Args:
+        context: The `BoltContext` of a request
+        token: The token to set
+    """
+    client = context.client
+    if isinstance(client, PooledWebClient):
+        context["client"] = client.pool.get(token=token, team_id=context.team_id)
+    else:
+        client.token = token
@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import List, Optional
+
+from slack_bolt.adapter.socket_mode.dispatch_scheduler import DispatchScheduler, DispatchSchedulerMetrics
+from slack_bolt.request import BoltRequest
+
+
+def build_request(channel_id: Optional[str]) -> BoltRequest:
+    body = {"event": {"type": "message", "channel": channel_id}} if channel_id else {"type": "shortcut"}
+    return BoltRequest(body=body, mode="socket_mode")
+
+
+class RecordingMetrics(DispatchSchedulerMetrics):
+    def __init__(self):
+        self.depths: List[int] = []
+        self.rejections: List[Optional[str]] = []
+        self.waits: List[float] = []
+
+    def record_lane_depth(self, *, lane: int, depth: int) -> None:
+        self.depths.append(depth)
+
+    def record_queue_wait(self, *, lane: int, seconds: float) -> None:
+        self.waits.append(seconds)
+
+    def record_rejection(self, *, lane: int, key: Optional[str]) -> None:
+        self.rejections.append(key)
+
+
+class TestDispatchScheduler:
+    def test_order_per_channel(self):
+        scheduler = DispatchScheduler(lanes=4)
+        processed = {"C111": [], "C222": []}
+        try:
+            for i in range(20):
+                for channel_id in processed.keys():
+
+                    def process(channel_id=channel_id, i=i):
+                        time.sleep(0.001)
+                        processed[channel_id].append(i)
+
+                    assert scheduler.submit(build_request(channel_id), process) is True
+        finally:
+            scheduler.shutdown()
+        assert processed["C111"] == list(range(20))
+        assert processed["C222"] == list(range(20))
+
+    def test_concurrency_across_lanes(self):
+        scheduler = DispatchScheduler(lanes=2, key=lambda req: req.context.channel_id)
+        started = threading.Barrier(2, timeout=5)
+        results = []
+
+        def process():
+            # Both envelopes must be running at the same time to pass the barrier
+            started.wait()
+            results.append(True)
+
+        try:
+            # The lane for a channel depends on the hash seed of the process
+            first = "C111"
+            second = next(c for c in ["C222", "C333", "C444", "C555"] if scheduler.lane_for(c) != scheduler.lane_for(first))
+            assert scheduler.submit(build_request(first), process) is True
+            assert scheduler.submit(build_request(second), process) is True
+        finally:
+            scheduler.shutdown()
+        assert results == [True, True]
+
+    def test_bounded_lane_queue(self):
+        metrics = RecordingMetrics()
+        scheduler = DispatchScheduler(lanes=1, max_lane_queue_size=2, metrics=metrics)
+        blocker = threading.Event()
+        try:
+            assert scheduler.submit(build_request("C111"), blocker.wait) is True
+            time.sleep(0.1)  # the lane starts running the first one
+            assert scheduler.submit(build_request("C111"), lambda: None) is True
+            assert scheduler.submit(build_request("C111"), lambda: None) is True
+            assert scheduler.lane_depths() == [2]
+            assert scheduler.submit(build_request("C111"), lambda: None) is False
+            assert metrics.rejections == ["C111"]
+        finally:
+            blocker.set()
+            scheduler.shutdown()
+        assert scheduler.lane_depths() == [0]
+        assert 2 in metrics.depths
+        assert len(metrics.waits) == 3
+
+    def test_no_key(self):
+        scheduler = DispatchScheduler(lanes=3)
+        try:
+            assert [scheduler.lane_for(None) for _ in range(4)] == [0, 1, 2, 0]
+            done = threading.Event()
+            assert scheduler.submit(build_request(None), done.set) is True
+            assert done.wait(5) is True
+        finally:
+            scheduler.shutdown()
+
+    def test_shutdown(self):
+        scheduler = DispatchScheduler(lanes=2)
+        processed = []
+        scheduler.submit(build_request("C111"), lambda: processed.append(1))
+        scheduler.shutdown()
+        assert processed == [1]
+        assert scheduler.submit(build_request("C111"), lambda: processed.append(2)) is False
+
+    def test_errors(self):
+        scheduler = DispatchScheduler(lanes=1)
+        processed = []
+
+        def fail():
+            raise ValueError("something wrong")
+
+        try:
+            scheduler.submit(build_request("C111"), fail)
+            scheduler.submit(build_request("C111"), lambda: processed.append(1))
+        finally:
+            scheduler.shutdown()
+        assert processed == [1]
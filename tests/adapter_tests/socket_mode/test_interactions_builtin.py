@@ -1,10 +1,13 @@
 import logging
 import time
 
+import pytest
 from slack_sdk import WebClient
 
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_bolt.adapter.socket_mode.dispatch_scheduler import DispatchScheduler
+from slack_bolt.error import BoltError
 from .mock_socket_mode_server import (
     start_socket_mode_server,
     stop_socket_mode_server,
@@ -76,3 +79,73 @@ class TestSocketModeBuiltin:
             assert result["message"] is True
         finally:
             handler.client.close()
+
+    def test_interactions_with_dispatch_scheduler(self):
+        app = App(client=self.web_client, process_before_response=True)
+
+        result = {"shortcut": False, "command": False, "message": False}
+
+        @app.shortcut("do-something")
+        def shortcut_handler(ack):
+            result["shortcut"] = True
+            ack()
+
+        @app.command("/hello-socket-mode")
+        def command_handler(ack):
+            result["command"] = True
+            ack()
+
+        @app.message("<@W111>")
+        def message_handler(ack):
+            result["message"] = True
+            ack()
+
+        scheduler = DispatchScheduler(lanes=2)
+        handler = SocketModeHandler(
+            app_token="xapp-A111-222-xyz",
+            app=app,
+            dispatch_scheduler=scheduler,
+        )
+        try:
+            handler.client.wss_uri = "ws://127.0.0.1:3011/link"
+
+            handler.connect()
+            assert handler.client.is_connected() is True
+            time.sleep(2)  # wait for the message receiver
+
+            handler.client.send_message("foo")
+
+            time.sleep(2)
+            assert result["shortcut"] is True
+            assert result["command"] is True
+            assert result["message"] is True
+        finally:
+            handler.close()
+        assert scheduler.lane_depths() == [0, 0]
+
+    def test_dispatch_scheduler_options(self, caplog):
+        scheduler = DispatchScheduler(lanes=2)
+        try:
+            handler = SocketModeHandler(app_token="xapp-A111-222-xyz", app=App(client=self.web_client))
+            assert handler.client.message_workers._max_workers == 10
+
+            # The envelopes must be submitted to the lanes in the order of arrival
+            handler = SocketModeHandler(
+                app_token="xapp-A111-222-xyz",
+                app=App(client=self.web_client, process_before_response=True),
+                dispatch_scheduler=scheduler,
+            )
+            assert handler.client.message_workers._max_workers == 1
+            assert "process_before_response" not in caplog.text
+            with pytest.raises(BoltError):
+                SocketModeHandler(
+                    app_token="xapp-A111-222-xyz",
+                    app=App(client=self.web_client, process_before_response=True),
+                    concurrency=10,
+                    dispatch_scheduler=scheduler,
+                )
+
+            SocketModeHandler(app_token="xapp-A111-222-xyz", app=App(client=self.web_client), dispatch_scheduler=scheduler)
+            assert "set process_before_response=True" in caplog.text
+        finally:
+            scheduler.shutdown()
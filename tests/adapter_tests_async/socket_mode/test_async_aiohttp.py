@@ -4,6 +4,7 @@ import pytest
 from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_bolt.adapter.socket_mode.aiohttp import AsyncSocketModeHandler
+from slack_bolt.adapter.socket_mode.async_dispatch_scheduler import AsyncDispatchScheduler
 from slack_bolt.app.async_app import AsyncApp
 from tests.mock_web_api_server import (
     setup_mock_web_api_server,
@@ -78,3 +79,49 @@ class TestSocketModeAiohttp:
         finally:
             await handler.client.close()
             stop_socket_mode_server(self)
+
+    @pytest.mark.asyncio
+    async def test_events_with_dispatch_scheduler(self):
+        start_socket_mode_server(self, 3021)
+
+        app = AsyncApp(client=self.web_client, process_before_response=True)
+
+        result = {"shortcut": False, "command": False, "message": False}
+
+        @app.shortcut("do-something")
+        async def shortcut_handler(ack):
+            result["shortcut"] = True
+            await ack()
+
+        @app.command("/hello-socket-mode")
+        async def command_handler(ack):
+            result["command"] = True
+            await ack()
+
+        @app.message("<@W111>")
+        async def message_handler(ack):
+            result["message"] = True
+            await ack()
+
+        scheduler = AsyncDispatchScheduler(lanes=2)
+        handler = AsyncSocketModeHandler(
+            app_token="xapp-A111-222-xyz",
+            app=app,
+            dispatch_scheduler=scheduler,
+        )
+        try:
+            handler.client.wss_uri = "ws://localhost:3021/link"
+
+            await handler.connect_async()
+            await asyncio.sleep(2)  # wait for the message receiver
+
+            await handler.client.send_message("foo")
+
+            await asyncio.sleep(2)
+            assert result["shortcut"] is True
+            assert result["command"] is True
+            assert result["message"] is True
+        finally:
+            await handler.close_async()
+            stop_socket_mode_server(self)
+        assert scheduler.lane_depths() == [0, 0]
@@ -0,0 +1,81 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from slack_bolt.adapter.socket_mode.async_dispatch_scheduler import AsyncDispatchScheduler
+from slack_bolt.adapter.socket_mode.dispatch_scheduler import DispatchSchedulerMetrics
+from slack_bolt.request.async_request import AsyncBoltRequest
+
+
+def build_request(channel_id: Optional[str]) -> AsyncBoltRequest:
+    body = {"event": {"type": "message", "channel": channel_id}} if channel_id else {"type": "shortcut"}
+    return AsyncBoltRequest(body=body, mode="socket_mode")
+
+
+class RecordingMetrics(DispatchSchedulerMetrics):
+    def __init__(self):
+        self.rejections: List[Optional[str]] = []
+
+    def record_rejection(self, *, lane: int, key: Optional[str]) -> None:
+        self.rejections.append(key)
+
+
+class TestAsyncDispatchScheduler:
+    @pytest.mark.asyncio
+    async def test_order_per_channel(self):
+        scheduler = AsyncDispatchScheduler(lanes=4)
+        processed = {"C111": [], "C222": []}
+        try:
+            for i in range(20):
+                for channel_id in processed.keys():
+
+                    async def process(channel_id=channel_id, i=i):
+                        await asyncio.sleep(0.001)
+                        processed[channel_id].append(i)
+
+                    assert scheduler.submit(build_request(channel_id), process) is True
+        finally:
+            await scheduler.shutdown()
+        assert processed["C111"] == list(range(20))
+        assert processed["C222"] == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_bounded_lane_queue(self):
+        metrics = RecordingMetrics()
+        scheduler = AsyncDispatchScheduler(lanes=1, max_lane_queue_size=2, metrics=metrics)
+        assert scheduler.lane_depths() == [0]
+        blocker = asyncio.Event()
+        try:
+            assert scheduler.submit(build_request("C111"), blocker.wait) is True
+            await asyncio.sleep(0.1)  # the lane starts running the first one
+
+            async def noop():
+                pass
+
+            assert scheduler.submit(build_request("C111"), noop) is True
+            assert scheduler.submit(build_request("C111"), noop) is True
+            assert scheduler.lane_depths() == [2]
+            assert scheduler.submit(build_request("C111"), noop) is False
+            assert metrics.rejections == ["C111"]
+        finally:
+            blocker.set()
+            await scheduler.shutdown()
+        assert scheduler.lane_depths() == [0]
+
+    @pytest.mark.asyncio
+    async def test_shutdown(self):
+        scheduler = AsyncDispatchScheduler(lanes=2)
+        processed = []
+
+        async def process():
+            processed.append(1)
+
+        def fail():
+            raise ValueError("something wrong")
+
+        scheduler.submit(build_request("C111"), fail)  # type: ignore[arg-type]
+        scheduler.submit(build_request("C111"), process)
+        await scheduler.shutdown()
+        assert processed == [1]
+        assert scheduler.submit(build_request("C111"), process) is False
@@ -10,6 +10,7 @@ from slack_sdk.oauth.state_store import FileOAuthStateStore
 
 from slack_bolt import App, BoltContext, BoltRequest, Say
 from slack_bolt.authorization import AuthorizeResult
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
 from slack_bolt.error import BoltError
 from slack_bolt.oauth import OAuthFlow
 from slack_bolt.oauth.oauth_settings import OAuthSettings
@@ -168,6 +169,41 @@ class TestApp:
         with pytest.raises(BoltError):
             App(signing_secret="valid", authorize=authorize, oauth_flow=oauth_flow)
 
+    def test_authorize_options(self):
+        options = dict(
+            authorize_result_cache=AuthorizeResultCache(ttl_seconds=60),
+            single_flight_enabled=False,
+            auth_test_mode="fallback",
+            auth_test_verification_interval_seconds=300,
+        )
+        oauth_settings = OAuthSettings(
+            client_id="111.222",
+            client_secret="valid",
+            installation_store=FileInstallationStore(),
+            state_store=FileOAuthStateStore(expiration_seconds=120),
+            **options,
+        )
+        # The authorize built by either the app or the OAuth settings
+        for app in [
+            App(signing_secret="valid", installation_store=FileInstallationStore(), **options),
+            App(signing_secret="valid", oauth_settings=oauth_settings),
+            App(
+                signing_secret="valid", installation_store=FileInstallationStore(), oauth_settings=oauth_settings, **options
+            ),
+        ]:
+            assert app._authorize.authorize_result_cache is options["authorize_result_cache"]
+            assert app._authorize.single_flight is None
+            assert app._authorize.auth_test_mode == "fallback"
+            assert app._authorize.auth_test_verification_schedule.interval_seconds == 300
+            if app._oauth_flow is not None:
+                # The OAuth flow drops the app's cache entries when saving installations
+                assert app._oauth_flow.authorize_result_cache is options["authorize_result_cache"]
+
+        with pytest.raises(BoltError):
+            App(signing_secret="valid", oauth_settings=oauth_settings, auth_test_mode="fallback")
+        with pytest.raises(BoltError):
+            App(signing_secret="valid", oauth_flow=OAuthFlow(settings=oauth_settings), single_flight_enabled=False)
+
     def test_installation_store_conflicts(self):
         store1 = FileInstallationStore()
         store2 = FileInstallationStore()
@@ -9,6 +9,7 @@ from slack_bolt import BoltRequest, BoltResponse
 from slack_bolt.app import App
 from slack_bolt.authorization import AuthorizeResult
 from slack_bolt.request.payload_utils import is_event
+from slack_bolt.util.web_client_pool import PooledWebClient
 from tests.mock_web_api_server import assert_auth_test_count, cleanup_mock_web_api_server, setup_mock_web_api_server
 from tests.utils import remove_os_env_temporarily, restore_os_env
 
@@ -164,6 +165,33 @@ class TestAuthorize:
         assert response.body == ""
         assert_auth_test_count(self, 1)
 
+    def test_web_client_pool(self):
+        app = App(
+            client=self.web_client,
+            authorize=authorize,
+            signing_secret=self.signing_secret,
+            web_client_pool_size=10,
+        )
+        clients = []
+
+        @app.action("a")
+        def handle(ack, client: WebClient):
+            clients.append(client)
+            ack()
+
+        for _ in range(2):
+            response = app.dispatch(self.build_block_actions_request())
+            assert response.status == 200
+        assert_auth_test_count(self, 2)
+
+        assert len(clients) == 2
+        assert clients[0] is clients[1]
+        assert isinstance(clients[0], PooledWebClient)
+        assert clients[0].token == valid_token
+        assert clients[0].default_params["team_id"] == "T111"
+        assert clients[0].base_url == self.web_client.base_url
+        assert clients[0] is not self.web_client
+
     def test_before_authorize(self):
         def skip_message_changed_events(body: dict, payload: dict, next_):
             if is_event(body) and payload.get("type") == "message" and payload.get("subtype") == "message_changed":
@@ -1,4 +1,5 @@
 import json
+import logging
 from time import sleep, time
 from typing import Optional
 
@@ -9,6 +10,8 @@ from slack_sdk.signature import SignatureVerifier
 from slack_sdk.web import WebClient
 
 from slack_bolt import App, BoltRequest
+from slack_bolt.authorization.authorize import InstallationStoreAuthorize
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache, build_authorize_result_cache_key
 from slack_bolt.error import BoltError
 from tests.mock_web_api_server import assert_auth_test_count, cleanup_mock_web_api_server, setup_mock_web_api_server
 from tests.utils import remove_os_env_temporarily, restore_os_env
@@ -165,3 +168,85 @@ class TestEventsTokenRevocations:
         assert app.installation_store.delete_bot_called is True
         assert app.installation_store.delete_installation_called is True
         assert app.installation_store.delete_all_called is True
+
+    def test_app_uninstalled_invalidates_authorize_result_cache(self):
+        installation_store = MyInstallationStore()
+        authorize = InstallationStoreAuthorize(
+            logger=logging.getLogger(__name__),
+            installation_store=installation_store,
+            authorize_result_cache=AuthorizeResultCache(),
+        )
+        app = App(
+            client=self.web_client,
+            signing_secret=self.signing_secret,
+            installation_store=installation_store,
+            authorize=authorize,
+        )
+        app.enable_token_revocation_listeners()
+        cache_key = build_authorize_result_cache_key(
+            enterprise_id="E111",
+            team_id=None,
+            user_id="W111",
+            is_enterprise_install=False,
+        )
+        authorize.authorize_result_cache.set_not_found(cache_key)
+        assert len(authorize.authorize_result_cache) == 1
+
+        event_payload = {
+            "token": "verification-token",
+            "enterprise_id": "E111",
+            "api_app_id": "A111",
+            "event": {"type": "app_uninstalled"},
+            "type": "event_callback",
+            "event_id": "Ev111",
+            "event_time": 1606805974,
+        }
+        timestamp, body = str(int(time())), json.dumps(event_payload)
+        request: BoltRequest = BoltRequest(body=body, headers=self.build_headers(timestamp, body))
+        response = app.dispatch(request)
+        assert response.status == 200
+        sleep(0.5)  # wait a bit after auto ack()
+        assert installation_store.delete_all_called is True
+        assert len(authorize.authorize_result_cache) == 0
+
+    def test_app_uninstalled_invalidates_authorize_result_cache_without_builtin_listeners(self):
+        installation_store = MyInstallationStore()
+        authorize = InstallationStoreAuthorize(
+            logger=logging.getLogger(__name__),
+            installation_store=installation_store,
+            authorize_result_cache=AuthorizeResultCache(),
+        )
+        app = App(
+            client=self.web_client,
+            signing_secret=self.signing_secret,
+            installation_store=installation_store,
+            authorize=authorize,
+        )
+
+        @app.event("app_uninstalled")
+        def handle_app_uninstalled(ack):
+            ack()
+
+        cache_key = build_authorize_result_cache_key(
+            enterprise_id="E111",
+            team_id=None,
+            user_id="W111",
+            is_enterprise_install=False,
+        )
+        authorize.authorize_result_cache.set_not_found(cache_key)
+        assert len(authorize.authorize_result_cache) == 1
+
+        event_payload = {
+            "token": "verification-token",
+            "enterprise_id": "E111",
+            "api_app_id": "A111",
+            "event": {"type": "app_uninstalled"},
+            "type": "event_callback",
+            "event_id": "Ev111",
+            "event_time": 1606805974,
+        }
+        timestamp, body = str(int(time())), json.dumps(event_payload)
+        request: BoltRequest = BoltRequest(body=body, headers=self.build_headers(timestamp, body))
+        response = app.dispatch(request)
+        assert response.status == 200
+        assert len(authorize.authorize_result_cache) == 0
@@ -9,6 +9,7 @@ from slack_sdk.web import WebClient
 
 import slack_bolt.listener.thread_runner as runner_module
 from slack_bolt.app import App
+from slack_bolt.context.ack import Ack
 from slack_bolt.request import BoltRequest
 from tests.mock_web_api_server import (
     assert_received_request_count,
@@ -54,9 +55,9 @@ class TestFunction:
         timestamp, body = str(int(time.time())), json.dumps(message_body)
         return BoltRequest(body=body, headers=self.build_headers(timestamp, body))
 
-    def setup_time_mocks(self, *, monkeypatch: pytest.MonkeyPatch, time_mock, sleep_mock):
+    def setup_ack_wait_mocks(self, *, monkeypatch: pytest.MonkeyPatch, time_mock, wait_mock):
         monkeypatch.setattr(runner_module.time, "time", time_mock)
-        monkeypatch.setattr(runner_module.time, "sleep", sleep_mock)
+        monkeypatch.setattr(Ack, "wait_until_acknowledged", wait_mock)
 
     def test_valid_callback_id_success(self):
         app = App(
@@ -140,19 +141,11 @@ class TestFunction:
 
         request = self.build_request_from_body(function_body)
 
-        elapsed_seconds = 0
-
-        def fake_time():
-            return float(elapsed_seconds)
-
-        def fake_sleep(duration):
-            nonlocal elapsed_seconds
-            elapsed_seconds += 1
-
-        self.setup_time_mocks(
+        wait_mock = Mock(return_value=False)
+        self.setup_ack_wait_mocks(
             monkeypatch=monkeypatch,
-            time_mock=fake_time,
-            sleep_mock=Mock(side_effect=fake_sleep),
+            time_mock=Mock(return_value=0.0),
+            wait_mock=wait_mock,
         )
         response = app.dispatch(request)
 
@@ -169,29 +162,19 @@ class TestFunction:
         app.function("reverse", auto_acknowledge=False, ack_timeout=timeout)(just_no_ack)
         request = self.build_request_from_body(function_body)
 
-        elapsed_seconds = 0
-
-        def fake_time():
-            return float(elapsed_seconds)
-
-        def fake_sleep(duration):
-            nonlocal elapsed_seconds
-            elapsed_seconds += 1
-
-        self.setup_time_mocks(
+        wait_mock = Mock(return_value=False)
+        self.setup_ack_wait_mocks(
             monkeypatch=monkeypatch,
-            time_mock=fake_time,
-            sleep_mock=Mock(side_effect=fake_sleep),
+            time_mock=Mock(return_value=0.0),
+            wait_mock=wait_mock,
         )
 
         response = app.dispatch(request)
 
         assert response.status == 404
         assert_auth_test_count(self, 1)
-        assert elapsed_seconds == timeout + 1, (
-            f"Expected handler to time out after {timeout + 1} time.sleep calls, "
-            f"but it was called {elapsed_seconds} times"
-        )
+        # The runner waits for the ack() call only once, up to the ack_timeout
+        wait_mock.assert_called_once_with(timeout=timeout)
 
     def test_warning_when_timeout_improperly_set(self, caplog):
         app = App(
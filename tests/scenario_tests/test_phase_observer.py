@@ -0,0 +1,153 @@
+import json
+import threading
+import time
+from urllib.parse import quote
+
+import pytest
+from slack_sdk import WebClient
+from slack_sdk.signature import SignatureVerifier
+
+from slack_bolt import BoltRequest
+from slack_bolt.app import App
+from slack_bolt.error import BoltError
+from slack_bolt.util.phase_observer import MiddlewareMetrics, PhaseObserver
+from tests.mock_web_api_server import cleanup_mock_web_api_server, setup_mock_web_api_server
+from tests.utils import remove_os_env_temporarily, restore_os_env
+
+
+class RecordingPhaseObserver(PhaseObserver):
+    def __init__(self):
+        self.phases = []
+        self.lock = threading.Lock()
+
+    def on_phase(self, request, phase: str, duration: float) -> None:
+        assert duration >= 0
+        with self.lock:
+            self.phases.append(phase)
+
+
+class TestPhaseObserver:
+    signing_secret = "secret"
+    valid_token = "xoxb-valid"
+    mock_api_server_base_url = "http://localhost:8888"
+    signature_verifier = SignatureVerifier(signing_secret)
+    web_client = WebClient(
+        token=valid_token,
+        base_url=mock_api_server_base_url,
+    )
+
+    def setup_method(self):
+        self.old_os_env = remove_os_env_temporarily()
+        setup_mock_web_api_server(self)
+
+    def teardown_method(self):
+        cleanup_mock_web_api_server(self)
+        restore_os_env(self.old_os_env)
+
+    def build_request(self, action_id: str) -> BoltRequest:
+        body = {
+            "type": "block_actions",
+            "user": {"id": "W111"},
+            "api_app_id": "A111",
+            "token": "verification_token",
+            "trigger_id": "111.222.valid",
+            "team": {"id": "T111"},
+            "channel": {"id": "C111", "name": "test-channel"},
+            "response_url": "https://hooks.slack.com/actions/T111/111/random-value",
+            "actions": [{"action_id": action_id, "block_id": "b", "type": "button", "action_ts": "1596530385.194939"}],
+        }
+        raw_body = f"payload={quote(json.dumps(body))}"
+        timestamp = str(int(time.time()))
+        return BoltRequest(
+            body=raw_body,
+            headers={
+                "content-type": ["application/x-www-form-urlencoded"],
+                "x-slack-signature": [self.signature_verifier.generate_signature(body=raw_body, timestamp=timestamp)],
+                "x-slack-request-timestamp": [timestamp],
+            },
+        )
+
+    def wait_for(self, observer: RecordingPhaseObserver, phase: str) -> None:
+        count = 0
+        while phase not in observer.phases and count < 20:
+            time.sleep(0.05)
+            count += 1
+
+    def test_phases(self):
+        observer = RecordingPhaseObserver()
+        app = App(
+            client=self.web_client,
+            signing_secret=self.signing_secret,
+            process_before_response=True,
+            phase_observer=observer,
+        )
+
+        def listener_middleware(next):
+            next()
+
+        def async_job():
+            pass
+
+        @app.action("b", middleware=[listener_middleware])
+        def handle_button(ack):
+            ack()
+
+        app.action("a")(ack=lambda ack: ack(), lazy=[async_job])
+
+        response = app.dispatch(self.build_request("a"))
+        assert response.status == 200
+        self.wait_for(observer, "lazy_function:async_job")
+        assert observer.phases[0].endswith(".RequestVerification")
+        assert any(phase.endswith(".SingleTeamAuthorization") for phase in observer.phases)
+        assert observer.phases.count("listener_matching") == 1
+        assert "ack_function:<lambda>" in observer.phases
+        assert "dispatch" in observer.phases
+        assert "lazy_function:async_job" in observer.phases
+
+        observer.phases.clear()
+        response = app.dispatch(self.build_request("b"))
+        assert response.status == 200
+        assert observer.phases.index("listener_matching") < observer.phases.index("listener_middleware:handle_button")
+        assert observer.phases.index("listener_middleware:handle_button") < observer.phases.index(
+            "ack_function:handle_button"
+        )
+        assert observer.phases[-1] == "dispatch"
+
+    def test_unhandled_request(self):
+        observer = RecordingPhaseObserver()
+        app = App(client=self.web_client, signing_secret=self.signing_secret, phase_observer=observer)
+
+        @app.action("b")
+        def handle_button(ack):
+            ack()
+
+        response = app.dispatch(self.build_request("a"))
+        assert response.status == 404
+        assert observer.phases[0].startswith("middleware:")
+        assert not any(phase.startswith("ack_function:") for phase in observer.phases)
+        assert observer.phases[-1] == "dispatch"
+
+    def test_middleware_metrics(self):
+        records = []
+
+        class NextCallRecordingPhaseObserver(RecordingPhaseObserver):
+            def record_middleware_time(self, *, request, name, seconds, next_called):
+                super().record_middleware_time(request=request, name=name, seconds=seconds, next_called=next_called)
+                records.append((name, next_called))
+
+        observer = NextCallRecordingPhaseObserver()
+        with pytest.raises(BoltError):
+            App(
+                client=self.web_client,
+                signing_secret=self.signing_secret,
+                middleware_metrics=MiddlewareMetrics(),
+                phase_observer=observer,
+            )
+
+        app = App(client=self.web_client, signing_secret=self.signing_secret, phase_observer=observer)
+        response = app.dispatch(self.build_request("a"))
+        assert response.status == 404
+        # The observer receives the global middleware executions via the MiddlewareMetrics hooks
+        assert len(records) > 0
+        assert all(next_called for _, next_called in records)
+        assert [f"middleware:{name}" for name, _ in records] == [p for p in observer.phases if p.startswith("middleware:")]
@@ -10,6 +10,7 @@ from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_bolt.async_app import AsyncApp
 from slack_bolt.authorization import AuthorizeResult
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
 from slack_bolt.context.async_context import AsyncBoltContext
 from slack_bolt.error import BoltError
 from slack_bolt.oauth.async_oauth_flow import AsyncOAuthFlow
@@ -144,6 +145,41 @@ class TestAsyncApp:
         with pytest.raises(BoltError):
             AsyncApp(signing_secret="valid", authorize=authorize, oauth_flow=oauth_flow)
 
+    def test_authorize_options(self):
+        options = dict(
+            authorize_result_cache=AuthorizeResultCache(ttl_seconds=60),
+            single_flight_enabled=False,
+            auth_test_mode="fallback",
+            auth_test_verification_interval_seconds=300,
+        )
+        oauth_settings = AsyncOAuthSettings(
+            client_id="111.222",
+            client_secret="valid",
+            installation_store=FileInstallationStore(),
+            state_store=FileOAuthStateStore(expiration_seconds=120),
+            **options,
+        )
+        # The authorize built by either the app or the OAuth settings
+        for app in [
+            AsyncApp(signing_secret="valid", installation_store=FileInstallationStore(), **options),
+            AsyncApp(signing_secret="valid", oauth_settings=oauth_settings),
+            AsyncApp(
+                signing_secret="valid", installation_store=FileInstallationStore(), oauth_settings=oauth_settings, **options
+            ),
+        ]:
+            assert app._async_authorize.authorize_result_cache is options["authorize_result_cache"]
+            assert app._async_authorize.single_flight is None
+            assert app._async_authorize.auth_test_mode == "fallback"
+            assert app._async_authorize.auth_test_verification_schedule.interval_seconds == 300
+            if app._async_oauth_flow is not None:
+                # The OAuth flow drops the app's cache entries when saving installations
+                assert app._async_oauth_flow.authorize_result_cache is options["authorize_result_cache"]
+
+        with pytest.raises(BoltError):
+            AsyncApp(signing_secret="valid", oauth_settings=oauth_settings, auth_test_mode="fallback")
+        with pytest.raises(BoltError):
+            AsyncApp(signing_secret="valid", oauth_flow=AsyncOAuthFlow(settings=oauth_settings), single_flight_enabled=False)
+
     def test_installation_store_conflicts(self):
         store1 = FileInstallationStore()
         store2 = FileInstallationStore()
@@ -11,6 +11,7 @@ from slack_bolt.app.async_app import AsyncApp
 from slack_bolt.authorization import AuthorizeResult
 from slack_bolt.request.async_request import AsyncBoltRequest
 from slack_bolt.request.payload_utils import is_event
+from slack_bolt.util.async_web_client_pool import AsyncPooledWebClient
 from tests.mock_web_api_server import (
     cleanup_mock_web_api_server_async,
     assert_auth_test_count_async,
@@ -131,6 +132,37 @@ class TestAsyncAuthorize:
         assert response.body == ""
         await assert_auth_test_count_async(self, 1)
 
+    @pytest.mark.asyncio
+    async def test_web_client_pool(self):
+        app = AsyncApp(
+            client=self.web_client,
+            authorize=authorize,
+            signing_secret=self.signing_secret,
+            web_client_pool_size=10,
+        )
+        clients = []
+
+        @app.action("a")
+        async def handle(ack, client: AsyncWebClient):
+            clients.append(client)
+            await ack()
+
+        try:
+            for _ in range(2):
+                response = await app.async_dispatch(self.build_block_actions_request())
+                assert response.status == 200
+            await assert_auth_test_count_async(self, 2)
+
+            assert len(clients) == 2
+            assert clients[0] is clients[1]
+            assert isinstance(clients[0], AsyncPooledWebClient)
+            assert clients[0].token == valid_token
+            assert clients[0].default_params["team_id"] == "T111"
+            assert clients[0].session is not None
+        finally:
+            await app.close_web_client_pool()
+        assert clients[0].session.closed
+
     @pytest.mark.asyncio
     async def test_failure(self):
         app = AsyncApp(
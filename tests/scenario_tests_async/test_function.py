@@ -4,12 +4,13 @@ import re
 import time
 
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock
 from slack_sdk.signature import SignatureVerifier
 from slack_sdk.web.async_client import AsyncWebClient
 
 import slack_bolt.listener.asyncio_runner as async_runner_module
 from slack_bolt.app.async_app import AsyncApp
+from slack_bolt.context.ack.async_ack import AsyncAck
 from slack_bolt.request.async_request import AsyncBoltRequest
 from tests.mock_web_api_server import (
     assert_received_request_count_async,
@@ -57,9 +58,9 @@ class TestAsyncFunction:
         timestamp, body = str(int(time.time())), json.dumps(message_body)
         return AsyncBoltRequest(body=body, headers=self.build_headers(timestamp, body))
 
-    def setup_time_mocks(self, *, monkeypatch: pytest.MonkeyPatch, time_mock, sleep_mock):
+    def setup_ack_wait_mocks(self, *, monkeypatch: pytest.MonkeyPatch, time_mock, wait_mock):
         monkeypatch.setattr(async_runner_module.time, "time", time_mock)
-        monkeypatch.setattr(async_runner_module.asyncio, "sleep", sleep_mock)
+        monkeypatch.setattr(AsyncAck, "wait_until_acknowledged", wait_mock)
 
     @pytest.mark.asyncio
     async def test_mock_server_is_running(self):
@@ -143,19 +144,15 @@ class TestAsyncFunction:
         app.function("reverse", auto_acknowledge=False)(just_no_ack)
         request = self.build_request_from_body(function_body)
 
-        elapsed_seconds = 0
+        wait_mock = Mock(return_value=False)
 
-        def fake_time():
-            return float(elapsed_seconds)
+        async def fake_wait(ack, timeout=None):
+            return wait_mock(timeout=timeout)
 
-        async def fake_sleep(duration):
-            nonlocal elapsed_seconds
-            elapsed_seconds += 1
-
-        self.setup_time_mocks(
+        self.setup_ack_wait_mocks(
             monkeypatch=monkeypatch,
-            time_mock=fake_time,
-            sleep_mock=MagicMock(side_effect=fake_sleep),
+            time_mock=Mock(return_value=0.0),
+            wait_mock=fake_wait,
         )
 
         response = await app.async_dispatch(request)
@@ -173,28 +170,23 @@ class TestAsyncFunction:
         app.function("reverse", auto_acknowledge=False, ack_timeout=timeout)(just_no_ack)
         request = self.build_request_from_body(function_body)
 
-        elapsed_seconds = 0
-
-        def fake_time():
-            return float(elapsed_seconds)
+        wait_mock = Mock(return_value=False)
 
-        async def fake_sleep(duration):
-            nonlocal elapsed_seconds
-            elapsed_seconds += 1
+        async def fake_wait(ack, timeout=None):
+            return wait_mock(timeout=timeout)
 
-        self.setup_time_mocks(
+        self.setup_ack_wait_mocks(
             monkeypatch=monkeypatch,
-            time_mock=fake_time,
-            sleep_mock=MagicMock(side_effect=fake_sleep),
+            time_mock=Mock(return_value=0.0),
+            wait_mock=fake_wait,
         )
 
         response = await app.async_dispatch(request)
 
         assert response.status == 404
         await assert_auth_test_count_async(self, 1)
-        assert elapsed_seconds == timeout + 1, (
-            f"Expected handler to time out after {timeout + 1} sleep calls, " f"but it was called {elapsed_seconds} times"
-        )
+        # The runner waits for the ack() call only once, up to the ack_timeout
+        wait_mock.assert_called_once_with(timeout=timeout)
 
     @pytest.mark.asyncio
     async def test_warning_when_timeout_improperly_set(self, caplog):
@@ -0,0 +1,114 @@
+import asyncio
+import json
+from time import time
+from urllib.parse import quote
+
+import pytest
+from slack_sdk.signature import SignatureVerifier
+from slack_sdk.web.async_client import AsyncWebClient
+
+from slack_bolt.async_app import AsyncApp
+from slack_bolt.request.async_request import AsyncBoltRequest
+from slack_bolt.util.phase_observer import PhaseObserver
+from tests.mock_web_api_server import cleanup_mock_web_api_server_async, setup_mock_web_api_server_async
+from tests.utils import remove_os_env_temporarily, restore_os_env
+
+
+class RecordingPhaseObserver(PhaseObserver):
+    def __init__(self):
+        self.phases = []
+
+    def on_phase(self, request, phase: str, duration: float) -> None:
+        assert duration >= 0
+        self.phases.append(phase)
+
+
+class TestAsyncPhaseObserver:
+    signing_secret = "secret"
+    valid_token = "xoxb-valid"
+    mock_api_server_base_url = "http://localhost:8888"
+    signature_verifier = SignatureVerifier(signing_secret)
+    web_client = AsyncWebClient(
+        token=valid_token,
+        base_url=mock_api_server_base_url,
+    )
+
+    @pytest.fixture(scope="function", autouse=True)
+    def setup_teardown(self):
+        old_os_env = remove_os_env_temporarily()
+        setup_mock_web_api_server_async(self)
+        try:
+            yield  # run the test here
+        finally:
+            cleanup_mock_web_api_server_async(self)
+            restore_os_env(old_os_env)
+
+    def build_request(self, action_id: str) -> AsyncBoltRequest:
+        body = {
+            "type": "block_actions",
+            "user": {"id": "W111"},
+            "api_app_id": "A111",
+            "token": "verification_token",
+            "trigger_id": "111.222.valid",
+            "team": {"id": "T111"},
+            "channel": {"id": "C111", "name": "test-channel"},
+            "response_url": "https://hooks.slack.com/actions/T111/111/random-value",
+            "actions": [{"action_id": action_id, "block_id": "b", "type": "button", "action_ts": "1596530385.194939"}],
+        }
+        raw_body = f"payload={quote(json.dumps(body))}"
+        timestamp = str(int(time()))
+        return AsyncBoltRequest(
+            body=raw_body,
+            headers={
+                "content-type": ["application/x-www-form-urlencoded"],
+                "x-slack-signature": [self.signature_verifier.generate_signature(body=raw_body, timestamp=timestamp)],
+                "x-slack-request-timestamp": [timestamp],
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_phases(self):
+        observer = RecordingPhaseObserver()
+        app = AsyncApp(
+            client=self.web_client,
+            signing_secret=self.signing_secret,
+            process_before_response=True,
+            phase_observer=observer,
+        )
+
+        async def listener_middleware(next):
+            await next()
+
+        async def ack_button(ack):
+            await ack()
+
+        async def async_job():
+            pass
+
+        @app.action("b", middleware=[listener_middleware])
+        async def handle_button(ack):
+            await ack()
+
+        app.action("a")(ack=ack_button, lazy=[async_job])
+
+        response = await app.async_dispatch(self.build_request("a"))
+        assert response.status == 200
+        count = 0
+        while "lazy_function:async_job" not in observer.phases and count < 20:
+            await asyncio.sleep(0.05)
+            count += 1
+        assert observer.phases[0].endswith(".AsyncRequestVerification")
+        assert any(phase.endswith(".AsyncSingleTeamAuthorization") for phase in observer.phases)
+        assert observer.phases.count("listener_matching") == 1
+        assert "ack_function:ack_button" in observer.phases
+        assert "dispatch" in observer.phases
+        assert "lazy_function:async_job" in observer.phases
+
+        observer.phases.clear()
+        response = await app.async_dispatch(self.build_request("b"))
+        assert response.status == 200
+        assert observer.phases.index("listener_matching") < observer.phases.index("listener_middleware:handle_button")
+        assert observer.phases.index("listener_middleware:handle_button") < observer.phases.index(
+            "ack_function:handle_button"
+        )
+        assert observer.phases[-1] == "dispatch"
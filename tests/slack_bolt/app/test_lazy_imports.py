@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+import slack_bolt
+
+
+def imported_modules(statement: str) -> set:
+    # Run in a fresh interpreter as the modules imported by other tests remain in sys.modules
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    def test_package_attributes(self):
+        for name in slack_bolt.__all__:
+            assert getattr(slack_bolt, name) is not None
+            assert name in dir(slack_bolt)
+
+    def test_unknown_attribute(self):
+        try:
+            slack_bolt.UnknownAttribute
+            assert False, "AttributeError is expected"
+        except AttributeError:
+            pass
+
+    def test_import_package(self):
+        modules = imported_modules("import slack_bolt.request")
+        assert "slack_bolt.app.app" not in modules
+
+    def test_import_app(self):
+        modules = imported_modules("from slack_bolt import App")
+        assert "slack_bolt.app.app" in modules
+        for rarely_used in [
+            "http.server",
+            "slack_bolt.oauth.oauth_flow",
+            "slack_bolt.middleware.assistant.assistant",
+            "slack_bolt.workflows.step.step",
+        ]:
+            assert rarely_used not in modules
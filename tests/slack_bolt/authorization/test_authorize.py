@@ -1,5 +1,7 @@
 import datetime
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 from typing import Optional
 
@@ -10,6 +12,8 @@ from slack_sdk.oauth.installation_store import Bot, Installation
 
 from slack_bolt import BoltContext
 from slack_bolt.authorization.authorize import InstallationStoreAuthorize, Authorize
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
+from slack_bolt.authorization.batch_installation_store import BatchInstallationStore
 from slack_bolt.error import BoltError
 from tests.mock_web_api_server import (
     cleanup_mock_web_api_server,
@@ -334,6 +338,170 @@ class TestAuthorize:
         assert result.url == "https://subarachnoid.slack.com/"
         assert_auth_test_count(self, 1)
 
+    def test_installation_store_cache_lookups(self):
+        installation_store = CountingInstallationStore()
+        authorize = InstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            authorize_result_cache=AuthorizeResultCache(),
+        )
+        context = BoltContext()
+        context["client"] = WebClient(base_url=self.mock_api_server_base_url)
+        for _ in range(3):
+            result = authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+            assert result.bot_token == "xoxb-valid-2"
+        # The installation store is not queried for the cached key
+        assert installation_store.find_installation_count == 1
+        assert_auth_test_count(self, 2)
+        assert authorize.authorize_result_cache.hit_count == 2
+
+        # Negative entries for unknown workspaces
+        for _ in range(3):
+            assert authorize(context=context, enterprise_id=None, team_id="T_UNKNOWN", user_id="W11111") is None
+        assert installation_store.find_installation_count == 2
+
+        authorize.authorize_result_cache.invalidate(enterprise_id="E111", team_id="T0G9PQBBK")
+        authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+        assert installation_store.find_installation_count == 3
+
+    def test_installation_store_single_flight(self):
+        installation_store = CountingInstallationStore(lookup_seconds=0.2)
+        authorize = InstallationStoreAuthorize(logger=installation_store.logger, installation_store=installation_store)
+        context = BoltContext()
+        context["client"] = WebClient(base_url=self.mock_api_server_base_url)
+
+        def run():
+            return authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = [f.result() for f in [executor.submit(run) for _ in range(5)]]
+        assert all(r.bot_token == "xoxb-valid-2" for r in results)
+        assert installation_store.find_installation_count == 1
+        assert_auth_test_count(self, 2)
+        assert authorize.single_flight.shared_count == 4
+
+    def test_installation_store_auth_test_fallback(self):
+        installation_store = MemoryInstallationStore()
+        with pytest.raises(BoltError):
+            InstallationStoreAuthorize(
+                logger=installation_store.logger,
+                installation_store=installation_store,
+                auth_test_mode="never",
+            )
+        authorize = InstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            auth_test_mode="fallback",
+        )
+        context = BoltContext()
+        context["client"] = WebClient(base_url=self.mock_api_server_base_url)
+        result = authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+        assert result.enterprise_id == "E111"
+        assert result.team_id == "T0G9PQBBK"
+        assert result.bot_id == "B"
+        assert result.bot_user_id == "W"
+        assert result.bot_token == "xoxb-valid-2"
+        assert result.user_id == "W11111"
+        assert result.user_token == "xoxp-valid"
+        assert result.user_scopes == ["search:read"]
+        assert_auth_test_count(self, 0)
+
+        # auth.test API is called when the stored data lacks the identity fields
+        authorize = InstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=NoBotUserIdInstallationStore(),
+            auth_test_mode="fallback",
+        )
+        result = authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+        assert result.bot_user_id == "W23456789"
+        assert_auth_test_count(self, 2)
+
+    def test_installation_store_auth_test_verification(self):
+        installation_store = MemoryInstallationStore()
+        authorize = InstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            auth_test_mode="fallback",
+            auth_test_verification_interval_seconds=3600,
+        )
+        context = BoltContext()
+        context["client"] = WebClient(base_url=self.mock_api_server_base_url)
+        result = authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+        assert result.bot_user_id == "W23456789"
+        assert_auth_test_count(self, 2)
+
+        # The verified token is not checked again until the interval passes
+        result = authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+        assert result.bot_user_id == "W"
+        assert_auth_test_count(self, 2)
+
+    def test_installation_store_cache_enabled(self):
+        installation_store = CountingInstallationStore()
+        authorize = InstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            cache_enabled=True,
+        )
+        context = BoltContext()
+        context["client"] = WebClient(base_url=self.mock_api_server_base_url)
+        for _ in range(3):
+            result = authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+            assert result.bot_token == "xoxb-valid-2"
+        # cache_enabled memoizes only the auth.test API results; the installation store is queried every time
+        assert authorize.authorize_result_cache is None
+        assert installation_store.find_installation_count == 3
+        # The bot and user tokens are verified only by the first request
+        assert_auth_test_count(self, 2)
+
+    def test_installation_store_cache_expiring_tokens(self):
+        installation_store = CountingInstallationStore(bot_token_expires_at=int(datetime.datetime.now().timestamp()) + 60)
+        authorize = InstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            authorize_result_cache=AuthorizeResultCache(),
+        )
+        context = BoltContext()
+        context["client"] = WebClient(base_url=self.mock_api_server_base_url)
+        authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+        authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+        assert installation_store.find_installation_count == 1
+
+        # The cached entry must expire before the token rotation needs to be done
+        authorize = InstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            client_id="111.222",
+            client_secret="secret",
+            authorize_result_cache=AuthorizeResultCache(),
+        )
+        installation_store.find_installation_count = 0
+        authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+        authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+        assert installation_store.find_installation_count == 2
+
+    def test_installation_store_batch_lookup(self):
+        installation_store = BatchValidUserTokenInstallationStore()
+        authorize = InstallationStoreAuthorize(logger=installation_store.logger, installation_store=installation_store)
+        assert authorize.find_installations_available is True
+        context = BoltContext()
+        context["client"] = WebClient(base_url=self.mock_api_server_base_url)
+        result = authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W222")
+        assert result.bot_token == "xoxb-valid"
+        assert result.user_token == "xoxp-valid"
+        assert result.user_id == "W99999"
+        assert installation_store.find_installations_count == 1
+        assert installation_store.find_installation_count == 0
+
+    def test_installation_store_batch_lookup_not_implemented(self):
+        installation_store = NotImplementedBatchInstallationStore()
+        authorize = InstallationStoreAuthorize(logger=installation_store.logger, installation_store=installation_store)
+        context = BoltContext()
+        context["client"] = WebClient(base_url=self.mock_api_server_base_url)
+        result = authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W222")
+        assert result.bot_token == "xoxb-valid"
+        assert result.user_token == "xoxp-valid"
+        assert authorize.find_installations_available is False
+
 
 class LegacyMemoryInstallationStore(InstallationStore):
     @property
@@ -386,6 +554,13 @@ class MemoryInstallationStore(LegacyMemoryInstallationStore):
         )
 
 
+class NoBotUserIdInstallationStore(MemoryInstallationStore):
+    def find_installation(self, **kwargs) -> Optional[Installation]:
+        installation = super().find_installation(**kwargs)
+        installation.bot_user_id = None
+        return installation
+
+
 class BotOnlyMemoryInstallationStore(LegacyMemoryInstallationStore):
     def find_installation(
         self,
@@ -486,3 +661,64 @@ class ValidUserTokenRotationInstallationStore(InstallationStore):
                 user_scopes=["search:read"],
                 installed_at=datetime.datetime.now().timestamp(),
             )
+
+
+class CountingInstallationStore(LegacyMemoryInstallationStore):
+    def __init__(self, bot_token_expires_at: Optional[int] = None, lookup_seconds: float = 0):
+        self.find_installation_count = 0
+        self.bot_token_expires_at = bot_token_expires_at
+        self.lookup_seconds = lookup_seconds
+
+    def find_installation(
+        self,
+        *,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        user_id: Optional[str] = None,
+        is_enterprise_install: Optional[bool] = False,
+    ) -> Optional[Installation]:
+        self.find_installation_count += 1
+        time.sleep(self.lookup_seconds)
+        if team_id != "T0G9PQBBK":
+            return None
+        return Installation(
+            app_id="A111",
+            enterprise_id="E111",
+            team_id="T0G9PQBBK",
+            bot_token="xoxb-valid-2",
+            bot_id="B",
+            bot_user_id="W",
+            bot_scopes=["commands", "chat:write"],
+            bot_token_expires_at=self.bot_token_expires_at,
+            user_id="W11111",
+            user_token="xoxp-valid",
+            user_scopes=["search:read"],
+            installed_at=datetime.datetime.now().timestamp(),
+        )
+
+    def find_bot(
+        self,
+        *,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        is_enterprise_install: Optional[bool] = False,
+    ) -> Optional[Bot]:
+        return None
+
+
+class BatchValidUserTokenInstallationStore(ValidUserTokenInstallationStore, BatchInstallationStore):
+    def __init__(self):
+        self.find_installation_count = 0
+        self.find_installations_count = 0
+
+    def find_installation(self, **kwargs) -> Optional[Installation]:
+        self.find_installation_count += 1
+        return super().find_installation(**kwargs)
+
+    def find_installations(self, *, queries):
+        self.find_installations_count += 1
+        return [super(BatchValidUserTokenInstallationStore, self).find_installation(**q._asdict()) for q in queries]
+
+
+class NotImplementedBatchInstallationStore(ValidUserTokenInstallationStore, BatchInstallationStore):
+    pass
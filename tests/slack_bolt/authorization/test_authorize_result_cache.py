@@ -0,0 +1,88 @@
+import time
+
+from slack_bolt.authorization import AuthorizeResult
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache, build_authorize_result_cache_key
+
+
+def build_key(team_id: str, user_id: str = "W111", enterprise_id: str = "E111"):
+    return build_authorize_result_cache_key(
+        enterprise_id=enterprise_id,
+        team_id=team_id,
+        user_id=user_id,
+        is_enterprise_install=False,
+    )
+
+
+def build_result(team_id: str) -> AuthorizeResult:
+    return AuthorizeResult(enterprise_id="E111", team_id=team_id, bot_token=f"xoxb-{team_id}")
+
+
+class TestAuthorizeResultCache:
+    def setup_method(self):
+        pass
+
+    def teardown_method(self):
+        pass
+
+    def test_get_and_set(self):
+        cache = AuthorizeResultCache()
+        assert cache.get(build_key("T111")) == (False, None)
+        result = build_result("T111")
+        cache.set(build_key("T111"), result)
+        assert cache.get(build_key("T111")) == (True, result)
+        assert cache.get(build_key("T111", user_id="W222")) == (False, None)
+        assert cache.hit_count == 1
+        assert cache.miss_count == 2
+
+    def test_lru_eviction(self):
+        cache = AuthorizeResultCache(max_size=2)
+        cache.set(build_key("T1"), build_result("T1"))
+        cache.set(build_key("T2"), build_result("T2"))
+        assert cache.get(build_key("T1"))[0] is True
+        cache.set(build_key("T3"), build_result("T3"))
+        assert len(cache) == 2
+        assert cache.eviction_count == 1
+        # T2 is the least recently used one
+        assert cache.get(build_key("T2"))[0] is False
+        assert cache.get(build_key("T1"))[0] is True
+        assert cache.get(build_key("T3"))[0] is True
+
+    def test_ttl(self):
+        cache = AuthorizeResultCache(ttl_seconds=0.1)
+        cache.set(build_key("T1"), build_result("T1"))
+        assert cache.get(build_key("T1"))[0] is True
+        time.sleep(0.2)
+        assert cache.get(build_key("T1"))[0] is False
+        assert len(cache) == 0
+
+    def test_token_expiration(self):
+        cache = AuthorizeResultCache(ttl_seconds=600)
+        cache.set(build_key("T1"), build_result("T1"), expires_at=int(time.time()) - 1)
+        assert cache.get(build_key("T1"))[0] is False
+        cache.set(build_key("T1"), build_result("T1"), expires_at=int(time.time()) + 60)
+        assert cache.get(build_key("T1"))[0] is True
+
+    def test_negative_entries(self):
+        cache = AuthorizeResultCache(negative_ttl_seconds=0.1)
+        cache.set_not_found(build_key("T1"))
+        assert cache.get(build_key("T1")) == (True, None)
+        time.sleep(0.2)
+        assert cache.get(build_key("T1")) == (False, None)
+
+        cache = AuthorizeResultCache(negative_ttl_seconds=0)
+        cache.set_not_found(build_key("T1"))
+        assert cache.get(build_key("T1")) == (False, None)
+
+    def test_invalidate(self):
+        cache = AuthorizeResultCache()
+        cache.set(build_key("T1"), build_result("T1"))
+        cache.set(build_key("T1", user_id="W222"), build_result("T1"))
+        cache.set(build_key("T2"), build_result("T2"))
+        cache.invalidate(enterprise_id="E111", team_id="T1")
+        assert cache.get(build_key("T1"))[0] is False
+        assert cache.get(build_key("T1", user_id="W222"))[0] is False
+        assert cache.get(build_key("T2"))[0] is True
+
+        # org-wide installation
+        cache.invalidate(enterprise_id="E111", team_id=None, is_enterprise_install=True)
+        assert len(cache) == 0
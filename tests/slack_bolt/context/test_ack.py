@@ -1,3 +1,7 @@
+import copy
+import threading
+import time
+
 from slack_sdk.models.blocks import PlainTextObject, DividerBlock
 from slack_sdk.models.views import View
 
@@ -16,6 +20,24 @@ class TestAck:
         response: BoltResponse = ack(text="foo")
         assert (response.status, response.body) == (200, "foo")
 
+    def test_wait_until_acknowledged(self):
+        ack = Ack()
+        assert ack.wait_until_acknowledged(timeout=0.01) is False
+
+        threading.Timer(0.05, ack).start()
+        started = time.time()
+        assert ack.wait_until_acknowledged(timeout=3) is True
+        assert time.time() - started < 1
+        assert ack.response.status == 200
+
+    def test_copy(self):
+        ack = Ack()
+        assert copy.deepcopy(ack).response is None
+        ack(text="foo")
+        copied = copy.deepcopy(ack)
+        assert copied.response.body == "foo"
+        assert copied.wait_until_acknowledged(timeout=0) is True
+
     sample_attachments = [
         {
             "fallback": "Plain-text summary of the attachment.",
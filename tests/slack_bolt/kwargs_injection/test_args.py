@@ -58,3 +58,46 @@ class TestArgs:
         assert arg_params["foo"] == "FOO"
         assert arg_params["bar"] == 123
         assert arg_params["ack"] is not None
+
+    def test_only_required_args_are_resolved(self):
+        req = BoltRequest(body='{"type": "event_callback", "event": {"type": "app_mention"}}', headers={})
+        arg_params: dict = build_required_kwargs(
+            logger=logging.getLogger(__name__),
+            required_arg_names=["event", "payload", "ack"],
+            request=req,
+            response=BoltResponse(status=200),
+        )
+        assert arg_params["event"] == {"type": "app_mention"}
+        assert arg_params["payload"] is arg_params["event"]
+        assert set(arg_params.keys()) == {"event", "payload", "ack"}
+        # say() / respond() are not initialized unless a function requires them
+        assert "say" not in req.context
+        assert "respond" not in req.context
+
+    def test_payload_cache_follows_body_replacement(self):
+        req = BoltRequest(body='{"type": "event_callback", "event": {"type": "app_mention"}}', headers={})
+        logger = logging.getLogger(__name__)
+        response = BoltResponse(status=200)
+        first = build_required_kwargs(logger=logger, required_arg_names=["event"], request=req, response=response)
+        second = build_required_kwargs(logger=logger, required_arg_names=["event"], request=req, response=response)
+        assert first["event"] is second["event"]
+
+        req.body = {"type": "event_callback", "event": {"type": "reaction_added"}}
+        third = build_required_kwargs(logger=logger, required_arg_names=["event"], request=req, response=response)
+        assert third["event"] == {"type": "reaction_added"}
+
+    def test_args(self):
+        req = BoltRequest(body='{"command": "/hello"}', headers={})
+        req.context["foo"] = "FOO"
+        arg_params: dict = build_required_kwargs(
+            logger=logging.getLogger(__name__),
+            required_arg_names=["args"],
+            request=req,
+            response=BoltResponse(status=200),
+            next_func=next,
+        )
+        args = arg_params["args"]
+        assert isinstance(args, Args)
+        assert args.command == {"command": "/hello"}
+        assert args.payload == {"command": "/hello"}
+        assert args.next is next
@@ -0,0 +1,147 @@
+import os
+import threading
+import time
+from typing import List, Optional
+
+import pytest
+
+from slack_bolt import App, BoltRequest
+from slack_bolt.authorization import AuthorizeResult
+from slack_bolt.error import BoltListenerExecutorSaturatedError
+from slack_bolt.listener.listener_executor import ListenerExecutor, ListenerExecutorMetrics
+
+
+class RecordingMetrics(ListenerExecutorMetrics):
+    def __init__(self):
+        self.queue_waits: List[Optional[str]] = []
+        self.run_times: List[Optional[str]] = []
+        self.errors: List[BaseException] = []
+        self.max_active_workers = 0
+        self.rejections: List[Optional[str]] = []
+
+    def record_queue_wait(self, *, name, seconds):
+        assert seconds >= 0
+        self.queue_waits.append(name)
+
+    def record_run_time(self, *, name, seconds, error):
+        assert seconds >= 0
+        self.run_times.append(name)
+        if error is not None:
+            self.errors.append(error)
+
+    def record_active_workers(self, *, active_workers, pending_tasks):
+        self.max_active_workers = max(self.max_active_workers, active_workers)
+
+    def record_rejection(self, *, name):
+        self.rejections.append(name)
+
+
+class TestListenerExecutor:
+    def test_submit(self):
+        metrics = RecordingMetrics()
+        executor = ListenerExecutor(max_workers=2, metrics=metrics)
+        assert executor.submit(lambda x: x * 2, 21).result(timeout=3) == 42
+        with pytest.raises(ValueError):
+            executor.submit_listener("broken", int, "foo").result(timeout=3)
+        executor.shutdown()
+
+        assert metrics.queue_waits == [None, "broken"]
+        assert metrics.run_times == [None, "broken"]
+        assert isinstance(metrics.errors[0], ValueError)
+        assert metrics.max_active_workers == 1
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+    def test_bounded_queue(self):
+        metrics = RecordingMetrics()
+        executor = ListenerExecutor(max_workers=1, max_queue_size=1, metrics=metrics)
+        release = threading.Event()
+        running = executor.submit(release.wait)
+        queued = executor.submit(lambda: "done")
+        with pytest.raises(BoltListenerExecutorSaturatedError):
+            executor.submit_listener("rejected", lambda: "never")
+        assert metrics.rejections == ["rejected"]
+        assert executor.pending_tasks == 2
+
+        release.set()
+        assert running.result(timeout=3) is True
+        assert queued.result(timeout=3) == "done"
+        executor.shutdown()
+        assert executor.pending_tasks == 0
+
+    def test_per_listener_concurrency(self):
+        executor = ListenerExecutor(max_workers=4, listener_max_concurrency={"limited": 1})
+        lock = threading.Lock()
+        running: List[str] = []
+        max_running = {"limited": 0, "unlimited": 0}
+
+        def task(name: str):
+            with lock:
+                running.append(name)
+                max_running[name] = max(max_running[name], running.count(name))
+            time.sleep(0.05)
+            with lock:
+                running.remove(name)
+
+        futures = [executor.submit_listener(name, task, name) for name in ["limited", "unlimited"] * 3]
+        for f in futures:
+            f.result(timeout=3)
+        executor.shutdown()
+        assert max_running["limited"] == 1
+        assert max_running["unlimited"] > 1
+
+    def test_drain(self):
+        executor = ListenerExecutor(max_workers=1, max_concurrency_per_listener=1)
+        results: List[int] = []
+        for i in range(3):
+            executor.submit_listener("listener", lambda i=i: time.sleep(0.01) or results.append(i))
+        assert executor.drain(timeout=3) is True
+        assert results == [0, 1, 2]
+        executor.shutdown()
+
+    def test_shutdown_cancel_futures(self):
+        executor = ListenerExecutor(max_workers=1)
+        release = threading.Event()
+        running = executor.submit(release.wait)
+        waiting = executor.submit(lambda: "never")
+        threading.Timer(0.05, release.set).start()
+        executor.shutdown(cancel_futures=True)
+        assert running.result() is True
+        assert waiting.cancelled()
+
+    def test_app_sheds_load(self):
+        executor = ListenerExecutor(max_workers=1, max_queue_size=0)
+        app = App(
+            signing_secret="secret",
+            request_verification_enabled=False,
+            authorize=lambda: AuthorizeResult(enterprise_id="E111", team_id="T111", bot_token="xoxb-valid"),
+            listener_executor=executor,
+        )
+        release = threading.Event()
+
+        @app.event("app_mention")
+        def handle_app_mention():
+            release.wait(timeout=3)
+
+        body = {
+            "type": "event_callback",
+            "team_id": "T111",
+            "enterprise_id": "E111",
+            "event": {"type": "app_mention", "user": "W111", "text": "<@U222> hi", "channel": "C111"},
+        }
+        assert app.dispatch(BoltRequest(body=body, mode="socket_mode")).status == 200
+        assert app.dispatch(BoltRequest(body=body, mode="socket_mode")).status == 503
+        release.set()
+        executor.shutdown()
+
+    def test_default_max_workers(self):
+        executor = ListenerExecutor()
+        try:
+            assert executor.max_workers == 5
+        finally:
+            executor.shutdown()
+        executor = ListenerExecutor(max_workers=None)
+        try:
+            assert executor.max_workers == min(32, (os.cpu_count() or 1) + 4)
+        finally:
+            executor.shutdown()
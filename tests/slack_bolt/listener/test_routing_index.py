@@ -0,0 +1,55 @@
+import re
+
+from slack_bolt.listener.routing_index import ListenerRoutingIndex, extract_routing_keys
+from slack_bolt.request.payload_kind import PayloadKind
+from slack_bolt.listener_matcher.builtins import action, command, event, options, view
+
+
+class TestListenerRoutingIndex:
+    def test_extract_routing_keys(self):
+        assert extract_routing_keys({}) == []
+        assert extract_routing_keys({"type": "event_callback", "event": {"type": "app_mention"}}) == [
+            ("event", "app_mention")
+        ]
+        assert extract_routing_keys({"command": "/hello", "text": "hi"}) == [("command", "/hello")]
+        assert extract_routing_keys({"type": "block_actions", "actions": [{"action_id": "a"}]}) == [("block_actions", "a")]
+        assert extract_routing_keys({"type": "block_actions", "actions": []}) == []
+        assert extract_routing_keys({"type": "view_submission", "view": {"callback_id": "v"}}) == [("view_submission", "v")]
+        assert extract_routing_keys({"type": "shortcut", "callback_id": "s"}) == [("shortcut", "s")]
+        assert extract_routing_keys({"type": "block_suggestion", "action_id": "o"}) == [("block_suggestion", "o")]
+
+    def test_builtin_matcher_routing_keys(self):
+        assert event("app_mention").routing_keys == [("event", "app_mention")]
+        assert event(re.compile("app_.+")).routing_keys is None
+        assert event({"type": "message", "subtype": None}).routing_keys == [("event", "message")]
+        assert command("/hello").routing_keys == [("command", "/hello")]
+        assert action({"action_id": "a", "block_id": "b"}).routing_keys == [("block_actions", "a")]
+        assert action({"block_id": "b"}).routing_keys is None
+        assert len(action("a").routing_keys) == 5
+        assert view("v").routing_keys == [("view_submission", "v")]
+        assert options("o").routing_keys == [("block_suggestion", "o"), ("dialog_suggestion", "o")]
+
+    def test_candidates_in_registration_order(self):
+        index = ListenerRoutingIndex()
+        index.add("a", [("event", "app_mention")])
+        index.add("b", None)
+        index.add("c", [("command", "/hello")])
+        index.add("d", [("event", "app_mention"), ("event", "app_mention")])
+        index.add("e", None)
+
+        body = {"type": "event_callback", "event": {"type": "app_mention"}}
+        assert list(index.candidates(body)) == ["a", "b", "d", "e"]
+        assert list(index.candidates({"command": "/hello"})) == ["b", "c", "e"]
+        assert list(index.candidates({"type": "block_actions", "actions": [{"action_id": "x"}]})) == ["b", "e"]
+        assert list(index.candidates({})) == ["b", "e"]
+        assert list(index.candidates(PayloadKind(body))) == ["a", "b", "d", "e"]
+
+    def test_candidates_with_multiple_keys(self):
+        index = ListenerRoutingIndex()
+        index.add("a", [("event", "app_mention"), ("command", "/hello")])
+        index.add("b", [("command", "/hello")])
+        index.add("c", [("event", "app_mention")])
+
+        # A weird payload that has both keys
+        body = {"type": "event_callback", "event": {"type": "app_mention"}, "command": "/hello"}
+        assert list(index.candidates(body)) == ["a", "b", "c"]
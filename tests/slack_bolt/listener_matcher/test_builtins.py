@@ -8,7 +8,9 @@ from slack_bolt.listener_matcher.builtins import (
     action,
     workflow_step_execute,
     event,
+    message_event,
     shortcut,
+    build_listener_matcher,
 )
 
 
@@ -151,6 +153,40 @@ class TestBuiltins:
         m = shortcut({"callback_id": "test-shortcut!!!", "type": "message_action"})
         assert not m.matches(request, None)
 
+    def test_message_event_subtypes(self):
+        message = {"type": "message", "text": "Hi there!", "user": "W222", "ts": "111.222"}
+        body = {"type": "event_callback", "event": message}
+        request = BoltRequest(body=json.dumps(body))
+
+        assert event({"type": "message", "subtype": None}).matches(request, None)
+        assert not event({"type": "message", "subtype": "bot_message"}).matches(request, None)
+        assert event({"type": "message", "subtype": (None, "bot_message")}).matches(request, None)
+        assert not event({"type": "message", "subtype": ("bot_message", re.compile("file_.+"))}).matches(request, None)
+        assert message_event({"type": "message", "subtype": (None,)}, keyword="Hi").matches(request, None)
+        assert message_event({"type": "message"}, keyword=re.compile("there!$")).matches(request, None)
+        assert not message_event({"type": "message"}, keyword="Hello").matches(request, None)
+
+        body["event"] = dict(message, subtype="file_share")
+        request = BoltRequest(body=json.dumps(body))
+        assert not event({"type": "message", "subtype": None}).matches(request, None)
+        assert event({"type": "message", "subtype": "file_share"}).matches(request, None)
+        assert event({"type": "message", "subtype": ("bot_message", re.compile("file_.+"))}).matches(request, None)
+        assert not event({"type": "app_mention", "subtype": "file_share"}).matches(request, None)
+
+    def test_body_only_matchers(self):
+        request = BoltRequest(body=json.dumps(event_payload))
+
+        m = event("app_mention")
+        assert m.payload_kind_only is True
+        assert m.matches(request, None)
+
+        def with_context(body, context):
+            return context.team_id == "T111" and body["event"]["type"] == "app_mention"
+
+        m = build_listener_matcher(with_context, asyncio=False)
+        assert m.body_only is False
+        assert m.matches(request, None)
+
 
 event_payload = {
     "team_id": "T111",
@@ -0,0 +1,81 @@
+import logging
+
+from slack_bolt import App
+from slack_bolt.logger import clear_logger_cache, get_bolt_app_logger, get_bolt_logger
+from slack_bolt.request import BoltRequest
+
+
+class TestLogger:
+    def setup_method(self):
+        clear_logger_cache()
+
+    def teardown_method(self):
+        clear_logger_cache()
+
+    def test_level_synchronized(self):
+        base_logger = logging.getLogger("test_logger.base")
+        base_logger.setLevel(logging.WARNING)
+        logger = get_bolt_app_logger(app_name="test-app", base_logger=base_logger)
+        assert logger.level == logging.WARNING
+        assert not logger.isEnabledFor(logging.INFO)
+
+        base_logger.setLevel(logging.INFO)
+        assert get_bolt_app_logger(app_name="test-app", base_logger=base_logger) is logger
+        assert logger.level == logging.INFO
+        assert logger.isEnabledFor(logging.INFO)
+
+        base_logger.disabled = True
+        try:
+            get_bolt_app_logger(app_name="test-app", base_logger=base_logger)
+            assert logger.disabled is True
+        finally:
+            base_logger.disabled = False
+
+    def test_root_level_synchronized(self):
+        root_level = logging.root.level
+        try:
+            logging.root.setLevel(logging.WARNING)
+            logger = get_bolt_app_logger(app_name="test-root-app")
+            assert logger.level == logging.WARNING
+
+            # e.g., logging.basicConfig(level=logging.DEBUG) after App()
+            logging.root.setLevel(logging.DEBUG)
+            assert get_bolt_app_logger(app_name="test-root-app") is logger
+            assert logger.level == logging.DEBUG
+        finally:
+            logging.root.setLevel(root_level)
+
+    def test_handlers_copied(self):
+        base_logger = logging.getLogger("test_logger.handlers")
+        handler = logging.NullHandler()
+        base_logger.addHandler(handler)
+        try:
+            logger = get_bolt_logger(TestLogger, base_logger=base_logger)
+            assert logger.handlers == [handler]
+            assert get_bolt_logger(TestLogger, base_logger=base_logger) is logger
+        finally:
+            base_logger.removeHandler(handler)
+            logging.getLogger(f"slack_bolt.{TestLogger.__name__}").handlers.clear()
+
+    def test_app_context_logger(self):
+        base_logger = logging.getLogger("test_logger.app")
+        base_logger.setLevel(logging.INFO)
+        app = App(
+            name="test-logger-app",
+            signing_secret="secret",
+            token="xoxb-valid",
+            token_verification_enabled=False,
+            logger=base_logger,
+        )
+        req = BoltRequest(body={}, mode="socket_mode")
+        app._init_context(req)
+        logger = req.context["logger"]
+        assert logger.name == "test-logger-app"
+        assert logger.level == logging.INFO
+
+        base_logger.setLevel(logging.DEBUG)
+        clear_logger_cache()
+        another_req = BoltRequest(body={}, mode="socket_mode")
+        app._init_context(another_req)
+        assert another_req.context["logger"] is logger
+        assert logger.level == logging.DEBUG
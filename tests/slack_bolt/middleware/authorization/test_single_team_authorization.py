@@ -1,3 +1,6 @@
+import json
+from typing import Optional
+
 from slack_sdk import WebClient
 from slack_sdk.web import SlackResponse
 
@@ -6,6 +9,7 @@ from slack_bolt.middleware.authorization.internals import _build_user_facing_aut
 from slack_bolt.request import BoltRequest
 from slack_bolt.response import BoltResponse
 from tests.mock_web_api_server import (
+    assert_auth_test_count,
     setup_mock_web_api_server,
     cleanup_mock_web_api_server,
 )
@@ -79,3 +83,82 @@ class TestSingleTeamAuthorization:
 
         assert resp.status == 200
         assert resp.body == "foo"
+
+    def test_authorize_result_reused(self):
+        client = WebClient(base_url=self.mock_api_server_base_url, token="xoxb-valid")
+        authorization = SingleTeamAuthorization()
+        results = []
+        for user_id in [None, None, "W111", "W222"]:
+            req = BoltRequest(body=_build_event_body("app_mention", user_id), headers=json_headers)
+            req.context["client"] = client
+            resp = authorization.process(req=req, resp=BoltResponse(status=404), next=next)
+            assert resp.status == 200
+            results.append(req.context.authorize_result)
+
+        assert_auth_test_count(self, 1)
+        assert results[0] is results[1]
+        assert results[2].user_id == "W111"
+        assert results[2]["user_id"] == "W111"
+        assert results[3].user_id == "W222"
+        assert results[3].bot_scopes == results[0].bot_scopes == ["chat:write", "commands"]
+        assert results[0].user_id is None
+
+    def test_refresh_on_tokens_revoked(self):
+        client = WebClient(base_url=self.mock_api_server_base_url, token="xoxb-valid")
+        authorization = SingleTeamAuthorization()
+        req = BoltRequest(body=_build_event_body("app_mention"), headers=json_headers)
+        req.context["client"] = client
+        authorization.process(req=req, resp=BoltResponse(status=404), next=next)
+        first_result = req.context.authorize_result
+
+        req = BoltRequest(body=_build_event_body("tokens_revoked"), headers=json_headers)
+        req.context["client"] = client
+        authorization.process(req=req, resp=BoltResponse(status=404), next=next)
+        assert authorization.auth_test_result is None
+
+        req = BoltRequest(body=_build_event_body("app_mention"), headers=json_headers)
+        req.context["client"] = client
+        authorization.process(req=req, resp=BoltResponse(status=404), next=next)
+        assert req.context.authorize_result is not first_result
+        assert_auth_test_count(self, 2)
+
+    def test_invalidated_while_processing(self):
+        authorization = SingleTeamAuthorization()
+
+        class InvalidatingWebClient(WebClient):
+            # Emulates a tokens_revoked event handled by another thread in the middle of a request
+            @property
+            def token(self):
+                authorization.invalidate()
+                return self._token
+
+            @token.setter
+            def token(self, value):
+                self._token = value
+
+        req = BoltRequest(body=_build_event_body("app_mention"), headers=json_headers)
+        req.context["client"] = InvalidatingWebClient(base_url=self.mock_api_server_base_url, token="xoxb-valid")
+        resp = authorization.process(req=req, resp=BoltResponse(status=404), next=next)
+        assert resp.status == 200
+        assert req.context.authorize_result.bot_token == "xoxb-valid"
+        assert authorization.auth_test_result is None
+
+    def test_refresh_interval(self):
+        client = WebClient(base_url=self.mock_api_server_base_url, token="xoxb-valid")
+        authorization = SingleTeamAuthorization(auth_test_refresh_interval_seconds=0)
+        for _ in range(3):
+            req = BoltRequest(body=_build_event_body("app_mention"), headers=json_headers)
+            req.context["client"] = client
+            resp = authorization.process(req=req, resp=BoltResponse(status=404), next=next)
+            assert resp.status == 200
+        assert_auth_test_count(self, 3)
+
+
+json_headers = {"content-type": ["application/json"]}
+
+
+def _build_event_body(event_type: str, user_id: Optional[str] = None) -> str:
+    event = {"type": event_type}
+    if user_id is not None:
+        event["user"] = user_id
+    return json.dumps({"type": "event_callback", "team_id": "T111", "api_app_id": "A111", "event": event})
@@ -39,6 +39,16 @@ class TestRequestVerification:
         assert resp.status == 200
         assert resp.body == "next"
 
+    def test_valid_bytes_body(self):
+        middleware = RequestVerification(signing_secret=self.signing_secret)
+        timestamp = str(int(time()))
+        raw_body = "payload=%7B%22text%22%3A%22%E3%81%82%22%7D"
+        req = BoltRequest(body=raw_body.encode("utf-8"), headers=self.build_headers(timestamp, raw_body))
+        resp = BoltResponse(status=404, body="default")
+        resp = middleware.process(req=req, resp=resp, next=next)
+        assert resp.status == 200
+        assert resp.body == "next"
+
     def test_invalid(self):
         middleware = RequestVerification(signing_secret=self.signing_secret)
         req = BoltRequest(body="payload={}", headers={})
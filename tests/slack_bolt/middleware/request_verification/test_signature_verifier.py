@@ -0,0 +1,51 @@
+from time import time
+
+from slack_sdk.signature import Clock, SignatureVerifier
+
+from slack_bolt.middleware.request_verification.signature_verifier import PreparedSignatureVerifier
+
+
+class MockClock(Clock):
+    def now(self) -> float:
+        return 1531420618
+
+
+class TestPreparedSignatureVerifier:
+    signing_secret = "8f742231b10e8888abcd99yyyzzz85a5"
+    # https://docs.slack.dev/authentication/verifying-requests-from-slack/
+    body = (
+        "token=xyzz0WbapA4vBCDEFasx0q6G&team_id=T1DC2JH3J&team_domain=testteamnow&channel_id=G8PSS9T3V"
+        "&channel_name=foobar&user_id=U2CERLKJA&user_name=roadrunner&command=%2Fwebhook-collect&text="
+        "&response_url=https%3A%2F%2Fhooks.slack.com%2Fcommands%2FT1DC2JH3J%2F397700885554%2F96rGlfmibIGlgcZRskXaIFfN"
+        "&trigger_id=398738663015.47445629121.803a0bc887a14d10d2c447fce8b6703c"
+    )
+    timestamp = "1531420618"
+    valid_signature = "v0=a2114d57b48eac39b9ad189dd8316235a7b4a8d21a10bd27519666489c69b503"
+
+    def test_valid(self):
+        verifier = PreparedSignatureVerifier(signing_secret=self.signing_secret, clock=MockClock())
+        assert verifier.is_valid(self.body, self.timestamp, self.valid_signature) is True
+        assert verifier.is_valid(self.body.encode("utf-8"), self.timestamp, self.valid_signature) is True
+        assert verifier.is_valid(memoryview(self.body.encode("utf-8")), self.timestamp, self.valid_signature) is True
+        # The prepared HMAC object is not modified by verifications
+        assert verifier.is_valid(self.body, self.timestamp, self.valid_signature) is True
+
+    def test_same_as_signature_verifier(self):
+        verifier = PreparedSignatureVerifier(signing_secret="secret")
+        timestamp = str(int(time()))
+        body = "payload=" + "日本語" * 1000
+        signature = SignatureVerifier(signing_secret="secret").generate_signature(timestamp=timestamp, body=body)
+        assert verifier.is_valid(body, timestamp, signature) is True
+        assert verifier.is_valid(body + "x", timestamp, signature) is False
+
+    def test_invalid(self):
+        verifier = PreparedSignatureVerifier(signing_secret=self.signing_secret, clock=MockClock())
+        assert verifier.is_valid(self.body, self.timestamp, "v0=invalid") is False
+        assert verifier.is_valid(self.body, self.timestamp, self.valid_signature[3:]) is False
+        assert verifier.is_valid(self.body, self.timestamp, None) is False
+        assert verifier.is_valid(self.body, None, self.valid_signature) is False
+        assert verifier.is_valid(self.body, "invalid", self.valid_signature) is False
+
+    def test_stale_timestamp(self):
+        verifier = PreparedSignatureVerifier(signing_secret=self.signing_secret)
+        assert verifier.is_valid(self.body, self.timestamp, self.valid_signature) is False
@@ -0,0 +1,128 @@
+from typing import List, Tuple
+
+from slack_bolt import App, BoltRequest, BoltResponse
+from slack_bolt.authorization import AuthorizeResult
+from slack_bolt.middleware import IgnoringSelfEvents, SslCheck, UrlVerification
+from slack_bolt.middleware.middleware import Middleware
+from slack_bolt.middleware.middleware_chain import MiddlewareChain, MiddlewareMetrics
+
+
+class RecordingMiddleware(Middleware):
+    def __init__(self, name: str, calls: List[str], calls_next: bool = True):
+        self._name = name
+        self.calls = calls
+        self.calls_next = calls_next
+
+    def process(self, *, req, resp, next):
+        self.calls.append(self._name)
+        if self.calls_next:
+            next()
+        return resp
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+
+class RecordingMetrics(MiddlewareMetrics):
+    def __init__(self):
+        self.records: List[Tuple[str, bool]] = []
+
+    def record_middleware_time(self, *, request, name, seconds, next_called):
+        assert seconds >= 0
+        self.records.append((name, next_called))
+
+
+def build_request(body: dict) -> BoltRequest:
+    return BoltRequest(body=body, mode="socket_mode")
+
+
+class TestMiddlewareChain:
+    def test_run(self):
+        calls: List[str] = []
+        chain = MiddlewareChain(
+            [
+                RecordingMiddleware("first", calls),
+                RecordingMiddleware("second", calls, calls_next=False),
+                RecordingMiddleware("third", calls),
+            ]
+        )
+        assert chain.names == ("first", "second", "third")
+        resp = BoltResponse(status=200)
+        assert chain.run(req=build_request({"type": "block_actions"}), resp=resp) == (resp, 1)
+        assert calls == ["first", "second"]
+
+        assert MiddlewareChain([RecordingMiddleware("first", calls)]).run(req=build_request({}), resp=resp) == (resp, None)
+
+    def test_skipping_builtin_middleware(self):
+        calls: List[str] = []
+        chain = MiddlewareChain([SslCheck(), IgnoringSelfEvents(), UrlVerification(), RecordingMiddleware("custom", calls)])
+        resp, stopped_at = chain.run(req=build_request({"type": "block_actions"}), resp=BoltResponse(status=200))
+        # Skipping the built-in middleware is the same as running them: they return next()'s result
+        assert resp is None
+        assert stopped_at is None
+        assert calls == ["custom"]
+
+        resp, stopped_at = chain.run(
+            req=build_request({"type": "url_verification", "challenge": "xxx"}),
+            resp=BoltResponse(status=200),
+        )
+        assert resp.body == '{"challenge": "xxx"}'
+        assert stopped_at == 2
+
+    def test_metrics(self):
+        calls: List[str] = []
+        metrics = RecordingMetrics()
+        chain = MiddlewareChain(
+            [UrlVerification(), RecordingMiddleware("first", calls), RecordingMiddleware("second", calls, False)],
+            metrics=metrics,
+        )
+        chain.run(req=build_request({"type": "block_actions"}), resp=BoltResponse(status=200))
+        assert metrics.records == [("first", True), ("second", False)]
+
+    def test_app_recompiles_chain(self):
+        metrics = RecordingMetrics()
+        app = App(
+            signing_secret="secret",
+            request_verification_enabled=False,
+            authorize=lambda: AuthorizeResult(enterprise_id="E111", team_id="T111", bot_token="xoxb-valid"),
+            middleware_metrics=metrics,
+        )
+        calls: List[str] = []
+
+        @app.use
+        def custom_middleware(next):
+            calls.append("custom")
+            next()
+
+        @app.shortcut("test-shortcut")
+        def handle_shortcut(ack):
+            ack()
+
+        body = {"type": "shortcut", "team": {"id": "T111"}, "user": {"id": "W111"}, "callback_id": "test-shortcut"}
+        response = app.dispatch(build_request(body))
+        assert response.status == 200
+        assert calls == ["custom"]
+        assert [name for name, _ in metrics.records][-1] == "CustomMiddleware(func=custom_middleware)"
+
+    def test_listener_recompiles_chain_on_replacement(self):
+        app = App(
+            signing_secret="secret",
+            request_verification_enabled=False,
+            authorize=lambda: AuthorizeResult(enterprise_id="E111", team_id="T111", bot_token="xoxb-valid"),
+        )
+        calls: List[str] = []
+
+        @app.shortcut("test-shortcut", middleware=[RecordingMiddleware("first", calls)])
+        def handle_shortcut(ack):
+            ack()
+
+        body = {"type": "shortcut", "team": {"id": "T111"}, "user": {"id": "W111"}, "callback_id": "test-shortcut"}
+        assert app.dispatch(build_request(body)).status == 200
+        assert calls == ["first"]
+
+        # Replace an element of the same list object, keeping its length
+        listener = app._listeners[-1]
+        listener.middleware[0] = RecordingMiddleware("second", calls)
+        assert app.dispatch(build_request(body)).status == 200
+        assert calls == ["first", "second"]
@@ -0,0 +1,81 @@
+from threading import Event
+
+from slack_sdk.oauth.installation_store import Installation
+
+from slack_bolt.oauth.installation_pipeline import InstallationPipeline
+
+
+def build_installation() -> Installation:
+    return Installation(app_id="A111", team_id="T111", user_id="W111", bot_token="xoxb-valid")
+
+
+class TestInstallationPipeline:
+    def test_submit(self):
+        pipeline = InstallationPipeline()
+        saved = []
+        try:
+            installation = build_installation()
+            assert pipeline.submit(installation, lambda: saved.append(installation)) is True
+            pipeline.join()
+            assert saved == [installation]
+            assert pipeline.completed_count == 1
+            assert pipeline.failed_count == 0
+        finally:
+            pipeline.shutdown()
+
+    def test_retry(self):
+        pipeline = InstallationPipeline(max_attempts=3, retry_interval_seconds=0.01)
+        attempts = []
+
+        def flaky_save():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise Exception("database is temporarily unavailable")
+
+        try:
+            pipeline.submit(build_installation(), flaky_save)
+            pipeline.join()
+            assert len(attempts) == 3
+            assert pipeline.completed_count == 1
+            assert pipeline.failed_count == 0
+        finally:
+            pipeline.shutdown()
+
+    def test_error_handler(self):
+        errors = []
+        pipeline = InstallationPipeline(
+            max_attempts=2,
+            retry_interval_seconds=0.01,
+            error_handler=lambda installation, e: errors.append((installation.team_id, str(e))),
+        )
+
+        def failing_save():
+            raise Exception("database is down")
+
+        try:
+            pipeline.submit(build_installation(), failing_save)
+            pipeline.join()
+            assert errors == [("T111", "database is down")]
+            assert pipeline.completed_count == 0
+            assert pipeline.failed_count == 1
+        finally:
+            pipeline.shutdown()
+
+    def test_bounded_queue(self):
+        pipeline = InstallationPipeline(worker_count=1, max_queue_size=1)
+        started, release = Event(), Event()
+
+        def blocking_save():
+            started.set()
+            release.wait()
+
+        try:
+            assert pipeline.submit(build_installation(), blocking_save) is True
+            assert started.wait(timeout=1)
+            assert pipeline.submit(build_installation(), lambda: None) is True
+            assert pipeline.queue_size == 1
+            assert pipeline.submit(build_installation(), lambda: None) is False
+        finally:
+            release.set()
+            pipeline.shutdown()
+        assert pipeline.completed_count == 2
@@ -1,7 +1,9 @@
 import json
+from threading import Event
 from time import time
 from urllib.parse import quote
 
+import pytest
 from slack_sdk import WebClient
 from slack_sdk.oauth.installation_store import FileInstallationStore
 from slack_sdk.oauth.state_store import (
@@ -11,9 +13,14 @@ from slack_sdk.oauth.state_store import (
 from slack_sdk.signature import SignatureVerifier
 
 from slack_bolt import BoltRequest, BoltResponse, App
+from slack_bolt.authorization.authorize import InstallationStoreAuthorize
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache, build_authorize_result_cache_key
+from slack_bolt.error import BoltError
 from slack_bolt.oauth import OAuthFlow
 from slack_bolt.oauth.callback_options import CallbackOptions, SuccessArgs, FailureArgs
+from slack_bolt.oauth.installation_pipeline import InstallationPipeline
 from slack_bolt.oauth.oauth_settings import OAuthSettings
+from slack_bolt.oauth.signed_state_store import SignedOAuthStateStore
 from tests.mock_web_api_server import (
     cleanup_mock_web_api_server,
     setup_mock_web_api_server,
@@ -182,6 +189,125 @@ class TestOAuthFlow:
         assert response.status == 200
         assert_auth_test_count(self, 1)
 
+    def test_handle_callback_installation_pipeline(self):
+        release = Event()
+        saved = []
+
+        class BlockingInstallationStore(FileInstallationStore):
+            def save(self, installation):
+                release.wait(timeout=1)
+                saved.append(installation)
+
+        pipeline = InstallationPipeline()
+        oauth_flow = OAuthFlow(
+            client=WebClient(base_url=self.mock_api_server_base_url),
+            settings=OAuthSettings(
+                client_id="111.222",
+                client_secret="xxx",
+                scopes=["chat:write", "commands"],
+                installation_store=BlockingInstallationStore(),
+                state_store=FileOAuthStateStore(expiration_seconds=120),
+                success_url="https://www.example.com/completion",
+                failure_url="https://www.example.com/failure",
+                installation_pipeline=pipeline,
+            ),
+        )
+        state = oauth_flow.issue_new_state(None)
+        req = BoltRequest(
+            body="",
+            query=f"code=foo&state={state}",
+            headers={"cookie": [f"{oauth_flow.settings.state_cookie_name}={state}"]},
+        )
+        try:
+            resp = oauth_flow.handle_callback(req)
+            # The completion page is displayed before the installation is saved
+            assert resp.status == 200
+            assert "https://www.example.com/completion" in resp.body
+            assert saved == []
+
+            release.set()
+            pipeline.join()
+            assert len(saved) == 1
+            assert saved[0].team_id == "T9TK3CUKW"
+        finally:
+            release.set()
+            pipeline.shutdown()
+
+    def test_handle_callback_invalidates_authorize_result_cache(self):
+        settings = OAuthSettings(
+            client_id="111.222",
+            client_secret="xxx",
+            scopes=["chat:write", "commands"],
+            installation_store=FileInstallationStore(),
+            state_store=FileOAuthStateStore(expiration_seconds=120),
+        )
+        settings.authorize = InstallationStoreAuthorize(
+            logger=settings.authorize.logger,
+            installation_store=settings.installation_store,
+            authorize_result_cache=AuthorizeResultCache(),
+        )
+        oauth_flow = OAuthFlow(client=WebClient(base_url=self.mock_api_server_base_url), settings=settings)
+        cache = oauth_flow.authorize_result_cache
+        assert cache is settings.authorize.authorize_result_cache
+
+        installed_key = build_authorize_result_cache_key(
+            enterprise_id="E12345678", team_id="T9TK3CUKW", user_id=None, is_enterprise_install=False
+        )
+        other_key = build_authorize_result_cache_key(
+            enterprise_id="E12345678", team_id="T222", user_id=None, is_enterprise_install=False
+        )
+        # The workspace was unknown before the installation
+        cache.set_not_found(installed_key)
+        cache.set_not_found(other_key)
+
+        state = oauth_flow.issue_new_state(None)
+        req = BoltRequest(
+            body="",
+            query=f"code=foo&state={state}",
+            headers={"cookie": [f"{oauth_flow.settings.state_cookie_name}={state}"]},
+        )
+        resp = oauth_flow.handle_callback(req)
+        assert resp.status == 200
+        assert cache.get(installed_key) == (False, None)
+        assert cache.get(other_key) == (True, None)
+
+    def test_handle_callback_signed_state(self):
+        oauth_flow = OAuthFlow(
+            client=WebClient(base_url=self.mock_api_server_base_url),
+            settings=OAuthSettings(
+                client_id="111.222",
+                client_secret="xxx",
+                scopes=["chat:write", "commands"],
+                installation_store=FileInstallationStore(),
+                state_signing_enabled=True,
+                success_url="https://www.example.com/completion",
+                failure_url="https://www.example.com/failure",
+            ),
+        )
+        assert isinstance(oauth_flow.settings.state_store, SignedOAuthStateStore)
+        state = oauth_flow.issue_new_state(None)
+        req = BoltRequest(
+            body="",
+            query=f"code=foo&state={state}",
+            headers={"cookie": [f"{oauth_flow.settings.state_cookie_name}={state}"]},
+        )
+        resp = oauth_flow.handle_callback(req)
+        assert resp.status == 200
+        assert "https://www.example.com/completion" in resp.body
+
+        # The same state cannot be used twice
+        resp = oauth_flow.handle_callback(req)
+        assert resp.status == 401
+
+    def test_signed_state_conflicts(self):
+        with pytest.raises(BoltError):
+            OAuthSettings(
+                client_id="111.222",
+                client_secret="xxx",
+                state_store=FileOAuthStateStore(expiration_seconds=120),
+                state_signing_enabled=True,
+            )
+
     def test_handle_callback_invalid_state(self):
         oauth_flow = OAuthFlow(
             settings=OAuthSettings(
@@ -0,0 +1,51 @@
+import time
+
+from slack_bolt.oauth.signed_state_store import SignedOAuthStateStore
+
+
+class TestSignedOAuthStateStore:
+    def test_issue_and_consume(self):
+        store = SignedOAuthStateStore(signing_secret="secret")
+        state = store.issue()
+        assert store.consume(state) is True
+
+    def test_replay(self):
+        store = SignedOAuthStateStore(signing_secret="secret")
+        state = store.issue()
+        assert store.consume(state) is True
+        assert store.consume(state) is False
+
+    def test_another_instance(self):
+        state = SignedOAuthStateStore(signing_secret="secret").issue()
+        assert SignedOAuthStateStore(signing_secret="secret").consume(state) is True
+        assert SignedOAuthStateStore(signing_secret="another").consume(state) is False
+
+    def test_invalid(self):
+        store = SignedOAuthStateStore(signing_secret="secret")
+        expires_at, nonce, signature = store.issue().split(".")
+        assert store.consume("") is False
+        assert store.consume("invalid") is False
+        assert store.consume(f"{expires_at}.{nonce}.invalid") is False
+        assert store.consume(f"{int(expires_at) + 60}.{nonce}.{signature}") is False
+        assert store.consume(f"x.{nonce}.{signature}") is False
+        assert store.consume(f"{expires_at}.{nonce}.é") is False
+        assert store.consume(f"{expires_at}.é.{signature}") is False
+
+    def test_expired(self):
+        store = SignedOAuthStateStore(signing_secret="secret", expiration_seconds=-1)
+        assert store.consume(store.issue()) is False
+
+    def test_bounded_replay_protection(self):
+        store = SignedOAuthStateStore(signing_secret="secret", max_consumed_states=2)
+        states = [store.issue() for _ in range(3)]
+        for state in states:
+            assert store.consume(state) is True
+        assert len(store._consumed) == 2
+        assert store.consume(states[2]) is False
+
+    def test_expired_nonces_removed(self):
+        store = SignedOAuthStateStore(signing_secret="secret", expiration_seconds=1)
+        assert store.consume(store.issue()) is True
+        time.sleep(2.1)
+        assert store.consume(store.issue()) is True
+        assert len(store._consumed) == 1
@@ -1,3 +1,5 @@
+from urllib.parse import quote, quote_plus, unquote_plus
+
 import pytest
 
 from slack_bolt.request.internals import (
@@ -14,6 +16,8 @@ from slack_bolt.request.internals import (
     extract_actor_user_id,
     extract_function_execution_id,
     extract_thread_ts,
+    extract_form_payload,
+    parse_body,
 )
 
 
@@ -604,6 +608,35 @@ class TestRequestInternals:
         with pytest.raises(ValueError):
             parse_query({"foo": {"bar": "ZZZ"}, "baz": {"123": "111"}})
 
+    def test_parse_body(self):
+        assert parse_body("", None) == {}
+        assert parse_body('{"type":"event_callback"}', "application/json") == {"type": "event_callback"}
+        assert parse_body("payload=%7B%22type%22%3A%22shortcut%22%7D", "application/x-www-form-urlencoded") == {
+            "type": "shortcut"
+        }
+        assert parse_body("token=xxx&command=%2Fhello&text=payload+foo", None) == {
+            "token": "xxx",
+            "command": "/hello",
+            "text": "payload foo",
+        }
+
+    def test_extract_form_payload(self):
+        assert extract_form_payload("payload=%7B%22a%22%3A+1%7D") == '{"a": 1}'
+        assert extract_form_payload("foo=bar&payload=%7B%7D&baz=1") == "{}"
+        assert extract_form_payload("text=payload%3D1&xpayload=2") is None
+        assert extract_form_payload("payload=1&payload=2") == "2"
+        assert extract_form_payload("payload=") == ""
+
+    def test_extract_form_payload_decoding(self):
+        values = [
+            '{"text": "Hello, world! <@W111> & ~ 100% + 日本語 \\n"}',
+            "a=b %zz 100%",
+            "line1\nline2 ",
+        ]
+        for value in values:
+            for encoded in [quote(value), quote_plus(value), value.replace("=", "%3D").replace("&", "%26")]:
+                assert extract_form_payload(f"payload={encoded}") == unquote_plus(encoded)
+
     slack_connect_from_non_grid_test_patterns = [
         (
             {
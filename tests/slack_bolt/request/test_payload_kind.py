@@ -0,0 +1,73 @@
+import json
+from urllib.parse import quote
+
+from slack_bolt.request.payload_kind import PayloadKind
+from slack_bolt.request.request import BoltRequest
+
+
+class TestPayloadKind:
+    def setup_method(self):
+        pass
+
+    def teardown_method(self):
+        pass
+
+    def test_empty(self):
+        kind = PayloadKind({})
+        assert kind.type is None
+        assert kind.is_event is False
+        assert kind.is_slash_command is False
+        assert kind.action_ids == ()
+        assert kind.action_id is None
+
+    def test_events(self):
+        kind = PayloadKind(
+            {
+                "type": "event_callback",
+                "event": {"type": "message", "subtype": "bot_message", "text": "hi"},
+            }
+        )
+        assert kind.type == "event_callback"
+        assert kind.is_event is True
+        assert kind.event_type == "message"
+        assert kind.event_subtype == "bot_message"
+        assert kind.callback_id is None
+
+        # $.event.type is required
+        assert PayloadKind({"type": "event_callback", "event": {}}).is_event is False
+
+    def test_commands(self):
+        kind = PayloadKind({"command": "/hello", "text": "hi"})
+        assert kind.type is None
+        assert kind.is_slash_command is True
+        assert kind.command == "/hello"
+
+    def test_block_actions(self):
+        kind = PayloadKind({"type": "block_actions", "actions": [{"action_id": "a"}, {"action_id": "b"}]})
+        assert kind.action_ids == ("a", "b")
+        assert kind.action_id == "a"
+        assert PayloadKind({"type": "block_actions", "actions": []}).action_id is None
+        assert PayloadKind({"type": "block_suggestion", "action_id": "o"}).action_ids == ("o",)
+
+    def test_views(self):
+        kind = PayloadKind({"type": "view_submission", "view": {"type": "workflow_step", "callback_id": "v"}})
+        assert kind.callback_id == "v"
+        assert kind.view_type == "workflow_step"
+        assert PayloadKind({"type": "view_closed", "view": {"callback_id": "v"}}).callback_id == "v"
+        assert PayloadKind({"type": "shortcut", "callback_id": "s"}).callback_id == "s"
+
+    def test_request(self):
+        body = {"type": "view_submission", "view": {"type": "modal", "callback_id": "v"}}
+        req = BoltRequest(body="payload=" + quote(json.dumps(body)))
+        kind = req.payload_kind
+        assert kind is req.context.payload_kind
+        assert kind is req.payload_kind
+        assert kind.callback_id == "v"
+
+        # The value is shared with the lazy listener requests
+        assert req.to_lazy_request("lazy").payload_kind is kind
+
+        # The value is extracted again when the body is replaced
+        req.body = {"command": "/hello"}
+        assert req.payload_kind is not kind
+        assert req.payload_kind.command == "/hello"
@@ -22,6 +22,50 @@ class TestRequest:
         assert req.raw_body == ""
         assert req.body == {}
 
+    def test_bytes_body(self):
+        raw_body = b'{"type":"event_callback","team_id":"T111","event":{"type":"app_mention","text":"\xe3\x81\x82"}}'
+        req = BoltRequest(body=raw_body, headers={"content-type": "application/json"})
+        assert req.raw_body_bytes is raw_body
+        assert req.body["event"]["text"] == "\u3042"
+        assert req.context.team_id == "T111"
+        assert req.raw_body == raw_body.decode("utf-8")
+
+        form_body = ("payload=" + quote('{"type":"block_actions","team":{"id":"T111"},"actions":[]}')).encode("utf-8")
+        req = BoltRequest(body=memoryview(form_body))
+        assert req.raw_body_bytes == form_body
+        assert req.body["type"] == "block_actions"
+        assert req.context.team_id == "T111"
+
+        copied_req = req.to_copyable()
+        assert copied_req.raw_body_bytes == form_body
+        assert copied_req.body == req.body
+
+        req.raw_body = "token=verification_token"
+        assert req.raw_body_bytes is None
+        assert req.raw_body == "token=verification_token"
+
+    def test_to_lazy_request(self):
+        req = BoltRequest(body="payload=" + quote('{"type":"block_actions","team":{"id":"T111"},"actions":[]}'))
+        ack = req.context.ack
+        req.context["listener_runner"] = object()
+        req.context["custom"] = {"foo": "bar"}
+
+        lazy_req = req.to_lazy_request("lazy_func")
+        assert lazy_req.lazy_only is True
+        assert lazy_req.lazy_function_name == "lazy_func"
+        assert lazy_req.body is req.body
+        assert lazy_req.raw_body == req.raw_body
+        assert lazy_req.context is not req.context
+        assert lazy_req.context.team_id == "T111"
+        assert lazy_req.context["custom"] == req.context["custom"]
+        assert lazy_req.context["custom"] is not req.context["custom"]
+        assert "listener_runner" not in lazy_req.context
+        assert lazy_req.context.ack is not ack
+        # The original request is not affected
+        assert req.lazy_only is False
+        lazy_req.context["foo"] = "bar"
+        assert "foo" not in req.context
+
     def test_org_wide_installations_block_actions(self):
         payload = """
 {
@@ -0,0 +1,69 @@
+import pytest
+
+from slack_bolt import BoltRequest, BoltResponse
+from slack_bolt.error import BoltError
+from slack_bolt.util.json_codec import (
+    JSONCodec,
+    OrjsonCodec,
+    build_json_codec,
+    get_json_codec,
+    set_json_codec,
+)
+
+
+class TestJSONCodec:
+    def setup_method(self):
+        self.default_codec = get_json_codec()
+
+    def teardown_method(self):
+        set_json_codec(self.default_codec)
+
+    def test_default(self):
+        codec = get_json_codec()
+        assert codec.name == "json"
+        assert codec.dumps({"text": "Hi"}) == '{"text": "Hi"}'
+        assert codec.loads(b'{"text": "Hi"}') == {"text": "Hi"}
+
+    @pytest.mark.parametrize("name", ["orjson", "ujson"])
+    def test_alternative_backends(self, name: str):
+        pytest.importorskip(name)
+        codec = build_json_codec(name)
+        assert codec.name == name
+        data = {"text": "日本語 https://example.com/", "blocks": [{"type": "divider"}], "ok": True, "count": 1}
+        assert codec.loads(codec.dumps(data)) == data
+        assert codec.loads(codec.dumps(data).encode("utf-8")) == data
+        assert "\\/" not in codec.dumps(data)
+
+    def test_orjson_fallback(self):
+        pytest.importorskip("orjson")
+        # orjson does not accept non-str keys
+        assert OrjsonCodec().dumps({1: "one"}) == '{"1": "one"}'
+
+    def test_auto(self):
+        codec = build_json_codec("auto")
+        assert isinstance(codec, JSONCodec)
+
+    def test_unknown(self):
+        with pytest.raises(BoltError):
+            build_json_codec("simplejson")
+
+    def test_request_and_response(self):
+        class RecordingCodec(JSONCodec):
+            def __init__(self):
+                self.calls = []
+
+            def loads(self, data):
+                self.calls.append("loads")
+                return super().loads(data)
+
+            def dumps(self, obj):
+                self.calls.append("dumps")
+                return super().dumps(obj)
+
+        codec = RecordingCodec()
+        set_json_codec(codec)
+        request = BoltRequest(body='{"type":"event_callback","event":{"type":"app_mention"}}')
+        assert request.body["event"]["type"] == "app_mention"
+        response = BoltResponse(status=200, body={"text": "Hi"})
+        assert response.body == '{"text": "Hi"}'
+        assert codec.calls == ["loads", "dumps"]
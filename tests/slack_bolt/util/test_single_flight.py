@@ -0,0 +1,57 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import pytest
+
+from slack_bolt.util.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    def setup_method(self):
+        pass
+
+    def teardown_method(self):
+        pass
+
+    def test_concurrent_calls_are_shared(self):
+        single_flight = SingleFlight()
+        calls = []
+        lock = Lock()
+
+        def func():
+            with lock:
+                calls.append(1)
+            time.sleep(0.2)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(single_flight.run, "key", func) for _ in range(5)]
+            results = [f.result() for f in futures]
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert single_flight.shared_count == 4
+
+        # Nothing is cached after the completion
+        assert single_flight.run("key", func) == "result"
+        assert len(calls) == 2
+
+    def test_different_keys(self):
+        single_flight = SingleFlight()
+        assert single_flight.run("a", lambda: 1) == 1
+        assert single_flight.run("b", lambda: 2) == 2
+        assert single_flight.shared_count == 0
+
+    def test_errors_are_shared(self):
+        single_flight = SingleFlight()
+
+        def func():
+            time.sleep(0.2)
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(single_flight.run, "key", func) for _ in range(3)]
+            for f in futures:
+                with pytest.raises(ValueError):
+                    f.result()
+        assert single_flight.run("key", lambda: "recovered") == "recovered"
@@ -0,0 +1,55 @@
+import pytest
+from slack_sdk import WebClient
+
+from slack_bolt import BoltContext
+from slack_bolt.error import BoltError
+from slack_bolt.util.web_client_pool import PooledWebClient, WebClientPool, assign_token_to_context_client
+
+
+class TestWebClientPool:
+    def test_get(self):
+        template = WebClient(base_url="http://localhost:8888/", timeout=10, headers={"x-foo": "bar"})
+        pool = WebClientPool(template=template, max_size=10)
+        client = pool.get(token="xoxb-1", team_id="T111")
+        assert isinstance(client, PooledWebClient)
+        assert client.token == "xoxb-1"
+        assert client.default_params["team_id"] == "T111"
+        assert client.base_url == "http://localhost:8888/"
+        assert client.timeout == 10
+        assert client.headers["x-foo"] == "bar"
+        assert pool.get(token="xoxb-1", team_id="T111") is client
+        assert pool.get(token="xoxb-1", team_id="T222") is not client
+        assert len(pool) == 2
+
+    def test_lru_eviction(self):
+        pool = WebClientPool(template=WebClient(), max_size=2)
+        first = pool.get(token="xoxb-1", team_id=None)
+        pool.get(token="xoxb-2", team_id=None)
+        assert pool.get(token="xoxb-1", team_id=None) is first  # now xoxb-2 is the least recently used
+        pool.get(token="xoxb-3", team_id=None)
+        assert len(pool) == 2
+        assert pool.get(token="xoxb-1", team_id=None) is first
+
+    def test_invalid_max_size(self):
+        with pytest.raises(BoltError):
+            WebClientPool(template=WebClient(), max_size=0)
+
+    def test_token_is_immutable(self):
+        client = WebClientPool(template=WebClient()).get(token=None, team_id=None)
+        with pytest.raises(BoltError):
+            client.token = "xoxb-1"
+
+    def test_assign_token_to_context_client(self):
+        pool = WebClientPool(template=WebClient())
+        shared = pool.get(token=None, team_id="T111")
+        context = BoltContext(client=shared, team_id="T111")
+        assign_token_to_context_client(context, "xoxb-1")
+        assert shared.token is None
+        assert context.client is not shared
+        assert context.client is pool.get(token="xoxb-1", team_id="T111")
+
+        context = BoltContext(client=WebClient(), team_id="T111")
+        client = context.client
+        assign_token_to_context_client(context, "xoxb-1")
+        assert context.client is client
+        assert client.token == "xoxb-1"
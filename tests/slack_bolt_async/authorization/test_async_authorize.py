@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging
 from logging import Logger
@@ -14,6 +15,8 @@ from slack_bolt.authorization.async_authorize import (
     AsyncInstallationStoreAuthorize,
     AsyncAuthorize,
 )
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache
+from slack_bolt.authorization.async_batch_installation_store import AsyncBatchInstallationStore
 from slack_bolt.context.async_context import AsyncBoltContext
 from slack_bolt.error import BoltError
 from tests.mock_web_api_server import (
@@ -355,6 +358,88 @@ class TestAsyncAuthorize:
         assert result.url == "https://subarachnoid.slack.com/"
         await assert_auth_test_count_async(self, 1)
 
+    @pytest.mark.asyncio
+    async def test_installation_store_cache_lookups(self):
+        installation_store = CountingInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            authorize_result_cache=AuthorizeResultCache(),
+        )
+        context = AsyncBoltContext()
+        context["client"] = self.client
+        for _ in range(3):
+            result = await authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+            assert result.bot_token == "xoxb-valid-2"
+        # The installation store is not queried for the cached key
+        assert installation_store.find_installation_count == 1
+        await assert_auth_test_count_async(self, 2)
+        assert authorize.authorize_result_cache.hit_count == 2
+
+        # Negative entries for unknown workspaces
+        for _ in range(3):
+            assert await authorize(context=context, enterprise_id=None, team_id="T_UNKNOWN", user_id="W11111") is None
+        assert installation_store.find_installation_count == 2
+
+    @pytest.mark.asyncio
+    async def test_installation_store_single_flight(self):
+        installation_store = CountingInstallationStore(lookup_seconds=0.1)
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+        )
+        context = AsyncBoltContext()
+        context["client"] = self.client
+        results = await asyncio.gather(
+            *[authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111") for _ in range(5)]
+        )
+        assert all(r.bot_token == "xoxb-valid-2" for r in results)
+        assert installation_store.find_installation_count == 1
+        await assert_auth_test_count_async(self, 2)
+        assert authorize.single_flight.shared_count == 4
+
+    @pytest.mark.asyncio
+    async def test_installation_store_auth_test_fallback(self):
+        installation_store = MemoryInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(
+            logger=installation_store.logger,
+            installation_store=installation_store,
+            auth_test_mode="fallback",
+        )
+        context = AsyncBoltContext()
+        context["client"] = self.client
+        result = await authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W11111")
+        assert result.bot_id == "B"
+        assert result.bot_user_id == "W"
+        assert result.user_id == "W11111"
+        assert result.user_token == "xoxp-valid"
+        await assert_auth_test_count_async(self, 0)
+
+    @pytest.mark.asyncio
+    async def test_installation_store_batch_lookup(self):
+        installation_store = BatchValidUserTokenInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(logger=installation_store.logger, installation_store=installation_store)
+        context = AsyncBoltContext()
+        context["client"] = AsyncWebClient(base_url=self.mock_api_server_base_url)
+        result = await authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W222")
+        assert authorize.find_installations_available is True
+        assert result.bot_token == "xoxb-valid"
+        assert result.user_token == "xoxp-valid"
+        assert result.user_id == "W99999"
+        assert installation_store.find_installations_count == 1
+        assert installation_store.find_installation_count == 0
+
+    @pytest.mark.asyncio
+    async def test_installation_store_batch_lookup_not_implemented(self):
+        installation_store = NotImplementedBatchInstallationStore()
+        authorize = AsyncInstallationStoreAuthorize(logger=installation_store.logger, installation_store=installation_store)
+        context = AsyncBoltContext()
+        context["client"] = AsyncWebClient(base_url=self.mock_api_server_base_url)
+        result = await authorize(context=context, enterprise_id="E111", team_id="T0G9PQBBK", user_id="W222")
+        assert result.bot_token == "xoxb-valid"
+        assert result.user_token == "xoxp-valid"
+        assert authorize.find_installations_available is False
+
 
 class LegacyMemoryInstallationStore(AsyncInstallationStore):
     @property
@@ -507,3 +592,64 @@ class ValidUserTokenRotationInstallationStore(AsyncInstallationStore):
                 user_scopes=["search:read"],
                 installed_at=datetime.datetime.now().timestamp(),
             )
+
+
+class CountingInstallationStore(LegacyMemoryInstallationStore):
+    def __init__(self, lookup_seconds: float = 0):
+        self.find_installation_count = 0
+        self.lookup_seconds = lookup_seconds
+
+    async def async_find_installation(
+        self,
+        *,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        user_id: Optional[str] = None,
+        is_enterprise_install: Optional[bool] = False,
+    ) -> Optional[Installation]:
+        self.find_installation_count += 1
+        await asyncio.sleep(self.lookup_seconds)
+        if team_id != "T0G9PQBBK":
+            return None
+        return Installation(
+            app_id="A111",
+            enterprise_id="E111",
+            team_id="T0G9PQBBK",
+            bot_token="xoxb-valid-2",
+            bot_id="B",
+            bot_user_id="W",
+            bot_scopes=["commands", "chat:write"],
+            user_id="W11111",
+            user_token="xoxp-valid",
+            user_scopes=["search:read"],
+            installed_at=datetime.datetime.now().timestamp(),
+        )
+
+    async def async_find_bot(
+        self,
+        *,
+        enterprise_id: Optional[str],
+        team_id: Optional[str],
+        is_enterprise_install: Optional[bool] = False,
+    ) -> Optional[Bot]:
+        return None
+
+
+class BatchValidUserTokenInstallationStore(ValidUserTokenInstallationStore, AsyncBatchInstallationStore):
+    def __init__(self):
+        self.find_installation_count = 0
+        self.find_installations_count = 0
+
+    async def async_find_installation(self, **kwargs) -> Optional[Installation]:
+        self.find_installation_count += 1
+        return await super().async_find_installation(**kwargs)
+
+    async def async_find_installations(self, *, queries):
+        self.find_installations_count += 1
+        return [
+            await super(BatchValidUserTokenInstallationStore, self).async_find_installation(**q._asdict()) for q in queries
+        ]
+
+
+class NotImplementedBatchInstallationStore(ValidUserTokenInstallationStore, AsyncBatchInstallationStore):
+    pass
@@ -1,3 +1,7 @@
+import asyncio
+import copy
+import time
+
 import pytest
 from slack_sdk.models.blocks import PlainTextObject, DividerBlock
 from slack_sdk.models.views import View
@@ -13,6 +17,25 @@ class TestAsyncAsyncAck:
         response: BoltResponse = await ack(text="foo")
         assert (response.status, response.body) == (200, "foo")
 
+    @pytest.mark.asyncio
+    async def test_wait_until_acknowledged(self):
+        ack = AsyncAck()
+        assert await ack.wait_until_acknowledged(timeout=0.01) is False
+
+        async def delayed_ack():
+            await asyncio.sleep(0.05)
+            await ack()
+
+        task = asyncio.ensure_future(delayed_ack())
+        started = time.time()
+        assert await ack.wait_until_acknowledged(timeout=3) is True
+        assert time.time() - started < 1
+        assert ack.response.status == 200
+        await task
+
+        copied = copy.deepcopy(ack)
+        assert copied.response.status == 200
+
     @pytest.mark.asyncio
     async def test_blocks(self):
         ack = AsyncAck()
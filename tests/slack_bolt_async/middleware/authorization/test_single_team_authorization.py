@@ -1,3 +1,6 @@
+import json
+from typing import Optional
+
 import pytest
 from slack_sdk.web.async_client import AsyncWebClient
 
@@ -8,6 +11,7 @@ from slack_bolt.middleware.authorization.internals import _build_user_facing_aut
 from slack_bolt.request.async_request import AsyncBoltRequest
 from slack_bolt.response import BoltResponse
 from tests.mock_web_api_server import (
+    assert_auth_test_count_async,
     cleanup_mock_web_api_server_async,
     setup_mock_web_api_server_async,
 )
@@ -81,3 +85,64 @@ class TestSingleTeamAuthorization:
 
         assert resp.status == 200
         assert resp.body == "foo"
+
+    @pytest.mark.asyncio
+    async def test_authorize_result_reused(self):
+        client = AsyncWebClient(base_url=self.mock_api_server_base_url, token="xoxb-valid")
+        authorization = AsyncSingleTeamAuthorization()
+        results = []
+        for user_id in [None, None, "W111", "W222"]:
+            req = AsyncBoltRequest(body=_build_event_body("app_mention", user_id), headers=json_headers)
+            req.context["client"] = client
+            resp = await authorization.async_process(req=req, resp=BoltResponse(status=404), next=next)
+            assert resp.status == 200
+            results.append(req.context.authorize_result)
+
+        await assert_auth_test_count_async(self, 1)
+        assert results[0] is results[1]
+        assert results[2].user_id == "W111"
+        assert results[2]["user_id"] == "W111"
+        assert results[3].user_id == "W222"
+        assert results[3].bot_scopes == results[0].bot_scopes == ["chat:write", "commands"]
+        assert results[0].user_id is None
+
+    @pytest.mark.asyncio
+    async def test_refresh_on_tokens_revoked(self):
+        client = AsyncWebClient(base_url=self.mock_api_server_base_url, token="xoxb-valid")
+        authorization = AsyncSingleTeamAuthorization()
+        req = AsyncBoltRequest(body=_build_event_body("app_mention"), headers=json_headers)
+        req.context["client"] = client
+        await authorization.async_process(req=req, resp=BoltResponse(status=404), next=next)
+        first_result = req.context.authorize_result
+
+        req = AsyncBoltRequest(body=_build_event_body("tokens_revoked"), headers=json_headers)
+        req.context["client"] = client
+        await authorization.async_process(req=req, resp=BoltResponse(status=404), next=next)
+        assert authorization.auth_test_result is None
+
+        req = AsyncBoltRequest(body=_build_event_body("app_mention"), headers=json_headers)
+        req.context["client"] = client
+        await authorization.async_process(req=req, resp=BoltResponse(status=404), next=next)
+        assert req.context.authorize_result is not first_result
+        await assert_auth_test_count_async(self, 2)
+
+    @pytest.mark.asyncio
+    async def test_refresh_interval(self):
+        client = AsyncWebClient(base_url=self.mock_api_server_base_url, token="xoxb-valid")
+        authorization = AsyncSingleTeamAuthorization(auth_test_refresh_interval_seconds=0)
+        for _ in range(3):
+            req = AsyncBoltRequest(body=_build_event_body("app_mention"), headers=json_headers)
+            req.context["client"] = client
+            resp = await authorization.async_process(req=req, resp=BoltResponse(status=404), next=next)
+            assert resp.status == 200
+        await assert_auth_test_count_async(self, 3)
+
+
+json_headers = {"content-type": ["application/json"]}
+
+
+def _build_event_body(event_type: str, user_id: Optional[str] = None) -> str:
+    event = {"type": event_type}
+    if user_id is not None:
+        event["user"] = user_id
+    return json.dumps({"type": "event_callback", "team_id": "T111", "api_app_id": "A111", "event": event})
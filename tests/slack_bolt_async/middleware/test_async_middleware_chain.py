@@ -0,0 +1,64 @@
+from typing import List
+
+import pytest
+
+from slack_bolt.middleware.async_builtins import AsyncIgnoringSelfEvents, AsyncSslCheck, AsyncUrlVerification
+from slack_bolt.middleware.async_middleware import AsyncMiddleware
+from slack_bolt.middleware.async_middleware_chain import AsyncMiddlewareChain
+from slack_bolt.request.async_request import AsyncBoltRequest
+from slack_bolt.response import BoltResponse
+
+
+class RecordingMiddleware(AsyncMiddleware):
+    def __init__(self, name: str, calls: List[str], calls_next: bool = True):
+        self._name = name
+        self.calls = calls
+        self.calls_next = calls_next
+
+    async def async_process(self, *, req, resp, next):
+        self.calls.append(self._name)
+        if self.calls_next:
+            await next()
+        return resp
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+
+def build_request(body: dict) -> AsyncBoltRequest:
+    return AsyncBoltRequest(body=body, mode="socket_mode")
+
+
+class TestAsyncMiddlewareChain:
+    @pytest.mark.asyncio
+    async def test_run(self):
+        calls: List[str] = []
+        chain = AsyncMiddlewareChain(
+            [
+                RecordingMiddleware("first", calls),
+                RecordingMiddleware("second", calls, calls_next=False),
+                RecordingMiddleware("third", calls),
+            ]
+        )
+        resp = BoltResponse(status=200)
+        assert await chain.run(req=build_request({"type": "block_actions"}), resp=resp) == (resp, 1)
+        assert calls == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_skipping_builtin_middleware(self):
+        calls: List[str] = []
+        chain = AsyncMiddlewareChain(
+            [AsyncSslCheck(), AsyncIgnoringSelfEvents(), AsyncUrlVerification(), RecordingMiddleware("custom", calls)]
+        )
+        resp, stopped_at = await chain.run(req=build_request({"type": "block_actions"}), resp=BoltResponse(status=200))
+        assert resp is None
+        assert stopped_at is None
+        assert calls == ["custom"]
+
+        resp, stopped_at = await chain.run(
+            req=build_request({"type": "url_verification", "challenge": "xxx"}),
+            resp=BoltResponse(status=200),
+        )
+        assert resp.body == '{"challenge": "xxx"}'
+        assert stopped_at == 2
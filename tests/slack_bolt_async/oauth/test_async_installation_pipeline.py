@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from slack_sdk.oauth.installation_store import Installation
+
+from slack_bolt.oauth.async_installation_pipeline import AsyncInstallationPipeline
+
+
+def build_installation() -> Installation:
+    return Installation(app_id="A111", team_id="T111", user_id="W111", bot_token="xoxb-valid")
+
+
+class TestAsyncInstallationPipeline:
+    @pytest.mark.asyncio
+    async def test_submit(self):
+        pipeline = AsyncInstallationPipeline()
+        saved = []
+        installation = build_installation()
+
+        async def save():
+            saved.append(installation)
+
+        try:
+            assert pipeline.submit(installation, save) is True
+            await pipeline.join()
+            assert saved == [installation]
+            assert pipeline.completed_count == 1
+        finally:
+            await pipeline.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_retry_and_error_handler(self):
+        errors = []
+
+        async def error_handler(installation, e):
+            errors.append((installation.team_id, str(e)))
+
+        pipeline = AsyncInstallationPipeline(max_attempts=3, retry_interval_seconds=0.01, error_handler=error_handler)
+        attempts = []
+
+        async def failing_save():
+            attempts.append(1)
+            raise Exception("database is down")
+
+        try:
+            pipeline.submit(build_installation(), failing_save)
+            await pipeline.join()
+            assert len(attempts) == 3
+            assert errors == [("T111", "database is down")]
+            assert pipeline.failed_count == 1
+        finally:
+            await pipeline.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue(self):
+        pipeline = AsyncInstallationPipeline(worker_count=1, max_queue_size=1)
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def blocking_save():
+            started.set()
+            await release.wait()
+
+        async def save():
+            pass
+
+        try:
+            assert pipeline.submit(build_installation(), blocking_save) is True
+            await asyncio.wait_for(started.wait(), timeout=1)
+            assert pipeline.submit(build_installation(), save) is True
+            assert pipeline.queue_size == 1
+            assert pipeline.submit(build_installation(), save) is False
+        finally:
+            release.set()
+            await pipeline.shutdown()
+        assert pipeline.completed_count == 2
+
+    def test_new_event_loop(self):
+        pipeline = AsyncInstallationPipeline(worker_count=1)
+        saved = []
+
+        async def save():
+            saved.append(1)
+
+        async def run_on_first_loop():
+            async def blocking_save():
+                await asyncio.Event().wait()
+
+            assert pipeline.submit(build_installation(), blocking_save) is True
+            assert pipeline.submit(build_installation(), save) is True
+            await asyncio.sleep(0.01)
+
+        async def run_on_second_loop():
+            assert pipeline.submit(build_installation(), save) is True
+            await asyncio.wait_for(pipeline.join(), timeout=1)
+
+        # The first loop is closed while the second installation is waiting in the queue
+        asyncio.run(run_on_first_loop())
+        assert saved == []
+        # The workers on the new loop take over the waiting installation
+        asyncio.run(run_on_second_loop())
+        assert saved == [1, 1]
+        assert pipeline.completed_count == 2
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from time import time
 from urllib.parse import quote
@@ -12,15 +13,19 @@ from slack_sdk.web.async_client import AsyncWebClient
 
 from slack_bolt import BoltResponse
 from slack_bolt.app.async_app import AsyncApp
+from slack_bolt.authorization.async_authorize import AsyncInstallationStoreAuthorize
+from slack_bolt.authorization.authorize_result_cache import AuthorizeResultCache, build_authorize_result_cache_key
 from slack_bolt.error import BoltError
 from slack_bolt.oauth.async_callback_options import (
     AsyncFailureArgs,
     AsyncSuccessArgs,
     AsyncCallbackOptions,
 )
+from slack_bolt.oauth.async_installation_pipeline import AsyncInstallationPipeline
 from slack_bolt.oauth.async_oauth_flow import AsyncOAuthFlow
 from slack_bolt.oauth.async_oauth_settings import AsyncOAuthSettings
 from slack_bolt.oauth.oauth_settings import OAuthSettings
+from slack_bolt.oauth.signed_state_store import SignedOAuthStateStore
 from slack_bolt.request.async_request import AsyncBoltRequest
 from tests.mock_web_api_server import (
     cleanup_mock_web_api_server_async,
@@ -224,6 +229,119 @@ class TestAsyncOAuthFlow:
         assert response.status == 200
         await assert_auth_test_count_async(self, 1)
 
+    @pytest.mark.asyncio
+    async def test_handle_callback_installation_pipeline(self):
+        release = asyncio.Event()
+        saved = []
+
+        class BlockingInstallationStore(FileInstallationStore):
+            async def async_save(self, installation):
+                await release.wait()
+                saved.append(installation)
+
+        pipeline = AsyncInstallationPipeline()
+        oauth_flow = AsyncOAuthFlow(
+            client=AsyncWebClient(base_url=self.mock_api_server_base_url),
+            settings=AsyncOAuthSettings(
+                client_id="111.222",
+                client_secret="xxx",
+                scopes=["chat:write", "commands"],
+                installation_store=BlockingInstallationStore(),
+                state_store=FileOAuthStateStore(expiration_seconds=120),
+                success_url="https://www.example.com/completion",
+                failure_url="https://www.example.com/failure",
+                installation_pipeline=pipeline,
+            ),
+        )
+        state = await oauth_flow.issue_new_state(None)
+        req = AsyncBoltRequest(
+            body="",
+            query=f"code=foo&state={state}",
+            headers={"cookie": [f"{oauth_flow.settings.state_cookie_name}={state}"]},
+        )
+        try:
+            resp = await oauth_flow.handle_callback(req)
+            # The completion page is displayed before the installation is saved
+            assert resp.status == 200
+            assert "https://www.example.com/completion" in resp.body
+            assert saved == []
+
+            release.set()
+            await pipeline.join()
+            assert len(saved) == 1
+            assert saved[0].team_id == "T9TK3CUKW"
+        finally:
+            release.set()
+            await pipeline.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_handle_callback_invalidates_authorize_result_cache(self):
+        settings = AsyncOAuthSettings(
+            client_id="111.222",
+            client_secret="xxx",
+            scopes=["chat:write", "commands"],
+            installation_store=FileInstallationStore(),
+            state_store=FileOAuthStateStore(expiration_seconds=120),
+        )
+        settings.authorize = AsyncInstallationStoreAuthorize(
+            logger=settings.authorize.logger,
+            installation_store=settings.installation_store,
+            authorize_result_cache=AuthorizeResultCache(),
+        )
+        oauth_flow = AsyncOAuthFlow(client=AsyncWebClient(base_url=self.mock_api_server_base_url), settings=settings)
+        cache = oauth_flow.authorize_result_cache
+        assert cache is settings.authorize.authorize_result_cache
+
+        installed_key = build_authorize_result_cache_key(
+            enterprise_id="E12345678", team_id="T9TK3CUKW", user_id=None, is_enterprise_install=False
+        )
+        other_key = build_authorize_result_cache_key(
+            enterprise_id="E12345678", team_id="T222", user_id=None, is_enterprise_install=False
+        )
+        # The workspace was unknown before the installation
+        cache.set_not_found(installed_key)
+        cache.set_not_found(other_key)
+
+        state = await oauth_flow.issue_new_state(None)
+        req = AsyncBoltRequest(
+            body="",
+            query=f"code=foo&state={state}",
+            headers={"cookie": [f"{oauth_flow.settings.state_cookie_name}={state}"]},
+        )
+        resp = await oauth_flow.handle_callback(req)
+        assert resp.status == 200
+        assert cache.get(installed_key) == (False, None)
+        assert cache.get(other_key) == (True, None)
+
+    @pytest.mark.asyncio
+    async def test_handle_callback_signed_state(self):
+        oauth_flow = AsyncOAuthFlow(
+            client=AsyncWebClient(base_url=self.mock_api_server_base_url),
+            settings=AsyncOAuthSettings(
+                client_id="111.222",
+                client_secret="xxx",
+                scopes=["chat:write", "commands"],
+                installation_store=FileInstallationStore(),
+                state_signing_enabled=True,
+                success_url="https://www.example.com/completion",
+                failure_url="https://www.example.com/failure",
+            ),
+        )
+        assert isinstance(oauth_flow.settings.state_store, SignedOAuthStateStore)
+        state = await oauth_flow.issue_new_state(None)
+        req = AsyncBoltRequest(
+            body="",
+            query=f"code=foo&state={state}",
+            headers={"cookie": [f"{oauth_flow.settings.state_cookie_name}={state}"]},
+        )
+        resp = await oauth_flow.handle_callback(req)
+        assert resp.status == 200
+        assert "https://www.example.com/completion" in resp.body
+
+        # The same state cannot be used twice
+        resp = await oauth_flow.handle_callback(req)
+        assert resp.status == 401
+
     @pytest.mark.asyncio
     async def test_handle_callback_invalid_state(self):
         oauth_flow = AsyncOAuthFlow(
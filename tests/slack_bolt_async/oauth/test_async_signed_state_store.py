@@ -0,0 +1,12 @@
+import pytest
+
+from slack_bolt.oauth.signed_state_store import SignedOAuthStateStore
+
+
+class TestAsyncSignedOAuthStateStore:
+    @pytest.mark.asyncio
+    async def test_issue_and_consume(self):
+        store = SignedOAuthStateStore(signing_secret="secret")
+        state = await store.async_issue()
+        assert await store.async_consume(state) is True
+        assert await store.async_consume(state) is False
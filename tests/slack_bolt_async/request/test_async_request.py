@@ -17,3 +17,31 @@ class TestAsyncRequest:
         assert req is not None
         assert req.raw_body == ""
         assert req.body == {}
+
+    @pytest.mark.asyncio
+    async def test_bytes_body(self):
+        raw_body = b'{"type":"event_callback","team_id":"T111","event":{"type":"app_mention","text":"\xe3\x81\x82"}}'
+        req = AsyncBoltRequest(body=raw_body, headers={"content-type": "application/json"})
+        assert req.raw_body_bytes is raw_body
+        assert req.body["event"]["text"] == "\u3042"
+        assert req.context.team_id == "T111"
+        assert req.raw_body == raw_body.decode("utf-8")
+
+        copied_req = req.to_copyable()
+        assert copied_req.raw_body_bytes is raw_body
+        assert copied_req.body == req.body
+
+    @pytest.mark.asyncio
+    async def test_to_lazy_request(self):
+        req = AsyncBoltRequest(body={"type": "block_actions", "team": {"id": "T111"}}, mode="socket_mode")
+        ack = req.context.ack
+        req.context["custom"] = {"foo": "bar"}
+
+        lazy_req = req.to_lazy_request("lazy_func")
+        assert lazy_req.lazy_only is True
+        assert lazy_req.lazy_function_name == "lazy_func"
+        assert lazy_req.body is req.body
+        assert lazy_req.context.team_id == "T111"
+        assert lazy_req.context["custom"] == req.context["custom"]
+        assert lazy_req.context.ack is not ack
+        assert req.lazy_only is False
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from slack_bolt.util.async_single_flight import AsyncSingleFlight
+
+
+class TestAsyncSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_shared(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return "result"
+
+        results = await asyncio.gather(*[single_flight.run("key", func) for _ in range(5)])
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert single_flight.shared_count == 4
+
+        # Nothing is cached after the completion
+        assert await single_flight.run("key", func) == "result"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared(self):
+        single_flight = AsyncSingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.1)
+            raise ValueError("failed")
+
+        results = await asyncio.gather(*[single_flight.run("key", func) for _ in range(3)], return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+
+        async def recovered():
+            return "recovered"
+
+        assert await single_flight.run("key", recovered) == "recovered"
+
+    @pytest.mark.asyncio
+    async def test_waiter_cancellation(self):
+        single_flight = AsyncSingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.1)
+            return "result"
+
+        leader = asyncio.ensure_future(single_flight.run("key", func))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(single_flight.run("key", func))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        assert await leader == "result"
+
+    @pytest.mark.asyncio
+    async def test_leader_cancellation(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return "result"
+
+        leader = asyncio.ensure_future(single_flight.run("key", func))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(single_flight.run("key", func)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        # One of the waiters runs the call again and the others share it
+        assert await asyncio.gather(*waiters) == ["result"] * 3
+        assert len(calls) == 2
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from slack_sdk.web.async_client import AsyncWebClient
+
+from slack_bolt.context.async_context import AsyncBoltContext
+from slack_bolt.error import BoltError
+from slack_bolt.util.async_web_client_pool import (
+    AsyncPooledWebClient,
+    AsyncWebClientPool,
+    assign_token_to_context_client,
+)
+
+
+class TestAsyncWebClientPool:
+    @pytest.mark.asyncio
+    async def test_shared_session(self):
+        pool = AsyncWebClientPool(template=AsyncWebClient(timeout=10), max_size=2)
+        try:
+            first = pool.get(token="xoxb-1", team_id="T111")
+            second = pool.get(token="xoxb-2", team_id="T111")
+            assert isinstance(first, AsyncPooledWebClient)
+            assert first.session is not None
+            assert first.session is second.session
+            assert pool.get(token="xoxb-1", team_id="T111") is first
+            pool.get(token="xoxb-3", team_id="T111")
+            assert len(pool) == 2
+        finally:
+            await pool.close()
+        assert first.session.closed
+
+        # A new session is created after closing the pool
+        client = pool.get(token="xoxb-1", team_id="T111")
+        assert client is not first
+        assert not client.session.closed
+        await pool.close()
+
+    def test_new_event_loop(self):
+        pool = AsyncWebClientPool(template=AsyncWebClient())
+
+        async def get_client() -> AsyncPooledWebClient:
+            return pool.get(token="xoxb-1", team_id="T111")
+
+        first = asyncio.run(get_client())
+        # The session of the first client is bound to the closed loop
+        second = asyncio.run(get_client())
+        assert second is not first
+        assert second.session is not first.session
+        assert len(pool) == 1
+        asyncio.run(pool.close())
+        asyncio.run(first.session.close())
+
+    @pytest.mark.asyncio
+    async def test_assign_token_to_context_client(self):
+        pool = AsyncWebClientPool(template=AsyncWebClient())
+        try:
+            shared = pool.get(token=None, team_id="T111")
+            with pytest.raises(BoltError):
+                shared.token = "xoxb-1"
+
+            context = AsyncBoltContext(client=shared, team_id="T111")
+            assign_token_to_context_client(context, "xoxb-1")
+            assert shared.token is None
+            assert context.client is pool.get(token="xoxb-1", team_id="T111")
+        finally:
+            await pool.close()